@@ -22,10 +22,13 @@ class WorkflowCommand:
 
     workflow_def: dict[str, Any]
     parameters: dict[str, Any]
+    engine: str = "prefect"
 
     def validate(self) -> bool:
         """Validate command business rules."""
-        if not self.workflow_def:
+        from src.application.workflows.execution import ENGINES
+
+        if not self.workflow_def or self.engine not in ENGINES:
             return False
         return "tasks" in self.workflow_def
 
@@ -70,7 +73,9 @@ class WorkflowExecutor:
 
         try:
             # Import here to avoid circular imports
-            from src.application.workflows.prefect import run_workflow
+            from src.application.workflows.execution import get_workflow_runner
+
+            run_workflow = get_workflow_runner(command.engine)
 
             # Execute workflow - context provides proper session management
             context, workflow_result = await run_workflow(
@@ -107,7 +112,7 @@ class WorkflowExecutor:
 
 # Convenience function for single workflow execution
 async def execute_workflow_use_case(
-    workflow_def: dict, **parameters
+    workflow_def: dict, engine: str = "prefect", **parameters
 ) -> WorkflowExecutionResult:
     """Execute workflow through the use case pattern.
 
@@ -116,12 +121,15 @@ async def execute_workflow_use_case(
 
     Args:
         workflow_def: Workflow definition
+        engine: Execution engine, "prefect" or "local"
         **parameters: Dynamic parameters for workflow
 
     Returns:
         Workflow execution result
     """
-    command = WorkflowCommand(workflow_def=workflow_def, parameters=parameters)
+    command = WorkflowCommand(
+        workflow_def=workflow_def, parameters=parameters, engine=engine
+    )
 
     executor = WorkflowExecutor()
     return await executor.execute(command)
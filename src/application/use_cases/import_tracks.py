@@ -211,7 +211,6 @@ class ImportTracksUseCase:
         limit = command.limit or 1000
         resolve_tracks = command.resolve_tracks
         
-        from src.infrastructure.connectors.lastfm import LastFMConnector
         from src.infrastructure.persistence.database import get_session
         from src.infrastructure.persistence.repositories.factories import (
             get_unit_of_work,
@@ -235,7 +234,9 @@ class ImportTracksUseCase:
                     checkpoint_repository=checkpoint_repo,
                     connector_repository=connector_repo,
                     track_repository=track_repo,
-                    lastfm_connector=LastFMConnector()
+                    lastfm_connector=uow.get_service_connector_provider().get_connector(
+                        "lastfm"
+                    ),
                 )
                 
                 try:
@@ -270,7 +271,6 @@ class ImportTracksUseCase:
         user_id = command.user_id
         resolve_tracks = command.resolve_tracks
         
-        from src.infrastructure.connectors.lastfm import LastFMConnector
         from src.infrastructure.persistence.database import get_session
         from src.infrastructure.persistence.repositories.factories import (
             get_unit_of_work,
@@ -294,7 +294,9 @@ class ImportTracksUseCase:
                     checkpoint_repository=checkpoint_repo,
                     connector_repository=connector_repo,
                     track_repository=track_repo,
-                    lastfm_connector=LastFMConnector()
+                    lastfm_connector=uow.get_service_connector_provider().get_connector(
+                        "lastfm"
+                    ),
                 )
                 
                 try:
@@ -355,7 +357,6 @@ class ImportTracksUseCase:
                     error_count=0,
                 )
         
-        from src.infrastructure.connectors.lastfm import LastFMConnector
         from src.infrastructure.persistence.database import get_session
         from src.infrastructure.persistence.repositories.factories import (
             get_unit_of_work,
@@ -379,7 +380,9 @@ class ImportTracksUseCase:
                     checkpoint_repository=checkpoint_repo,
                     connector_repository=connector_repo,
                     track_repository=track_repo,
-                    lastfm_connector=LastFMConnector()
+                    lastfm_connector=uow.get_service_connector_provider().get_connector(
+                        "lastfm"
+                    ),
                 )
                 
                 try:
@@ -0,0 +1,118 @@
+"""QueryLibrary use case selecting tracks from the local library in the database.
+
+Workflows that start from the local library describe the tracks they want
+as a LibraryQuery. The query runs as one database query, so filtering,
+ordering and limiting a large library only loads the final tracks.
+"""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+
+from attrs import define, field
+
+from src.config import get_logger
+from src.domain.entities import LibraryQuery, TrackList
+from src.domain.repositories import UnitOfWorkProtocol
+
+logger = get_logger(__name__)
+
+
+@define(frozen=True, slots=True)
+class QueryLibraryCommand:
+    """Command selecting library tracks with a declarative query."""
+
+    query: LibraryQuery = field(factory=LibraryQuery)
+    batch_size: int = 500  # Tracks per batch when the query is streamed
+
+    def validate(self) -> bool:
+        """Validate command business rules.
+
+        Returns:
+            True if the limit, when given, is not negative and batches are
+            not empty
+        """
+        return (self.query.limit is None or self.query.limit >= 0) and (
+            self.batch_size > 0
+        )
+
+
+@define(frozen=True, slots=True)
+class QueryLibraryResult:
+    """Result of a library query."""
+
+    tracklist: TrackList
+    execution_time_ms: int = 0
+
+    @property
+    def track_count(self) -> int:
+        """Number of tracks the query returned."""
+        return len(self.tracklist.tracks)
+
+
+class QueryLibraryUseCase:
+    """Runs library queries through the UnitOfWork's library repository.
+
+    Follows the UnitOfWork pattern: no constructor dependencies, the
+    repository comes from the UnitOfWork passed to ``execute``.
+    """
+
+    async def execute(
+        self, command: QueryLibraryCommand, uow: UnitOfWorkProtocol
+    ) -> QueryLibraryResult:
+        """Execute the library query.
+
+        Args:
+            command: Query to run
+            uow: UnitOfWork for repository access
+
+        Returns:
+            Tracks matching the query, in query order
+
+        Raises:
+            ValueError: If the command is invalid
+        """
+        if not command.validate():
+            raise ValueError("Invalid command: negative limit or empty batches")
+
+        start_time = datetime.now(UTC)
+        async with uow:
+            tracklist = await uow.get_library_repository().query_tracks(command.query)
+
+        execution_time_ms = int((datetime.now(UTC) - start_time).total_seconds() * 1000)
+        logger.info(
+            "Library query completed",
+            track_count=len(tracklist.tracks),
+            execution_time_ms=execution_time_ms,
+        )
+        return QueryLibraryResult(
+            tracklist=tracklist, execution_time_ms=execution_time_ms
+        )
+
+    async def stream(
+        self, command: QueryLibraryCommand, uow: UnitOfWorkProtocol
+    ) -> AsyncIterator[TrackList]:
+        """Execute the library query, loading its tracks batch by batch.
+
+        Args:
+            command: Query to run
+            uow: UnitOfWork for repository access
+
+        Yields:
+            TrackLists of at most ``command.batch_size`` tracks, in query order
+
+        Raises:
+            ValueError: If the command is invalid
+        """
+        if not command.validate():
+            raise ValueError("Invalid command: negative limit or empty batches")
+
+        track_count = 0
+        async with uow:
+            repository = uow.get_library_repository()
+            async for batch in repository.iter_query_tracks(
+                command.query, command.batch_size
+            ):
+                track_count += len(batch.tracks)
+                yield batch
+
+        logger.info("Library query streamed", track_count=track_count)
@@ -11,17 +11,20 @@ following Clean Architecture principles and modern Python patterns including:
 from datetime import UTC, datetime
 from typing import Any, Literal, Protocol
 
+import attrs
 from attrs import define, field
 
 from src.config import get_logger
-from src.domain.entities.playlist import Playlist
+from src.domain.entities.playlist import ConnectorPlaylist, Playlist
 from src.domain.entities.track import Track, TrackList
 from src.domain.repositories import UnitOfWorkProtocol
 
 logger = get_logger(__name__)
 
 # Type definitions for configuration
-OperationType = Literal["create_internal", "create_spotify", "update_spotify"]
+OperationType = Literal[
+    "create_internal", "create_spotify", "update_spotify", "sync_spotify_source"
+]
 ConnectorType = Literal["internal", "spotify", "lastfm", "musicbrainz"]
 
 
@@ -58,6 +61,8 @@ class PersistenceOptions:
     append_mode: bool = False
     batch_size: int = 100
     fail_on_track_error: bool = False
+    # Fetched state of the Spotify playlist mirrored by sync_spotify_source
+    source_playlist: ConnectorPlaylist | None = None
 
 
 @define(frozen=True, slots=True)
@@ -83,9 +88,13 @@ class SavePlaylistCommand:
         if not self.tracklist.tracks:
             return False
 
+        options = self.persistence_options
+        if options.operation_type == "sync_spotify_source":
+            return options.source_playlist is not None
+
         return not (
-            self.persistence_options.operation_type == "update_spotify"
-            and not self.persistence_options.spotify_playlist_id
+            options.operation_type == "update_spotify"
+            and not options.spotify_playlist_id
         )
 
 
@@ -262,6 +271,26 @@ class SavePlaylistUseCase:
 
         async with uow:
             try:
+                # Step 0: A mirrored source playlist with an unchanged snapshot
+                # is already stored as it is, so nothing needs writing
+                unchanged = await self._find_unchanged_source_playlist(command, uow)
+                if unchanged is not None:
+                    logger.info(
+                        "Source playlist unchanged since last sync, skipping save",
+                        playlist_id=unchanged.id,
+                        track_count=len(unchanged.tracks),
+                    )
+                    return SavePlaylistResult(
+                        playlist=unchanged,
+                        enriched_tracks=unchanged.tracks,
+                        operation_type=command.persistence_options.operation_type,
+                        track_count=len(unchanged.tracks),
+                        persistence_stats={"unchanged": 1},
+                        execution_time_ms=int(
+                            (datetime.now(UTC) - start_time).total_seconds() * 1000
+                        ),
+                    )
+
                 # Step 1: Enrich tracks if enabled
                 enriched_tracks = await self._enrich_tracks(command, uow)
 
@@ -303,6 +332,38 @@ class SavePlaylistUseCase:
                 )
                 raise
 
+    async def _find_unchanged_source_playlist(
+        self, command: SavePlaylistCommand, uow: UnitOfWorkProtocol
+    ) -> Playlist | None:
+        """Return the stored mirror of a source playlist whose snapshot is unchanged.
+
+        Args:
+            command: Save command, only ``sync_spotify_source`` is checked
+
+        Returns:
+            The stored playlist, or None when it must be saved
+        """
+        source = command.persistence_options.source_playlist
+        if command.persistence_options.operation_type != "sync_spotify_source":
+            return None
+        if source is None or not source.raw_metadata.get("snapshot_id"):
+            return None
+
+        stored = await uow.get_connector_playlist_repository().get_by_connector_id(
+            source.connector_name, source.connector_playlist_id
+        )
+        if stored is None or (
+            stored.raw_metadata.get("snapshot_id")
+            != source.raw_metadata["snapshot_id"]
+        ):
+            return None
+
+        return await uow.get_playlist_repository().get_playlist_by_connector(
+            source.connector_name,
+            source.connector_playlist_id,
+            raise_if_not_found=False,
+        )
+
     async def _enrich_tracks(self, command: SavePlaylistCommand, uow: UnitOfWorkProtocol) -> list[Track]:
         """Enrich tracks using configured strategy.
 
@@ -380,6 +441,10 @@ class SavePlaylistUseCase:
             playlist = await self._create_spotify_playlist(options, persisted_tracks, playlist_repo)
         elif options.operation_type == "update_spotify":
             playlist = await self._update_spotify_playlist(options, persisted_tracks, playlist_repo)
+        elif options.operation_type == "sync_spotify_source":
+            playlist = await self._sync_spotify_source_playlist(
+                options, persisted_tracks, uow
+            )
         else:
             raise ValueError(f"Unsupported operation type: {options.operation_type}")
 
@@ -470,3 +535,52 @@ class SavePlaylistUseCase:
         if existing.id is None:
             raise ValueError("Existing playlist has no ID")
         return await playlist_repo.update_playlist(existing.id, updated)
+
+    async def _sync_spotify_source_playlist(
+        self, options: PersistenceOptions, tracks: list[Track], uow: UnitOfWorkProtocol
+    ) -> Playlist:
+        """Create or update the internal mirror of a Spotify source playlist.
+
+        The mirror is found through its Spotify playlist mapping, so repeated
+        runs update one playlist in place instead of creating a new one each
+        time. The fetched Spotify state is stored alongside it, so a later run
+        with the same snapshot can skip saving altogether.
+        """
+        from src.domain.workflows.playlist_operations import (
+            create_spotify_playlist_operation,
+        )
+
+        source = options.source_playlist
+        if source is None:
+            raise ValueError("Source playlist required for sync_spotify_source operation")
+
+        playlist_repo = uow.get_playlist_repository()
+        existing = await playlist_repo.get_playlist_by_connector(
+            source.connector_name,
+            source.connector_playlist_id,
+            raise_if_not_found=False,
+        )
+
+        if existing is None or existing.id is None:
+            playlist = await playlist_repo.save_playlist(
+                create_spotify_playlist_operation(
+                    TrackList(tracks=tracks),
+                    {
+                        "name": options.playlist_name,
+                        "description": options.playlist_description,
+                    },
+                    tracks,
+                    source.connector_playlist_id,
+                )
+            )
+        else:
+            # Diff against the stored tracks: moves, additions and removals only
+            updated = attrs.evolve(
+                existing.with_tracks(tracks),
+                name=options.playlist_name,
+                description=options.playlist_description,
+            )
+            playlist = await playlist_repo.update_playlist(existing.id, updated)
+
+        await uow.get_connector_playlist_repository().upsert_model(source)
+        return playlist
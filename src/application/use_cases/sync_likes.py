@@ -9,8 +9,10 @@ from collections.abc import Callable, Coroutine
 from datetime import UTC, datetime
 from typing import Any, Literal
 
-from attrs import define
+from attrs import define, evolve
 
+from src.application.utilities.prefetch import PagePrefetcher
+from src.application.utilities.simple_batching import gather_in_batch
 from src.config import get_config, get_logger
 from src.domain.entities import OperationResult, SyncCheckpoint, Track
 from src.domain.repositories import UnitOfWorkProtocol
@@ -80,126 +82,82 @@ class ImportSpotifyLikesUseCase:
         imported_count = 0
         tracks_found_in_db = 0
         batches_processed = 0
-        cursor = None
 
-        # Process in batches with pagination
-        while True:
-            # Exit if we've reached the maximum import count
-            if max_imports is not None and imported_count >= max_imports:
-                logger.info(f"Reached maximum import count: {max_imports}")
-                break
+        # Pages are fetched ahead in the background while the current one is
+        # written, so Spotify requests overlap with database work
+        spotify_connector = self._get_spotify_connector(uow)
+        prefetch_pages = get_config("SPOTIFY_API_PREFETCH_PAGES", 2) or 2
 
-            # Fetch connector tracks from Spotify
-            spotify_connector = self._get_spotify_connector(uow)
-            (
-                connector_tracks,
-                next_cursor,
-            ) = await spotify_connector.get_liked_tracks(
-                limit=api_batch_size,
-                cursor=cursor,
+        async def fetch_page(cursor: str | None) -> tuple[list[Any], str | None]:
+            return await spotify_connector.get_liked_tracks(
+                limit=api_batch_size, cursor=cursor
             )
 
-            if not connector_tracks:
-                logger.info("No more tracks to import from Spotify")
-                break
+        async with PagePrefetcher(fetch_page, prefetch=prefetch_pages) as pages:
+            async for connector_tracks, next_cursor in pages:
+                # Exit if we've reached the maximum import count
+                if max_imports is not None and imported_count >= max_imports:
+                    logger.info(f"Reached maximum import count: {max_imports}")
+                    break
 
-            # Process tracks in this batch
-            batch_timestamp = datetime.now(UTC)
-            successful_tracks = []
-            new_tracks_in_batch = 0
+                if not connector_tracks:
+                    logger.info("No more tracks to import from Spotify")
+                    break
 
-            for connector_track in connector_tracks:
+                # Process the page as a set: one connector lookup, one like-state
+                # read, one bulk ingest and one like upsert per service
+                batch_timestamp = datetime.now(UTC)
                 try:
-                    # Check if this track already exists and is liked
-                    connector_repo = uow.get_connector_repository()
-                    existing_track = (
-                        await connector_repo.find_track_by_connector(
-                            connector="spotify",
-                            connector_id=connector_track.connector_track_id,
-                        )
-                    )
-
-                    if existing_track and existing_track.id is not None:
-                        # Check if it's already liked in both services
-                        if await self._is_track_already_liked(
-                            existing_track.id, ["spotify", "narada"], uow
-                        ):
-                            tracks_found_in_db += 1
-                            logger.debug(
-                                f"Track already synced: {connector_track.title}"
-                            )
-                            continue
-                        else:
-                            # Track exists but not properly liked, process it
-                            successful_tracks.append(existing_track.id)
-                            continue
-
-                    # Track doesn't exist, ingest it
-                    db_track = await connector_repo.ingest_external_track(
-                        connector="spotify",
-                        connector_id=connector_track.connector_track_id,
-                        metadata=connector_track.raw_metadata,
-                        title=connector_track.title,
-                        artists=[a.name for a in connector_track.artists],
-                        album=connector_track.album,
-                        duration_ms=connector_track.duration_ms,
-                        release_date=connector_track.release_date,
-                        isrc=connector_track.isrc,
-                    )
-
-                    if db_track and db_track.id is not None:
-                        successful_tracks.append(db_track.id)
-                        new_tracks_in_batch += 1
-                    else:
-                        logger.warning(
-                            f"Could not ingest track: {connector_track.title}"
-                        )
-
+                    (
+                        successful_tracks,
+                        already_synced,
+                        new_tracks_in_batch,
+                    ) = await self._resolve_liked_page(connector_tracks, uow)
                 except Exception as e:
-                    logger.exception(
-                        f"Error importing track {connector_track.title}: {e}"
-                    )
+                    logger.exception(f"Error importing liked tracks page: {e}")
+                    successful_tracks, already_synced, new_tracks_in_batch = [], 0, 0
+                tracks_found_in_db += already_synced
 
-            # Save likes for all successful tracks
-            for track_id in successful_tracks:
+                # Save likes for all successful tracks
                 try:
-                    await self._save_like_to_services(
-                        track_id=track_id,
+                    await self._save_likes_to_services(
+                        track_ids=successful_tracks,
                         timestamp=batch_timestamp,
                         services=["spotify", "narada"],
                         uow=uow,
                     )
-                    imported_count += 1
+                    imported_count += len(successful_tracks)
                 except Exception as e:
-                    logger.exception(f"Error saving likes for track {track_id}: {e}")
-
-            batches_processed += 1
+                    logger.exception(
+                        f"Error saving likes for {len(successful_tracks)} tracks: {e}"
+                    )
 
-            # Early termination logic for incremental efficiency
-            if (
-                new_tracks_in_batch == 0
-                and tracks_found_in_db > len(connector_tracks) * 0.8
-            ):
-                logger.info(
-                    "Reached previously synced tracks, stopping incremental sync"
-                )
-                break
+                batches_processed += 1
 
-            # Update checkpoint periodically
-            if batches_processed % 10 == 0 or not next_cursor:
-                await self._update_checkpoint(
-                    checkpoint=checkpoint,
-                    timestamp=batch_timestamp,
-                    cursor=next_cursor,
-                    uow=uow,
-                )
+                # Early termination logic for incremental efficiency; leaving
+                # the prefetcher also cancels any pages still being fetched
+                if (
+                    new_tracks_in_batch == 0
+                    and tracks_found_in_db > len(connector_tracks) * 0.8
+                ):
+                    logger.info(
+                        "Reached previously synced tracks, stopping incremental sync"
+                    )
+                    break
 
-            # Break if no more pagination
-            if not next_cursor:
-                logger.info("Completed import of all Spotify likes")
-                break
+                # Update checkpoint periodically
+                if batches_processed % 10 == 0 or not next_cursor:
+                    await self._update_checkpoint(
+                        checkpoint=checkpoint,
+                        timestamp=batch_timestamp,
+                        cursor=next_cursor,
+                        uow=uow,
+                    )
 
-            cursor = next_cursor
+                # Break if no more pagination
+                if not next_cursor:
+                    logger.info("Completed import of all Spotify likes")
+                    break
 
         logger.info(
             f"Spotify likes import completed: {imported_count} imported, "
@@ -264,15 +222,86 @@ class ImportSpotifyLikesUseCase:
         checkpoint_repo = uow.get_checkpoint_repository()
         return await checkpoint_repo.save_sync_checkpoint(updated)
 
-    async def _save_like_to_services(
+    async def _resolve_liked_page(
+        self, connector_tracks: list[Any], uow: UnitOfWorkProtocol
+    ) -> tuple[list[int], int, int]:
+        """Resolve one page of Spotify likes to internal track IDs in bulk.
+
+        Args:
+            connector_tracks: ConnectorTrack objects from one liked-tracks page
+            uow: Unit of work for repository access
+
+        Returns:
+            Tuple of (track IDs that need their likes saved, number of tracks
+            already liked in both services, number of newly ingested tracks)
+        """
+        connector_repo = uow.get_connector_repository()
+        like_repo = uow.get_like_repository()
+
+        # Deduplicate while keeping page order
+        by_spotify_id = {
+            connector_track.connector_track_id: connector_track
+            for connector_track in connector_tracks
+        }
+        existing = await connector_repo.find_tracks_by_connectors([
+            ("spotify", spotify_id) for spotify_id in by_spotify_id
+        ])
+        existing_ids = {
+            spotify_id: track.id
+            for (_, spotify_id), track in existing.items()
+            if track.id is not None
+        }
+
+        # Tracks already liked in both services need no further work
+        liked_in: dict[int, set[str]] = {}
+        for like in await like_repo.get_track_likes_batch(
+            list(existing_ids.values()), services=["spotify", "narada"]
+        ):
+            if like.is_liked:
+                liked_in.setdefault(like.track_id, set()).add(like.service)
+
+        track_ids = []
+        already_synced = 0
+        for spotify_id, track_id in existing_ids.items():
+            if liked_in.get(track_id, set()) >= {"spotify", "narada"}:
+                already_synced += 1
+                logger.debug(
+                    f"Track already synced: {by_spotify_id[spotify_id].title}"
+                )
+            else:
+                # Track exists but not properly liked, process it
+                track_ids.append(track_id)
+
+        # Ingest every unknown track in one bulk operation
+        new_tracks = [
+            connector_track
+            for spotify_id, connector_track in by_spotify_id.items()
+            if spotify_id not in existing_ids
+        ]
+        ingested = await connector_repo.ingest_external_tracks_bulk(
+            "spotify", new_tracks
+        )
+        new_track_ids = [track.id for track in ingested if track.id is not None]
+        if len(new_track_ids) < len(new_tracks):
+            logger.warning(
+                f"Could not ingest {len(new_tracks) - len(new_track_ids)} "
+                f"of {len(new_tracks)} new tracks"
+            )
+
+        return [*track_ids, *new_track_ids], already_synced, len(new_track_ids)
+
+    async def _save_likes_to_services(
         self,
-        track_id: int,
+        track_ids: list[int],
         timestamp: datetime | None = None,
         is_liked: bool = True,
         services: list[str] | None = None,
         uow: UnitOfWorkProtocol | None = None,
     ) -> None:
-        """Save like status to multiple services at once."""
+        """Save like status for many tracks with one upsert per service."""
+        if not track_ids:
+            return
+
         services = services or ["narada"]
         now = timestamp or datetime.now(UTC)
 
@@ -281,30 +310,13 @@ class ImportSpotifyLikesUseCase:
         like_repo = uow.get_like_repository()
 
         for service in services:
-            await like_repo.save_track_like(
-                track_id=track_id,
+            await like_repo.save_track_likes_batch(
+                track_ids,
                 service=service,
                 is_liked=is_liked,
                 last_synced=now,
             )
 
-    async def _is_track_already_liked(
-        self,
-        track_id: int,
-        services: list[str],
-        uow: UnitOfWorkProtocol,
-    ) -> bool:
-        """Check if track is already liked in all specified services."""
-        like_repo = uow.get_like_repository()
-        for service in services:
-            likes = await like_repo.get_track_likes(
-                track_id=track_id,
-                services=[service],
-            )
-            if not any(like.is_liked for like in likes):
-                return False
-        return True
-
 
 @define(slots=True)
 class ExportLastFmLikesUseCase:
@@ -332,110 +344,125 @@ class ExportLastFmLikesUseCase:
         batch_size: int | None = None,
         max_exports: int | None = None,
     ) -> OperationResult:
-        """Internal implementation of Last.fm likes export."""
+        """Internal implementation of Last.fm likes export.
+
+        Unsynced likes are streamed in chunks by keyset pagination on the like
+        ID. Each chunk is loved concurrently (paced by the Last.fm rate
+        limiter), then its like states and the checkpoint cursor are committed
+        together, so an interrupted export resumes after the last committed
+        chunk instead of starting over.
+        """
         # Use Last.fm specific batch size from config
-        api_batch_size = batch_size or get_config("LASTFM_API_BATCH_SIZE", 20) or 20
+        chunk_size = batch_size or get_config("LASTFM_API_BATCH_SIZE", 20) or 20
 
         # Create checkpoint for tracking
         checkpoint = await self._get_or_create_checkpoint(user_id, "lastfm", "likes", uow)
         last_sync_time = checkpoint.last_timestamp
+        after_id, run_started = _parse_export_cursor(checkpoint.cursor)
 
-        # Get likes that need exporting
-        if last_sync_time:
+        if after_id is not None:
+            logger.info(f"Resuming Last.fm export after like {after_id}")
+        elif last_sync_time:
             logger.info(f"Performing incremental export since {last_sync_time}")
-            liked_tracks = await self._get_unsynced_likes(
-                source_service="narada",
-                target_service="lastfm",
-                is_liked=True,
-                since_timestamp=last_sync_time,
-                uow=uow,
-            )
-        else:
-            liked_tracks = await self._get_unsynced_likes(
-                source_service="narada",
-                target_service="lastfm",
-                is_liked=True,
-                uow=uow,
-            )
 
-        # Calculate metrics
         like_repo = uow.get_like_repository()
-        total_liked_in_narada = len(
-            await like_repo.get_all_liked_tracks(
-                service="narada", is_liked=True
-            )
-        )
-        candidates = len(liked_tracks)
-        already_loved = total_liked_in_narada - candidates
-
-        logger.info(
-            f"Export analysis: {total_liked_in_narada} total liked tracks, "
-            f"{already_loved} already loved on Last.fm ({already_loved / total_liked_in_narada * 100:.1f}%), "
-            f"{candidates} candidates for export"
-        )
+        track_repo = uow.get_track_repository()
+        lastfm_connector = self._get_lastfm_connector(uow)
 
+        candidates = 0
         exported_count = 0
         skipped_count = 0
         error_count = 0
+        exhausted = False
 
-        # Process tracks in batches using unified batch processor
-        for i in range(0, len(liked_tracks), api_batch_size):
-            if max_exports is not None and exported_count >= max_exports:
-                logger.info(f"Reached maximum export count: {max_exports}")
-                break
-
-            batch = liked_tracks[i : i + api_batch_size]
-            batch_timestamp = datetime.now(UTC)
+        while max_exports is None or exported_count < max_exports:
+            page_limit = chunk_size
+            if max_exports is not None:
+                page_limit = min(chunk_size, max_exports - exported_count)
 
-            # Build tracks to match
-            tracks_to_match = []
-            for track_like in batch:
-                if max_exports is not None and exported_count >= max_exports:
-                    break
+            likes = await self._get_unsynced_likes(
+                source_service="narada",
+                target_service="lastfm",
+                is_liked=True,
+                since_timestamp=last_sync_time,
+                after_id=after_id,
+                limit=page_limit,
+                uow=uow,
+            )
+            if not likes:
+                exhausted = True
+                break
 
-                try:
-                    track_repo = uow.get_track_repository()
-                    tracks_dict = await track_repo.find_tracks_by_ids([track_like.track_id])
-                    track = tracks_dict.get(track_like.track_id)
-                    if track and track.artists:
-                        tracks_to_match.append(track)
-                except Exception as e:
-                    logger.exception(
-                        f"Error preparing track {track_like.track_id}: {e}"
-                    )
+            candidates += len(likes)
+            tracks_by_id = await track_repo.find_tracks_by_ids([
+                like.track_id for like in likes
+            ])
+            tracks_to_love = []
+            for like in likes:
+                track = tracks_by_id.get(like.track_id)
+                if track and track.artists:
+                    tracks_to_love.append(track)
+                else:
+                    logger.warning(f"Cannot export like for track {like.track_id}")
                     error_count += 1
 
-            if not tracks_to_match:
-                continue
-
-            # Process batch with unified processor
-            lastfm_connector = self._get_lastfm_connector(uow)
             batch_results = await self._process_batch_with_unified_processor(
-                tracks=tracks_to_match,
+                tracks=tracks_to_love,
                 connector=lastfm_connector,
                 processor_func=self._love_track_on_lastfm,
-                uow=uow,
             )
 
             # Update counters based on results
+            loved_track_ids = []
             for result in batch_results:
                 if result["status"] == "exported":
                     exported_count += 1
+                    if result["track_id"] is not None:
+                        loved_track_ids.append(result["track_id"])
                 elif result["status"] == "skipped":
                     skipped_count += 1
                 else:
                     error_count += 1
 
-            # Update checkpoint
-            await self._update_checkpoint(
-                checkpoint=checkpoint,
-                timestamp=batch_timestamp,
+            # Commit like states together with the cursor past this chunk
+            if loved_track_ids:
+                await like_repo.save_track_likes_batch(
+                    loved_track_ids, "lastfm", last_synced=datetime.now(UTC)
+                )
+            after_id = likes[-1].id
+            # The timestamp only advances once a run finishes, so a resumed
+            # run still sees every like changed since the last completed one
+            checkpoint = await self._save_export_progress(
+                checkpoint,
+                cursor=f"{after_id}@{run_started.isoformat()}",
+                timestamp=last_sync_time,
                 uow=uow,
             )
+            await uow.commit()
+
+            if len(likes) < page_limit:
+                exhausted = True
+                break
+
+        if max_exports is not None and not exhausted:
+            logger.info(f"Reached maximum export count: {max_exports}")
+        else:
+            # Finished: the next run only looks at likes changed since this one
+            # started, and starts from the first like again
+            await self._save_export_progress(
+                checkpoint, cursor=None, timestamp=run_started, uow=uow
+            )
+            await uow.commit()
+
+        total_liked_in_narada = len(
+            await like_repo.get_all_liked_tracks(service="narada", is_liked=True)
+        )
+        already_loved = max(total_liked_in_narada - candidates, 0)
 
         logger.info(
             f"Last.fm loves export completed: {exported_count} exported, "
-            f"{skipped_count} skipped out of {candidates} candidates"
+            f"{skipped_count} skipped out of {candidates} candidates "
+            f"({already_loved} of {total_liked_in_narada} liked tracks already loved)"
         )
 
         return OperationResult(
@@ -480,23 +507,22 @@ class ExportLastFmLikesUseCase:
 
         return checkpoint
 
-    async def _update_checkpoint(
+    async def _save_export_progress(
         self,
         checkpoint: SyncCheckpoint,
-        timestamp: datetime | None = None,
-        cursor: str | None = None,
-        uow: UnitOfWorkProtocol | None = None,
+        cursor: str | None,
+        timestamp: datetime | None,
+        uow: UnitOfWorkProtocol,
     ) -> SyncCheckpoint:
-        """Update the checkpoint with new timestamp and cursor."""
-        updated = checkpoint.with_update(
-            timestamp=timestamp or datetime.now(UTC),
-            cursor=cursor,
-        )
+        """Save the checkpoint with exactly this cursor and timestamp.
 
-        if uow is None:
-            raise ValueError("UnitOfWork is required for updating checkpoint")
+        Either may be None, which clears it: a finished export drops its
+        cursor, and a first export keeps no timestamp until it completes.
+        """
         checkpoint_repo = uow.get_checkpoint_repository()
-        return await checkpoint_repo.save_sync_checkpoint(updated)
+        return await checkpoint_repo.save_sync_checkpoint(
+            evolve(checkpoint, cursor=cursor, last_timestamp=timestamp)
+        )
 
     async def _get_unsynced_likes(
         self,
@@ -504,9 +530,11 @@ class ExportLastFmLikesUseCase:
         target_service: str,
         is_liked: bool = True,
         since_timestamp: datetime | None = None,
+        after_id: int | None = None,
+        limit: int | None = None,
         uow: UnitOfWorkProtocol | None = None,
     ) -> list[Any]:
-        """Get tracks that need like status syncing."""
+        """Get one keyset page of tracks that need like status syncing."""
         if uow is None:
             raise ValueError("UnitOfWork is required for getting unsynced likes")
         like_repo = uow.get_like_repository()
@@ -515,41 +543,50 @@ class ExportLastFmLikesUseCase:
             target_service=target_service,
             is_liked=is_liked,
             since_timestamp=since_timestamp,
+            after_id=after_id,
+            limit=limit,
         )
 
     async def _process_batch_with_unified_processor(
         self,
         tracks: list[Track],
         connector: Any,
-        processor_func: Callable[[Track, Any, UnitOfWorkProtocol], Coroutine[Any, Any, dict]],
-        uow: UnitOfWorkProtocol,
+        processor_func: Callable[[Track, Any], Coroutine[Any, Any, dict]],
     ) -> list[dict]:
-        """Unified batch processor that replaces duplicate processing patterns."""
-        results = []
+        """Unified batch processor that replaces duplicate processing patterns.
+
+        Tracks are processed concurrently up to LASTFM_API_CONCURRENCY; the
+        connector's rate limiter paces the API calls themselves.
+        """
+        outcomes = await gather_in_batch(
+            tracks,
+            lambda track: processor_func(track, connector),
+            connector="lastfm",
+        )
 
-        for track in tracks:
-            try:
-                result = await processor_func(track, connector, uow)
-                results.append(result)
-            except Exception as e:
-                logger.exception(f"Error processing track {track.id}: {e}")
+        results = []
+        for track, outcome in zip(tracks, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Error processing track {track.id}: {outcome}")
                 results.append({
                     "track_id": track.id,
                     "status": "error",
-                    "error": str(e),
+                    "error": str(outcome),
                 })
+            else:
+                results.append(outcome)
 
         return results
 
-    async def _love_track_on_lastfm(
-        self, track: Track, connector: Any, uow: UnitOfWorkProtocol
-    ) -> dict:
+    async def _love_track_on_lastfm(self, track: Track, connector: Any) -> dict:
         """Process a single track for Last.fm loving.
-        
+
+        Only calls the API; like states are saved per chunk by the caller so
+        concurrent loves never share the database session.
+
         Args:
             track: Track to love on Last.fm
             connector: Music service connector (expected to have love_track method)
-            uow: Unit of work for transaction management
         """
         if not track.artists:
             return {
@@ -568,13 +605,6 @@ class ExportLastFmLikesUseCase:
             )
 
             if success:
-                # Save the like status
-                if track.id is not None:
-                    await self._save_like_to_services(
-                        track_id=track.id,
-                        services=["lastfm"],
-                        uow=uow,
-                    )
                 return {
                     "track_id": track.id,
                     "status": "exported",
@@ -592,29 +622,18 @@ class ExportLastFmLikesUseCase:
                 "error": str(e),
             }
 
-    async def _save_like_to_services(
-        self,
-        track_id: int,
-        timestamp: datetime | None = None,
-        is_liked: bool = True,
-        services: list[str] | None = None,
-        uow: UnitOfWorkProtocol | None = None,
-    ) -> None:
-        """Save like status to multiple services at once."""
-        services = services or ["narada"]
-        now = timestamp or datetime.now(UTC)
 
-        if uow is None:
-            raise ValueError("UnitOfWork is required for saving likes")
-        like_repo = uow.get_like_repository()
+def _parse_export_cursor(cursor: str | None) -> tuple[int | None, datetime]:
+    """Split an export cursor into the last committed like ID and run start.
 
-        for service in services:
-            await like_repo.save_track_like(
-                track_id=track_id,
-                service=service,
-                is_liked=is_liked,
-                last_synced=now,
-            )
+    Cursors look like ``"<like_id>@<iso timestamp>"``. A missing or unreadable
+    cursor starts a fresh run from the first unsynced like.
+    """
+    like_id, _, started = (cursor or "").partition("@")
+    try:
+        return int(like_id), datetime.fromisoformat(started)
+    except ValueError:
+        return None, datetime.now(UTC)
 
 
 # Convenience functions for CLI usage - maintain backward compatibility
@@ -0,0 +1,115 @@
+"""Read-ahead iteration over cursor-paginated APIs.
+
+Lets a consumer process one page (e.g. write it to the database) while the
+next pages are already being fetched, so network and database work overlap
+instead of alternating.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import contextlib
+from typing import Self
+
+from attrs import define, field
+
+from src.config import get_logger
+
+logger = get_logger(__name__)
+
+type Page[T] = tuple[list[T], str | None]
+
+
+@define(slots=True)
+class PagePrefetcher[T]:
+    """Async iterator over pages that fetches up to ``prefetch`` pages ahead.
+
+    A background producer follows the cursor chain, calling ``fetch_page``
+    with each page's next cursor. At most ``prefetch`` fetched pages wait for
+    the consumer at any time, which bounds memory. Leaving the ``async with``
+    block, or calling ``close()``, stops prefetching, so a consumer that
+    decides it has seen enough does not pay for pages it will never use.
+
+    Each iteration yields ``(items, next_cursor)`` exactly as ``fetch_page``
+    returned it. Iteration ends after a page without a next cursor or an
+    empty page; a fetch error is raised from the iteration that would have
+    returned that page.
+
+    Example:
+        async with PagePrefetcher(fetch, prefetch=2) as pages:
+            async for items, next_cursor in pages:
+                await save(items)
+    """
+
+    fetch_page: Callable[[str | None], Awaitable[Page[T]]]
+    cursor: str | None = None
+    prefetch: int = 2
+    _queue: asyncio.Queue = field(init=False, factory=asyncio.Queue)
+    _slots: asyncio.Semaphore = field(init=False)
+    _producer: asyncio.Task | None = field(init=False, default=None)
+    _done: bool = field(init=False, default=False)
+    pages_fetched: int = field(init=False, default=0)
+
+    def __attrs_post_init__(self) -> None:
+        """Reserve one slot per page allowed to wait for the consumer."""
+        self._slots = asyncio.Semaphore(max(1, self.prefetch))
+
+    async def __aenter__(self) -> Self:
+        """Start fetching pages in the background."""
+        self._producer = asyncio.create_task(self._produce())
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        """Stop prefetching, discarding pages the consumer did not take."""
+        await self.close()
+
+    def __aiter__(self) -> Self:
+        """Return the prefetcher itself as the page iterator."""
+        return self
+
+    async def __anext__(self) -> Page[T]:
+        """Return the next fetched page, waiting for it if necessary."""
+        if self._done:
+            raise StopAsyncIteration
+        if self._producer is None:
+            raise RuntimeError("PagePrefetcher must be used with 'async with'")
+
+        page = await self._queue.get()
+        # Taking a page frees room for the producer to fetch another
+        self._slots.release()
+
+        if isinstance(page, BaseException):
+            self._done = True
+            raise page
+        if page is None:
+            self._done = True
+            raise StopAsyncIteration
+        return page
+
+    async def close(self) -> None:
+        """Cancel the producer and wait for any in-flight fetch to unwind."""
+        self._done = True
+        if self._producer is None or self._producer.done():
+            return
+
+        self._producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._producer
+        logger.debug(f"Stopped prefetching after {self.pages_fetched} pages")
+
+    async def _produce(self) -> None:
+        """Fetch pages along the cursor chain until the last page or an error."""
+        cursor = self.cursor
+        while True:
+            await self._slots.acquire()
+            try:
+                items, next_cursor = await self.fetch_page(cursor)
+            except Exception as e:
+                await self._queue.put(e)
+                return
+
+            self.pages_fetched += 1
+            await self._queue.put((items, next_cursor))
+            if not items or not next_cursor:
+                await self._queue.put(None)
+                return
+            cursor = next_cursor
@@ -0,0 +1,125 @@
+"""
+Per-node resource accounting for workflow execution.
+
+Connectors and the database layer report each API call and SQL statement
+here; the workflow executor opens a usage scope around every node and turns
+what was counted into a NodeProfile. Scopes live in a context variable, so
+work a node spawns in other asyncio tasks is attributed to that node, and
+concurrent workflows never see each other's counts.
+
+Memory is traced with tracemalloc only inside ``trace_memory()``, since
+tracing slows down allocation-heavy code considerably.
+
+Clean Architecture compliant - no external dependencies.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import time
+import tracemalloc
+
+from attrs import define, field
+
+from src.domain.entities.operations import NodeProfile
+
+
+@define(slots=True)
+class NodeUsage:
+    """Mutable counters filled in while a node runs."""
+
+    api_calls: dict[str, int] = field(factory=dict)
+    sql_statements: int = 0
+
+
+_current_usage: ContextVar[NodeUsage | None] = ContextVar("node_usage", default=None)
+_trace_memory: ContextVar[bool] = ContextVar("trace_node_memory", default=False)
+
+
+def record_api_call(service: str) -> None:
+    """Count one API call against the node currently running, if any."""
+    if (usage := _current_usage.get()) is not None:
+        usage.api_calls[service] = usage.api_calls.get(service, 0) + 1
+
+
+def record_sql_statement() -> None:
+    """Count one SQL statement against the node currently running, if any."""
+    if (usage := _current_usage.get()) is not None:
+        usage.sql_statements += 1
+
+
+@contextmanager
+def trace_memory() -> Iterator[None]:
+    """Trace peak memory of the nodes run inside this block."""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    token = _trace_memory.set(True)
+    try:
+        yield
+    finally:
+        _trace_memory.reset(token)
+        if started:
+            tracemalloc.stop()
+
+
+@define(slots=True)
+class NodeMeter:
+    """Measures one node run; call ``finish`` with its output track count."""
+
+    task_id: str
+    node_type: str
+    start_offset: float
+    tracks_in: int
+    usage: NodeUsage = field(factory=NodeUsage)
+    _wall_started: float = field(factory=time.perf_counter, init=False)
+    _cpu_started: float = field(factory=time.process_time, init=False)
+    _memory_base: int | None = field(default=None, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        """Start memory accounting from the node's current allocation."""
+        if _trace_memory.get() and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            self._memory_base = tracemalloc.get_traced_memory()[0]
+
+    def finish(self, tracks_out: int) -> NodeProfile:
+        """Freeze the measurements into a NodeProfile."""
+        peak_memory = None
+        if self._memory_base is not None and tracemalloc.is_tracing():
+            peak_memory = max(0, tracemalloc.get_traced_memory()[1] - self._memory_base)
+
+        return NodeProfile(
+            task_id=self.task_id,
+            node_type=self.node_type,
+            start_offset=self.start_offset,
+            wall_time=time.perf_counter() - self._wall_started,
+            cpu_time=time.process_time() - self._cpu_started,
+            peak_memory=peak_memory,
+            api_calls=dict(self.usage.api_calls),
+            sql_statements=self.usage.sql_statements,
+            tracks_in=self.tracks_in,
+            tracks_out=tracks_out,
+        )
+
+
+@contextmanager
+def measure_node(
+    task_id: str, node_type: str, start_offset: float, tracks_in: int
+) -> Iterator[NodeMeter]:
+    """Count the API calls and SQL statements a node makes while it runs.
+
+    Args:
+        task_id: ID of the task being run
+        node_type: Node type of the task
+        start_offset: Seconds since the workflow started
+        tracks_in: Tracks across the node's inputs
+
+    Yields:
+        Meter whose ``finish`` produces the node's profile
+    """
+    meter = NodeMeter(task_id, node_type, start_offset, tracks_in)
+    token = _current_usage.set(meter.usage)
+    try:
+        yield meter
+    finally:
+        _current_usage.reset(token)
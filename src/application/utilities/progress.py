@@ -8,6 +8,7 @@ for async operations and Rich library integration.
 Clean Architecture compliant - no external dependencies.
 """
 
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any, Protocol
 from uuid import uuid4
@@ -181,3 +182,31 @@ def create_operation(
         total_items=total_items,
         metadata=metadata,
     )
+
+
+# Live status sources (e.g. connector rate limiters) that progress displays can
+# append to descriptions; each returns a short human-readable summary
+_status_sources: dict[str, Callable[[], str]] = {}
+
+
+def register_status_source(name: str, source: Callable[[], str]) -> None:
+    """Register a live status summary, replacing any previous one of that name.
+
+    Args:
+        name: Source name, typically a connector name
+        source: Callable returning a short status string
+    """
+    _status_sources[name] = source
+
+
+def get_status_summary(name: str) -> str | None:
+    """Get the current summary for a registered status source.
+
+    Args:
+        name: Source name used at registration
+
+    Returns:
+        Status summary, or None if no such source is registered
+    """
+    source = _status_sources.get(name)
+    return source() if source else None
@@ -18,6 +18,7 @@ from .progress import (
     ProgressProvider,
     create_operation,
     get_progress_provider,
+    get_status_summary,
     set_progress_provider,
 )
 
@@ -284,18 +285,27 @@ def batch_progress_wrapper(
     *,
     operation_description: str = "Processing items",
     batch_size: int = 50,
+    max_concurrent_batches: int = 1,
     progress_provider: ProgressProvider | None = None,
+    status_source: str | None = None,
 ) -> Callable[[], Awaitable[dict[int, Any]]]:
     """Create a progress-aware batch processing wrapper.
 
     Replaces existing process_in_batches function with unified progress.
+    Up to ``max_concurrent_batches`` batches run at once, pulled from a shared
+    queue by a small worker pool so a slow batch never holds back the next
+    one. Progress counts completed items, and results are merged in batch
+    order regardless of completion order.
 
     Args:
         items: Items to process
         process_func: Async function to process batches
         operation_description: Description for progress display
         batch_size: Size of each batch
+        max_concurrent_batches: Number of batches allowed in flight at once
         progress_provider: Optional progress provider (injected dependency)
+        status_source: Optional registered status source (e.g. a connector's
+            rate limiter) whose live summary is appended to the description
 
     Returns:
         Async function that processes items with progress tracking
@@ -310,29 +320,59 @@ def batch_progress_wrapper(
         provider = progress_provider or get_progress_provider()
         operation_id = provider.start_operation(operation)
 
-        try:
-            results = {}
-            processed_items = 0
+        batches = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+        total_batches = len(batches)
+        batch_results: list[dict[int, Any] | None] = [None] * total_batches
+        pending = iter(enumerate(batches))
+        started_batches = 0
+        in_flight = 0
+        processed_items = 0
+
+        def describe() -> None:
+            description = (
+                f"{operation_description} (batch {started_batches}/{total_batches})"
+            )
+            if in_flight > 1:
+                description = f"{description}, {in_flight} in flight"
+            if status_source and (status := get_status_summary(status_source)):
+                description = f"{description} · {status}"
+            provider.set_description(operation_id, description)
+
+        async def worker() -> None:
+            nonlocal started_batches, in_flight, processed_items
+            # The event loop is single-threaded, so the shared iterator and
+            # counters need no locking between awaits
+            for index, batch in pending:
+                started_batches += 1
+                in_flight += 1
+                describe()
+                try:
+                    batch_results[index] = await process_func(batch)
+                finally:
+                    in_flight -= 1
 
-            # Process in batches
-            for i in range(0, len(items), batch_size):
-                batch = items[i : i + batch_size]
-                batch_num = (i // batch_size) + 1
-                total_batches = (len(items) + batch_size - 1) // batch_size
+                processed_items += len(batch)
+                provider.update_progress(operation_id, processed_items)
 
-                # Update progress description
-                description = (
-                    f"{operation_description} (batch {batch_num}/{total_batches})"
-                )
-                provider.set_description(operation_id, description)
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(max(1, min(max_concurrent_batches, total_batches)))
+        ]
 
-                # Process batch
-                batch_results = await process_func(batch)
-                if batch_results:
-                    results.update(batch_results)
+        try:
+            try:
+                await asyncio.gather(*workers)
+            except BaseException:
+                # Stop the remaining batches before surfacing the first error
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                raise
 
-                processed_items += len(batch)
-                provider.update_progress(operation_id, processed_items)
+            results = {}
+            for batch_result in batch_results:
+                if batch_result:
+                    results.update(batch_result)
 
             provider.complete_operation(operation_id)
             return results
@@ -4,7 +4,8 @@ This module provides lightweight batch processing functions that integrate
 with the existing progress system, extracted from the original matcher.py.
 """
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from src.application.utilities.progress_integration import batch_progress_wrapper
@@ -13,11 +14,20 @@ from src.config import get_config, get_logger
 logger = get_logger(__name__)
 
 
+def _connector_setting(connector: str | None, setting: str, default: int) -> int:
+    """Read a per-connector API setting, falling back to the global default."""
+    fallback = get_config(f"DEFAULT_API_{setting}", default) or default
+    if not connector:
+        return fallback
+    return get_config(f"{connector.upper()}_API_{setting}", fallback) or fallback
+
+
 async def process_in_batches(
     items: list[Any],
     process_func: Callable,
     *,
     batch_size: int | None = None,
+    max_concurrent_batches: int | None = None,
     operation_name: str = "batch_process",
     connector: str | None = None,
 ) -> dict[int, Any]:
@@ -25,11 +35,16 @@ async def process_in_batches(
 
     Maintains API compatibility while using the new unified progress system.
     The progress_callback parameter is now bridged to the unified system.
+    Several batches may be in flight at once; actual request pacing is left
+    to the connector's rate limiter, which is also shown in the progress
+    description.
 
     Args:
         items: List of items to process
         process_func: Function to process each batch
         batch_size: Optional batch size override
+        max_concurrent_batches: Optional override for batches in flight,
+            otherwise read from ``{CONNECTOR}_API_BATCHES_IN_FLIGHT``
         operation_name: Name for progress reporting
         connector: Connector name for batch size configuration
 
@@ -40,19 +55,53 @@ async def process_in_batches(
         logger.info(f"No items to process for {operation_name}")
         return {}
 
-    # Get appropriate batch size based on connector config
-    if connector and not batch_size:
-        config_key = f"{connector.upper()}_API_BATCH_SIZE"
-        batch_size = get_config(config_key, get_config("DEFAULT_API_BATCH_SIZE", 50))
-    elif not batch_size:
-        batch_size = get_config("DEFAULT_API_BATCH_SIZE", 50)
+    # Get appropriate batch settings based on connector config
+    batch_size = batch_size or _connector_setting(connector, "BATCH_SIZE", 50)
+    max_concurrent_batches = max_concurrent_batches or _connector_setting(
+        connector, "BATCHES_IN_FLIGHT", 1
+    )
 
     # Use unified progress system
     process_with_progress = batch_progress_wrapper(
         items=items,
         process_func=process_func,
         operation_description=operation_name,
-        batch_size=batch_size or 50,
+        batch_size=batch_size,
+        max_concurrent_batches=max_concurrent_batches,
+        status_source=connector,
     )
 
     return await process_with_progress()
+
+
+async def gather_in_batch[T, R](
+    items: list[T],
+    item_func: Callable[[T], Awaitable[R]],
+    *,
+    concurrency: int | None = None,
+    connector: str | None = None,
+) -> list[R | BaseException]:
+    """Run an async function over the items of one batch concurrently.
+
+    At most ``concurrency`` calls are in flight, read from
+    ``{CONNECTOR}_API_CONCURRENCY`` when not given. Failures are returned in
+    place of results so one bad item does not abort the rest of the batch.
+
+    Args:
+        items: Items of the batch
+        item_func: Async function applied to each item
+        concurrency: Optional override for calls in flight
+        connector: Connector name for concurrency configuration
+
+    Returns:
+        Results or exceptions, in the same order as ``items``
+    """
+    semaphore = asyncio.Semaphore(
+        concurrency or _connector_setting(connector, "CONCURRENCY", 5)
+    )
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await item_func(item)
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
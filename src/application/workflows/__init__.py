@@ -1,6 +1,7 @@
 """Workflow orchestration system with node-based transformation pipeline."""
 
 from contextlib import suppress
+from typing import TYPE_CHECKING, Any
 
 # Force eager registration of all nodes to ensure registry completeness
 # This statement is key for registry population
@@ -16,8 +17,21 @@ from .node_factories import (
 )
 from .node_registry import get_node, node, registry
 
-# Workflow execution
-from .prefect import run_workflow
+if TYPE_CHECKING:
+    from .prefect import run_workflow
+
+
+def __getattr__(name: str) -> Any:
+    """Import the Prefect engine only when its run_workflow is requested.
+
+    The local engine runs workflows without Prefect, so importing this
+    package must not pay for it.
+    """
+    if name == "run_workflow":
+        from .prefect import run_workflow
+
+        return run_workflow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def validate_registry():
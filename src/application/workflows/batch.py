@@ -0,0 +1,204 @@
+"""
+Batch runs of several workflows merged into one DAG.
+
+Workflows that run together often fetch the same playlists and enrich the
+same tracks. Merging them prefixes every task ID with the ID of its
+workflow, then eliminates common subexpressions: sources and enrichers with
+the same node type, config and inputs become a single task whose result is
+fanned out to every workflow reading it. The merged workflow runs once on
+the chosen engine, and each workflow still gets its own WorkflowResult.
+"""
+
+from collections.abc import Mapping
+import json
+
+from attrs import define
+
+from src.config import get_logger
+from src.domain.entities.operations import WorkflowResult
+
+from .execution import (
+    DEFAULT_ENGINE,
+    INPUT_CONFIG_KEYS,
+    collect_workflow_result,
+    get_workflow_runner,
+)
+from .plan import WorkflowPlan, compile_workflow
+
+logger = get_logger(__name__)
+
+# Node categories whose identical tasks are run once for the whole batch
+SHARED_NODE_PREFIXES = ("source.", "enricher.")
+
+BATCH_WORKFLOW_NAME = "workflow_batch"
+
+
+@define(frozen=True, slots=True)
+class WorkflowBatch:
+    """Several workflows merged into one plan.
+
+    Attributes:
+        plan: The merged workflow's plan
+        members: Each workflow's definition, by workflow ID, with its tasks
+            renamed to the merged tasks they run as
+    """
+
+    plan: WorkflowPlan
+    members: dict[str, dict]
+
+    @property
+    def shared_task_ids(self) -> set[str]:
+        """Merged tasks read by more than one workflow."""
+        seen: set[str] = set()
+        shared: set[str] = set()
+        for member in self.members.values():
+            task_ids = {task["id"] for task in member["tasks"]}
+            shared |= seen & task_ids
+            seen |= task_ids
+        return shared
+
+    def result_for(
+        self, workflow_id: str, context: dict, execution_time: float
+    ) -> WorkflowResult:
+        """Extract one workflow's result from the context of the batch run."""
+        member = self.members[workflow_id]
+        task_ids = {task["id"] for task in member["tasks"]}
+        task_results = {
+            task_id: context[task_id] for task_id in task_ids if task_id in context
+        }
+        task_results["released_metrics"] = context.get("released_metrics", {})
+        task_results["node_profiles"] = [
+            profile
+            for profile in context.get("node_profiles", [])
+            if profile.task_id in task_ids
+        ]
+        return collect_workflow_result(
+            member, task_results, self.plan.name, execution_time
+        )
+
+
+def _rename(task_def: dict, task_ids: dict[str, str]) -> dict:
+    """Copy of a task reading the merged tasks its inputs were renamed to."""
+    config = dict(task_def.get("config", {}))
+    for key in (*INPUT_CONFIG_KEYS, "primary_input"):
+        refs = config.get(key)
+        if isinstance(refs, str):
+            config[key] = task_ids.get(refs, refs)
+        elif isinstance(refs, list):
+            config[key] = [task_ids.get(ref, ref) for ref in refs]
+
+    renamed = {**task_def, "config": config}
+    if "upstream" in task_def:
+        renamed["upstream"] = [task_ids[i] for i in task_def["upstream"]]
+    return renamed
+
+
+def _signature(task_def: dict) -> str | None:
+    """Identity of a task that may be shared, None if it is never shared."""
+    if not task_def["type"].startswith(SHARED_NODE_PREFIXES):
+        return None
+    if "result_key" in task_def:
+        return None
+    return json.dumps(
+        [task_def["type"], task_def["config"], task_def.get("upstream", [])],
+        sort_keys=True,
+        default=str,
+    )
+
+
+def merge_workflows(
+    workflows: Mapping[str, dict | WorkflowPlan], *, streaming: bool = False
+) -> WorkflowBatch:
+    """Merge workflows into one DAG, sharing identical sources and enrichers.
+
+    Args:
+        workflows: Workflow definitions or plans by workflow ID, which
+            prefixes their task IDs and result keys in the merged DAG
+        streaming: Stream the merged run, as does any streaming workflow
+
+    Returns:
+        The merged batch
+
+    Raises:
+        ValueError: If no workflows are given, a workflow has no destination
+            or a definition is invalid
+    """
+    if not workflows:
+        raise ValueError("No workflows to run")
+
+    tasks: list[dict] = []
+    tasks_by_signature: dict[str, dict] = {}
+    members: dict[str, dict] = {}
+
+    for workflow_id, workflow in workflows.items():
+        plan = compile_workflow(workflow)
+        if not any(t["type"].startswith("destination.") for t in plan.tasks):
+            raise ValueError(f"Workflow {workflow_id} has no destination task")
+        streaming = streaming or plan.streaming
+
+        # Tasks are in execution order, so every input is renamed already
+        task_ids: dict[str, str] = {}
+        member_tasks: list[dict] = []
+        for task_def in plan.tasks:
+            renamed = _rename(task_def, task_ids)
+            renamed["id"] = f"{workflow_id}/{task_def['id']}"
+            if result_key := task_def.get("result_key"):
+                renamed["result_key"] = f"{workflow_id}/{result_key}"
+
+            signature = _signature(renamed)
+            if signature is not None and signature in tasks_by_signature:
+                renamed = tasks_by_signature[signature]
+            else:
+                tasks.append(renamed)
+                if signature is not None:
+                    tasks_by_signature[signature] = renamed
+
+            task_ids[task_def["id"]] = renamed["id"]
+            member_tasks.append(renamed)
+
+        members[workflow_id] = {
+            "name": plan.name,
+            "description": plan.description,
+            "tasks": member_tasks,
+        }
+
+    batch = WorkflowBatch(
+        plan=compile_workflow({
+            "name": BATCH_WORKFLOW_NAME,
+            "description": f"Batch of {', '.join(workflows)}",
+            "tasks": tasks,
+            "streaming": streaming,
+        }),
+        members=members,
+    )
+    logger.debug(
+        "Merged workflow batch",
+        workflows=list(workflows),
+        tasks=len(tasks),
+        shared_tasks=len(batch.shared_task_ids),
+    )
+    return batch
+
+
+async def run_workflow_batch(
+    batch: WorkflowBatch, engine: str = DEFAULT_ENGINE, **parameters
+) -> tuple[dict, dict[str, WorkflowResult]]:
+    """Run a merged batch of workflows once.
+
+    Args:
+        batch: Workflows merged by ``merge_workflows``
+        engine: Execution engine, one of ``execution.ENGINES``
+        **parameters: Dynamic parameters for workflow nodes
+
+    Returns:
+        Tuple of (execution context of the merged run, result of each
+        workflow by workflow ID)
+    """
+    run_workflow = get_workflow_runner(engine)
+    context, batch_result = await run_workflow(batch.plan, **parameters)
+
+    results = {
+        workflow_id: batch.result_for(workflow_id, context, batch_result.execution_time)
+        for workflow_id in batch.members
+    }
+    return context, results
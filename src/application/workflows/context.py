@@ -4,6 +4,7 @@ Provides concrete implementations of all workflow dependencies following
 Clean Architecture principles.
 """
 
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -11,6 +12,7 @@ from src.config import get_logger
 
 # Repository interfaces imported only where needed by use case providers
 from src.infrastructure.connectors import CONNECTORS, discover_connectors
+from src.infrastructure.connectors.connector_pool import get_connector_pool
 from src.infrastructure.persistence.database.db_connection import get_session
 
 # Repository factory functions will be imported locally where needed
@@ -67,20 +69,24 @@ class LoggerProviderImpl:
 
 
 class ConnectorRegistryImpl:
-    """Connector registry implementation using direct connector access."""
+    """Connector registry implementation backed by the shared connector pool.
+
+    All workflow nodes receive the same connector instance per service, so
+    they share HTTP sessions and a single rate limit budget.
+    """
 
     def __init__(self):
         """Initialize connector registry."""
         discover_connectors()
         self._connectors = CONNECTORS
+        self._pool = get_connector_pool()
 
     def get_connector(self, name: str):
-        """Get connector by name - direct access without provider wrapper."""
+        """Get the process-wide shared connector by name."""
         if name not in self._connectors:
             raise ValueError(f"Unknown connector: {name}")
-        
-        connector_config = self._connectors[name]
-        return connector_config["factory"]({})
+
+        return self._pool.get(name, self._connectors[name]["factory"])
 
     def list_connectors(self) -> list[str]:
         """List available connector names."""
@@ -166,6 +172,14 @@ class UseCaseProviderImpl:
         # UnitOfWork will be passed as parameter during execution
         return MatchTracksUseCase()
 
+    async def get_query_library_use_case(self):
+        """Get QueryLibraryUseCase with UnitOfWork pattern."""
+        from src.application.use_cases.query_library import QueryLibraryUseCase
+
+        # Simple instantiation - no dependencies
+        # UnitOfWork will be passed as parameter during execution
+        return QueryLibraryUseCase()
+
 
 # RepositoryProviderImpl removed - Clean Architecture: use cases handle dependency injection
 
@@ -209,6 +223,31 @@ class ConcreteWorkflowContext:
             # Execute use case with command and UnitOfWork
             return await use_case.execute(command, uow)
 
+    async def stream_use_case(
+        self, use_case_getter: Any, command: Any
+    ) -> AsyncIterator[Any]:
+        """Stream a use case's results with the UnitOfWork pattern.
+
+        The session stays open until the stream is exhausted or closed, so
+        streamed work happens in one UnitOfWork like ``execute_use_case``.
+
+        Args:
+            use_case_getter: Async function that returns a use case instance
+            command: Command object to pass to the use case's ``stream``
+
+        Yields:
+            Each item the use case streams
+        """
+        async with self.session_provider.get_session() as session:
+            from src.infrastructure.persistence.repositories.factories import (
+                get_unit_of_work,
+            )
+
+            uow = get_unit_of_work(session)
+            use_case = await use_case_getter()
+            async for item in use_case.stream(command, uow):
+                yield item
+
 
 def create_workflow_context(shared_session=None) -> WorkflowContext:
     """Create a WorkflowContext with real dependencies wired up."""
@@ -0,0 +1,550 @@
+"""
+Engine-neutral workflow execution shared by the Prefect and local engines.
+
+Both engines run the same loop: tasks in dependency order against one shared
+database session, each node receiving its upstream results in its context.
+They differ only in how a single node is executed, so the loop, progress
+events and result extraction live here and each engine supplies its own
+node runner. Engines execute compiled plans (see ``plan``), whose node
+callables are resolved once when the flow is built.
+"""
+
+from collections.abc import Awaitable, Callable
+import datetime
+from importlib import import_module
+import time
+from typing import Any, Protocol
+
+from attrs import define, field
+
+from src.application.utilities.profiling import measure_node
+from src.config import get_logger
+from src.domain.entities.operations import NodeProfile, WorkflowResult
+
+from .node_registry import NodeFn
+
+logger = get_logger(__name__)
+
+# Engines selectable per run, mapped to the module providing run_workflow
+ENGINES: dict[str, str] = {
+    "prefect": "src.application.workflows.prefect",
+    "local": "src.application.workflows.local",
+}
+DEFAULT_ENGINE = "prefect"
+
+# Retry policy applied to every node, whichever engine runs it
+NODE_RETRIES = 3
+NODE_RETRY_DELAY_SECONDS = 30
+
+type NodeRunner = Callable[[str, NodeFn, dict, dict], Awaitable[dict]]
+type WorkflowRunner = Callable[..., Awaitable[tuple[dict, WorkflowResult]]]
+
+
+class RunLogger(Protocol):
+    """Logger interface the task loop needs from an engine."""
+
+    def info(self, msg: str, /) -> Any: ...
+
+    def debug(self, msg: str, /) -> Any: ...
+
+
+def get_workflow_runner(engine: str = DEFAULT_ENGINE) -> WorkflowRunner:
+    """Resolve the run_workflow coroutine of an execution engine.
+
+    Engine modules are imported on demand, so choosing the local engine
+    never imports Prefect.
+
+    Args:
+        engine: Engine name, one of ENGINES
+
+    Returns:
+        The engine's run_workflow(workflow, **parameters), taking a
+        definition or its compiled plan
+
+    Raises:
+        ValueError: If the engine is unknown
+    """
+    if engine not in ENGINES:
+        choices = ", ".join(ENGINES)
+        raise ValueError(f"Unknown workflow engine: {engine} (choose from {choices})")
+    return import_module(ENGINES[engine]).run_workflow
+
+
+# --- Simple progress feedback for CLI ---
+
+_simple_callback: Callable | None = None
+
+
+def register_simple_progress_callback(callback: Callable) -> None:
+    """Register a simple callback for basic CLI feedback."""
+    global _simple_callback
+    _simple_callback = callback
+
+
+def _emit_simple_event(event_type: str, event_data: dict[str, Any]) -> None:
+    """Emit a simple progress event if callback is registered."""
+    if _simple_callback:
+        try:
+            _simple_callback(event_type, event_data)
+        except Exception as e:
+            logger.warning(f"Simple progress callback error: {e}")
+
+
+# --- Task ordering and execution ---
+
+
+def generate_flow_run_name(flow_name: str) -> str:
+    """Generate a dynamic flow run name with a timestamp."""
+    return (
+        f"{flow_name}-{datetime.datetime.now(datetime.UTC).strftime('%Y%m%d-%H%M%S')}"
+    )
+
+
+def _track_count(result: Any) -> int:
+    """Number of tracks in a node result, 0 for results without a tracklist."""
+    if isinstance(result, dict) and "tracklist" in result:
+        return len(result["tracklist"].tracks)
+    return 0
+
+
+def topological_sort(tasks: list[dict]) -> list[dict]:
+    """Sort tasks so every task runs after the tasks whose results it reads.
+
+    Visits tasks depth-first in definition order, so each branch runs to
+    completion before the next starts and its results can be released
+    early. Runs in time linear in the number of tasks and inputs.
+
+    Raises:
+        ValueError: If a task reads an unknown task or tasks form a cycle
+    """
+    tasks_by_id = {task["id"]: task for task in tasks}
+    # False while a task's inputs are being visited, True once it is placed
+    placed: dict[str, bool] = {}
+    result: list[dict] = []
+
+    for root in tasks:
+        if root["id"] in placed:
+            continue
+        placed[root["id"]] = False
+        stack = [(root, iter(task_inputs(root)))]
+        while stack:
+            task_def, inputs = stack[-1]
+            for input_id in inputs:
+                if input_id not in tasks_by_id:
+                    raise ValueError(
+                        f"Task {task_def['id']} reads unknown task: {input_id}"
+                    )
+                if input_id not in placed:
+                    placed[input_id] = False
+                    upstream_def = tasks_by_id[input_id]
+                    stack.append((upstream_def, iter(task_inputs(upstream_def))))
+                    break
+                if not placed[input_id]:
+                    raise ValueError(f"Workflow tasks form a cycle at: {input_id}")
+            else:
+                stack.pop()
+                placed[task_def["id"]] = True
+                result.append(task_def)
+
+    return result
+
+
+# Config keys naming other tasks whose results a node reads
+INPUT_CONFIG_KEYS = ("exclusion_source", "sources", "order")
+
+
+def primary_input(task_def: dict) -> str | None:
+    """ID of the upstream task whose tracklist a node transforms."""
+    upstream = task_def.get("upstream", [])
+    if not upstream:
+        return None
+    # First upstream is primary by convention, unless config names another
+    primary = task_def.get("config", {}).get("primary_input")
+    return primary if primary in upstream else upstream[0]
+
+
+def task_inputs(task_def: dict) -> list[str]:
+    """IDs of every task result a node reads, upstream tasks first."""
+    inputs = list(task_def.get("upstream", []))
+    config = task_def.get("config", {})
+    for key in INPUT_CONFIG_KEYS:
+        refs = config.get(key) or []
+        for ref in [refs] if isinstance(refs, str) else refs:
+            if ref not in inputs:
+                inputs.append(ref)
+    return inputs
+
+
+def count_consumers(tasks: list[dict]) -> dict[str, int]:
+    """Number of tasks reading each task's result."""
+    counts = {task["id"]: 0 for task in tasks}
+    for task_def in tasks:
+        for input_id in task_inputs(task_def):
+            if input_id in counts:
+                counts[input_id] += 1
+    return counts
+
+
+def is_retained(task_def: dict) -> bool:
+    """Whether a task's result must outlive its consumers.
+
+    Destination outputs make up the workflow result, and results stored
+    under a result key are handed back to the caller.
+    """
+    return task_def["type"].startswith("destination.") or "result_key" in task_def
+
+
+def build_task_context(context: dict, task_def: dict, results: dict) -> dict:
+    """Create a node's context: the run context plus the results it reads."""
+    task_context = context.copy()
+
+    if upstream := task_def.get("upstream"):
+        task_context["upstream_task_id"] = primary_input(task_def)
+        # Add all upstream tasks as a list for nodes that need multiple inputs
+        task_context["upstream_task_ids"] = upstream
+
+    for input_id in task_inputs(task_def):
+        if input_id in results:
+            task_context[input_id] = results[input_id]
+
+    return task_context
+
+
+@define(slots=True)
+class TaskResults:
+    """Task results, each kept only until the last task reading it has run.
+
+    Consumer counts come from the DAG: every task naming a result upstream
+    or in its config holds one read of it. Once the last read is done the
+    result is dropped, unless it is retained (see ``is_retained``); retained
+    results are also stored in the run context for the caller.
+    """
+
+    context: dict
+    tasks: dict[str, dict]
+    remaining_reads: dict[str, int]
+    results: dict[str, Any] = field(factory=dict)
+
+    @classmethod
+    def for_tasks(cls, context: dict, sorted_tasks: list[dict]) -> "TaskResults":
+        """Count the consumers of every task in a workflow."""
+        return cls(
+            context=context,
+            tasks={task["id"]: task for task in sorted_tasks},
+            remaining_reads=count_consumers(sorted_tasks),
+        )
+
+    def store(self, task_def: dict, result: Any, run_logger: RunLogger) -> None:
+        """Keep a task result until its consumers have run."""
+        task_id = task_def["id"]
+        self.results[task_id] = result
+        if is_retained(task_def):
+            self.context[task_id] = result
+            # Also store in context under node-specified result key if present
+            if result_key := task_def.get("result_key"):
+                run_logger.debug(f"Storing result under key: {result_key}")
+                self.context[result_key] = result
+        elif self.remaining_reads.get(task_id) == 0:
+            self._release(task_id)
+
+    def consumed(self, task_defs: list[dict]) -> None:
+        """Count the reads of tasks that have run, releasing finished results."""
+        for task_def in task_defs:
+            for input_id in task_inputs(task_def):
+                if input_id not in self.remaining_reads:
+                    continue
+                self.remaining_reads[input_id] -= 1
+                if (
+                    self.remaining_reads[input_id] == 0
+                    and input_id in self.results
+                    and not is_retained(self.tasks[input_id])
+                ):
+                    self._release(input_id)
+
+    def _release(self, task_id: str) -> None:
+        """Drop a result no remaining task reads.
+
+        Its tracklist's metrics are kept, so the workflow result still
+        reports every metric computed along the way.
+        """
+        logger.debug(f"Releasing result of {task_id}")
+        result = self.results.pop(task_id)
+        if isinstance(result, dict) and "tracklist" in result:
+            released = self.context.setdefault("released_metrics", {})
+            metrics = result["tracklist"].metadata.get("metrics", {})
+            for metric_name, values in metrics.items():
+                released.setdefault(metric_name, {}).update(values)
+
+
+def emit_task_started(run_logger: RunLogger, task_def: dict) -> None:
+    """Log a task start and report it to the CLI."""
+    task_id, node_type = task_def["id"], task_def["type"]
+    run_logger.info(f"Starting task: {task_id} (type: {node_type})")
+    _emit_simple_event(
+        "task_started",
+        {"task_id": task_id, "task_name": task_id, "task_type": node_type},
+    )
+
+
+def emit_task_completed(task_def: dict, result: Any) -> None:
+    """Report a task completion to the CLI."""
+    task_id = task_def["id"]
+    _emit_simple_event(
+        "task_completed",
+        {
+            "task_id": task_id,
+            "task_name": task_id,
+            "task_type": task_def["type"],
+            "result": result,
+        },
+    )
+
+
+def log_node_profile(profile: NodeProfile) -> None:
+    """Log the resources a node used."""
+    logger.debug(
+        f"Node profile: {profile.task_id}",
+        wall_ms=round(profile.wall_time * 1000, 1),
+        cpu_ms=round(profile.cpu_time * 1000, 1),
+        api_calls=profile.total_api_calls,
+        sql_statements=profile.sql_statements,
+        tracks_in=profile.tracks_in,
+        tracks_out=profile.tracks_out,
+    )
+
+
+async def run_measured_node(
+    run_node: NodeRunner,
+    node_fn: NodeFn,
+    task_def: dict,
+    task_context: dict,
+    start_offset: float,
+) -> tuple[Any, NodeProfile]:
+    """Run one node, measuring what it uses.
+
+    Args:
+        run_node: Engine-specific executor for a single node
+        node_fn: Node callable bound for the task
+        task_def: Task definition of the node
+        task_context: Context built for the node
+        start_offset: Seconds since the workflow started
+
+    Returns:
+        Tuple of (node result, node profile)
+    """
+    tracks_in = sum(
+        _track_count(task_context.get(upstream_id))
+        for upstream_id in task_def.get("upstream", [])
+    )
+    with measure_node(
+        task_def["id"], task_def["type"], start_offset, tracks_in
+    ) as meter:
+        result = await run_node(
+            task_def["type"], node_fn, task_context, task_def.get("config", {})
+        )
+        profile = meter.finish(_track_count(result))
+    return result, profile
+
+
+async def execute_workflow_tasks(
+    flow_name: str,
+    sorted_tasks: list[dict],
+    nodes: dict[str, NodeFn],
+    parameters: dict[str, Any],
+    run_node: NodeRunner,
+    run_logger: RunLogger,
+    streaming: bool = False,
+) -> dict:
+    """Run workflow tasks in order against one shared database session.
+
+    Args:
+        flow_name: Workflow name reported in progress events
+        sorted_tasks: Task definitions in execution order
+        nodes: Node callables by task ID, see ``plan.bind_nodes``
+        parameters: Dynamic parameters for workflow nodes
+        run_node: Engine-specific executor for a single node
+        run_logger: Logger for workflow and task progress
+        streaming: Pass tracks between batch nodes in bounded batches,
+            see ``streaming.run_streaming_tasks``
+
+    Returns:
+        Execution context holding the destination outputs and results
+        stored under a result key, the metrics of every released result
+        under ``released_metrics`` and the profile of each node in run
+        order under ``node_profiles``. Other results are released as soon
+        as the last task reading them has run.
+    """
+    run_logger.info("Starting workflow")
+    workflow_started = time.perf_counter()
+
+    # Emit simple workflow started event for CLI feedback
+    _emit_simple_event("workflow_started", {"workflow_name": flow_name})
+
+    # Create workflow context with all required providers
+    from src.infrastructure.persistence.database.db_connection import get_session
+
+    from .context import SharedSessionProvider, create_workflow_context
+
+    # Create a single shared session for the entire workflow execution
+    async with get_session() as shared_session:
+        # Create shared session provider that wraps the session
+        shared_session_provider = SharedSessionProvider(shared_session)
+
+        # Create workflow context with shared session
+        workflow_context = create_workflow_context(shared_session)
+
+        # Initialize execution context with shared session provider
+        context = {
+            "parameters": parameters,
+            "use_cases": workflow_context.use_cases,  # Clean Architecture: use case dependency injection
+            "connectors": workflow_context.connectors,
+            "config": workflow_context.config,
+            "logger": workflow_context.logger,
+            "session_provider": shared_session_provider,  # Use shared session
+            "shared_session": shared_session,  # Direct access for nodes that need it
+            "workflow_context": workflow_context,  # Full context for UoW execution
+        }
+        node_profiles: list[NodeProfile] = []
+        context["node_profiles"] = node_profiles
+
+        task_results = TaskResults.for_tasks(context, sorted_tasks)
+
+        if streaming:
+            from .streaming import run_streaming_tasks
+
+            await run_streaming_tasks(
+                sorted_tasks,
+                nodes,
+                task_results,
+                run_node,
+                run_logger,
+                workflow_started,
+            )
+        else:
+            # Execute tasks in dependency order
+            for task_def in sorted_tasks:
+                emit_task_started(run_logger, task_def)
+
+                # Create task-specific context with the results it reads
+                task_context = build_task_context(
+                    context, task_def, task_results.results
+                )
+
+                result, profile = await run_measured_node(
+                    run_node,
+                    nodes[task_def["id"]],
+                    task_def,
+                    task_context,
+                    time.perf_counter() - workflow_started,
+                )
+                node_profiles.append(profile)
+                log_node_profile(profile)
+
+                task_results.store(task_def, result, run_logger)
+                emit_task_completed(task_def, result)
+                task_results.consumed([task_def])
+                # Drop the loop's own references before the next node runs
+                del task_context, result
+
+        run_logger.info("Workflow completed successfully")
+
+        # Emit simple workflow completed event for CLI feedback
+        _emit_simple_event("workflow_completed", {"workflow_name": flow_name})
+
+        return context
+
+
+# --- Result extraction ---
+
+
+def collect_workflow_result(
+    workflow_def: dict,
+    task_results: dict,
+    flow_run_name: str,
+    execution_time: float,
+) -> WorkflowResult:
+    """Extract final workflow result with metrics from task results."""
+
+    # Find the destination task - it should be the last one in the workflow
+    destination_task = next(
+        (
+            t
+            for t in reversed(workflow_def.get("tasks", []))
+            if t.get("type", "").startswith("destination.")
+        ),
+        None,
+    )
+
+    if not destination_task:
+        raise ValueError("No destination task found in workflow")
+
+    destination_id = destination_task["id"]
+
+    if destination_id not in task_results:
+        raise ValueError(f"Destination task result not found: {destination_id}")
+
+    # Get the tracklist from the destination result - this is the FINAL filtered list
+    destination_result = task_results[destination_id]
+    if "tracklist" not in destination_result:
+        raise ValueError(f"Destination task has no tracklist: {destination_id}")
+
+    # Use the FINAL filtered tracks from destination
+    final_tracks = destination_result["tracklist"].tracks
+
+    # Extract all metrics from task results, starting with released ones
+    all_metrics = {
+        metric_name: values.copy()
+        for metric_name, values in task_results.get("released_metrics", {}).items()
+    }
+
+    for task_id, result in task_results.items():
+        if isinstance(result, dict) and "tracklist" in result:
+            task_metrics = result["tracklist"].metadata.get("metrics", {})
+
+            # Log metrics information for debugging
+            for metric_name, values in task_metrics.items():
+                if values:
+                    metric_keys = list(values.keys())
+                    logger.debug(
+                        f"Metrics found in {task_id}",
+                        metric_name=metric_name,
+                        key_count=len(metric_keys),
+                        key_type=str(type(metric_keys[0])) if metric_keys else "N/A",
+                        sample_values_count=sum(1 for v in values.values() if v != 0),
+                    )
+
+            # Add to all_metrics - make deep copy to ensure values are preserved
+            for metric_name, values in task_metrics.items():
+                if metric_name not in all_metrics:
+                    all_metrics[metric_name] = {}
+                # Ensure we're not losing any values during update
+                all_metrics[metric_name].update(values.copy())
+
+    # Verify final metrics
+    if "spotify_popularity" in all_metrics:
+        sp_keys = list(all_metrics["spotify_popularity"].keys())
+        logger.debug(
+            "Final spotify_popularity metrics",
+            key_count=len(sp_keys),
+            key_type=str(type(sp_keys[0])) if sp_keys else "N/A",
+            sample_keys=sp_keys[:5],
+            sample_values=[
+                all_metrics["spotify_popularity"].get(k) for k in sp_keys[:5]
+            ]
+            if sp_keys
+            else [],
+        )
+
+    logger.debug(
+        "Final extracted metrics",
+        metric_names=list(all_metrics.keys()),
+        spotify_popularity_count=len(all_metrics.get("spotify_popularity", {})),
+    )
+
+    return WorkflowResult(
+        tracks=final_tracks,
+        metrics=all_metrics,
+        operation_name=workflow_def.get("name", flow_run_name),
+        execution_time=execution_time,
+        node_profiles=list(task_results.get("node_profiles", [])),
+    )
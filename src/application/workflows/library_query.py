@@ -0,0 +1,328 @@
+"""Push workflow filter, sorter and limit nodes into library queries.
+
+A ``source.library_query`` node selects tracks from the local library. Left
+alone it would load every stored track and leave downstream nodes to filter,
+sort and cut the list in Python. Before a workflow runs, the planner instead
+folds the chain of nodes directly after the source into the source itself,
+for as long as each node has a database equivalent:
+
+- ``filter.deduplicate``, ``filter.by_release_date``, ``filter.by_metric``,
+  ``filter.by_play_history``
+- ``sorter.by_metric``, ``sorter.by_release_date``, ``sorter.by_metrics``
+- ``selector.limit_tracks`` with the ``first`` method
+
+Folded nodes are kept in the source config under ``pushdown`` and compiled
+to a LibraryQuery when the source runs, so relative dates are taken at run
+time. The fused source takes over the ID of the last node it absorbed, so
+every reference to that node keeps working. A chain stops at the first node
+that cannot be compiled, that reads from another node as well, or whose
+input is also used elsewhere in the workflow.
+"""
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from src.config import get_logger
+from src.domain.entities import LibraryQuery, ValueBound
+from src.domain.entities.library_query import TRACK_ATTRIBUTES
+
+logger = get_logger(__name__)
+
+LIBRARY_SOURCE = "source.library_query"
+
+type _Compiler = Callable[[LibraryQuery, dict, datetime], LibraryQuery | None]
+
+
+def _deduplicate(query: LibraryQuery, _cfg: dict, _now: datetime) -> LibraryQuery:
+    # Library rows are distinct tracks already
+    return query
+
+
+def _release_date(query: LibraryQuery, cfg: dict, now: datetime) -> LibraryQuery:
+    min_age_days = cfg.get("min_age_days")
+    max_age_days = cfg.get("max_age_days")
+    # Ages are whole days: older than max_age_days means released on or
+    # before max_age_days + 1 days ago. Tracks without a date never pass.
+    return query.where(
+        ValueBound(
+            "release_date",
+            min_value=now - timedelta(days=max_age_days + 1)
+            if max_age_days is not None
+            else None,
+            max_value=now - timedelta(days=min_age_days)
+            if min_age_days is not None
+            else None,
+            min_inclusive=False,
+        )
+    )
+
+
+def _metric(query: LibraryQuery, cfg: dict, _now: datetime) -> LibraryQuery | None:
+    name = cfg["metric_name"]
+    # Metric filters only see metrics, never a track's own attributes
+    if name in TRACK_ATTRIBUTES or not _available(query, name):
+        return None
+    return query.where(
+        ValueBound(
+            name,
+            min_value=cfg.get("min_value"),
+            max_value=cfg.get("max_value"),
+            include_missing=cfg.get("include_missing", False),
+        )
+    )
+
+
+def _play_history(query: LibraryQuery, cfg: dict, now: datetime) -> LibraryQuery | None:
+    after_date = cfg.get("after_date")
+    before_date = cfg.get("before_date")
+    if not all(
+        value is None or isinstance(value, datetime)
+        for value in (after_date, before_date)
+    ):
+        return None
+
+    days_back = cfg.get("days_back")
+    days_forward = cfg.get("days_forward")
+    if days_back is not None:
+        after_date = now - timedelta(days=days_back)
+    if days_forward is not None:
+        before_date = now + timedelta(days=days_forward)
+
+    min_plays = cfg.get("min_plays")
+    max_plays = cfg.get("max_plays")
+    if (
+        min_plays is None
+        and max_plays is None
+        and after_date is None
+        and before_date is None
+    ):
+        # The node itself reports the missing constraint
+        return None
+
+    if min_plays is not None or max_plays is not None:
+        query = query.where(ValueBound("total_plays", min_plays, max_plays))
+    if after_date is not None or before_date is not None:
+        query = query.where(
+            ValueBound(
+                "last_played_dates",
+                min_value=after_date,
+                max_value=before_date,
+                max_inclusive=False,
+                include_missing=cfg.get("include_missing", False),
+            )
+        )
+    return query
+
+
+def _sort(keys: list[tuple[str, bool]], query: LibraryQuery) -> LibraryQuery | None:
+    if not keys or not all(name and _available(query, name) for name, _ in keys):
+        return None
+    return query.order_by(keys)
+
+
+def _sort_by_metric(
+    query: LibraryQuery, cfg: dict, _now: datetime
+) -> LibraryQuery | None:
+    return _sort([(cfg.get("metric_name"), cfg.get("reverse", True))], query)
+
+
+def _sort_by_release_date(
+    query: LibraryQuery, cfg: dict, _now: datetime
+) -> LibraryQuery | None:
+    return _sort([("release_date", cfg.get("reverse", False))], query)
+
+
+def _sort_by_metrics(
+    query: LibraryQuery, cfg: dict, _now: datetime
+) -> LibraryQuery | None:
+    keys = [
+        (key["metric_name"], key.get("reverse", True)) for key in cfg.get("keys", [])
+    ]
+    return _sort(keys, query)
+
+
+def _limit(query: LibraryQuery, cfg: dict, _now: datetime) -> LibraryQuery | None:
+    count = cfg.get("count", 10)
+    # Only "first" keeps a prefix; negative counts drop from the end
+    if cfg.get("method", "first") != "first" or not isinstance(count, int) or count < 0:
+        return None
+    return query.take(count)
+
+
+def _available(query: LibraryQuery, name: str) -> bool:
+    """Whether the query can compute a value, period plays needing a period."""
+    return name != "period_plays" or query.has_period
+
+
+_COMPILERS: dict[str, _Compiler] = {
+    "filter.deduplicate": _deduplicate,
+    "filter.by_release_date": _release_date,
+    "filter.by_metric": _metric,
+    "filter.by_play_history": _play_history,
+    "sorter.by_metric": _sort_by_metric,
+    "sorter.by_release_date": _sort_by_release_date,
+    "sorter.by_metrics": _sort_by_metrics,
+    "selector.limit_tracks": _limit,
+}
+
+
+def compile_step(
+    query: LibraryQuery, node_type: str, config: dict, now: datetime | None = None
+) -> LibraryQuery | None:
+    """Fold one workflow node into a library query.
+
+    Args:
+        query: Query for the nodes folded so far
+        node_type: Type of the node to fold
+        config: The node's config
+        now: Reference time for relative dates, defaults to now
+
+    Returns:
+        The extended query, or None when the node cannot run in the database
+    """
+    compiler = _COMPILERS.get(node_type)
+    if compiler is None:
+        return None
+    # Anything after a limit works on the limited tracks, except a tighter limit
+    if query.limit is not None and node_type != "selector.limit_tracks":
+        return None
+    try:
+        return compiler(query, config, now or datetime.now(UTC))
+    except (KeyError, TypeError, ValueError):
+        # Leave malformed configs to the node, which reports them as before
+        return None
+
+
+def compile_library_query(config: dict, now: datetime | None = None) -> LibraryQuery:
+    """Build the query for a ``source.library_query`` config.
+
+    Args:
+        config: Source config with optional ``period_days``, the window counted
+            by the ``period_plays`` metric, and the ``pushdown`` nodes
+        now: Reference time for relative dates, defaults to now
+
+    Returns:
+        Query applying every pushed-down node in order
+
+    Raises:
+        ValueError: If a pushed-down node cannot run in the database
+    """
+    now = now or datetime.now(UTC)
+    period_days = config.get("period_days")
+    query = (
+        LibraryQuery(period_start=now - timedelta(days=period_days), period_end=now)
+        if period_days
+        else LibraryQuery()
+    )
+
+    for step in config.get("pushdown", []):
+        compiled = compile_step(query, step["type"], step.get("config", {}), now)
+        if compiled is None:
+            raise ValueError(
+                f"Node {step['type']} cannot be pushed into a library query"
+            )
+        query = compiled
+    return query
+
+
+def _config_references(value: Any) -> set[str]:
+    """Every string inside a task config, any of which may name another task."""
+    if isinstance(value, str):
+        return {value}
+    if isinstance(value, dict):
+        return set().union(*(_config_references(v) for v in value.values()))
+    if isinstance(value, list | tuple):
+        return set().union(*(_config_references(v) for v in value))
+    return set()
+
+
+def push_down_library_queries(workflow_def: dict) -> dict:
+    """Fold the nodes after each library source into the source's query.
+
+    Args:
+        workflow_def: Workflow definition; it is not modified
+
+    Returns:
+        Workflow definition with fused library sources, or the original
+        definition when nothing could be pushed down
+    """
+    tasks = workflow_def.get("tasks", [])
+    if not any(task.get("type") == LIBRARY_SOURCE for task in tasks):
+        return workflow_def
+
+    by_id = {task["id"]: task for task in tasks}
+    consumers: dict[str, list[str]] = {task["id"]: [] for task in tasks}
+    for task in tasks:
+        for upstream_id in task.get("upstream", []):
+            consumers.setdefault(upstream_id, []).append(task["id"])
+    referenced = set().union(*(_config_references(t.get("config", {})) for t in tasks))
+
+    now = datetime.now(UTC)
+    absorbed: set[str] = set()
+    replacements: dict[str, dict] = {}
+
+    for source in tasks:
+        if source.get("type") != LIBRARY_SOURCE:
+            continue
+
+        source_config = source.get("config", {})
+        query = compile_library_query(source_config, now)
+        pushdown = list(source_config.get("pushdown", []))
+        tail = source
+        chain = []
+
+        while True:
+            # The tail's output must only feed the next node
+            next_ids = consumers.get(tail["id"], [])
+            if len(next_ids) != 1 or tail.get("result_key") or tail["id"] in referenced:
+                break
+            candidate = by_id[next_ids[0]]
+            if candidate.get("upstream") != [tail["id"]]:
+                break
+            compiled = compile_step(
+                query, candidate["type"], candidate.get("config", {}), now
+            )
+            if compiled is None:
+                break
+
+            query = compiled
+            pushdown.append({
+                "type": candidate["type"],
+                "config": candidate.get("config", {}),
+            })
+            chain.append(candidate["id"])
+            tail = candidate
+
+        if not chain:
+            continue
+
+        fused = {
+            **source,
+            "id": tail["id"],
+            "config": {**source_config, "pushdown": pushdown},
+            "upstream": [],
+        }
+        if tail.get("result_key"):
+            fused["result_key"] = tail["result_key"]
+        else:
+            fused.pop("result_key", None)
+
+        replacements[source["id"]] = fused
+        absorbed.update(chain)
+        logger.info(
+            "Pushed workflow nodes into library query",
+            source=source["id"],
+            task_id=tail["id"],
+            pushed=chain,
+        )
+
+    if not replacements:
+        return workflow_def
+
+    fused_tasks = [
+        replacements.get(task["id"], task)
+        for task in tasks
+        if task["id"] not in absorbed
+    ]
+    return {**workflow_def, "tasks": fused_tasks}
@@ -12,7 +12,7 @@ from .node_factories import (
     make_node,
 )
 from .node_registry import node
-from .source_nodes import spotify_playlist_source
+from .source_nodes import library_query_source, spotify_playlist_source
 
 # === SOURCE NODES ===
 node(
@@ -21,6 +21,12 @@ node(
     output_type="tracklist",
 )(spotify_playlist_source)
 
+node(
+    "source.library_query",
+    description="Selects tracks from the local library, filtering in the database",
+    output_type="tracklist",
+)(library_query_source)
+
 # === ENRICHER NODES ===
 # LastFm enricher
 node(
@@ -107,6 +113,20 @@ node(
     output_type="tracklist",
 )(make_node("sorter", "by_metric"))
 
+node(
+    "sorter.by_release_date",
+    description="Sorts tracks by release date, oldest first by default",
+    input_type="tracklist",
+    output_type="tracklist",
+)(make_node("sorter", "by_release_date"))
+
+node(
+    "sorter.by_metrics",
+    description="Sorts tracks by several metrics, later ones breaking ties",
+    input_type="tracklist",
+    output_type="tracklist",
+)(make_node("sorter", "by_metrics"))
+
 # === SELECTOR NODES ===
 node(
     "selector.limit_tracks",
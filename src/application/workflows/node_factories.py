@@ -18,7 +18,7 @@ from src.domain.entities.track import TrackList
 from .destination_nodes import DESTINATION_HANDLERS
 from .node_context import NodeContext
 from .protocols import WorkflowContext
-from .transform_registry import TRANSFORM_REGISTRY
+from .transform_registry import CONTEXT_STRATEGIES, TRANSFORM_REGISTRY
 
 # Type definitions
 type NodeFn = Callable[[dict, dict], Awaitable[dict]]
@@ -79,11 +79,20 @@ def create_destination_node(destination_type: str) -> NodeFn:
 
 # === SHARED NODE IMPLEMENTATION ===
 
-def _create_transform_node_impl(category: str, node_type: str, operation_name: str | None = None) -> NodeFn:
+def _create_transform_node_impl(
+    category: str,
+    node_type: str,
+    operation_name: str | None = None,
+    bound_transform: Callable[[TrackList], TrackList] | None = None,
+) -> NodeFn:
     """
     Shared implementation for creating transform nodes from registry.
     
     This eliminates duplication between WorkflowNodeFactory.make_node and make_node.
+
+    Nodes whose strategy depends on its config alone get a ``bind(config)``
+    attribute returning the same node with the strategy built in advance,
+    which workflow plans use so the strategy is not rebuilt on every run.
     """
     if category not in TRANSFORM_REGISTRY:
         raise ValueError(f"Unknown node category: {category}")
@@ -132,7 +141,7 @@ def _create_transform_node_impl(category: str, node_type: str, operation_name: s
                 tracklist = ctx.extract_tracklist()
 
                 # Create and apply the transformation
-                transform = transform_factory(ctx, config)
+                transform = bound_transform or transform_factory(ctx, config)
                 result = transform(tracklist)
 
                 return {
@@ -145,6 +154,18 @@ def _create_transform_node_impl(category: str, node_type: str, operation_name: s
                 logger.error(f"Error in node {operation}: {e}")
                 raise
 
+    if (category, node_type) not in CONTEXT_STRATEGIES:
+
+        def bind(config: dict) -> NodeFn:
+            return _create_transform_node_impl(
+                category,
+                node_type,
+                operation_name,
+                bound_transform=transform_factory(None, config),
+            )
+
+        node_impl.bind = bind  # type: ignore[attr-defined]
+
     return node_impl
 
 
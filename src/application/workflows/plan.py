@@ -0,0 +1,283 @@
+"""
+Compiled execution plans for workflow definitions.
+
+Compiling a definition validates its DAG once, folds nodes into library
+queries, fixes the execution order and groups tasks into parallel levels.
+Plans are cached by the content hash of their definition, in memory and as
+JSON files in the data directory, so repeated CLI runs and scheduled jobs
+skip parsing and validating definitions that have not changed. Cached files
+also record a fingerprint of the workflow package's code and the registered
+node types, and are recompiled when either has changed since.
+
+Node callables cannot be cached on disk, so they are resolved by
+``bind_nodes`` when a flow is built from a plan, once per flow instead of
+once per node execution. Transform nodes whose strategy depends on its
+config alone are bound with that strategy already built.
+"""
+
+from functools import cache
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from attrs import define, evolve, field
+
+from src.config import get_logger, settings
+
+from .execution import task_inputs, topological_sort
+from .library_query import push_down_library_queries
+from .node_registry import NodeFn, get_node, list_nodes
+
+logger = get_logger(__name__)
+
+_plans: dict[str, "WorkflowPlan"] = {}
+
+
+@define(frozen=True, slots=True)
+class WorkflowPlan:
+    """A validated workflow definition, ready to execute.
+
+    Attributes:
+        name: Workflow name
+        description: Workflow description
+        content_hash: SHA-256 of the definition the plan was compiled from
+        tasks: Task definitions in execution order, library queries folded
+        levels: Task IDs grouped by dependency depth; tasks in a level only
+            read results of earlier levels
+        streaming: Whether to run in bounded track batches
+    """
+
+    name: str
+    description: str
+    content_hash: str
+    tasks: list[dict] = field(factory=list)
+    levels: list[list[str]] = field(factory=list)
+    streaming: bool = False
+
+    @property
+    def definition(self) -> dict[str, Any]:
+        """The plan as a workflow definition, for result extraction."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "tasks": self.tasks,
+            "streaming": self.streaming,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the plan for the plan cache."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "content_hash": self.content_hash,
+            "tasks": self.tasks,
+            "levels": self.levels,
+            "streaming": self.streaming,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "WorkflowPlan":
+        """Load a plan serialized with ``to_dict``."""
+        return cls(
+            name=data["name"],
+            description=data["description"],
+            content_hash=data["content_hash"],
+            tasks=data["tasks"],
+            levels=data["levels"],
+            streaming=data["streaming"],
+        )
+
+
+def _validate(workflow_def: dict) -> None:
+    """Check a definition describes a DAG of registered nodes.
+
+    Raises:
+        ValueError: If a task is malformed, duplicated, of an unknown node
+            type or reads a task that does not exist
+    """
+    tasks = workflow_def.get("tasks")
+    if not isinstance(tasks, list):
+        raise ValueError("Workflow definition has no task list")
+
+    task_ids: set[str] = set()
+    for task_def in tasks:
+        if not isinstance(task_def, dict) or not {"id", "type"} <= task_def.keys():
+            raise ValueError(f"Workflow task needs an id and a type: {task_def}")
+        if task_def["id"] in task_ids:
+            raise ValueError(f"Duplicate workflow task ID: {task_def['id']}")
+        task_ids.add(task_def["id"])
+        try:
+            get_node(task_def["type"])
+        except KeyError as e:
+            raise ValueError(
+                f"Unknown node type for task {task_def['id']}: {task_def['type']}"
+            ) from e
+
+    for task_def in tasks:
+        unknown = [i for i in task_inputs(task_def) if i not in task_ids]
+        if unknown:
+            raise ValueError(
+                f"Task {task_def['id']} reads unknown tasks: {', '.join(unknown)}"
+            )
+
+
+def _levels(sorted_tasks: list[dict]) -> list[list[str]]:
+    """Group tasks by dependency depth, keeping execution order within levels."""
+    depth: dict[str, int] = {}
+    levels: list[list[str]] = []
+    for task_def in sorted_tasks:
+        inputs = task_inputs(task_def)
+        level = 1 + max((depth[i] for i in inputs), default=-1)
+        depth[task_def["id"]] = level
+        if level == len(levels):
+            levels.append([])
+        levels[level].append(task_def["id"])
+    return levels
+
+
+def _compile(workflow_def: dict, content_hash: str) -> WorkflowPlan:
+    """Validate a definition and compile it into a plan."""
+    _validate(workflow_def)
+    # Fold filters, sorts and limits after library sources into their queries
+    folded = push_down_library_queries(workflow_def)
+    sorted_tasks = topological_sort(folded.get("tasks", []))
+    return WorkflowPlan(
+        name=workflow_def.get("name", "unnamed_workflow"),
+        description=workflow_def.get("description", ""),
+        content_hash=content_hash,
+        tasks=sorted_tasks,
+        levels=_levels(sorted_tasks),
+        streaming=workflow_def.get("streaming", False),
+    )
+
+
+def compile_workflow(workflow: "dict | WorkflowPlan") -> WorkflowPlan:
+    """Compile a workflow definition, reusing the plan of an identical one.
+
+    Args:
+        workflow: Workflow definition, or an already compiled plan
+
+    Returns:
+        The definition's execution plan
+
+    Raises:
+        ValueError: If the definition is invalid
+    """
+    if isinstance(workflow, WorkflowPlan):
+        return workflow
+
+    canonical = json.dumps(workflow, sort_keys=True, separators=(",", ":"))
+    content_hash = hashlib.sha256(canonical.encode()).hexdigest()
+    if (plan := _plans.get(content_hash)) is None:
+        plan = _plans[content_hash] = _compile(workflow, content_hash)
+    return plan
+
+
+def plan_cache_dir() -> Path:
+    """Directory of cached plans under the configured data directory."""
+    return settings.data_dir / "cache" / "workflow_plans"
+
+
+@cache
+def _code_fingerprint() -> str:
+    """Hash of the workflow package's source, which compilation depends on."""
+    digest = hashlib.sha256()
+    for module in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(module.name.encode())
+        digest.update(module.read_bytes())
+    return digest.hexdigest()
+
+
+def _plan_fingerprint() -> str:
+    """Fingerprint of the code and node registry a cached plan was built with."""
+    node_types = json.dumps(sorted(list_nodes()))
+    return hashlib.sha256(f"{_code_fingerprint()}:{node_types}".encode()).hexdigest()
+
+
+def load_workflow_plan(path: Path, *, cache_dir: Path | None = None) -> WorkflowPlan:
+    """Load the plan of a workflow definition file, compiling it if needed.
+
+    Args:
+        path: Workflow definition JSON file
+        cache_dir: Directory of cached plans, defaults to ``plan_cache_dir()``
+
+    Returns:
+        The definition's execution plan
+
+    Raises:
+        ValueError: If the definition is invalid
+    """
+    content = path.read_bytes()
+    content_hash = hashlib.sha256(content).hexdigest()
+    if (plan := _plans.get(content_hash)) is not None:
+        return plan
+
+    cache_file = (cache_dir or plan_cache_dir()) / f"{content_hash}.json"
+    fingerprint = _plan_fingerprint()
+    plan = _read_cached_plan(cache_file, content_hash, fingerprint)
+    if plan is None:
+        plan = _compile(json.loads(content), content_hash)
+        logger.debug(f"Compiled workflow plan: {path.name}", tasks=len(plan.tasks))
+        _write_cached_plan(cache_file, plan, fingerprint)
+
+    _plans[content_hash] = plan
+    return plan
+
+
+def bind_nodes(plan: WorkflowPlan) -> dict[str, NodeFn]:
+    """Resolve the node callable of every task in a plan.
+
+    Returns:
+        Node callables by task ID, with strategies that depend on their
+        config alone already built
+    """
+    nodes: dict[str, NodeFn] = {}
+    for task_def in plan.tasks:
+        node_fn, _ = get_node(task_def["type"])
+        if bind := getattr(node_fn, "bind", None):
+            node_fn = bind(task_def.get("config", {}))
+        nodes[task_def["id"]] = node_fn
+    return nodes
+
+
+def with_streaming(plan: WorkflowPlan, streaming: bool = True) -> WorkflowPlan:
+    """Copy of a plan running in, or out of, streaming mode."""
+    return evolve(plan, streaming=streaming)
+
+
+def _read_cached_plan(
+    cache_file: Path, content_hash: str, fingerprint: str
+) -> WorkflowPlan | None:
+    """Cached plan for a definition, or None when missing, stale or unusable."""
+    try:
+        data = json.loads(cache_file.read_text())
+        if data.get("fingerprint") != fingerprint:
+            return None
+        plan = WorkflowPlan.from_dict(data)
+    except (OSError, ValueError, KeyError, AttributeError):
+        return None
+    return plan if plan.content_hash == content_hash else None
+
+
+def _write_cached_plan(cache_file: Path, plan: WorkflowPlan, fingerprint: str) -> None:
+    """Atomically write a plan to the cache; the cache is best-effort only.
+
+    Plans holding values JSON cannot represent exactly are kept in memory
+    only, rather than read back as different values.
+    """
+    data = {"fingerprint": fingerprint, **plan.to_dict()}
+    try:
+        payload = json.dumps(data, allow_nan=False)
+    except (TypeError, ValueError):
+        return
+    if json.loads(payload) != data:
+        return
+    tmp_path = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(payload)
+        tmp_path.replace(cache_file)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
@@ -6,7 +6,6 @@ and Prefect's execution engine, enabling declarative workflows to be
 executed with enterprise-grade reliability.
 """
 
-from collections.abc import Callable
 import datetime
 from typing import TYPE_CHECKING, Any, NotRequired, TypedDict
 
@@ -22,31 +21,19 @@ from prefect.logging import get_run_logger
 from src.config import get_logger
 from src.domain.entities.operations import WorkflowResult
 
-from .node_registry import get_node
+from .execution import (
+    NODE_RETRIES,
+    NODE_RETRY_DELAY_SECONDS,
+    collect_workflow_result,
+    execute_workflow_tasks,
+    generate_flow_run_name,
+)
+from .node_registry import NodeFn
+from .plan import WorkflowPlan, bind_nodes, compile_workflow
 
 logger = get_logger(__name__)
 
 
-# --- Simple progress feedback for CLI ---
-
-_simple_callback: Callable | None = None
-
-
-def register_simple_progress_callback(callback: Callable) -> None:
-    """Register a simple callback for basic CLI feedback."""
-    global _simple_callback
-    _simple_callback = callback
-
-
-def _emit_simple_event(event_type: str, event_data: dict[str, Any]) -> None:
-    """Emit a simple progress event if callback is registered."""
-    if _simple_callback:
-        try:
-            _simple_callback(event_type, event_data)
-        except Exception as e:
-            logger.warning(f"Simple progress callback error: {e}")
-
-
 # --- Node execution ---
 
 
@@ -75,12 +62,14 @@ class TaskResult(TypedDict):
 
 
 @task(
-    retries=3,
-    retry_delay_seconds=30,
+    retries=NODE_RETRIES,
+    retry_delay_seconds=NODE_RETRY_DELAY_SECONDS,
     tags=["node"],
     cache_policy=NONE,  # Disable caching due to non-serializable context objects
 )
-async def execute_node(node_type: str, context: dict, config: dict) -> dict:
+async def execute_node(
+    node_type: str, node_func: NodeFn, context: dict, config: dict
+) -> dict:
     """Execute a single workflow node as a Prefect task."""
     # Use Prefect's run logger to get task context
     task_logger = get_run_logger()
@@ -88,9 +77,6 @@ async def execute_node(node_type: str, context: dict, config: dict) -> dict:
     # Log node execution
     task_logger.info(f"Executing node: {node_type}")
 
-    # Get node implementation
-    node_func, _ = get_node(node_type)
-
     # Create progress artifact for potentially long-running operations
     progress_artifact_id: UUID | None = None
     if _should_show_progress_for_node(node_type):
@@ -134,157 +120,34 @@ async def execute_node(node_type: str, context: dict, config: dict) -> dict:
 # --- Flow building ---
 
 
-def generate_flow_run_name(flow_name: str) -> str:
-    """Generate a dynamic flow run name with a timestamp."""
-    return (
-        f"{flow_name}-{datetime.datetime.now(datetime.UTC).strftime('%Y%m%d-%H%M%S')}"
-    )
-
-
-def build_flow(workflow_def: dict) -> Any:
-    """Build an executable Prefect flow from a workflow definition."""
-
-    # Extract workflow metadata
-    flow_name = workflow_def.get("name", "unnamed_workflow")
-    flow_description = workflow_def.get("description", "")
-    tasks = workflow_def.get("tasks", [])
-
-    # Create a topological sort of tasks based on dependencies
-    def topological_sort(tasks):
-        """Sort tasks to ensure dependencies execute first."""
-        # Create a dependency graph
-        graph = {task["id"]: task.get("upstream", []) for task in tasks}
-
-        # Find execution order
-        visited = set()
-        result = []
-
-        def visit(node_id):
-            if node_id in visited:
-                return
-            visited.add(node_id)
-            for dep in graph[node_id]:
-                visit(dep)
-            result.append(next(t for t in tasks if t["id"] == node_id))
+def build_flow(workflow: dict | WorkflowPlan) -> Any:
+    """Build an executable Prefect flow from a workflow definition or plan."""
 
-        for task_id in graph:
-            visit(task_id)
-
-        return result
-
-    # Sort tasks in execution order
-    sorted_tasks = topological_sort(tasks)
+    # Validated, sorted tasks with library queries folded, and their nodes
+    plan = compile_workflow(workflow)
+    flow_name = plan.name
+    sorted_tasks = plan.tasks
+    nodes = bind_nodes(plan)
+    streaming = plan.streaming
 
     @flow(
         name=flow_name,
-        description=flow_description,
+        description=plan.description,
         flow_run_name=generate_flow_run_name(flow_name),
     )
     async def workflow_flow(**parameters):
         """Dynamically generated Prefect flow from workflow definition."""
-        # Use Prefect's run logger to get flow context
-        flow_logger = get_run_logger()
-        flow_logger.info("Starting workflow")
-
-        # Emit simple workflow started event for CLI feedback
-        _emit_simple_event("workflow_started", {"workflow_name": flow_name})
-
-        # Create workflow context with all required providers
-        from src.infrastructure.persistence.database.db_connection import get_session
-
-        from .context import SharedSessionProvider, create_workflow_context
-
-        # Create a single shared session for the entire workflow execution
-        async with get_session() as shared_session:
-            # Create shared session provider that wraps the session
-            shared_session_provider = SharedSessionProvider(shared_session)
-
-            # Create workflow context with shared session
-            workflow_context = create_workflow_context(shared_session)
-
-            # Initialize execution context with shared session provider
-            context = {
-                "parameters": parameters,
-                "use_cases": workflow_context.use_cases,  # Clean Architecture: use case dependency injection
-                "connectors": workflow_context.connectors,
-                "config": workflow_context.config,
-                "logger": workflow_context.logger,
-                "session_provider": shared_session_provider,  # Use shared session
-                "shared_session": shared_session,  # Direct access for nodes that need it
-                "workflow_context": workflow_context,  # Full context for UoW execution
-            }
-            task_results = {}
-
-            # Execute tasks in dependency order
-            for task_def in sorted_tasks:
-                task_id = task_def["id"]
-                node_type = task_def["type"]
-
-                # Log the task start
-                flow_logger.info(f"Starting task: {task_id} (type: {node_type})")
-
-                # Emit simple task started event for CLI feedback
-                _emit_simple_event(
-                    "task_started",
-                    {"task_id": task_id, "task_name": task_id, "task_type": node_type},
-                )
-
-                # Resolve configuration with current context
-                config = task_def.get("config", {})
-
-                # Create task-specific context with upstream results
-                task_context = context.copy()
-
-                if task_def.get("upstream"):
-                    if len(task_def["upstream"]) == 1:
-                        # Single upstream case
-                        task_context["upstream_task_id"] = task_def["upstream"][0]
-                    else:
-                        # Multiple upstream case - first one is primary by convention
-                        # (unless config specifies a primary_input)
-                        primary_input = config.get("primary_input")
-                        if primary_input and primary_input in task_def["upstream"]:
-                            task_context["upstream_task_id"] = primary_input
-                        else:
-                            task_context["upstream_task_id"] = task_def["upstream"][0]
-
-                    # Add all upstream tasks as a list for nodes that need multiple inputs
-                    task_context["upstream_task_ids"] = task_def["upstream"]
-
-                    # Copy upstream task results into context
-                    for upstream_id in task_def["upstream"]:
-                        if upstream_id in task_results:
-                            task_context[upstream_id] = task_results[upstream_id]
-
-                # Execute node with Prefect's native progress tracking
-                result = await execute_node(node_type, task_context, config)
-
-                # Store result in context and task_results
-                context[task_id] = result
-                task_results[task_id] = result
-
-                # Also store in context under node-specified result key if present
-                if result_key := task_def.get("result_key"):
-                    flow_logger.debug(f"Storing result under key: {result_key}")
-                    context[result_key] = result
-
-                # Emit simple task completed event for CLI feedback
-                _emit_simple_event(
-                    "task_completed",
-                    {
-                        "task_id": task_id,
-                        "task_name": task_id,
-                        "task_type": node_type,
-                        "result": result,
-                    },
-                )
-
-            flow_logger.info("Workflow completed successfully")
-
-            # Emit simple workflow completed event for CLI feedback
-            _emit_simple_event("workflow_completed", {"workflow_name": flow_name})
-
-            return context
+        # Use Prefect's run logger to get flow context; each node runs as a
+        # Prefect task with native retries and progress tracking
+        return await execute_workflow_tasks(
+            flow_name,
+            sorted_tasks,
+            nodes,
+            parameters,
+            execute_node,
+            get_run_logger(),
+            streaming=streaming,
+        )
 
     # Return the decorated flow function
     return workflow_flow
@@ -305,97 +168,22 @@ async def extract_workflow_result(  # noqa: RUF029
     execution_time: float,
 ) -> WorkflowResult:
     """Extract final workflow result with metrics from task results."""
-
-    # Find the destination task - it should be the last one in the workflow
-    destination_task = next(
-        (
-            t
-            for t in reversed(workflow_def.get("tasks", []))
-            if t.get("type", "").startswith("destination.")
-        ),
-        None,
-    )
-
-    if not destination_task:
-        raise ValueError("No destination task found in workflow")
-
-    destination_id = destination_task["id"]
-
-    if destination_id not in task_results:
-        raise ValueError(f"Destination task result not found: {destination_id}")
-
-    # Get the tracklist from the destination result - this is the FINAL filtered list
-    destination_result = task_results[destination_id]
-    if "tracklist" not in destination_result:
-        raise ValueError(f"Destination task has no tracklist: {destination_id}")
-
-    # Use the FINAL filtered tracks from destination
-    final_tracks = destination_result["tracklist"].tracks
-
-    # Extract all metrics from task results
-    all_metrics = {}
-
-    for task_id, result in task_results.items():
-        if isinstance(result, dict) and "tracklist" in result:
-            task_metrics = result["tracklist"].metadata.get("metrics", {})
-
-            # Log metrics information for debugging
-            for metric_name, values in task_metrics.items():
-                if values:
-                    metric_keys = list(values.keys())
-                    logger.debug(
-                        f"Metrics found in {task_id}",
-                        metric_name=metric_name,
-                        key_count=len(metric_keys),
-                        key_type=str(type(metric_keys[0])) if metric_keys else "N/A",
-                        sample_values_count=sum(1 for v in values.values() if v != 0),
-                    )
-
-            # Add to all_metrics - make deep copy to ensure values are preserved
-            for metric_name, values in task_metrics.items():
-                if metric_name not in all_metrics:
-                    all_metrics[metric_name] = {}
-                # Ensure we're not losing any values during update
-                all_metrics[metric_name].update(values.copy())
-
-    # Verify final metrics
-    if "spotify_popularity" in all_metrics:
-        sp_keys = list(all_metrics["spotify_popularity"].keys())
-        logger.debug(
-            "Final spotify_popularity metrics",
-            key_count=len(sp_keys),
-            key_type=str(type(sp_keys[0])) if sp_keys else "N/A",
-            sample_keys=sp_keys[:5],
-            sample_values=[
-                all_metrics["spotify_popularity"].get(k) for k in sp_keys[:5]
-            ]
-            if sp_keys
-            else [],
-        )
-
-    logger.debug(
-        "Final extracted metrics",
-        metric_names=list(all_metrics.keys()),
-        spotify_popularity_count=len(all_metrics.get("spotify_popularity", {})),
-    )
-
-    return WorkflowResult(
-        tracks=final_tracks,
-        metrics=all_metrics,
-        operation_name=workflow_def.get("name", flow_run_name),
-        execution_time=execution_time,
+    return collect_workflow_result(
+        workflow_def, task_results, flow_run_name, execution_time
     )
 
 
 @flow(name="run_workflow")
-async def run_workflow(workflow_def: dict, **parameters) -> tuple[dict, WorkflowResult]:
+async def run_workflow(
+    workflow: dict | WorkflowPlan, **parameters
+) -> tuple[dict, WorkflowResult]:
     """Execute a workflow definition with dynamic parameters.
 
     Orchestrates workflow execution including flow construction,
     parameter passing, and metrics collection.
 
     Args:
-        workflow_def: Workflow definition dictionary
+        workflow: Workflow definition dictionary, or its compiled plan
         **parameters: Dynamic parameters for workflow nodes
 
     Returns:
@@ -403,9 +191,10 @@ async def run_workflow(workflow_def: dict, **parameters) -> tuple[dict, Workflow
     """
 
     logger = get_run_logger()
-    workflow_name = workflow_def.get("name", "unnamed")
 
     try:
+        plan = compile_workflow(workflow)
+        workflow_name = plan.name
         with tags("workflow", workflow_name):
             logger.info(f"Running workflow: {workflow_name}")
 
@@ -413,8 +202,8 @@ async def run_workflow(workflow_def: dict, **parameters) -> tuple[dict, Workflow
             start_time = datetime.datetime.now(datetime.UTC)
 
             # Build and execute the workflow
-            workflow = build_flow(workflow_def)
-            context = await workflow(**parameters)
+            workflow_flow = build_flow(plan)
+            context = await workflow_flow(**parameters)
 
             # Calculate execution time
             end_time = datetime.datetime.now(datetime.UTC)
@@ -424,9 +213,9 @@ async def run_workflow(workflow_def: dict, **parameters) -> tuple[dict, Workflow
             context["workflow_name"] = workflow_name
 
             # Submit task and get result with actual execution time
-            flow_run_name = workflow.flow_run_name
+            flow_run_name = workflow_flow.flow_run_name
             result = await extract_workflow_result(
-                workflow_def,
+                plan.definition,
                 context,
                 flow_run_name,
                 execution_time,
@@ -4,6 +4,7 @@ These protocols define contracts for external dependencies needed by workflows,
 enabling Clean Architecture compliance through dependency inversion.
 """
 
+from collections.abc import AsyncIterator
 from typing import Any, Protocol
 
 from src.domain.entities.track import Track, TrackList
@@ -94,6 +95,10 @@ class UseCaseProvider(Protocol):
         """Get MatchTracksUseCase with injected dependencies."""
         ...
 
+    async def get_query_library_use_case(self) -> Any:
+        """Get QueryLibraryUseCase with injected dependencies."""
+        ...
+
 
 class WorkflowContext(Protocol):
     """Complete workflow execution context with all dependencies."""
@@ -138,6 +143,22 @@ class WorkflowContext(Protocol):
         """
         ...
 
+    def stream_use_case(
+        self, use_case_getter: Any, command: Any
+    ) -> AsyncIterator[Any]:
+        """Stream a use case's results with the UnitOfWork pattern.
+
+        The use case's session stays open until the stream is exhausted.
+
+        Args:
+            use_case_getter: Async function that returns a use case instance
+            command: Command object to pass to the use case's ``stream``
+
+        Yields:
+            Each item the use case streams
+        """
+        ...
+
 
 class TransformFunction(Protocol):
     """Protocol for workflow transform functions."""
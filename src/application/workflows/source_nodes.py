@@ -4,8 +4,10 @@ All nodes follow the batch-first design principle, processing data in bulk
 and leveraging optimized bulk operations for maximum efficiency.
 """
 
+from collections.abc import AsyncIterator
 from typing import Any
 
+from src.application.use_cases.query_library import QueryLibraryCommand
 from src.application.use_cases.save_playlist import (
     EnrichmentConfig,
     PersistenceOptions,
@@ -34,8 +36,11 @@ async def spotify_playlist_source(
         ctx = NodeContext(context)
         spotify_connector = ctx.get_connector("spotify")
 
-    # 1. Fetch playlist with its items in a single API call
-    connector_playlist = await spotify_connector.get_spotify_playlist(playlist_id)
+    # 1. Fetch playlist with its items; tracks come from the embedded payloads
+    (
+        connector_playlist,
+        connector_tracks,
+    ) = await spotify_connector.get_spotify_playlist_with_tracks(playlist_id)
 
     if not connector_playlist or not connector_playlist.items:
         logger.warning(f"Playlist empty or not found: {playlist_id}")
@@ -51,30 +56,20 @@ async def spotify_playlist_source(
             "track_count": 0,
         }
 
-    # 2. Extract all track IDs for bulk fetch
-    track_ids = connector_playlist.track_ids
-    logger.info(f"Fetching {len(track_ids)} tracks in bulk from Spotify")
-
-    # 3. Bulk fetch all track data (this uses the tracks endpoint)
-    track_data_map = await spotify_connector.get_tracks_by_ids(track_ids)
-
-    # 4. Convert all tracks to domain models
-    # Import locally to avoid top-level infrastructure dependency
-    from src.infrastructure.connectors.spotify import convert_spotify_track_to_connector
-
+    # 2. Convert tracks to domain models, keeping playlist order and duplicates
     domain_tracks = [
-        _convert_connector_track_to_domain(
-            convert_spotify_track_to_connector(track_data)
-        )
-        for track_data in track_data_map.values()
+        _convert_connector_track_to_domain(connector_track)
+        for connector_track in connector_tracks
     ]
 
-    logger.info(f"Retrieved {len(domain_tracks)}/{len(track_ids)} tracks in bulk")
+    logger.info(
+        f"Retrieved {len(domain_tracks)}/{len(connector_playlist.items)} playlist tracks"
+    )
 
-    # 5. Create tracklist for use case
+    # 3. Create tracklist for use case
     tracklist = TrackList(tracks=domain_tracks)
 
-    # 6. Save playlist using SavePlaylistUseCase (with track upsert)
+    # 4. Save playlist using SavePlaylistUseCase (with track upsert)
     save_command = SavePlaylistCommand(
         tracklist=tracklist,
         enrichment_config=EnrichmentConfig(
@@ -83,11 +78,14 @@ async def spotify_playlist_source(
             enrich_missing_only=True,
         ),
         persistence_options=PersistenceOptions(
-            operation_type="create_internal",
+            # Mirror keyed on the Spotify playlist mapping: updated in place,
+            # skipped entirely while the Spotify snapshot is unchanged
+            operation_type="sync_spotify_source",
             playlist_name=connector_playlist.name,
             playlist_description=connector_playlist.description
             or "Imported from Spotify",
-            create_internal_playlist=True,
+            spotify_playlist_id=playlist_id,
+            source_playlist=connector_playlist,
         ),
     )
 
@@ -115,6 +113,68 @@ async def spotify_playlist_source(
     }
 
 
+async def library_query_source(context: dict, config: dict) -> dict[str, Any]:
+    """Select tracks from the local library with a single database query.
+
+    Filter, sorter and limit nodes directly downstream are folded into this
+    node by the workflow planner and arrive as ``config["pushdown"]``, so
+    only the final tracks are loaded from the database.
+    """
+    from .library_query import compile_library_query
+    from .node_context import NodeContext
+
+    query = compile_library_query(config)
+    pushed_down = [step["type"] for step in config.get("pushdown", [])]
+    logger.info(
+        "Querying local library",
+        pushed_down=pushed_down,
+        limit=query.limit,
+    )
+
+    ctx = NodeContext(context)
+    workflow_context = ctx.extract_workflow_context()
+    use_cases = ctx.extract_use_cases()
+
+    result = await workflow_context.execute_use_case(
+        use_cases.get_query_library_use_case,
+        QueryLibraryCommand(query=query),
+    )
+
+    return {
+        "tracklist": result.tracklist,
+        "source": "library",
+        "operation": "library_query_source",
+        "track_count": result.track_count,
+        "pushed_down": pushed_down,
+    }
+
+
+async def library_query_batches(
+    context: dict, config: dict, batch_size: int
+) -> AsyncIterator[TrackList]:
+    """Stream the tracks of a library query in batches.
+
+    Used by streaming workflow runs instead of ``library_query_source``: the
+    query still runs once, but full tracks are loaded batch by batch as the
+    downstream nodes consume them.
+    """
+    from .library_query import compile_library_query
+    from .node_context import NodeContext
+
+    query = compile_library_query(config)
+    logger.info("Streaming local library query", batch_size=batch_size)
+
+    ctx = NodeContext(context)
+    workflow_context = ctx.extract_workflow_context()
+    use_cases = ctx.extract_use_cases()
+
+    async for batch in workflow_context.stream_use_case(
+        use_cases.get_query_library_use_case,
+        QueryLibraryCommand(query=query, batch_size=batch_size),
+    ):
+        yield batch
+
+
 def _convert_connector_track_to_domain(connector_track) -> Track:
     """Convert ConnectorTrack to domain Track entity.
 
@@ -0,0 +1,387 @@
+"""
+Streaming workflow execution over bounded track batches.
+
+In a streaming run, chains of batch nodes pass tracks to each other a batch
+at a time instead of as one TrackList. Batch nodes are sources and the
+filters and enrichers whose output for a track depends on that track alone.
+Every other node is a barrier: sorters, selectors, combiners, deduplication
+and destinations need all of their input at once, so the batches reaching
+them are merged first. Sources in ``BATCH_SOURCES`` load their tracks batch
+by batch; other sources run whole and are split into batches.
+
+Results that do get materialized are released as soon as the last task
+reading them has run, unless they are destination outputs or stored under a
+result key, so peak memory stays bounded by a batch per streamed node plus
+the barrier inputs actually alive.
+"""
+
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing
+import time
+from typing import Any
+
+from attrs import define, evolve, field
+
+from src.application.utilities.profiling import measure_node
+from src.config import get_logger
+from src.domain.entities.operations import NodeProfile
+from src.domain.entities.track import TrackList
+
+from .execution import (
+    NodeFn,
+    NodeRunner,
+    RunLogger,
+    TaskResults,
+    build_task_context,
+    emit_task_completed,
+    emit_task_started,
+    is_retained,
+    log_node_profile,
+    primary_input,
+    run_measured_node,
+    task_inputs,
+)
+from .source_nodes import library_query_batches
+
+logger = get_logger(__name__)
+
+# Tracks per batch passed between streamed nodes
+STREAM_BATCH_SIZE = 500
+
+# Nodes whose output for a batch depends only on the tracks in it
+BATCH_NODE_TYPES = frozenset({
+    "filter.by_release_date",
+    "filter.by_tracks",
+    "filter.by_artists",
+    "filter.by_metric",
+    "filter.by_play_history",
+    "enricher.lastfm",
+    "enricher.spotify",
+    "enricher.play_history",
+})
+
+type BatchSource = Callable[[dict, dict, int], AsyncIterator[TrackList]]
+
+# Sources that can load their tracks batch by batch
+BATCH_SOURCES: dict[str, BatchSource] = {
+    "source.library_query": library_query_batches,
+}
+
+
+def is_batch_node(task_def: dict) -> bool:
+    """Whether a node can produce its output batch by batch."""
+    node_type = task_def["type"]
+    return node_type.startswith("source.") or node_type in BATCH_NODE_TYPES
+
+
+def _config_inputs(task_def: dict) -> list[str]:
+    """Task IDs a node reads through its config rather than upstream."""
+    upstream = task_def.get("upstream", [])
+    return [input_id for input_id in task_inputs(task_def) if input_id not in upstream]
+
+
+def plan_pipes(sorted_tasks: list[dict]) -> set[str]:
+    """Find the tasks whose output is streamed into their consumer.
+
+    A task's output is piped when it is a batch node read by exactly one
+    task, that task is a non-source batch node transforming it as its
+    primary input, and the output is not retained. Piped outputs are never
+    materialized.
+
+    Args:
+        sorted_tasks: Task definitions in execution order
+
+    Returns:
+        IDs of the piped tasks
+    """
+    readers: dict[str, list[dict]] = {task["id"]: [] for task in sorted_tasks}
+    for task_def in sorted_tasks:
+        for input_id in task_inputs(task_def):
+            if input_id in readers:
+                readers[input_id].append(task_def)
+
+    piped = set()
+    for task_def in sorted_tasks:
+        task_id = task_def["id"]
+        consumers = readers[task_id]
+        if (
+            is_batch_node(task_def)
+            and not is_retained(task_def)
+            and len(consumers) == 1
+            and consumers[0]["type"] in BATCH_NODE_TYPES
+            and primary_input(consumers[0]) == task_id
+            # An exclusion list has to be complete before filtering starts
+            and task_id not in _config_inputs(consumers[0])
+        ):
+            piped.add(task_id)
+    return piped
+
+
+def merge_batches(batches: list[TrackList]) -> TrackList:
+    """Join batches back into one TrackList, merging their metrics."""
+    tracks = [track for batch in batches for track in batch.tracks]
+    metadata: dict[str, Any] = {}
+    metrics: dict[str, dict] = {}
+    for batch in batches:
+        for key, value in batch.metadata.items():
+            if key == "metrics":
+                for metric_name, values in value.items():
+                    metrics.setdefault(metric_name, {}).update(values)
+            else:
+                metadata.setdefault(key, value)
+    if metrics:
+        metadata["metrics"] = metrics
+    return TrackList(tracks=tracks, metadata=metadata)
+
+
+def _split(tracklist: TrackList, batch_size: int) -> list[TrackList]:
+    """Split a materialized tracklist into batches sharing its metadata."""
+    return [
+        tracklist.with_tracks(tracklist.tracks[start : start + batch_size])
+        for start in range(0, len(tracklist.tracks), batch_size)
+    ]
+
+
+def _add_profile(total: NodeProfile | None, batch: NodeProfile) -> NodeProfile:
+    """Fold the profile of one batch into a node's running total."""
+    if total is None:
+        return batch
+    api_calls = dict(total.api_calls)
+    for service, count in batch.api_calls.items():
+        api_calls[service] = api_calls.get(service, 0) + count
+    peaks = [p for p in (total.peak_memory, batch.peak_memory) if p is not None]
+    return evolve(
+        total,
+        wall_time=total.wall_time + batch.wall_time,
+        cpu_time=total.cpu_time + batch.cpu_time,
+        peak_memory=max(peaks) if peaks else None,
+        api_calls=api_calls,
+        sql_statements=total.sql_statements + batch.sql_statements,
+        tracks_in=total.tracks_in + batch.tracks_in,
+        tracks_out=total.tracks_out + batch.tracks_out,
+    )
+
+
+@define(slots=True)
+class StreamingRun:
+    """State of one streaming workflow run."""
+
+    sorted_tasks: list[dict]
+    nodes: dict[str, NodeFn]
+    task_results: TaskResults
+    run_node: NodeRunner
+    run_logger: RunLogger
+    workflow_started: float
+    batch_size: int = STREAM_BATCH_SIZE
+    piped: set[str] = field(init=False)
+    _profiles: dict[str, NodeProfile] = field(factory=dict, init=False)
+    _batch_counts: dict[str, int] = field(factory=dict, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        """Plan which task outputs are piped."""
+        self.piped = plan_pipes(self.sorted_tasks)
+
+    @property
+    def context(self) -> dict:
+        """Run context shared by every node."""
+        return self.task_results.context
+
+    @property
+    def results(self) -> dict[str, Any]:
+        """Materialized results still read by a task yet to run."""
+        return self.task_results.results
+
+    async def run(self) -> None:
+        """Run every task, streaming piped chains into their consumers."""
+        logger.debug("Streaming workflow run", piped=sorted(self.piped))
+        for task_def in self.sorted_tasks:
+            if task_def["id"] in self.piped:
+                # Runs once the task reading it pulls its batches
+                continue
+            if primary_input(task_def) in self.piped:
+                chain = await self._run_chain(task_def)
+            else:
+                await self._run_barrier(task_def)
+                chain = [task_def]
+            self.task_results.consumed(chain)
+
+    async def _run_barrier(self, task_def: dict) -> None:
+        """Run a node on fully materialized inputs."""
+        emit_task_started(self.run_logger, task_def)
+        task_context = build_task_context(self.context, task_def, self.results)
+        result, profile = await run_measured_node(
+            self.run_node,
+            self.nodes[task_def["id"]],
+            task_def,
+            task_context,
+            self._offset(),
+        )
+        self._finish(profile)
+        self.task_results.store(task_def, result, self.run_logger)
+        emit_task_completed(task_def, result)
+
+    async def _run_chain(self, tail: dict) -> list[dict]:
+        """Stream a chain of piped tasks into its last node, then merge.
+
+        Returns:
+            The chain's task definitions, upstream first
+        """
+        chain = [tail]
+        while (upstream_id := primary_input(chain[0])) in self.piped:
+            chain.insert(0, self.task_results.tasks[upstream_id])
+        for task_def in chain:
+            emit_task_started(self.run_logger, task_def)
+
+        batches: list[TrackList] = []
+        last_result: dict = {}
+        async for result in self._stream(tail):
+            batches.append(result["tracklist"])
+            last_result = result
+        result = {
+            **last_result,
+            "tracklist": merge_batches(batches),
+            "batch_count": len(batches),
+        }
+
+        for task_def in chain[:-1]:
+            profile = self._finish_streamed(task_def)
+            emit_task_completed(
+                task_def,
+                {
+                    "track_count": profile.tracks_out,
+                    "batch_count": self._batch_counts.get(task_def["id"], 0),
+                },
+            )
+        self._finish_streamed(tail)
+        self.task_results.store(tail, result, self.run_logger)
+        emit_task_completed(tail, result)
+        return chain
+
+    async def _stream(self, task_def: dict) -> AsyncIterator[dict]:
+        """Yield a node's result for each batch of its primary input."""
+        if task_def["type"].startswith("source."):
+            async for batch in self._source_batches(task_def):
+                yield {"tracklist": batch}
+            return
+
+        upstream_id = primary_input(task_def)
+        async for batch in self._input_batches(upstream_id):
+            task_context = build_task_context(self.context, task_def, self.results)
+            task_context[upstream_id] = {"tracklist": batch}
+            result, profile = await run_measured_node(
+                self.run_node,
+                self.nodes[task_def["id"]],
+                task_def,
+                task_context,
+                self._offset(),
+            )
+            # Other inputs, like an exclusion list, are read for every batch
+            self._add_batch(task_def, evolve(profile, tracks_in=len(batch.tracks)))
+            yield result
+
+    async def _input_batches(self, task_id: str | None) -> AsyncIterator[TrackList]:
+        """Batches of a node's input, streamed or split from its result."""
+        if task_id in self.piped:
+            async for result in self._stream(self.task_results.tasks[task_id]):
+                yield result["tracklist"]
+            return
+        for batch in _split(self.results[task_id]["tracklist"], self.batch_size):
+            yield batch
+
+    async def _source_batches(self, task_def: dict) -> AsyncIterator[TrackList]:
+        """Load a piped source batch by batch, natively where supported.
+
+        Native batch sources are called directly rather than through the
+        engine's node runner, so they are not retried.
+        """
+        config = task_def.get("config", {})
+        batch_source = BATCH_SOURCES.get(task_def["type"])
+        if batch_source is None:
+            task_context = build_task_context(self.context, task_def, self.results)
+            result, profile = await run_measured_node(
+                self.run_node,
+                self.nodes[task_def["id"]],
+                task_def,
+                task_context,
+                self._offset(),
+            )
+            self._add_batch(task_def, profile)
+            for batch in _split(result["tracklist"], self.batch_size):
+                yield batch
+            return
+
+        async with aclosing(
+            batch_source(self.context, config, self.batch_size)
+        ) as batches:
+            while True:
+                with measure_node(
+                    task_def["id"], task_def["type"], self._offset(), 0
+                ) as meter:
+                    batch = await anext(batches, None)
+                    profile = meter.finish(len(batch.tracks) if batch else 0)
+                self._add_batch(task_def, profile, counted=batch is not None)
+                if batch is None:
+                    return
+                yield batch
+
+    def _add_batch(
+        self, task_def: dict, profile: NodeProfile, counted: bool = True
+    ) -> None:
+        """Fold the work done for one batch into a streamed node's profile."""
+        task_id = task_def["id"]
+        self._profiles[task_id] = _add_profile(self._profiles.get(task_id), profile)
+        if counted:
+            self._batch_counts[task_id] = self._batch_counts.get(task_id, 0) + 1
+
+    def _finish_streamed(self, task_def: dict) -> NodeProfile:
+        """Record the profile a streamed node built up over its batches."""
+        profile = self._profiles.pop(task_def["id"], None)
+        if profile is None:
+            # The input had no tracks, so the node never ran
+            profile = NodeProfile(
+                task_id=task_def["id"],
+                node_type=task_def["type"],
+                start_offset=self._offset(),
+                wall_time=0.0,
+                cpu_time=0.0,
+            )
+        self._finish(profile)
+        return profile
+
+    def _finish(self, profile: NodeProfile) -> None:
+        """Record a node's profile once it has produced all its output."""
+        self.context["node_profiles"].append(profile)
+        log_node_profile(profile)
+
+    def _offset(self) -> float:
+        """Seconds since the workflow started."""
+        return time.perf_counter() - self.workflow_started
+
+
+async def run_streaming_tasks(
+    sorted_tasks: list[dict],
+    nodes: dict[str, NodeFn],
+    task_results: TaskResults,
+    run_node: NodeRunner,
+    run_logger: RunLogger,
+    workflow_started: float,
+) -> None:
+    """Run workflow tasks in order, streaming batch node chains.
+
+    Args:
+        sorted_tasks: Task definitions in execution order
+        nodes: Node callables by task ID
+        task_results: Reference-counted results of the run
+        run_node: Engine-specific executor for a single node
+        run_logger: Logger for workflow and task progress
+        workflow_started: ``time.perf_counter()`` when the workflow started
+    """
+    await StreamingRun(
+        sorted_tasks,
+        nodes,
+        task_results,
+        run_node,
+        run_logger,
+        workflow_started,
+        batch_size=STREAM_BATCH_SIZE,
+    ).run()
@@ -27,6 +27,7 @@ from src.domain.transforms.core import (
     interleave,
     select_by_method,
     sort_by_attribute,
+    sort_by_keys,
 )
 
 # Logger will be injected via WorkflowContext when needed
@@ -77,6 +78,13 @@ TRANSFORM_REGISTRY = {
             metric_name="release_date",
             reverse=cfg.get("reverse", False),  # Default to oldest first
         ),
+        "by_metrics": lambda _ctx, cfg: sort_by_keys(
+            # Multi-key sort - later metrics break ties in earlier ones
+            [
+                (key["metric_name"], key.get("reverse", True))
+                for key in cfg.get("keys", [])
+            ],
+        ),
     },
     "selector": {
         "limit_tracks": lambda _ctx, cfg: select_by_method(
@@ -96,3 +104,13 @@ TRANSFORM_REGISTRY = {
         ),
     },
 }
+
+# Strategies reading other task results through the node context; the rest
+# depend on their config alone and can be built before the workflow runs
+CONTEXT_STRATEGIES = frozenset({
+    ("filter", "by_tracks"),
+    ("filter", "by_artists"),
+    ("combiner", "merge_playlists"),
+    ("combiner", "concatenate_playlists"),
+    ("combiner", "interleave_playlists"),
+})
@@ -60,6 +60,7 @@ class APIConfig(BaseModel):
     # Global API defaults
     default_batch_size: int = 50
     default_concurrency: int = 5
+    default_batches_in_flight: int = 2
     default_retry_count: int = 3
     default_retry_base_delay: float = 1.0
     default_retry_max_delay: float = 30.0
@@ -69,6 +70,7 @@ class APIConfig(BaseModel):
     lastfm_batch_size: int = 50
     lastfm_concurrency: int = 1000  # High concurrency for in-flight requests
     lastfm_rate_limit: float = 5.0  # Calls per second (rate limiter)
+    lastfm_rate_limit_max: float = 10.0  # Ceiling for adaptive rate increase
     lastfm_retry_count: int = 3
     lastfm_retry_base_delay: float = 2.0
     lastfm_retry_max_delay: float = 60.0
@@ -80,6 +82,10 @@ class APIConfig(BaseModel):
     # Spotify API Configuration
     spotify_batch_size: int = 50
     spotify_concurrency: int = 5
+    spotify_batches_in_flight: int = 2
+    spotify_prefetch_pages: int = 2  # Liked-track pages fetched ahead of the DB
+    spotify_rate_limit: float = 10.0  # Calls per second (rate limiter)
+    spotify_rate_limit_max: float = 30.0  # Ceiling for adaptive rate increase
     spotify_retry_count: int = 3
     spotify_retry_base_delay: float = 0.5
     spotify_retry_max_delay: float = 30.0
@@ -88,10 +94,14 @@ class APIConfig(BaseModel):
     # MusicBrainz API Configuration
     musicbrainz_batch_size: int = 50
     musicbrainz_concurrency: int = 5
+    musicbrainz_batches_in_flight: int = 2
     musicbrainz_retry_count: int = 3
     musicbrainz_retry_base_delay: float = 1.0
     musicbrainz_retry_max_delay: float = 30.0
     musicbrainz_request_delay: float = 0.2
+    musicbrainz_rate_limit: float = 0.9  # Calls per second (1/sec API policy)
+    musicbrainz_rate_limit_max: float = 0.9  # Capped at 0.9 by the connector
+    musicbrainz_local_index_path: Path | None = None  # Defaults under data_dir
 
 
 class BatchConfig(BaseModel):
@@ -246,6 +256,7 @@ _LEGACY_KEY_MAP = {
     # Global API defaults
     "DEFAULT_API_BATCH_SIZE": lambda: settings.api.default_batch_size,
     "DEFAULT_API_CONCURRENCY": lambda: settings.api.default_concurrency,
+    "DEFAULT_API_BATCHES_IN_FLIGHT": lambda: settings.api.default_batches_in_flight,
     "DEFAULT_API_RETRY_COUNT": lambda: settings.api.default_retry_count,
     "DEFAULT_API_RETRY_BASE_DELAY": lambda: settings.api.default_retry_base_delay,
     "DEFAULT_API_RETRY_MAX_DELAY": lambda: settings.api.default_retry_max_delay,
@@ -255,6 +266,7 @@ _LEGACY_KEY_MAP = {
     "LASTFM_API_BATCH_SIZE": lambda: settings.api.lastfm_batch_size,
     "LASTFM_API_CONCURRENCY": lambda: settings.api.lastfm_concurrency,
     "LASTFM_API_RATE_LIMIT": lambda: settings.api.lastfm_rate_limit,
+    "LASTFM_API_RATE_LIMIT_MAX": lambda: settings.api.lastfm_rate_limit_max,
     "LASTFM_API_RETRY_COUNT": lambda: settings.api.lastfm_retry_count,
     "LASTFM_API_RETRY_BASE_DELAY": lambda: settings.api.lastfm_retry_base_delay,
     "LASTFM_API_RETRY_MAX_DELAY": lambda: settings.api.lastfm_retry_max_delay,
@@ -266,6 +278,10 @@ _LEGACY_KEY_MAP = {
     # Spotify API settings
     "SPOTIFY_API_BATCH_SIZE": lambda: settings.api.spotify_batch_size,
     "SPOTIFY_API_CONCURRENCY": lambda: settings.api.spotify_concurrency,
+    "SPOTIFY_API_BATCHES_IN_FLIGHT": lambda: settings.api.spotify_batches_in_flight,
+    "SPOTIFY_API_PREFETCH_PAGES": lambda: settings.api.spotify_prefetch_pages,
+    "SPOTIFY_API_RATE_LIMIT": lambda: settings.api.spotify_rate_limit,
+    "SPOTIFY_API_RATE_LIMIT_MAX": lambda: settings.api.spotify_rate_limit_max,
     "SPOTIFY_API_RETRY_COUNT": lambda: settings.api.spotify_retry_count,
     "SPOTIFY_API_RETRY_BASE_DELAY": lambda: settings.api.spotify_retry_base_delay,
     "SPOTIFY_API_RETRY_MAX_DELAY": lambda: settings.api.spotify_retry_max_delay,
@@ -274,10 +290,14 @@ _LEGACY_KEY_MAP = {
     # MusicBrainz API settings
     "MUSICBRAINZ_API_BATCH_SIZE": lambda: settings.api.musicbrainz_batch_size,
     "MUSICBRAINZ_API_CONCURRENCY": lambda: settings.api.musicbrainz_concurrency,
+    "MUSICBRAINZ_API_BATCHES_IN_FLIGHT": lambda: settings.api.musicbrainz_batches_in_flight,
     "MUSICBRAINZ_API_RETRY_COUNT": lambda: settings.api.musicbrainz_retry_count,
     "MUSICBRAINZ_API_RETRY_BASE_DELAY": lambda: settings.api.musicbrainz_retry_base_delay,
     "MUSICBRAINZ_API_RETRY_MAX_DELAY": lambda: settings.api.musicbrainz_retry_max_delay,
     "MUSICBRAINZ_API_REQUEST_DELAY": lambda: settings.api.musicbrainz_request_delay,
+    "MUSICBRAINZ_API_RATE_LIMIT": lambda: settings.api.musicbrainz_rate_limit,
+    "MUSICBRAINZ_API_RATE_LIMIT_MAX": lambda: settings.api.musicbrainz_rate_limit_max,
+    "MUSICBRAINZ_LOCAL_INDEX_PATH": lambda: settings.api.musicbrainz_local_index_path,
     
     # Data freshness settings
     "ENRICHER_DATA_FRESHNESS_LASTFM": lambda: settings.freshness.lastfm_hours,
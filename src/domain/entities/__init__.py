@@ -1,8 +1,12 @@
 """Core domain entities representing music concepts."""
 
+# Library query value objects
+from .library_query import LibraryQuery, ValueBound
+
 # Track-related entities
 # Operation-related entities
 from .operations import (
+    NodeProfile,
     OperationResult,
     PlayRecord,
     SyncCheckpoint,
@@ -40,7 +44,10 @@ __all__ = [
     "ConnectorPlaylistItem",
     "ConnectorTrack",
     "ConnectorTrackMapping",
+    # Library queries
+    "LibraryQuery",
     # Operation entities
+    "NodeProfile",
     "OperationResult",
     "PlayRecord",
     "Playlist",
@@ -52,6 +59,7 @@ __all__ = [
     "TrackList",
     "TrackMetric",
     "TrackPlay",
+    "ValueBound",
     "WorkflowResult",
     "create_lastfm_play_record",
     # Shared utilities
@@ -0,0 +1,91 @@
+"""Declarative queries over the local track library.
+
+A LibraryQuery describes which stored tracks a workflow wants, in which order
+and how many, without saying how to fetch them. Repositories compile it into
+one database query, so only the tracks in the final result are loaded.
+
+Values are looked up by name, the same names workflow nodes use for metrics:
+
+- play history aggregates: ``total_plays``, ``last_played_dates`` and, when
+  the query has a play period, ``period_plays``
+- track attributes: ``title``, ``album``, ``duration_ms``, ``release_date``
+- any other name is a stored track metric (e.g. ``lastfm_user_playcount``)
+"""
+
+from datetime import datetime
+from typing import Any
+
+from attrs import define, evolve
+
+PLAY_METRICS = frozenset({"total_plays", "last_played_dates", "period_plays"})
+TRACK_ATTRIBUTES = frozenset({"title", "album", "duration_ms", "release_date"})
+
+
+@define(frozen=True, slots=True)
+class ValueBound:
+    """Keep tracks whose value for a name lies within bounds.
+
+    Attributes:
+        name: Metric or track attribute the bound applies to
+        min_value: Lower bound, or None for no lower bound
+        max_value: Upper bound, or None for no upper bound
+        min_inclusive: Whether a value equal to ``min_value`` is kept
+        max_inclusive: Whether a value equal to ``max_value`` is kept
+        include_missing: Whether tracks without a value are kept
+    """
+
+    name: str
+    min_value: Any = None
+    max_value: Any = None
+    min_inclusive: bool = True
+    max_inclusive: bool = True
+    include_missing: bool = False
+
+
+@define(frozen=True, slots=True)
+class LibraryQuery:
+    """Filters, ordering and limit for a query over all stored tracks.
+
+    Without sort keys tracks come in library order (by track ID). Ties
+    between sort keys keep the order of the previous sort, like the stable
+    sorts of the transform layer.
+
+    Attributes:
+        bounds: Value bounds every returned track satisfies
+        sort_keys: ``(name, reverse)`` pairs, most significant first;
+            tracks without a value sort last in either direction
+        limit: Maximum number of tracks, or None for all
+        period_start: Start of the window counted by ``period_plays``
+        period_end: End of the window counted by ``period_plays``
+    """
+
+    bounds: tuple[ValueBound, ...] = ()
+    sort_keys: tuple[tuple[str, bool], ...] = ()
+    limit: int | None = None
+    period_start: datetime | None = None
+    period_end: datetime | None = None
+
+    @property
+    def has_period(self) -> bool:
+        """Whether ``period_plays`` can be computed for this query."""
+        return self.period_start is not None and self.period_end is not None
+
+    @property
+    def value_names(self) -> list[str]:
+        """Names of all values the query filters or sorts on, in first-use order."""
+        names = [bound.name for bound in self.bounds]
+        names += [name for name, _ in self.sort_keys]
+        return list(dict.fromkeys(names))
+
+    def where(self, bound: ValueBound) -> "LibraryQuery":
+        """Return a query that also requires ``bound``."""
+        return evolve(self, bounds=(*self.bounds, bound))
+
+    def order_by(self, keys: list[tuple[str, bool]]) -> "LibraryQuery":
+        """Return a query re-sorted by ``keys``, keeping earlier order for ties."""
+        return evolve(self, sort_keys=(*keys, *self.sort_keys))
+
+    def take(self, count: int) -> "LibraryQuery":
+        """Return a query limited to at most ``count`` tracks."""
+        limit = count if self.limit is None else min(self.limit, count)
+        return evolve(self, limit=limit)
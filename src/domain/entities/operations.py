@@ -366,6 +366,56 @@ class OperationResult:
         return result
 
 
+@define(frozen=True, slots=True)
+class NodeProfile:
+    """Resources one workflow node used while it ran.
+
+    Attributes:
+        task_id: ID of the task in the workflow definition
+        node_type: Node type the task ran
+        start_offset: Seconds from workflow start to node start
+        wall_time: Elapsed seconds, including retries
+        cpu_time: Process CPU seconds spent while the node ran
+        peak_memory: Peak bytes allocated above the node's starting point,
+            or None when memory was not traced
+        api_calls: Connector API calls made, per service
+        sql_statements: SQL statements executed
+        tracks_in: Tracks across all upstream inputs
+        tracks_out: Tracks in the node's output
+    """
+
+    task_id: str
+    node_type: str
+    start_offset: float = 0.0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_memory: int | None = None
+    api_calls: dict[str, int] = field(factory=dict)
+    sql_statements: int = 0
+    tracks_in: int = 0
+    tracks_out: int = 0
+
+    @property
+    def total_api_calls(self) -> int:
+        """API calls across all services."""
+        return sum(self.api_calls.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a serializable dictionary."""
+        return {
+            "task_id": self.task_id,
+            "node_type": self.node_type,
+            "start_offset": self.start_offset,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "peak_memory": self.peak_memory,
+            "api_calls": dict(self.api_calls),
+            "sql_statements": self.sql_statements,
+            "tracks_in": self.tracks_in,
+            "tracks_out": self.tracks_out,
+        }
+
+
 @define(frozen=False)
 class WorkflowResult(OperationResult):
     """Result of a workflow execution with associated metrics.
@@ -374,11 +424,56 @@ class WorkflowResult(OperationResult):
     providing workflow-specific properties and methods.
     """
 
+    node_profiles: list[NodeProfile] = field(factory=list)
+
     @property
     def workflow_name(self) -> str:
         """Backward compatibility property for workflow name."""
         return self.operation_name
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to serializable dictionary, including per-node profiles."""
+        result = super().to_dict()
+        if self.node_profiles:
+            result["node_profiles"] = [
+                profile.to_dict() for profile in self.node_profiles
+            ]
+        return result
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Export node profiles in the Chrome trace event format.
+
+        The result loads in chrome://tracing or Perfetto, with one complete
+        event per node on a single timeline.
+
+        Returns:
+            Trace document with a ``traceEvents`` list
+        """
+        events: list[dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 1,
+                "args": {"name": self.operation_name or "workflow"},
+            }
+        ]
+        events.extend(
+            {
+                "name": profile.task_id,
+                "cat": profile.node_type,
+                "ph": "X",
+                "pid": 1,
+                "tid": 1,
+                # Trace timestamps and durations are in microseconds
+                "ts": round(profile.start_offset * 1_000_000),
+                "dur": round(profile.wall_time * 1_000_000),
+                "args": profile.to_dict(),
+            }
+            for profile in self.node_profiles
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
     @classmethod
     def create_workflow_result(
         cls,
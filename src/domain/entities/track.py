@@ -3,12 +3,15 @@
 Pure track representations and related value objects with zero external dependencies.
 """
 
+from collections.abc import Sequence
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, cast
 
 import attrs
 from attrs import define, field, validators
 
+from .track_columns import TrackColumns
+
 
 @define(frozen=True, slots=True)
 class Artist:
@@ -185,6 +188,27 @@ class TrackList:
 
     tracks: list[Track] = field(factory=list)
     metadata: dict[str, Any] = field(factory=dict)
+    _columns: TrackColumns | None = field(
+        default=None, init=False, eq=False, repr=False
+    )
+
+    @property
+    def columns(self) -> TrackColumns:
+        """Columnar view of the tracks, built on first use and then reused."""
+        if self._columns is None:
+            object.__setattr__(self, "_columns", TrackColumns.from_tracks(self.tracks))
+        return cast("TrackColumns", self._columns)
+
+    def take(self, indices: Sequence[int]) -> "TrackList":
+        """Create new TrackList with the tracks at the given positions.
+
+        Columns already built for this TrackList are sliced along, so
+        chained filters and sorts never rebuild them.
+        """
+        result = self.with_tracks([self.tracks[i] for i in indices])
+        if self._columns is not None:
+            object.__setattr__(result, "_columns", self._columns.take(indices))
+        return result
 
     def with_tracks(self, tracks: list[Track]) -> "TrackList":
         """Create new TrackList with the given tracks."""
@@ -197,7 +221,11 @@ class TrackList:
         """Add metadata to the TrackList."""
         new_metadata = self.metadata.copy()
         new_metadata[key] = value
-        return self.__class__(tracks=self.tracks, metadata=new_metadata)
+        result = self.__class__(tracks=self.tracks, metadata=new_metadata)
+        # Same tracks, so the columns stay valid; metric columns re-resolve
+        # themselves if the metadata dict they came from was replaced
+        object.__setattr__(result, "_columns", self._columns)
+        return result
 
     @classmethod
     def from_playlist(cls, playlist: Any) -> "TrackList":  # Avoiding circular import
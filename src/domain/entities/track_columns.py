@@ -0,0 +1,120 @@
+"""Columnar view of a TrackList for bulk filtering and sorting.
+
+Transforms that test the same few fields of every track are faster over flat,
+track-aligned columns than over Track objects and nested metric dicts. A
+TrackColumns is built once per TrackList, metric columns are resolved once per
+metric, and selecting rows by index carries every column along so the next
+transform in a pipeline does not rebuild anything.
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from attrs import define, field
+
+if TYPE_CHECKING:
+    from .track import Track
+
+
+@define(slots=True)
+class TrackColumns:
+    """Track-aligned columns of ids, release dates, durations and metrics.
+
+    Row ``i`` of every column describes ``tracks[i]`` of the TrackList the
+    columns were built from. Metric columns are resolved lazily from the
+    metadata dict they were requested with and reused for as long as that
+    same dict is passed in.
+    """
+
+    ids: list[int | None]
+    release_dates: list[datetime | None]
+    durations: list[int | None]
+    _metrics: dict[str, tuple[Mapping[int, Any], list[Any]]] = field(factory=dict)
+
+    @classmethod
+    def from_tracks(cls, tracks: Iterable["Track"]) -> "TrackColumns":
+        """Build the base columns in a single pass over the tracks."""
+        ids, release_dates, durations = [], [], []
+        for track in tracks:
+            ids.append(track.id)
+            release_dates.append(track.release_date)
+            durations.append(track.duration_ms)
+        return cls(ids=ids, release_dates=release_dates, durations=durations)
+
+    def __len__(self) -> int:
+        """Number of rows (tracks)."""
+        return len(self.ids)
+
+    def metric(self, name: str, values_by_id: Mapping[int, Any]) -> list[Any]:
+        """Column of a metric's values aligned to track order.
+
+        Args:
+            name: Metric name, used as the cache key
+            values_by_id: Metric values keyed by track ID, as stored in
+                TrackList metadata
+
+        Returns:
+            One value per row; None where the track has no ID or no value
+        """
+        cached = self._metrics.get(name)
+        if cached is not None and cached[0] is values_by_id:
+            return cached[1]
+
+        get = values_by_id.get
+        column = [None if track_id is None else get(track_id) for track_id in self.ids]
+        self._metrics[name] = (values_by_id, column)
+        return column
+
+    def take(self, indices: Sequence[int]) -> "TrackColumns":
+        """Select rows by index, keeping resolved metric columns."""
+        return TrackColumns(
+            ids=[self.ids[i] for i in indices],
+            release_dates=[self.release_dates[i] for i in indices],
+            durations=[self.durations[i] for i in indices],
+            metrics={
+                name: (source, [column[i] for i in indices])
+                for name, (source, column) in self._metrics.items()
+            },
+        )
+
+
+def argsort(values: Sequence[Any], *, reverse: bool = False) -> list[int]:
+    """Row indices that order ``values``, stable and with None values last.
+
+    Args:
+        values: Column to order by
+        reverse: Sort descending; missing values still come last
+
+    Returns:
+        Indices into ``values`` in sorted order
+    """
+    return lexsort([(values, reverse)])
+
+
+def lexsort(keys: Sequence[tuple[Sequence[Any], bool]]) -> list[int]:
+    """Row indices that order rows by several key columns.
+
+    Rows are compared on the first key, ties broken by the next, and so on.
+    Each key has its own direction and puts its None values last. Rows that
+    tie on every key keep their original order.
+
+    Args:
+        keys: ``(column, reverse)`` pairs, most significant first; all
+            columns must have the same length
+
+    Returns:
+        Indices into the columns in sorted order
+    """
+    if not keys:
+        return []
+
+    order = list(range(len(keys[0][0])))
+    # Stable sorts from the least significant key up leave rows ordered by
+    # every key; key columns are only indexed, never recomputed
+    for values, reverse in reversed(keys):
+        present = [i for i in order if values[i] is not None]
+        missing = [i for i in order if values[i] is None]
+        present.sort(key=values.__getitem__, reverse=reverse)
+        order = present + missing
+    return order
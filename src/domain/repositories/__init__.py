@@ -6,7 +6,9 @@ infrastructure implementations, following the dependency inversion principle.
 
 from .interfaces import (
     CheckpointRepositoryProtocol,
+    ConnectorPlaylistRepositoryProtocol,
     ConnectorRepositoryProtocol,
+    LibraryRepositoryProtocol,
     LikeRepositoryProtocol,
     MetricsRepositoryProtocol,
     PlaylistRepositoryProtocol,
@@ -18,7 +20,9 @@ from .interfaces import (
 
 __all__ = [
     "CheckpointRepositoryProtocol",
+    "ConnectorPlaylistRepositoryProtocol",
     "ConnectorRepositoryProtocol",
+    "LibraryRepositoryProtocol",
     "LikeRepositoryProtocol",
     "MetricsRepositoryProtocol",
     "PlaylistRepositoryProtocol",
@@ -5,7 +5,7 @@ infrastructure implementations, following the dependency inversion principle.
 Repository interfaces belong in the domain layer according to Clean Architecture.
 """
 
-from collections.abc import Awaitable
+from collections.abc import AsyncIterator, Awaitable
 from typing import TYPE_CHECKING, Literal, Protocol, Self
 
 if TYPE_CHECKING:
@@ -17,7 +17,9 @@ if TYPE_CHECKING:
         ExternalMetadataService,
     )
     from src.domain.entities import (
+        ConnectorPlaylist,
         ConnectorTrack,
+        LibraryQuery,
         Playlist,
         SyncCheckpoint,
         Track,
@@ -55,6 +57,37 @@ class TrackRepositoryProtocol(Protocol):
         ...
 
 
+class LibraryRepositoryProtocol(Protocol):
+    """Repository interface for queries over the whole track library."""
+
+    def query_tracks(self, query: "LibraryQuery") -> Awaitable["TrackList"]:
+        """Run a library query, loading only the tracks it returns.
+
+        Args:
+            query: Filters, ordering and limit to apply in the database
+
+        Returns:
+            TrackList in query order, with the values the query used stored
+            as metrics in its metadata
+        """
+        ...
+
+    def iter_query_tracks(
+        self, query: "LibraryQuery", batch_size: int = 500
+    ) -> AsyncIterator["TrackList"]:
+        """Run a library query, loading its tracks one batch at a time.
+
+        Args:
+            query: Filters, ordering and limit to apply in the database
+            batch_size: Tracks per yielded TrackList
+
+        Yields:
+            TrackLists in query order, each with the query values of its
+            own tracks as metrics
+        """
+        ...
+
+
 class PlaylistRepositoryProtocol(Protocol):
     """Repository interface for playlist persistence operations."""
 
@@ -79,6 +112,22 @@ class PlaylistRepositoryProtocol(Protocol):
         ...
 
 
+class ConnectorPlaylistRepositoryProtocol(Protocol):
+    """Repository interface for stored external playlist state."""
+
+    def get_by_connector_id(
+        self, connector: str, connector_id: str
+    ) -> Awaitable["ConnectorPlaylist | None"]:
+        """Get the last stored state of an external playlist."""
+        ...
+
+    def upsert_model(
+        self, connector_playlist: "ConnectorPlaylist"
+    ) -> Awaitable["ConnectorPlaylist"]:
+        """Store the current state of an external playlist."""
+        ...
+
+
 class LikeRepositoryProtocol(Protocol):
     """Repository interface for like persistence operations."""
 
@@ -88,6 +137,12 @@ class LikeRepositoryProtocol(Protocol):
         """Get likes for a track across services."""
         ...
 
+    def get_track_likes_batch(
+        self, track_ids: list[int], services: list[str] | None = None
+    ) -> Awaitable[list["TrackLike"]]:
+        """Get likes for many tracks across services in one operation."""
+        ...
+
     def save_track_like(
         self,
         track_id: int,
@@ -110,8 +165,23 @@ class LikeRepositoryProtocol(Protocol):
         target_service: str,
         is_liked: bool = True,
         since_timestamp: "datetime | None" = None,
+        after_id: int | None = None,
+        limit: int | None = None,
     ) -> Awaitable[list["TrackLike"]]:
-        """Get tracks liked in source_service but not in target_service."""
+        """Get tracks liked in source_service but not in target_service.
+
+        Ordered by like ID; ``after_id`` and ``limit`` page through the results.
+        """
+        ...
+
+    def save_track_likes_batch(
+        self,
+        track_ids: list[int],
+        service: str,
+        is_liked: bool = True,
+        last_synced: "datetime | None" = None,
+    ) -> Awaitable[int]:
+        """Save the same like status for many tracks in one operation."""
         ...
 
 
@@ -179,6 +249,20 @@ class ConnectorRepositoryProtocol(Protocol):
         """Map an existing track to a connector."""
         ...
 
+    def get_current_metrics(
+        self, track_ids: list[int], connector: str
+    ) -> Awaitable[dict[int, dict[str, tuple[float, "datetime"]]]]:
+        """Get the stored value of every metric a connector has for tracks.
+
+        Args:
+            track_ids: Track IDs to read metrics for.
+            connector: Connector name to filter by.
+
+        Returns:
+            Dictionary mapping track_id to metric name -> (value, collected_at).
+        """
+        ...
+
     def get_metadata_timestamps(
         self, track_ids: list[int], connector: str
     ) -> Awaitable[dict[int, "datetime"]]:
@@ -261,6 +345,20 @@ class ConnectorRepositoryProtocol(Protocol):
         """
         ...
 
+    def find_connector_tracks_by_isrcs(
+        self, connector: str, isrcs: list[str]
+    ) -> Awaitable[dict[str, dict[str, "Any"]]]:
+        """Find a connector's tracks by ISRC in bulk.
+
+        Args:
+            connector: Connector name (e.g., "spotify")
+            isrcs: ISRC codes to look up
+
+        Returns:
+            Dictionary mapping ISRCs to connector track dictionaries
+        """
+        ...
+
     def ingest_external_tracks_bulk(
         self,
         connector: str,
@@ -433,6 +531,16 @@ class UnitOfWorkProtocol(Protocol):
         """Get playlist repository using this unit of work's transaction."""
         ...
 
+    def get_connector_playlist_repository(
+        self,
+    ) -> ConnectorPlaylistRepositoryProtocol:
+        """Get connector playlist repository using this unit of work's transaction."""
+        ...
+
+    def get_library_repository(self) -> LibraryRepositoryProtocol:
+        """Get library query repository using this unit of work's transaction."""
+        ...
+
     def get_like_repository(self) -> LikeRepositoryProtocol:
         """Get like repository using this unit of work's transaction."""
         ...
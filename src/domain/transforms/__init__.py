@@ -17,6 +17,7 @@ from .core import (
     select_by_method,
     set_description,
     sort_by_attribute,
+    sort_by_keys,
     take_last,
 )
 
@@ -43,5 +44,6 @@ __all__ = [
     "set_description",
     # Track sorting
     "sort_by_attribute",
+    "sort_by_keys",
     "take_last",
 ]
@@ -16,12 +16,21 @@ from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any, TypeVar, cast
 
-from toolz import compose_left, curry, get_in
+from toolz import curry, get_in
 
 from src.config import get_logger
 
 from src.domain.entities.playlist import Playlist
 from src.domain.entities.track import Track, TrackList
+from src.domain.transforms.pipeline import (
+    BoundFilter,
+    FilterStep,
+    KeyColumns,
+    LimitStep,
+    Pipeline,
+    Rows,
+    SortStep,
+)
 
 logger = get_logger(__name__)
 
@@ -35,17 +44,21 @@ Transform = Callable[[TrackList], TrackList]
 # === Core Pipeline Functions ===
 
 
-def create_pipeline(*operations: Transform) -> Transform:
+def create_pipeline(*operations: Transform) -> Pipeline:
     """
     Compose multiple transformations into a single operation.
 
+    The chain is planned lazily: consecutive filters run as one pass, a limit
+    after a sort selects the top tracks with a heap, and only the final
+    TrackList is built. Use ``explain()`` on the result to see the plan.
+
     Args:
         *operations: Transformation functions to compose
 
     Returns:
         A single transformation function combining all operations
     """
-    return compose_left(*operations)
+    return Pipeline(operations)
 
 
 # === Track Filtering ===
@@ -67,9 +80,12 @@ def filter_by_predicate(
         Transformation function or transformed tracklist if provided
     """
 
-    def transform(t: TrackList) -> TrackList:
-        filtered = [track for track in t.tracks if predicate(track)]
-        return t.with_tracks(filtered)
+    def bind(t: TrackList) -> BoundFilter:
+        tracks = t.tracks
+        return BoundFilter(lambda i: predicate(tracks[i]))
+
+    name = getattr(predicate, "__name__", "predicate")
+    transform = FilterStep(f"filter_by_predicate({name})", bind)
 
     if tracklist is not None:
         return transform(tracklist)
@@ -88,32 +104,34 @@ def filter_duplicates(tracklist: TrackList | None = None) -> Transform | TrackLi
         Transformation function or transformed tracklist if provided
     """
 
-    def transform(t: TrackList) -> TrackList:
+    def bind(t: TrackList) -> BoundFilter:
+        tracks = t.tracks
         seen_ids = set()
-        unique_tracks = []
-        duplicates_removed = 0
-        original_count = len(t.tracks)
         tracks_without_ids = 0
 
-        for track in t.tracks:
-            if track.id is None:
+        def is_first_occurrence(i: int) -> bool:
+            nonlocal tracks_without_ids
+            track_id = tracks[i].id
+            if track_id is None:
                 # If track has no ID, keep it (can't properly deduplicate)
-                unique_tracks.append(track)
                 tracks_without_ids += 1
-            elif track.id not in seen_ids:
-                seen_ids.add(track.id)
-                unique_tracks.append(track)
-            else:
-                duplicates_removed += 1
-
-        result = t.with_tracks(unique_tracks)
-        # Add metadata for reporting
-        return (
-            result.with_metadata("duplicates_removed", duplicates_removed)
-            .with_metadata("original_count", original_count)
-            .with_metadata("tracks_without_ids", tracks_without_ids)
-        )
+                return True
+            if track_id in seen_ids:
+                return False
+            seen_ids.add(track_id)
+            return True
+
+        def finish(result: TrackList, original_count: int, kept: int) -> TrackList:
+            # Add metadata for reporting
+            return (
+                result.with_metadata("duplicates_removed", original_count - kept)
+                .with_metadata("original_count", original_count)
+                .with_metadata("tracks_without_ids", tracks_without_ids)
+            )
 
+        return BoundFilter(is_first_occurrence, finish)
+
+    transform = FilterStep("filter_duplicates", bind, records_counts=True)
     return transform(tracklist) if tracklist is not None else transform
 
 
@@ -135,18 +153,26 @@ def filter_by_date_range(
         Transformation function or transformed tracklist if provided
     """
 
-    def in_date_range(track: Track) -> bool:
-        if not track.release_date:
-            return False
+    def bind(t: TrackList) -> BoundFilter:
+        now = datetime.now(UTC)
+        release_dates = t.columns.release_dates
 
-        age_days = (datetime.now(UTC) - track.release_date).days
+        def in_age_range(i: int) -> bool:
+            release_date = release_dates[i]
+            if not release_date:
+                return False
 
-        if max_age_days is not None and age_days > max_age_days:
-            return False
+            age_days = (now - release_date).days
+            if max_age_days is not None and age_days > max_age_days:
+                return False
+            return not (min_age_days is not None and age_days < min_age_days)
 
-        return not (min_age_days is not None and age_days < min_age_days)
+        return BoundFilter(in_age_range)
 
-    return cast("Transform | TrackList", filter_by_predicate(in_date_range, tracklist))
+    transform = FilterStep(
+        f"filter_by_date_range({min_age_days}, {max_age_days})", bind
+    )
+    return transform(tracklist) if tracklist is not None else transform
 
 
 @curry
@@ -247,58 +273,89 @@ def filter_by_metric_range(
         Transformation function or transformed tracklist if provided
     """
 
-    def is_in_range(track: Track) -> bool:
-        """Check if track's metric is within the specified range."""
-        if not track.id:
-            return include_missing
-
-        # Get the metrics dictionary from the tracklist metadata
-        metrics = {} if tracklist is None else tracklist.metadata.get("metrics", {})
-        metric_values = metrics.get(metric_name, {})
-
-        # Check if track has the metric
-        if track.id not in metric_values:
-            return include_missing
-
-        value = metric_values[track.id]
-
-        # Check range bounds
+    def is_in_range(value: Any) -> bool:
+        """Check if a metric value is within the specified range."""
         if min_value is not None and value < min_value:
             return False
 
         return not (max_value is not None and value > max_value)
 
-    def transform(t: TrackList) -> TrackList:
-        """Apply the metric filter transformation."""
-        # Set the tracklist for metric lookup in is_in_range
-        nonlocal tracklist
-        tracklist = t
-
-        # Apply filter
-        filter_func = cast("Transform", filter_by_predicate(is_in_range))
-        result = filter_func(t)
-
-        # Add metadata about the filter operation
-        filtered_count = len(result.tracks)
-        return cast("TrackList", result).with_metadata(
-            "filter_metrics",
-            {
-                "metric_name": metric_name,
-                "min_value": min_value,
-                "max_value": max_value,
-                "include_missing": include_missing,
-                "original_count": len(t.tracks),
-                "filtered_count": filtered_count,
-                "removed_count": len(t.tracks) - filtered_count,
-            },
+    def bind(t: TrackList) -> BoundFilter:
+        """Bind the metric filter to a tracklist's metric column."""
+        columns = t.columns
+        ids = columns.ids
+        values = columns.metric(
+            metric_name, t.metadata.get("metrics", {}).get(metric_name, {})
         )
 
+        def keep(i: int) -> bool:
+            value = values[i]
+            # Tracks without an ID or without the metric follow include_missing
+            if not ids[i] or value is None:
+                return include_missing
+            return is_in_range(value)
+
+        def finish(result: TrackList, original_count: int, kept: int) -> TrackList:
+            # Add metadata about the filter operation
+            return result.with_metadata(
+                "filter_metrics",
+                {
+                    "metric_name": metric_name,
+                    "min_value": min_value,
+                    "max_value": max_value,
+                    "include_missing": include_missing,
+                    "original_count": original_count,
+                    "filtered_count": kept,
+                    "removed_count": original_count - kept,
+                },
+            )
+
+        return BoundFilter(keep, finish)
+
+    transform = FilterStep(
+        f"filter_by_metric_range({metric_name})", bind, records_counts=True
+    )
     return transform(tracklist) if tracklist is not None else transform
 
 
 # === Track Sorting ===
 
 
+def _sort_key_column(
+    t: TrackList, key: Callable[[Track], Any] | str, metric_name: str, rows: Rows
+) -> list[Any]:
+    """Compute one sort key for each of the given rows, in row order.
+
+    Resolved metrics in the tracklist metadata take priority. Tracks without
+    a metric value fall back to ``key``: a callable is applied to the track,
+    a string is read as a track attribute. None marks a missing key.
+    """
+    metrics_dict = t.metadata.get("metrics", {}).get(metric_name, {})
+
+    # Track IDs in metrics must be integers, a string key is an upstream bug
+    string_keys = [k for k in metrics_dict if isinstance(k, str)]
+    if string_keys:
+        raise TypeError(
+            f"Metrics dictionary contains string keys instead of integer track IDs: {string_keys[:5]}. "
+            f"This indicates an upstream issue in metric resolution or storage."
+        )
+
+    column = t.columns.metric(metric_name, metrics_dict)
+    if isinstance(key, str):
+        attribute = key
+
+        def fallback(track: Track) -> Any:
+            return getattr(track, attribute, None)
+
+    else:
+        fallback = key
+
+    tracks = t.tracks
+    return [
+        value if (value := column[i]) is not None else fallback(tracks[i]) for i in rows
+    ]
+
+
 @curry
 def sort_by_attribute(
     key_fn: Callable[[Track], Any] | str,
@@ -308,6 +365,10 @@ def sort_by_attribute(
 ) -> Transform | TrackList:
     """Sort tracks by any attribute or derived value.
 
+    Each track's key is computed once: the resolved metric value when there
+    is one, otherwise ``key_fn``. The sort is stable and tracks without a key
+    come last in either direction.
+
     Args:
         key_fn: Function to extract sort key or metric name string
         metric_name: Name for tracking metrics in tracklist metadata
@@ -318,102 +379,66 @@ def sort_by_attribute(
         Transformation function or transformed tracklist if provided
     """
 
-    # Allow passing metric name directly for common use cases
-    if isinstance(key_fn, str):
-        stored_metric_name = key_fn
-
-        def metric_key_fn(track: Track) -> Any:
-            return _extract_track_metric(track, stored_metric_name, 0)
-
-        key_fn = metric_key_fn
+    def sort_keys(t: TrackList, rows: Rows) -> KeyColumns:
+        """Compute the metrics-driven sort key of every row once."""
+        return [(_sort_key_column(t, key_fn, metric_name, rows), reverse)]
 
-    def _extract_track_metric(track: Track, metric_key: str, default: Any = 0) -> Any:
-        """Extract metric from track or its metadata.
-
-        This function is used during the initial key_fn setup phase,
-        but the actual metric extraction is handled by enhanced_key_fn
-        which has access to the tracklist metadata.
-        """
-        if not track.id:
-            return default
-
-        # First try track's own properties
-        if hasattr(track, metric_key) and getattr(track, metric_key) is not None:
-            return getattr(track, metric_key)
-
-        # Note: Tracklist metadata metrics are handled by enhanced_key_fn
-        # This function is only used as a fallback for track attributes
-        return default
-
-    def transform(t: TrackList) -> TrackList:
-        """Apply the sorting transformation with metrics-driven approach."""
-        # Simply use metrics that were resolved at the node boundary
-        metrics_dict = t.metadata.get("metrics", {}).get(metric_name, {})
-
-        # Validate that metrics keys are integers (our expected format)
-        if metrics_dict:
-            # Check if metrics dictionary has string keys (which is an error)
-            string_keys = [k for k in metrics_dict if isinstance(k, str)]
-            if string_keys:
-                # Instead of silently working around this, throw an error so we can fix it
-                # at the source - track IDs should be integers
-                sample_keys = string_keys[:5]
-                raise TypeError(
-                    f"Metrics dictionary contains string keys instead of integer track IDs: {sample_keys}. "
-                    f"This indicates an upstream issue in metric resolution or storage."
-                )
-
-        # Check if we have any non-null values
-
-        # Create enhanced key function that prioritizes metrics
-        def enhanced_key_fn(track: Track) -> Any:
-            if not track.id:
-                return key_fn(track)
-
-            # Check if track ID exists in metrics - track IDs should be integers
-            logger.debug(
-                f"Sorting track {track.id} (type: {type(track.id)}), metric_dict keys: {list(metrics_dict.keys())[:5]}..."
-            )
-            if track.id in metrics_dict:
-                # Use resolved metric if it exists and isn't None
-                metric_value = metrics_dict[track.id]
-                if metric_value is not None:
-                    logger.debug(
-                        f"Using metric value {metric_value} for track {track.id}"
-                    )
-                    return metric_value
-
-            # For missing or None values, use a default that will sort appropriately
-            logger.debug(f"Track {track.id} missing from metrics, using fallback value")
-            if reverse:
-                # When sorting in descending order (reverse=True), put None values at the end
-                return float("-inf")  # Lowest possible value
-            else:
-                # When sorting in ascending order, put None values at the end
-                return float("inf")  # Highest possible value
-
-        # Sort tracks using the enhanced key function
-        sorted_tracks = sorted(t.tracks, key=enhanced_key_fn, reverse=reverse)
-        result = t.with_tracks(sorted_tracks)
-
-        # Store metrics in tracklist metadata (preserving existing metrics)
-        # Use integer track IDs for consistency
+    def finish(t: TrackList, rows: Rows, keys: KeyColumns) -> TrackList:
+        """Store the keys used in tracklist metadata (preserving existing metrics)."""
+        ids = t.columns.ids
         track_metrics = {
-            track.id: enhanced_key_fn(track)
-            for track in t.tracks
-            if track.id is not None
+            ids[i]: value
+            for i, value in zip(rows, keys[0][0], strict=True)
+            if ids[i] is not None and value is not None
         }
-
-        result = result.with_metadata(
+        return t.with_metadata(
             "metrics",
             {
-                **result.metadata.get("metrics", {}),
+                **t.metadata.get("metrics", {}),
                 metric_name: track_metrics,
             },
         )
 
-        return result
+    direction = "desc" if reverse else "asc"
+    transform = SortStep(
+        f"sort_by_attribute({metric_name} {direction})", sort_keys, finish
+    )
+    return transform(tracklist) if tracklist is not None else transform
+
+
+@curry
+def sort_by_keys(
+    keys: list[tuple[str, bool]],
+    tracklist: TrackList | None = None,
+) -> Transform | TrackList:
+    """Sort tracks by several metrics, ties broken by the next metric.
+
+    Each key is a metric name, read from resolved metrics with the track
+    attribute of the same name as fallback, and its own sort direction. Every
+    key is computed once per track, the sort is stable and tracks missing a
+    key come last for that key.
+
+    Args:
+        keys: ``(metric_name, reverse)`` pairs, most significant first
+        tracklist: Optional tracklist to transform immediately
+
+    Returns:
+        Transformation function or transformed tracklist if provided
+    """
+    if not keys:
+        raise ValueError("sort_by_keys requires at least one sort key")
+
+    def sort_keys(t: TrackList, rows: Rows) -> KeyColumns:
+        """Compute every key of every row once."""
+        return [
+            (_sort_key_column(t, metric_name, metric_name, rows), reverse)
+            for metric_name, reverse in keys
+        ]
 
+    labels = ", ".join(
+        f"{metric_name} {'desc' if reverse else 'asc'}" for metric_name, reverse in keys
+    )
+    transform = SortStep(f"sort_by_keys({labels})", sort_keys)
     return transform(tracklist) if tracklist is not None else transform
 
 
@@ -433,9 +458,7 @@ def limit(count: int, tracklist: TrackList | None = None) -> Transform | TrackLi
         Transformation function or transformed tracklist if provided
     """
 
-    def transform(t: TrackList) -> TrackList:
-        return t.with_tracks(t.tracks[:count])
-
+    transform = LimitStep(count)
     return transform(tracklist) if tracklist is not None else transform
 
 
@@ -766,32 +789,31 @@ def filter_by_time_criteria(
 
         return time_pred(time_data)
 
-    def transform(t: TrackList) -> TrackList:
-        """Apply time-based filtering using existing predicate infrastructure."""
-
-        # Create predicate function that captures current tracklist
-        def predicate_with_tracklist(track: Track) -> bool:
-            return track_time_predicate(track, t)
+    def bind(t: TrackList) -> BoundFilter:
+        """Bind the time predicate to the tracklist holding the time data."""
+        tracks = t.tracks
+
+        def finish(result: TrackList, original_count: int, kept: int) -> TrackList:
+            # Add filter metadata
+            return result.with_metadata(
+                "time_filter_applied",
+                {
+                    "metadata_key": metadata_key,
+                    "days_back": days_back,
+                    "after_date": after_date.isoformat() if after_date else None,
+                    "before_date": before_date.isoformat() if before_date else None,
+                    "include_missing": include_missing,
+                    "original_count": original_count,
+                    "filtered_count": kept,
+                    "removed_count": original_count - kept,
+                },
+            )
 
-        # Use existing filter_by_predicate with our time predicate
-        filter_func: Transform = filter_by_predicate(predicate_with_tracklist)  # type: ignore[assignment]
-        result: TrackList = filter_func(t)
-
-        # Add filter metadata
-        return result.with_metadata(
-            "time_filter_applied",
-            {
-                "metadata_key": metadata_key,
-                "days_back": days_back,
-                "after_date": after_date.isoformat() if after_date else None,
-                "before_date": before_date.isoformat() if before_date else None,
-                "include_missing": include_missing,
-                "original_count": len(t.tracks),
-                "filtered_count": len(result.tracks),
-                "removed_count": len(t.tracks) - len(result.tracks),
-            },
-        )
+        return BoundFilter(lambda i: track_time_predicate(tracks[i], t), finish)
 
+    transform = FilterStep(
+        f"filter_by_time_criteria({metadata_key})", bind, records_counts=True
+    )
     return transform(tracklist) if tracklist is not None else transform
 
 
@@ -855,8 +877,8 @@ def filter_by_play_history(
             "min_plays, max_plays, after_date, before_date, days_back, or days_forward"
         )
 
-    def transform(t: TrackList) -> TrackList:
-        """Apply unified play history filtering."""
+    def bind(t: TrackList) -> BoundFilter:
+        """Bind unified play history filtering to a tracklist's play data."""
         # Calculate effective date range
         effective_after = None
         effective_before = None
@@ -879,13 +901,23 @@ def filter_by_play_history(
             "metrics", {}
         ).get("last_played_dates", {})
 
-        def meets_play_history_criteria(track: Track) -> bool:
-            if not track.id:
+        columns = t.columns
+        check_counts = min_plays is not None or max_plays is not None
+        check_dates = effective_after is not None or effective_before is not None
+        counts = columns.metric("total_plays", play_counts) if check_counts else None
+        last_played_column = (
+            columns.metric("last_played_dates", last_played_dates)
+            if check_dates
+            else None
+        )
+
+        def meets_play_history_criteria(i: int) -> bool:
+            if not columns.ids[i]:
                 return include_missing
 
             # Apply play count constraints
-            if min_plays is not None or max_plays is not None:
-                play_count = play_counts.get(track.id, 0)
+            if counts is not None:
+                play_count = counts[i] or 0
 
                 if min_plays is not None and play_count < min_plays:
                     return False
@@ -893,8 +925,8 @@ def filter_by_play_history(
                     return False
 
             # Apply date constraints
-            if effective_after is not None or effective_before is not None:
-                last_played = last_played_dates.get(track.id)
+            if last_played_column is not None:
+                last_played = last_played_column[i]
 
                 if last_played is None:
                     return include_missing
@@ -913,30 +945,28 @@ def filter_by_play_history(
 
             return True
 
-        filtered_tracks = [
-            track for track in t.tracks if meets_play_history_criteria(track)
-        ]
-        result = t.with_tracks(filtered_tracks)
-
-        # Add comprehensive filter metadata
-        filter_metadata = {
-            "type": "unified_play_history",
-            "min_plays": min_plays,
-            "max_plays": max_plays,
-            "effective_after_date": effective_after.isoformat()
-            if effective_after
-            else None,
-            "effective_before_date": effective_before.isoformat()
-            if effective_before
-            else None,
-            "days_back": days_back,
-            "days_forward": days_forward,
-            "include_missing": include_missing,
-            "original_count": len(t.tracks),
-            "filtered_count": len(filtered_tracks),
-            "removed_count": len(t.tracks) - len(filtered_tracks),
-        }
+        def finish(result: TrackList, original_count: int, kept: int) -> TrackList:
+            # Add comprehensive filter metadata
+            filter_metadata = {
+                "type": "unified_play_history",
+                "min_plays": min_plays,
+                "max_plays": max_plays,
+                "effective_after_date": effective_after.isoformat()
+                if effective_after
+                else None,
+                "effective_before_date": effective_before.isoformat()
+                if effective_before
+                else None,
+                "days_back": days_back,
+                "days_forward": days_forward,
+                "include_missing": include_missing,
+                "original_count": original_count,
+                "filtered_count": kept,
+                "removed_count": original_count - kept,
+            }
+            return result.with_metadata("play_filter_applied", filter_metadata)
 
-        return result.with_metadata("play_filter_applied", filter_metadata)
+        return BoundFilter(meets_play_history_criteria, finish)
 
+    transform = FilterStep("filter_by_play_history", bind, records_counts=True)
     return transform(tracklist) if tracklist is not None else transform
@@ -0,0 +1,355 @@
+"""Lazy planning and fused execution of TrackList transform pipelines.
+
+Composing transforms eagerly builds a full TrackList, with a metadata copy,
+after every step. A Pipeline instead plans the whole chain first and runs it
+over row indices into the input, so only the final TrackList is allocated:
+
+- consecutive filters are fused into one pass over the rows
+- a limit is pushed into the step before it: a filter scan stops as soon as
+  enough rows passed, a sort keeps only the top ``k`` rows with a heap
+- transforms the planner does not understand run unchanged, as barriers
+
+Transforms take part in planning by being one of the step types below; the
+step is itself a Transform, so the same object works on its own and inside a
+pipeline. ``Pipeline.explain()`` shows the plan.
+"""
+
+from collections.abc import Callable, Iterator, Sequence
+import heapq
+from itertools import islice
+from typing import Any
+
+from attrs import define, field
+
+from src.config import get_logger
+from src.domain.entities.track import TrackList
+from src.domain.entities.track_columns import lexsort
+
+logger = get_logger(__name__)
+
+# Positions into the rows of the TrackList a stage reads from
+type Rows = list[int]
+# Sort key columns aligned with Rows, each with its direction
+type KeyColumns = list[tuple[list[Any], bool]]
+
+
+@define(frozen=True, slots=True)
+class BoundFilter:
+    """A filter's row test bound to one input TrackList.
+
+    Attributes:
+        keep: Whether to keep the row at a position of the input
+        finish: Optional hook that records filter statistics as metadata,
+            called with the result, the rows tested and the rows kept
+    """
+
+    keep: Callable[[int], bool]
+    finish: Callable[[TrackList, int, int], TrackList] | None = None
+
+
+@define(frozen=True, slots=True)
+class FilterStep:
+    """Keep the rows a predicate accepts; fused with neighbouring filters.
+
+    Attributes:
+        label: Name shown by ``Pipeline.explain()``
+        bind: Builds the row test for an input TrackList
+        records_counts: Whether ``finish`` needs every row tested, which
+            stops a following limit from ending the scan early
+    """
+
+    label: str
+    bind: Callable[[TrackList], BoundFilter]
+    records_counts: bool = False
+
+    def __call__(self, tracklist: TrackList) -> TrackList:
+        """Apply the filter on its own."""
+        return Pipeline((self,))(tracklist)
+
+
+@define(frozen=True, slots=True)
+class SortStep:
+    """Order rows by key columns computed once per row.
+
+    Attributes:
+        label: Name shown by ``Pipeline.explain()``
+        keys: Computes the key columns for the given rows of an input
+        finish: Optional hook that records the keys as metadata, called
+            with the input, the rows sorted and their key columns
+    """
+
+    label: str
+    keys: Callable[[TrackList, Rows], KeyColumns]
+    finish: Callable[[TrackList, Rows, KeyColumns], TrackList] | None = None
+
+    def __call__(self, tracklist: TrackList) -> TrackList:
+        """Apply the sort on its own."""
+        return Pipeline((self,))(tracklist)
+
+
+@define(frozen=True, slots=True)
+class LimitStep:
+    """Keep the first ``count`` rows, with slice semantics."""
+
+    count: int
+
+    def __call__(self, tracklist: TrackList) -> TrackList:
+        """Apply the limit on its own."""
+        return Pipeline((self,))(tracklist)
+
+
+def _all_rows(tracklist: TrackList, rows: Rows | None) -> Rows:
+    """Rows to read, ``None`` meaning every row of the input in order."""
+    return list(range(len(tracklist.tracks))) if rows is None else rows
+
+
+@define(slots=True)
+class _Scan:
+    """Fused filters, optionally ending in a limit."""
+
+    filters: list[FilterStep]
+    limit: int | None = None
+
+    def describe(self) -> str:
+        labels = " -> ".join(step.label for step in self.filters)
+        text = f"filter [{labels}]"
+        if len(self.filters) > 1:
+            text += f", fused {len(self.filters)} filters in one pass"
+        if self.limit is not None:
+            early = not any(step.records_counts for step in self.filters)
+            text += f", limit {self.limit}"
+            text += " (stops scanning early)" if early else " (after full scan)"
+        return text
+
+    def run(self, ctx: TrackList, rows: Rows | None) -> tuple[TrackList, Rows]:
+        rows = _all_rows(ctx, rows)
+        bound = [step.bind(ctx) for step in self.filters]
+
+        if not any(b.finish for b in bound):
+            keeps = [b.keep for b in bound]
+            if len(keeps) == 1:
+                keep = keeps[0]
+                passing = (row for row in rows if keep(row))
+            else:
+                passing = (row for row in rows if all(k(row) for k in keeps))
+            return ctx, list(islice(passing, self.limit))
+
+        # Statistics need how many rows reached and passed each filter
+        passed = [0] * len(bound)
+        kept = []
+        for row in rows:
+            for j, b in enumerate(bound):
+                if not b.keep(row):
+                    break
+                passed[j] += 1
+            else:
+                kept.append(row)
+
+        tested = len(rows)
+        for b, kept_count in zip(bound, passed, strict=True):
+            if b.finish is not None:
+                ctx = b.finish(ctx, tested, kept_count)
+            tested = kept_count
+        return ctx, kept[: self.limit]
+
+
+class _RowKey:
+    """Comparison key for one row across several key columns.
+
+    Only used to feed multi-key rows to ``heapq``; ``lexsort`` is faster
+    when every row is needed.
+    """
+
+    __slots__ = ("keys", "row")
+
+    def __init__(self, keys: KeyColumns, row: int) -> None:
+        self.keys = keys
+        self.row = row
+
+    def _compare(self, other: "_RowKey") -> int:
+        for values, reverse in self.keys:
+            a, b = values[self.row], values[other.row]
+            if a is None or b is None:
+                # Missing keys come last whatever the direction
+                if a is None and b is None:
+                    continue
+                return 1 if a is None else -1
+            if a < b:
+                return 1 if reverse else -1
+            if b < a:
+                return -1 if reverse else 1
+        return 0
+
+    def __lt__(self, other: "_RowKey") -> bool:
+        return self._compare(other) < 0
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _RowKey) and self._compare(other) == 0
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _top_k(keys: KeyColumns, k: int) -> list[int]:
+    """Positions of the first ``k`` rows in ``lexsort(keys)`` order."""
+    count = len(keys[0][0])
+    if k >= count:
+        return lexsort(keys)[:k]
+
+    if len(keys) == 1:
+        values, reverse = keys[0]
+        present = [i for i in range(count) if values[i] is not None]
+        # Both are documented equivalent to sorted(...)[:k], so stable
+        pick = heapq.nlargest if reverse else heapq.nsmallest
+        top = pick(k, present, key=values.__getitem__)
+        if len(top) < k:
+            missing = (i for i in range(count) if values[i] is None)
+            top.extend(islice(missing, k - len(top)))
+        return top
+
+    return heapq.nsmallest(k, range(count), key=lambda i: _RowKey(keys, i))
+
+
+@define(slots=True)
+class _Sort:
+    """A sort, run as a top-k heap selection when followed by a limit."""
+
+    sort: SortStep
+    limit: int | None = None
+
+    def describe(self) -> str:
+        if self.limit is None:
+            return f"sort {self.sort.label}"
+        return f"top-{self.limit} heap {self.sort.label}"
+
+    def run(self, ctx: TrackList, rows: Rows | None) -> tuple[TrackList, Rows]:
+        rows = _all_rows(ctx, rows)
+        keys = self.sort.keys(ctx, rows)
+        if not rows:
+            positions = []
+        elif self.limit is None:
+            positions = lexsort(keys)
+        else:
+            positions = _top_k(keys, self.limit)
+
+        logger.debug(
+            "Sorted tracks",
+            sort=self.sort.label,
+            track_count=len(rows),
+            missing_count=keys[0][0].count(None) if keys else 0,
+            top_k=self.limit,
+        )
+
+        if self.sort.finish is not None:
+            ctx = self.sort.finish(ctx, rows, keys)
+        return ctx, [rows[p] for p in positions]
+
+
+@define(slots=True)
+class _Limit:
+    """A limit that could not be pushed into the stage before it."""
+
+    count: int
+
+    def describe(self) -> str:
+        return f"limit {self.count}"
+
+    def run(self, ctx: TrackList, rows: Rows | None) -> tuple[TrackList, Rows]:
+        return ctx, _all_rows(ctx, rows)[: self.count]
+
+
+@define(slots=True)
+class _Opaque:
+    """A transform the planner cannot see into; materializes its input."""
+
+    transform: Callable[[TrackList], TrackList]
+
+    def describe(self) -> str:
+        name = getattr(self.transform, "__qualname__", repr(self.transform))
+        return f"transform {name} (materializes input)"
+
+    def run(self, ctx: TrackList, rows: Rows | None) -> tuple[TrackList, None]:
+        tracklist = ctx if rows is None else ctx.take(rows)
+        return self.transform(tracklist), None
+
+
+type _Stage = _Scan | _Sort | _Limit | _Opaque
+
+
+def _flatten(
+    operations: Sequence[Callable[[TrackList], TrackList]],
+) -> Iterator[Callable[[TrackList], TrackList]]:
+    """Inline nested pipelines so their steps fuse with their neighbours."""
+    for operation in operations:
+        if isinstance(operation, Pipeline):
+            yield from _flatten(operation.operations)
+        else:
+            yield operation
+
+
+def _plan(operations: Sequence[Callable[[TrackList], TrackList]]) -> list[_Stage]:
+    """Group operations into stages, fusing filters and pushing limits down."""
+    stages: list[_Stage] = []
+    for operation in _flatten(operations):
+        last = stages[-1] if stages else None
+
+        if isinstance(operation, FilterStep):
+            if isinstance(last, _Scan) and last.limit is None:
+                last.filters.append(operation)
+            else:
+                stages.append(_Scan([operation]))
+        elif isinstance(operation, SortStep):
+            stages.append(_Sort(operation))
+        elif isinstance(operation, LimitStep):
+            count = operation.count
+            # Negative counts drop rows from the end, so they never move
+            if count < 0:
+                stages.append(_Limit(count))
+            elif isinstance(last, _Scan | _Sort):
+                last.limit = count if last.limit is None else min(last.limit, count)
+            elif isinstance(last, _Limit) and last.count >= 0:
+                last.count = min(last.count, count)
+            else:
+                stages.append(_Limit(count))
+        else:
+            stages.append(_Opaque(operation))
+    return stages
+
+
+@define(slots=True)
+class Pipeline:
+    """A planned chain of transforms, applied as one Transform.
+
+    Example:
+        pipeline = create_pipeline(
+            filter_duplicates(),
+            filter_by_metric_range("popularity", min_value=50),
+            sort_by_attribute("popularity", "popularity", reverse=True),
+            limit(20),
+        )
+        print(pipeline.explain())
+        result = pipeline(tracklist)
+    """
+
+    operations: tuple[Callable[[TrackList], TrackList], ...]
+    _stages: list[_Stage] = field(init=False)
+
+    def __attrs_post_init__(self) -> None:
+        """Plan once; the plan is reused for every tracklist."""
+        self._stages = _plan(self.operations)
+
+    def __call__(self, tracklist: TrackList) -> TrackList:
+        """Run the plan, allocating only the resulting TrackList."""
+        ctx = tracklist
+        rows: Rows | None = None
+        for stage in self._stages:
+            ctx, rows = stage.run(ctx, rows)
+        return ctx if rows is None else ctx.take(rows)
+
+    def explain(self) -> str:
+        """Describe the planned stages, one numbered line per stage."""
+        if not self._stages:
+            return "(empty pipeline)"
+        return "\n".join(
+            f"{number}. {stage.describe()}"
+            for number, stage in enumerate(self._stages, start=1)
+        )
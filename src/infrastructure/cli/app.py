@@ -1,26 +1,162 @@
-"""Narada CLI - Main application entry point and app structure."""
+"""Narada CLI - Main application entry point and app structure.
 
+Commands are registered lazily: ``narada --help`` lists them from the metadata
+below, and a command module (with its Prefect, SQLAlchemy or connector
+imports) is only imported when one of its commands runs. Keep module-level
+imports here limited to the CLI toolkit.
+"""
+
+from functools import partial
 from importlib.metadata import version
 from pathlib import Path
 from typing import Annotated
 
+import click
 from rich.console import Console
 import typer
 
-from src.config import get_logger, setup_loguru_logger
-from src.infrastructure.cli import data_commands, workflows_commands
-from src.infrastructure.cli.setup_commands import register_setup_commands
-from src.infrastructure.cli.status_commands import register_status_commands
-from src.infrastructure.cli.workflows_commands import list_workflows
+from src.infrastructure.cli.lazy_group import (
+    LazyCommandSpec,
+    LazyTyperGroup,
+    import_registered_command,
+    import_typer_app,
+)
+from src.infrastructure.cli.workflow_index import load_workflow_index
 
 VERSION = version("narada")
 
-# Initialize console and logger with reasonable width
+# Initialize console with reasonable width
 console = Console(width=80)
-logger = get_logger(__name__)
+
+COMMANDS = [
+    LazyCommandSpec(
+        name="playlist",
+        help="Create and manage playlists",
+        load=import_typer_app("src.infrastructure.cli.workflows_commands:app"),
+        rich_help_panel="🔧 Playlist Workflow Management",
+    ),
+    LazyCommandSpec(
+        name="status",
+        help="Check connection status of music services",
+        load=import_registered_command(
+            "src.infrastructure.cli.status_commands:register_status_commands",
+            "status",
+        ),
+        rich_help_panel="⚙️ System",
+    ),
+    LazyCommandSpec(
+        name="setup",
+        help="Configure your music service connections",
+        load=import_registered_command(
+            "src.infrastructure.cli.setup_commands:register_setup_commands", "setup"
+        ),
+        rich_help_panel="⚙️ System",
+    ),
+    LazyCommandSpec(
+        name="init-db",
+        help="Initialize the database schema",
+        load=import_registered_command(
+            "src.infrastructure.cli.setup_commands:register_setup_commands",
+            "init-db",
+        ),
+        rich_help_panel="⚙️ System",
+    ),
+    LazyCommandSpec(
+        name="data",
+        help="Manage your music data",
+        load=import_typer_app("src.infrastructure.cli.data_commands:app"),
+        rich_help_panel="📊 Data Sync",
+    ),
+]
+
+
+def _workflow_command(workflow_id: str, workflow_name: str) -> click.Command:
+    """Build the top-level command that runs a single workflow."""
+    workflow_app = typer.Typer()
+
+    @workflow_app.command(name=workflow_id, help=f"Run {workflow_name} workflow")
+    def workflow_command(  # pyright: ignore[reportUnusedFunction]
+        show_results: Annotated[
+            bool,
+            typer.Option("--show-results/--no-results", help="Show result metrics"),
+        ] = True,
+        output_format: Annotated[
+            str,
+            typer.Option("--format", "-f", help="Output format (table, json)"),
+        ] = "table",
+        engine: Annotated[
+            str,
+            typer.Option("--engine", help="Execution engine (prefect, local)"),
+        ] = "prefect",
+        profile: Annotated[
+            bool,
+            typer.Option(
+                "--profile", help="Show time, memory, API and SQL use per node"
+            ),
+        ] = False,
+        trace_file: Annotated[
+            Path | None,
+            typer.Option(
+                "--trace", help="Write a Chrome trace of the run to this file"
+            ),
+        ] = None,
+        stream: Annotated[
+            bool,
+            typer.Option(
+                "--stream", help="Stream tracks between nodes in bounded batches"
+            ),
+        ] = False,
+    ) -> None:
+        """Run workflow."""
+        from src.infrastructure.cli.workflows_commands import (
+            _run_workflow_interactive,
+        )
+
+        _run_workflow_interactive(
+            workflow_id,
+            show_results,
+            output_format,
+            engine,
+            profile,
+            trace_file,
+            stream,
+        )
+
+    return typer.main.get_command(workflow_app)
+
+
+def workflow_commands() -> list[LazyCommandSpec]:
+    """Top-level commands for direct access to each workflow definition."""
+    try:
+        workflows = load_workflow_index()
+    except Exception as e:
+        # If workflow discovery fails, log but don't crash the CLI
+        from src.config import get_logger
+
+        get_logger(__name__).debug(f"Failed to register workflow commands: {e}")
+        return []
+
+    return [
+        LazyCommandSpec(
+            name=workflow["id"],
+            help=f"Run {workflow['name']} workflow",
+            load=partial(_workflow_command, workflow["id"], workflow["name"]),
+            rich_help_panel="🎵 Playlist Workflows",
+        )
+        for workflow in workflows
+    ]
+
+
+class NaradaGroup(LazyTyperGroup):
+    """Root command group resolving command modules and workflows lazily."""
+
+    def lazy_commands(self) -> list[LazyCommandSpec]:
+        return [*COMMANDS, *workflow_commands()]
+
 
 # Initialize main app with modern configuration
 app = typer.Typer(
+    cls=NaradaGroup,
     help=f"🎵 Narada v{VERSION} - Your personal music integration platform",
     no_args_is_help=True,  # Show help when no command provided
     rich_markup_mode="rich",
@@ -30,77 +166,6 @@ app = typer.Typer(
     pretty_exceptions_show_locals=False,
 )
 
-# Add unified playlist command
-app.add_typer(
-    workflows_commands.app,
-    name="playlist",
-    help="Create and manage playlists",
-    rich_help_panel="🔧 Playlist Workflow Management",
-)
-
-# Register individual utility commands
-register_status_commands(app)
-register_setup_commands(app)
-
-# Add unified data command
-app.add_typer(
-    data_commands.app,
-    name="data",
-    help="Manage your music data",
-    rich_help_panel="📊 Data Sync",
-)
-
-
-# Register individual workflow commands for direct access
-def register_workflow_commands() -> None:
-    """Register individual workflow commands at the top level for direct access."""
-    try:
-        workflows = list_workflows()
-        for workflow in workflows:
-            workflow_id = workflow["id"]
-            workflow_name = workflow["name"]
-
-            # Create a command function for this workflow
-            def create_workflow_command(wf_id: str, wf_name: str) -> None:
-                """Create a command function for a specific workflow."""
-
-                @app.command(
-                    name=wf_id,
-                    help=f"Run {wf_name} workflow",
-                    rich_help_panel="🎵 Playlist Workflows",
-                )
-                def workflow_command(  # pyright: ignore[reportUnusedFunction]
-                    show_results: Annotated[
-                        bool,
-                        typer.Option(
-                            "--show-results/--no-results", help="Show result metrics"
-                        ),
-                    ] = True,
-                    output_format: Annotated[
-                        str,
-                        typer.Option(
-                            "--format", "-f", help="Output format (table, json)"
-                        ),
-                    ] = "table",
-                ) -> None:
-                    """Run workflow."""
-                    # Import here to avoid circular imports
-                    from src.infrastructure.cli.workflows_commands import (
-                        _run_workflow_interactive,
-                    )
-
-                    _run_workflow_interactive(wf_id, show_results, output_format)
-
-            create_workflow_command(workflow_id, workflow_name)
-
-    except Exception as e:
-        # If workflow registration fails, log but don't crash the CLI
-        logger.debug(f"Failed to register workflow commands: {e}")
-
-
-# Register workflow commands at import time
-register_workflow_commands()
-
 
 @app.command(name="version", rich_help_panel="⚙️ System")
 def version_command() -> None:
@@ -110,9 +175,6 @@ def version_command() -> None:
     )
 
 
-# No longer registering duplicate workflow commands - use unified 'playlist' command
-
-
 @app.callback()
 def init_cli(
     ctx: typer.Context,
@@ -122,6 +184,8 @@ def init_cli(
     ] = False,
 ) -> None:
     """Initialize Narada CLI."""
+    from src.config import setup_loguru_logger
+
     # Store verbosity in context for subcommands
     ctx.ensure_object(dict)
     ctx.obj["verbose"] = verbose
@@ -139,5 +203,7 @@ def main() -> int:
         # Let Typer handle command execution
         return app() or 0
     except Exception:
-        logger.exception("Unhandled exception")
+        from src.config import get_logger
+
+        get_logger(__name__).exception("Unhandled exception")
         return 1
@@ -541,3 +541,41 @@ def export_likes_lastfm_command(
 ) -> None:
     """Export your liked tracks to Last.fm as loves."""
     _handle_lastfm_loves(limit, batch_size, user_id)
+
+
+@app.command(name="build-musicbrainz-index")
+def build_musicbrainz_index_command(
+    source: Annotated[
+        Path,
+        typer.Argument(
+            help="Recording/ISRC TSV file or MusicBrainz dump directory (mbdump)"
+        ),
+    ],
+    output: Annotated[
+        Path | None,
+        typer.Option("--output", "-o", help="Index file to write"),
+    ] = None,
+) -> None:
+    """Build an offline MusicBrainz index for local ISRC and artist/title lookups."""
+    from src.infrastructure.connectors.musicbrainz_index import (
+        build_musicbrainz_index,
+        local_index_path,
+    )
+
+    if not source.exists():
+        console.print(f"[red]Source not found: {source}[/red]")
+        raise typer.Exit(1)
+
+    index_path = output or local_index_path()
+
+    with console.status(f"[bold blue]Indexing {source}..."):
+        try:
+            counts = build_musicbrainz_index(source, index_path)
+        except FileNotFoundError as e:
+            console.print(f"[red]{e}[/red]")
+            raise typer.Exit(1) from e
+
+    console.print(
+        f"[green]Indexed {counts['recordings']:,} recordings and "
+        f"{counts['isrcs']:,} ISRCs into {index_path}[/green]"
+    )
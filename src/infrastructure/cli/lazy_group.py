@@ -0,0 +1,124 @@
+"""Lazy command loading for the Narada CLI.
+
+Command modules import heavy dependencies at module level: the data commands
+pull in SQLAlchemy and the repositories, the playlist commands Prefect, and
+the connectors spotipy and pylast. Registering every command eagerly made even
+``narada --help`` pay for all of them.
+
+``LazyTyperGroup`` lists lazily registered commands from static metadata
+(name, help text, help panel) and imports a command's module only when that
+command is actually resolved for execution or for its own ``--help``.
+"""
+
+from collections.abc import Callable
+from functools import cached_property
+from importlib import import_module
+from typing import Any
+
+from attrs import define
+import click
+import typer
+from typer.core import TyperGroup
+
+type CommandLoader = Callable[[], click.Command]
+
+
+@define(frozen=True, slots=True)
+class LazyCommandSpec:
+    """Help metadata and loader for a command imported on demand.
+
+    Attributes:
+        name: Command name on the command line
+        help: Short help shown in the parent's command listing
+        load: Builds the real click command, importing whatever it needs
+        rich_help_panel: Help panel the command is listed under
+    """
+
+    name: str
+    help: str
+    load: CommandLoader
+    rich_help_panel: str | None = None
+
+
+class LazyCommand(click.Command):
+    """Help-listing placeholder for a command that has not been imported."""
+
+    def __init__(self, spec: LazyCommandSpec) -> None:
+        super().__init__(spec.name, help=spec.help)
+        self.spec = spec
+        self.rich_help_panel = spec.rich_help_panel
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group whose lazily registered commands load on first use.
+
+    Subclasses override ``lazy_commands``. Help output renders placeholders
+    built from the specs, while ``resolve_command`` (used for invocation and
+    completion) swaps in the real command. Commands registered directly on the
+    Typer app take precedence over lazy specs with the same name.
+    """
+
+    def lazy_commands(self) -> list[LazyCommandSpec]:
+        """Specs for the commands this group loads lazily."""
+        return []
+
+    @cached_property
+    def _lazy_specs(self) -> dict[str, LazyCommandSpec]:
+        return {
+            spec.name: spec
+            for spec in self.lazy_commands()
+            if spec.name not in self.commands
+        }
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return [*self._lazy_specs, *super().list_commands(ctx)]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self._lazy_specs:
+            command = LazyCommand(self._lazy_specs[cmd_name])
+        return command
+
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        cmd_name, command, remaining = super().resolve_command(ctx, args)
+        if isinstance(command, LazyCommand):
+            command = command.spec.load()
+        return cmd_name, command, remaining
+
+
+def _import_attribute(target: str) -> Any:
+    module_name, _, attribute = target.partition(":")
+    return getattr(import_module(module_name), attribute)
+
+
+def import_typer_app(target: str) -> CommandLoader:
+    """Loader for a Typer sub-app given as ``"package.module:attribute"``."""
+
+    def load() -> click.Command:
+        return typer.main.get_command(_import_attribute(target))
+
+    return load
+
+
+def import_registered_command(target: str, name: str) -> CommandLoader:
+    """Loader for a command added by a ``register_*_commands(app)`` function.
+
+    Args:
+        target: Registration function as ``"package.module:function"``
+        name: Name of the command to extract after registration
+
+    Returns:
+        Loader that registers into a scratch app and returns the named command
+    """
+
+    def load() -> click.Command:
+        scratch = typer.Typer()
+        _import_attribute(target)(scratch)
+        command = typer.main.get_command(scratch)
+        if isinstance(command, click.Group):
+            return command.commands[name]
+        return command
+
+    return load
@@ -16,7 +16,7 @@ from rich.text import Text
 import typer
 
 from src.config import get_logger
-from src.domain.entities import OperationResult
+from src.domain.entities import OperationResult, WorkflowResult
 
 # Initialize console and logger
 console = Console()
@@ -277,6 +277,49 @@ def display_operation_result(
     console.print()
 
 
+def display_workflow_profile(result: WorkflowResult) -> None:
+    """Display the time, memory, API and SQL use of each workflow node.
+
+    Args:
+        result: Workflow result carrying per-node profiles
+    """
+    if not result.node_profiles:
+        console.print("[dim]No node profiles recorded.[/dim]")
+        return
+
+    table = Table(title="Node Profile")
+    table.add_column("Task", style="cyan")
+    table.add_column("Type", style="dim")
+    table.add_column("Wall", justify="right", style="green bold")
+    table.add_column("CPU", justify="right")
+    table.add_column("Peak Mem", justify="right")
+    table.add_column("API", justify="right", style="yellow")
+    table.add_column("SQL", justify="right", style="yellow")
+    table.add_column("Tracks", justify="right")
+
+    for profile in result.node_profiles:
+        memory = (
+            "—"
+            if profile.peak_memory is None
+            else f"{profile.peak_memory / 1_048_576:.1f} MB"
+        )
+        api_calls = ", ".join(
+            f"{service} {count}" for service, count in profile.api_calls.items()
+        )
+        table.add_row(
+            profile.task_id,
+            profile.node_type,
+            f"{profile.wall_time * 1000:.0f} ms",
+            f"{profile.cpu_time * 1000:.0f} ms",
+            memory,
+            api_calls or "0",
+            str(profile.sql_statements),
+            f"{profile.tracks_in} → {profile.tracks_out}",
+        )
+
+    console.print(table)
+
+
 def display_error(error: Exception, operation: str) -> None:
     """Display error message with consistent formatting.
 
@@ -0,0 +1,137 @@
+"""Cached index of workflow definition metadata for the CLI.
+
+``narada --help``, shell completion and the playlist menus only need each
+workflow's id, name, description and task count. The index stores those
+summaries on disk keyed by each definition file's modification time and size,
+so repeated CLI invocations stat the definitions directory instead of parsing
+every JSON file, and only new or edited definitions are re-read.
+
+This module is imported on the CLI startup path; keep it free of application,
+Prefect and database imports.
+"""
+
+from collections.abc import Callable
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+DEFINITIONS_PATH = (
+    Path(__file__).parent.parent.parent / "application" / "workflows" / "definitions"
+)
+INDEX_CACHE_NAME = "workflow_index.json"
+
+# Bump when the summary format changes so stale caches are rebuilt
+_INDEX_VERSION = 1
+
+type WorkflowSummary = dict[str, Any]
+type ErrorHandler = Callable[[Path, Exception], None]
+
+
+def index_cache_path() -> Path:
+    """Index cache file under the configured data directory.
+
+    Reads ``DATA_DIR`` as ``settings.data_dir`` does, without importing the
+    settings stack onto the CLI startup path.
+    """
+    return Path(os.environ.get("DATA_DIR", "data")) / "cache" / INDEX_CACHE_NAME
+
+
+def load_workflow_index(
+    definitions_path: Path = DEFINITIONS_PATH,
+    *,
+    cache_path: Path | None = None,
+    on_error: ErrorHandler | None = None,
+) -> list[WorkflowSummary]:
+    """Summaries of all workflow definitions, served from cache when fresh.
+
+    Args:
+        definitions_path: Directory containing workflow definition JSON files
+        cache_path: Index cache file, defaults to ``index_cache_path()``
+        on_error: Called with the file and exception for unreadable definitions
+
+    Returns:
+        Workflow summaries (id, name, description, task_count, path) ordered
+        by file name
+    """
+    if not definitions_path.exists():
+        return []
+
+    if cache_path is None:
+        cache_path = index_cache_path()
+
+    cached = _read_cache(cache_path, definitions_path)
+    files: dict[str, dict[str, Any]] = {}
+    workflows: list[WorkflowSummary] = []
+    changed = False
+
+    for json_file in sorted(definitions_path.glob("*.json")):
+        key = str(json_file)
+        try:
+            stat = json_file.stat()
+            fingerprint = [stat.st_mtime_ns, stat.st_size]
+            entry = cached.get(key)
+            if entry is None or entry.get("fingerprint") != fingerprint:
+                definition = json.loads(json_file.read_text())
+                entry = {
+                    "fingerprint": fingerprint,
+                    "workflow": _summarize(definition, json_file),
+                }
+                changed = True
+        except (OSError, json.JSONDecodeError) as e:
+            if on_error is not None:
+                on_error(json_file, e)
+            continue
+
+        files[key] = entry
+        workflows.append(dict(entry["workflow"]))
+
+    # Deleted definitions also invalidate the cache
+    if changed or files.keys() != cached.keys():
+        _write_cache(cache_path, definitions_path, files)
+
+    return workflows
+
+
+def _summarize(definition: dict[str, Any], json_file: Path) -> WorkflowSummary:
+    return {
+        "id": definition.get("id", json_file.stem),
+        "name": definition.get("name", "Unknown"),
+        "description": definition.get("description", ""),
+        "task_count": len(definition.get("tasks", [])),
+        "path": str(json_file),
+    }
+
+
+def _read_cache(cache_path: Path, definitions_path: Path) -> dict[str, dict[str, Any]]:
+    """Cached entries for a definitions directory, or empty when unusable."""
+    try:
+        data = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != _INDEX_VERSION
+        or data.get("definitions_path") != str(definitions_path)
+        or not isinstance(data.get("files"), dict)
+    ):
+        return {}
+    return data["files"]
+
+
+def _write_cache(
+    cache_path: Path, definitions_path: Path, files: dict[str, dict[str, Any]]
+) -> None:
+    """Atomically replace the cache file; the cache is best-effort only."""
+    payload = {
+        "version": _INDEX_VERSION,
+        "definitions_path": str(definitions_path),
+        "files": files,
+    }
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(payload))
+        tmp_path.replace(cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
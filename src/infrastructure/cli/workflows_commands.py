@@ -1,5 +1,7 @@
 """Workflow commands for Narada CLI."""
 
+from collections.abc import Sequence
+from contextlib import nullcontext
 import json
 from pathlib import Path
 from typing import Annotated
@@ -10,10 +12,10 @@ from rich.prompt import Prompt
 from rich.table import Table
 import typer
 
-from src.application.workflows.prefect import run_workflow as execute_workflow
 from src.infrastructure.cli.async_helpers import interactive_async_operation
 from src.infrastructure.cli.completions import complete_workflow_names
-from src.infrastructure.cli.ui import display_operation_result
+from src.infrastructure.cli.ui import display_operation_result, display_workflow_profile
+from src.infrastructure.cli.workflow_index import load_workflow_index
 
 # Create workflows subcommand app
 app = typer.Typer(help="Run workflows for playlist generation")
@@ -47,9 +49,57 @@ def run(
         str,
         typer.Option("--format", "-f", help="Output format (table, json)"),
     ] = "table",
+    engine: Annotated[
+        str,
+        typer.Option("--engine", help="Execution engine (prefect, local)"),
+    ] = "prefect",
+    profile: Annotated[
+        bool,
+        typer.Option("--profile", help="Show time, memory, API and SQL use per node"),
+    ] = False,
+    trace_file: Annotated[
+        Path | None,
+        typer.Option("--trace", help="Write a Chrome trace of the run to this file"),
+    ] = None,
+    stream: Annotated[
+        bool,
+        typer.Option("--stream", help="Stream tracks between nodes in bounded batches"),
+    ] = False,
 ) -> None:
     """Run a workflow from available definitions."""
-    _run_workflow_interactive(workflow_id, show_results, output_format)
+    _run_workflow_interactive(
+        workflow_id, show_results, output_format, engine, profile, trace_file, stream
+    )
+
+
+@app.command("run-batch")
+def run_batch(
+    workflow_ids: Annotated[
+        list[str],
+        typer.Argument(
+            help="Workflow IDs to execute together",
+            autocompletion=complete_workflow_names,
+        ),
+    ],
+    show_results: Annotated[
+        bool,
+        typer.Option("--show-results/--no-results", help="Show result metrics"),
+    ] = True,
+    output_format: Annotated[
+        str,
+        typer.Option("--format", "-f", help="Output format (table, json)"),
+    ] = "table",
+    engine: Annotated[
+        str,
+        typer.Option("--engine", help="Execution engine (prefect, local)"),
+    ] = "prefect",
+    stream: Annotated[
+        bool,
+        typer.Option("--stream", help="Stream tracks between nodes in bounded batches"),
+    ] = False,
+) -> None:
+    """Run several workflows as one, fetching and enriching shared sources once."""
+    _run_workflow_batch(workflow_ids, show_results, output_format, engine, stream)
 
 
 @app.command()
@@ -63,8 +113,25 @@ async def _run_workflow_interactive(
     workflow_id: str | None,
     show_results: bool,
     output_format: str,
+    engine: str = "prefect",
+    profile: bool = False,
+    trace_file: Path | None = None,
+    stream: bool = False,
 ) -> None:
     """Run workflow with interactive selection if needed."""
+    # Prefect is only imported once a workflow actually runs on it
+    from src.application.utilities.profiling import trace_memory
+    from src.application.workflows.execution import (
+        get_workflow_runner,
+        register_simple_progress_callback,
+    )
+    from src.application.workflows.plan import load_workflow_plan, with_streaming
+
+    try:
+        execute_workflow = get_workflow_runner(engine)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1) from e
 
     # Get available workflows
     workflows = list_workflows()
@@ -141,16 +208,17 @@ async def _run_workflow_interactive(
     )
 
     # Register simple progress callback for CLI feedback
-    from src.application.workflows.prefect import register_simple_progress_callback
-
     register_simple_progress_callback(_simple_workflow_feedback)
 
     try:
-        # Load and execute workflow
-        workflow_path = Path(workflow_info["path"])
-        workflow_def = json.loads(workflow_path.read_text())
+        # Load the compiled plan, cached until the definition changes
+        plan = load_workflow_plan(Path(workflow_info["path"]))
+        if stream:
+            plan = with_streaming(plan)
 
-        _, result = await execute_workflow(workflow_def)
+        # Memory tracing slows allocation down, so only pay for it on request
+        with trace_memory() if profile else nullcontext():
+            _, result = await execute_workflow(plan)
 
         # Display results
         console.print(
@@ -165,12 +233,94 @@ async def _run_workflow_interactive(
         if show_results and result:
             display_operation_result(result, output_format=output_format)
 
+        if profile and result:
+            display_workflow_profile(result)
+
+        if trace_file and result:
+            trace_file.write_text(json.dumps(result.to_chrome_trace()))
+            console.print(f"[dim]Trace written to {trace_file}[/dim]")
+
     except Exception as e:
         console.print("[bold red]✗ Workflow failed[/bold red]")
         console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1) from e
 
 
+@interactive_async_operation()
+async def _run_workflow_batch(
+    workflow_ids: Sequence[str],
+    show_results: bool,
+    output_format: str,
+    engine: str = "prefect",
+    stream: bool = False,
+) -> None:
+    """Merge workflows into one run and show each workflow's result."""
+    from src.application.workflows.batch import merge_workflows, run_workflow_batch
+    from src.application.workflows.execution import (
+        ENGINES,
+        register_simple_progress_callback,
+    )
+    from src.application.workflows.plan import load_workflow_plan
+
+    if engine not in ENGINES:
+        console.print(f"[red]Unknown workflow engine: {engine}[/red]")
+        raise typer.Exit(1)
+
+    workflows = {wf["id"]: wf for wf in list_workflows()}
+    unknown = [wf_id for wf_id in workflow_ids if wf_id not in workflows]
+    if unknown:
+        console.print(f"[red]Workflows not found: {', '.join(unknown)}[/red]")
+        raise typer.Exit(1)
+
+    with console.status("[bold blue]Initializing workflow system..."):
+        success, message = initialize_workflow_system()
+
+    if not success:
+        console.print(f"[bold red]✗ {message}[/bold red]")
+        raise typer.Exit(1)
+
+    console.print(f"[bold green]✓ {message}[/bold green]")
+
+    register_simple_progress_callback(_simple_workflow_feedback)
+
+    try:
+        batch = merge_workflows(
+            {
+                wf_id: load_workflow_plan(Path(workflows[wf_id]["path"]))
+                for wf_id in workflow_ids
+            },
+            streaming=stream,
+        )
+        console.print(
+            Panel.fit(
+                f"[bold]{', '.join(batch.members)}[/bold]\n"
+                f"[cyan]Tasks: [bold]{len(batch.plan.tasks)}[/bold][/cyan] "
+                f"[dim]({len(batch.shared_task_ids)} shared)[/dim]",
+                title="[bold bright_blue]⚡ Starting Workflow Batch[/bold bright_blue]",
+                border_style="blue",
+            )
+        )
+
+        _, results = await run_workflow_batch(batch, engine)
+
+        for wf_id, result in results.items():
+            console.print(
+                Panel.fit(
+                    f"[bold green]{workflows[wf_id]['name']}[/bold green]\n"
+                    f"[cyan]Processed [bold]{len(result.tracks)}[/bold] tracks[/cyan]",
+                    title="[bold green]✓ Workflow Completed[/bold green]",
+                    border_style="green",
+                )
+            )
+            if show_results:
+                display_operation_result(result, output_format=output_format)
+
+    except Exception as e:
+        console.print("[bold red]✗ Workflow batch failed[/bold red]")
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1) from e
+
+
 def _list_workflows() -> None:
     """Display available workflows."""
     workflows = list_workflows()
@@ -310,39 +460,30 @@ def _get_completion_summary(result: dict) -> str:
         )
         return f"([dim]{track_count} tracks[/dim])"
 
+    if "batch_count" in result:
+        # Streamed nodes hand their tracks on batch by batch
+        return (
+            f"([dim]{result.get('track_count', 0)} tracks in "
+            f"{result['batch_count']} batches[/dim])"
+        )
+
     return ""
 
 
 def list_workflows():
-    """Discover and parse workflow definitions from JSON files."""
+    """Discover workflow definitions through the cached definition index."""
     # Get path to workflow definitions directory
     current_file = Path(__file__)
     definitions_path = (
         current_file.parent.parent.parent / "application" / "workflows" / "definitions"
     )
-    workflows = []
 
-    if not definitions_path.exists():
-        return workflows
-
-    for json_file in definitions_path.glob("*.json"):
-        try:
-            definition = json.loads(json_file.read_text())
-
-            workflows.append({
-                "id": definition.get("id", json_file.stem),
-                "name": definition.get("name", "Unknown"),
-                "description": definition.get("description", ""),
-                "task_count": len(definition.get("tasks", [])),
-                "path": str(json_file),
-            })
-        except (OSError, json.JSONDecodeError) as e:
-            console.print(
-                f"[yellow]Warning: Could not parse {json_file.name}: {e}[/yellow]"
-            )
-            continue
+    def warn(json_file: Path, error: Exception) -> None:
+        console.print(
+            f"[yellow]Warning: Could not parse {json_file.name}: {error}[/yellow]"
+        )
 
-    return workflows
+    return load_workflow_index(definitions_path, on_error=warn)
 
 
 def initialize_workflow_system() -> tuple[bool, str]:
@@ -5,7 +5,7 @@ including standardized metric resolution, batch processing, and error handling.
 
 Key Components:
 - BaseMetricResolver: Abstract base class for resolving service-specific metrics
-- BatchProcessor: Generic utility for batch processing with concurrency control
+- BatchProcessor: Sliding-window work queue with concurrency and rate control
 - register_metrics: Function to register metric resolvers with the global registry
 
 These components establish a consistent foundation for all connector implementations,
@@ -14,10 +14,9 @@ error handling, and batch processing operations.
 """
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any, ClassVar, TypeVar
 
-from aiolimiter import AsyncLimiter
 from attrs import define, field
 import backoff
 
@@ -27,6 +26,7 @@ from src.infrastructure.connectors.metrics_registry import (
     get_metric_freshness,
     register_metric_resolver,
 )
+from src.infrastructure.connectors.rate_limiter import AdaptiveRateLimiter
 from src.infrastructure.persistence.database.db_connection import get_session
 
 # Get contextual logger
@@ -159,15 +159,21 @@ class BaseMetricResolver:
 
 @define(slots=True)
 class BatchProcessor[T, R]:
-    """Generic batch processor with concurrency control and rate limiting capabilities.
+    """Generic work-queue processor with bounded concurrency and rate limiting.
 
     This utility simplifies batch processing operations across all connectors,
-    standardizing concurrency control, rate limiting, batching logic and error handling.
+    standardizing concurrency control, rate limiting, retries and error handling.
     Uses configuration values from config.py.
 
+    Items flow through a sliding window rather than fixed chunks: a pool of
+    ``concurrency_limit`` workers pulls the next item as soon as one finishes,
+    so a slow request never stalls its neighbours and the rate limiter is never
+    idle at a batch boundary. Request starts are paced by the rate limiter when
+    one is configured; in-flight requests are always capped by the pool size.
+
     Attributes:
-        batch_size: Maximum number of items to process in a single batch
-        concurrency_limit: Maximum number of concurrent processing tasks
+        batch_size: Completions between window progress events and log entries
+        concurrency_limit: Maximum number of items in flight at once
         retry_count: Maximum number of retry attempts on failure
         retry_base_delay: Base delay between retries (seconds)
         retry_max_delay: Maximum delay between retries (seconds)
@@ -182,7 +188,7 @@ class BatchProcessor[T, R]:
     retry_base_delay: float
     retry_max_delay: float
     request_delay: float
-    rate_limiter: AsyncLimiter | None = field(default=None)
+    rate_limiter: AdaptiveRateLimiter | None = field(default=None)
     logger_instance: Any = field(factory=lambda: get_logger(__name__))
 
     def _on_backoff(self, details):
@@ -221,8 +227,10 @@ class BatchProcessor[T, R]:
         progress_callback: Callable[[str, dict], None] | None = None,
         progress_task_name: str = "batch_processing",
         progress_description: str = "Processing items",
+        *,
+        ordered: bool = True,
     ) -> list[R]:
-        """Process items in batches with controlled concurrency and exponential backoff.
+        """Process items with bounded concurrency and exponential backoff.
 
         Args:
             items: List of items to process
@@ -230,18 +238,55 @@ class BatchProcessor[T, R]:
             progress_callback: Optional callback for progress updates
             progress_task_name: Task name for progress tracking
             progress_description: Human-readable description for progress
+            ordered: Return results in input order rather than completion order
 
         Returns:
-            List of results in the same order as input items
+            Results of the items that succeeded; failed items are logged and
+            omitted
+        """
+        return [
+            result
+            async for result in self.stream(
+                items,
+                process_func,
+                progress_callback=progress_callback,
+                progress_task_name=progress_task_name,
+                progress_description=progress_description,
+                ordered=ordered,
+            )
+        ]
+
+    async def stream(
+        self,
+        items: list[T],
+        process_func: Callable[[T], Awaitable[R]],
+        *,
+        ordered: bool = True,
+        progress_callback: Callable[[str, dict], None] | None = None,
+        progress_task_name: str = "batch_processing",
+        progress_description: str = "Processing items",
+    ) -> AsyncIterator[R]:
+        """Yield results while items are still being processed.
+
+        Args:
+            items: List of items to process
+            process_func: Async function that processes a single item
+            ordered: Yield in input order, holding back results that finish
+                early; otherwise yield each result as soon as it completes
+            progress_callback: Optional callback for progress updates
+            progress_task_name: Task name for progress tracking
+            progress_description: Human-readable description for progress
+
+        Yields:
+            Results of the items that succeeded
         """
         if not items:
-            return []
+            return
 
-        results: list[R] = []
-        semaphore = asyncio.Semaphore(self.concurrency_limit)
-        total_batches = (len(items) + self.batch_size - 1) // self.batch_size
         total_items = len(items)
-        processed_items = 0
+        total_windows = (total_items + self.batch_size - 1) // self.batch_size
+        worker_count = min(self.concurrency_limit, total_items)
+        progress_frequency = get_config("BATCH_PROGRESS_LOG_FREQUENCY") or 10
 
         # Emit batch processing started event
         if progress_callback:
@@ -249,12 +294,98 @@ class BatchProcessor[T, R]:
                 "batch_started",
                 {
                     "task_name": progress_task_name,
-                    "total_batches": total_batches,
+                    "total_batches": total_windows,
                     "total_items": total_items,
+                    "concurrency": worker_count,
                     "description": progress_description,
                 },
             )
 
+        process_with_backoff = self._with_backoff(process_func)
+        completions: asyncio.Queue[tuple[int, Any]] = asyncio.Queue()
+        # Shared iterator is the work queue: next() never awaits, so each item
+        # is claimed by exactly one worker
+        work = iter(enumerate(items))
+
+        async def worker() -> None:
+            for index, item in work:
+                try:
+                    outcome = await process_with_backoff(item)
+                except Exception as e:
+                    outcome = _Failure(e)
+                await completions.put((index, outcome))
+
+        workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
+        held: dict[int, Any] = {}
+        next_index = 0
+        failures = 0
+
+        try:
+            for completed in range(1, total_items + 1):
+                index, outcome = await completions.get()
+
+                if isinstance(outcome, _Failure):
+                    failures += 1
+                    self.logger_instance.error(
+                        "Item processing failed",
+                        error=str(outcome.error),
+                        error_type=type(outcome.error).__name__,
+                    )
+
+                if progress_callback:
+                    self._emit_progress(
+                        progress_callback,
+                        items[index],
+                        index,
+                        completed,
+                        total_items,
+                        failures,
+                        progress_frequency,
+                        progress_task_name,
+                        progress_description,
+                    )
+
+                if not ordered:
+                    if not isinstance(outcome, _Failure):
+                        yield outcome
+                    continue
+
+                held[index] = outcome
+                while next_index in held:
+                    ready = held.pop(next_index)
+                    next_index += 1
+                    if not isinstance(ready, _Failure):
+                        yield ready
+        finally:
+            # Stops the pool if the consumer abandons the stream early
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        if progress_callback:
+            progress_callback(
+                "batch_completed",
+                {
+                    "task_name": progress_task_name,
+                    "total_batches": total_windows,
+                    "items_processed": total_items,
+                    "total_items": total_items,
+                    "batch_results": total_items - failures,
+                    "batch_failures": failures,
+                },
+            )
+
+        self.logger_instance.debug(
+            f"{progress_description} complete",
+            valid_results=total_items - failures,
+            failures=failures,
+        )
+
+    def _with_backoff(
+        self, process_func: Callable[[T], Awaitable[R]]
+    ) -> Callable[[T], Awaitable[R]]:
+        """Wrap the item function with retries and request-start pacing."""
+
         @backoff.on_exception(
             backoff.expo,
             Exception,  # Catch all exceptions - can be customized for specific error types
@@ -268,151 +399,93 @@ class BatchProcessor[T, R]:
         )
         async def process_with_backoff(item: T) -> R:
             """Process an item with automatic backoff on failures.
-            
-            Uses rate limiter if provided for controlling request start rate,
-            or falls back to semaphore-based concurrency limiting.
+
+            Uses the rate limiter, if provided, to pace request starts; the
+            worker pool bounds how many run at once either way.
             """
-            if self.rate_limiter:
-                # Use rate limiter for controlling request start rate
-                async with self.rate_limiter:
-                    return await process_func(item)
-            else:
-                # Fall back to semaphore-based concurrency limiting
-                async with semaphore:
-                    return await process_func(item)
+            if self.rate_limiter is None:
+                return await process_func(item)
+            async with self.rate_limiter:
+                return await process_func(item)
 
-        # Process in batches for memory efficiency and rate limit management
-        for i in range(0, len(items), self.batch_size):
-            batch = items[i : i + self.batch_size]
-            current_batch = i // self.batch_size + 1
-            batch_start_items = processed_items
+        return process_with_backoff
 
-            self.logger_instance.debug(
-                f"Processing batch {current_batch}/{total_batches}",
-                batch_size=len(batch),
-                total_items=len(items),
+    def _emit_progress(
+        self,
+        progress_callback: Callable[[str, dict], None],
+        item: T,
+        index: int,
+        completed: int,
+        total_items: int,
+        failures: int,
+        progress_frequency: int,
+        task_name: str,
+        description: str,
+    ) -> None:
+        """Emit completion-driven progress events."""
+        window = (completed - 1) // self.batch_size + 1
+
+        if completed % progress_frequency == 0 or completed == total_items:
+            progress_callback(
+                "track_processed",
+                {
+                    "task_name": task_name,
+                    "items_processed": completed,
+                    "total_items": total_items,
+                    "current_batch": window,
+                    "item_description": _describe_item(item, index),
+                    "description": f"Processed {completed}/{total_items} items",
+                },
             )
 
-            # Emit batch started event
-            if progress_callback:
-                progress_callback(
-                    "batch_progress",
-                    {
-                        "task_name": progress_task_name,
-                        "batch_number": current_batch,
-                        "total_batches": total_batches,
-                        "batch_size": len(batch),
-                        "items_processed": processed_items,
-                        "total_items": total_items,
-                        "description": f"{progress_description} (batch {current_batch}/{total_batches})",
-                    },
-                )
-
-            # Create a progress-aware wrapper for individual item processing
-            async def process_item_with_progress(
-                item: T,
-                item_index: int,
-                batch_start: int = batch_start_items,
-                batch_num: int = current_batch,
-            ) -> R:
-                """Process item and emit progress event."""
-                result = await process_with_backoff(item)
-
-                # Emit individual item progress based on config frequency
-                current_item = batch_start + item_index + 1
-                progress_frequency = get_config("BATCH_PROGRESS_LOG_FREQUENCY") or 10
-                if progress_callback and (
-                    current_item % progress_frequency == 0
-                    or current_item == total_items
-                ):
-                    # Try to get a meaningful description from the item
-                    item_desc = ""
-                    try:
-                        if hasattr(item, "title") and hasattr(item, "artists"):
-                            artists = getattr(item, "artists", [])
-                            if artists and hasattr(artists[0], "name"):
-                                artist_name = artists[0].name
-                            else:
-                                artist_name = "Unknown Artist"
-                            item_desc = f"{artist_name} - {getattr(item, 'title', 'Unknown Track')}"
-                        elif hasattr(item, "name"):
-                            item_desc = str(getattr(item, "name", ""))
-                        elif hasattr(item, "id"):
-                            item_desc = f"Item {getattr(item, 'id', '')}"
-                    except (AttributeError, IndexError):
-                        # Fallback if item structure is unexpected
-                        item_desc = f"Item {item_index + 1}"
-
-                    progress_callback(
-                        "track_processed",
-                        {
-                            "task_name": progress_task_name,
-                            "items_processed": current_item,
-                            "total_items": total_items,
-                            "current_batch": batch_num,
-                            "item_description": item_desc,
-                            "description": f"Processed {current_item}/{total_items} items",
-                        },
-                    )
-
-                return result
-
-            # Create tasks for all items in this batch
-            batch_tasks = [
-                asyncio.create_task(process_item_with_progress(item, idx))
-                for idx, item in enumerate(batch)
-            ]
-
-            # Process items as they complete for real-time progress (streaming pattern)
-            valid_results = []
-            completed_in_batch = 0
+        if completed % self.batch_size == 0 or completed == total_items:
+            total_windows = (total_items + self.batch_size - 1) // self.batch_size
+            progress_callback(
+                "batch_progress",
+                {
+                    "task_name": task_name,
+                    "batch_number": window,
+                    "total_batches": total_windows,
+                    "items_processed": completed,
+                    "total_items": total_items,
+                    "failures": failures,
+                    "description": f"{description} ({completed}/{total_items})",
+                    "rate_limit": self.rate_limiter.snapshot()
+                    if self.rate_limiter
+                    else None,
+                },
+            )
+            self.logger_instance.debug(
+                f"Processed {completed}/{total_items} items",
+                failures=failures,
+            )
 
-            for completed_task in asyncio.as_completed(batch_tasks):
-                try:
-                    result = await completed_task
-                    valid_results.append(result)
-                    completed_in_batch += 1
-
-                    # Log real-time completion within batch
-                    self.logger_instance.debug(
-                        f"Item {completed_in_batch}/{len(batch)} completed in batch {current_batch}",
-                        batch_progress=f"{completed_in_batch}/{len(batch)}",
-                        total_progress=f"{processed_items + completed_in_batch}/{total_items}",
-                    )
 
-                except Exception as result:
-                    self.logger_instance.error(
-                        "Item processing failed",
-                        error=str(result),
-                        error_type=type(result).__name__,
-                    )
+@define(frozen=True, slots=True)
+class _Failure:
+    """Marks an item whose processing failed after all retries."""
 
-            results.extend(valid_results)
-            processed_items += len(batch)
-
-            # Emit batch completed event
-            if progress_callback:
-                progress_callback(
-                    "batch_completed",
-                    {
-                        "task_name": progress_task_name,
-                        "batch_number": current_batch,
-                        "total_batches": total_batches,
-                        "items_processed": processed_items,
-                        "total_items": total_items,
-                        "batch_results": len(valid_results),
-                        "batch_failures": len(batch) - len(valid_results),
-                    },
-                )
+    error: Exception
 
-            # Log batch completion
-            self.logger_instance.debug(
-                f"Batch {current_batch} complete",
-                valid_results=len(valid_results),
-                failures=len(batch) - len(valid_results),
-            )
 
-        return results
+def _describe_item(item: Any, index: int) -> str:
+    """Best-effort human-readable description of an item for progress output."""
+    try:
+        if hasattr(item, "title") and hasattr(item, "artists"):
+            artists = getattr(item, "artists", [])
+            if artists and hasattr(artists[0], "name"):
+                artist_name = artists[0].name
+            else:
+                artist_name = "Unknown Artist"
+            return f"{artist_name} - {getattr(item, 'title', 'Unknown Track')}"
+        if hasattr(item, "name"):
+            return str(getattr(item, "name", ""))
+        if hasattr(item, "id"):
+            return f"Item {getattr(item, 'id', '')}"
+    except (AttributeError, IndexError):
+        # Fallback if item structure is unexpected
+        pass
+    return f"Item {index + 1}"
 
 
 def register_metrics(
@@ -0,0 +1,132 @@
+"""Process-scoped pool of shared service connector instances.
+
+Connectors own expensive, stateful resources: spotipy clients with their HTTP
+sessions and OAuth cache, pylast networks, and per-service rate limiters.
+Constructing a fresh connector for every node or use case means each copy
+re-reads the auth cache and, worse, enforces its own rate budget unaware of
+the others. The pool hands out one instance per service so concurrent callers
+share connections and a single limiter.
+
+Lifecycle:
+- Instances are created lazily from the connector's registered factory
+- Connectors may define a synchronous ``close()``; the pool calls it on
+  shutdown (explicitly via ``close`` or at interpreter exit)
+- Instances hold asyncio primitives, so when the event loop they were created
+  under has closed, the next ``get`` retires them and builds fresh ones
+"""
+
+import asyncio
+import atexit
+from collections.abc import Callable
+import inspect
+import threading
+from typing import Any
+
+from attrs import define, field
+
+from src.config import get_logger
+
+logger = get_logger(__name__)
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+@define(slots=True)
+class ConnectorPool:
+    """Registry of lazily created, shared connector instances.
+
+    Attributes:
+        _instances: Connector instances keyed by service name, in creation order
+        _loop: Event loop that was running when the current instances were built
+    """
+
+    _instances: dict[str, Any] = field(factory=dict, init=False)
+    _loop: asyncio.AbstractEventLoop | None = field(default=None, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False, repr=False)
+
+    def get(
+        self, name: str, factory: Callable[[dict[str, Any]], Any] | None = None
+    ) -> Any:
+        """Get the shared connector for a service, creating it on first use.
+
+        Args:
+            name: Connector name as registered in ``CONNECTORS``
+            factory: Factory to build the instance; defaults to the registered one
+
+        Returns:
+            Shared connector instance
+
+        Raises:
+            ValueError: Unknown connector name
+        """
+        if factory is None:
+            from src.infrastructure.connectors import discover_connectors
+
+            connectors = discover_connectors()
+            if name not in connectors:
+                raise ValueError(f"Unknown connector: {name}")
+            factory = connectors[name]["factory"]
+
+        with self._lock:
+            self._retire_if_loop_closed()
+
+            instance = self._instances.get(name)
+            if instance is None:
+                instance = factory({})
+                self._instances[name] = instance
+                if self._loop is None:
+                    self._loop = _running_loop()
+                logger.debug(f"Created shared {name} connector")
+            return instance
+
+    def active(self) -> list[str]:
+        """Names of connectors currently held by the pool."""
+        return list(self._instances)
+
+    def _retire_if_loop_closed(self) -> None:
+        """Drop instances bound to an event loop that no longer runs."""
+        if self._loop is not None and self._loop.is_closed():
+            logger.debug("Event loop closed; recycling pooled connectors")
+            self._close_sync(self._drain())
+
+    def _drain(self) -> list[tuple[str, Any]]:
+        instances = list(reversed(self._instances.items()))
+        self._instances.clear()
+        self._loop = None
+        return instances
+
+    def close(self) -> None:
+        """Close every pooled connector, newest first."""
+        with self._lock:
+            instances = self._drain()
+        self._close_sync(instances)
+
+    @staticmethod
+    def _close_sync(instances: list[tuple[str, Any]]) -> None:
+        for name, instance in instances:
+            close = getattr(instance, "close", None)
+            if close is None or inspect.iscoroutinefunction(close):
+                continue
+            try:
+                close()
+            except Exception as e:
+                logger.warning(f"Error closing {name} connector: {e}")
+
+
+_POOL = ConnectorPool()
+atexit.register(_POOL.close)
+
+
+def get_connector_pool() -> ConnectorPool:
+    """Get the process-wide connector pool."""
+    return _POOL
+
+
+def get_shared_connector(name: str) -> Any:
+    """Get the shared connector instance for a service."""
+    return _POOL.get(name)
@@ -19,14 +19,14 @@ The module supports:
 """
 
 import asyncio
+from collections import OrderedDict
 from collections.abc import Callable
 import contextlib
 from datetime import datetime
 import os
 from typing import Any, ClassVar
 
-from aiolimiter import AsyncLimiter
-from attrs import define, field
+from attrs import define, evolve, field
 import backoff
 import pylast
 
@@ -43,10 +43,33 @@ from src.infrastructure.connectors.base_connector import (
     register_metrics,
 )
 from src.infrastructure.connectors.protocols import ConnectorConfig
+from src.infrastructure.connectors.rate_limiter import (
+    AdaptiveRateLimiter,
+    RateFeedback,
+    RateSignal,
+)
 
 # Get contextual logger with service binding
 logger = get_logger(__name__).bind(service="lastfm")
 
+# Last.fm reports throttling and outages as API error codes, not HTTP statuses
+_LASTFM_RATE_LIMIT_EXCEEDED = "29"
+_LASTFM_SERVICE_UNAVAILABLE = {"11", "16"}
+
+
+def lastfm_feedback(exc: BaseException) -> RateFeedback | None:
+    """Map pylast errors to adaptive rate limiter feedback."""
+    if isinstance(exc, pylast.WSError):
+        status = str(exc.get_id())
+        if status == _LASTFM_RATE_LIMIT_EXCEEDED:
+            return RateSignal.THROTTLED, None
+        if status in _LASTFM_SERVICE_UNAVAILABLE:
+            return RateSignal.SERVER_ERROR, None
+        return None
+    if isinstance(exc, (pylast.NetworkError, pylast.MalformedResponseError)):
+        return RateSignal.SERVER_ERROR, None
+    return None
+
 
 @define(frozen=True, slots=True)
 class LastFMTrackInfo:
@@ -70,6 +93,8 @@ class LastFMTrackInfo:
         lastfm_global_playcount: Total play count across all Last.fm users
         lastfm_listeners: Number of unique listeners on Last.fm
         lastfm_user_loved: Whether the user has "loved" this track on Last.fm
+        lastfm_lookup_artist: Artist variant whose artist/title lookup found this
+            track, remembered so refreshes can skip the other variants
     """
 
     # Basic track info
@@ -94,6 +119,9 @@ class LastFMTrackInfo:
     lastfm_listeners: int | None = field(default=None)
     lastfm_user_loved: bool = field(default=False)
 
+    # Lookup provenance - set by the connector, not extracted from pylast
+    lastfm_lookup_artist: str | None = field(default=None)
+
     # Field extraction mapping for pylast Track objects
     EXTRACTORS: ClassVar[dict[str, Callable]] = {
         "lastfm_title": lambda t: t.get_title(),
@@ -180,11 +208,17 @@ class LastFMConnector:
     lastfm_username: str | None = field(default=None)
     client: pylast.LastFMNetwork | None = field(default=None, init=False, repr=False)
     batch_processor: BatchProcessor = field(init=False, repr=False)
-    _api_rate_limiter: AsyncLimiter = field(init=False, repr=False)
+    _api_rate_limiter: AdaptiveRateLimiter = field(init=False, repr=False)
+    _preferred_artists: OrderedDict[int, str] = field(
+        factory=OrderedDict, init=False, repr=False
+    )
     connector_name: str = "lastfm"
 
     # Constants for API communication
     USER_AGENT: ClassVar[str] = "Narada/0.1.0 (Music Metadata Integration)"
+    # Tracks whose matching artist variant is remembered in-process; pooled
+    # connectors live as long as the process, so the oldest are evicted
+    PREFERRED_ARTISTS_MAX: ClassVar[int] = 10_000
 
     def __attrs_post_init__(self) -> None:
         """Initialize Last.fm client with API credentials."""
@@ -193,11 +227,19 @@ class LastFMConnector:
         self.api_secret = self.api_secret or os.getenv("LASTFM_SECRET")
         self.lastfm_username = self.lastfm_username or os.getenv("LASTFM_USERNAME")
 
-        # Create shared rate limiter for ALL API calls (first tries AND retries)
+        # Create shared adaptive rate limiter for ALL API calls (first tries AND
+        # retries); it backs off when Last.fm reports rate limit errors
         rate_limit = get_config("LASTFM_API_RATE_LIMIT", 5.0) or 5.0
-        self._api_rate_limiter = AsyncLimiter(rate_limit, 1)
-        
-        # Initialize the batch processor with the shared rate limiter
+        self._api_rate_limiter = AdaptiveRateLimiter(
+            "lastfm",
+            rate_limit,
+            max_rate=get_config("LASTFM_API_RATE_LIMIT_MAX", rate_limit) or rate_limit,
+            classifier=lastfm_feedback,
+        )
+
+        # Initialize the batch processor; every API call inside a track lookup
+        # acquires the rate limiter itself, so the processor must not also
+        # spend a slot per track
         self.batch_processor = BatchProcessor[
             Track,
             tuple[int, LastFMTrackInfo | None],
@@ -208,7 +250,6 @@ class LastFMConnector:
             retry_base_delay=get_config("LASTFM_API_RETRY_BASE_DELAY") or 1.0,
             retry_max_delay=get_config("LASTFM_API_RETRY_MAX_DELAY") or 60.0,
             request_delay=0.0,  # No artificial delay - rate limiter handles this
-            rate_limiter=self._api_rate_limiter,  # Share rate limiter with direct calls
             logger_instance=logger,
         )
 
@@ -402,48 +443,8 @@ class LastFMConnector:
                 logger.warning(f"Track has no ID, skipping: {track.title}")
                 return -1, None
 
-            # Try MusicBrainz ID first (highest confidence)
-            mbid = track.connector_track_ids.get("musicbrainz")
-            
             try:
-                if mbid:
-                    result = await self.get_lastfm_track_info(
-                        mbid=mbid,
-                        lastfm_username=user,
-                    )
-                    if result and result.lastfm_url:
-                        return track.id, result
-
-                # Try each artist sequentially until we find a match
-                if track.artists:
-                    for i, artist in enumerate(track.artists):
-                        result = await self.get_lastfm_track_info(
-                            artist_name=artist.name,
-                            track_title=track.title,
-                            lastfm_username=user,
-                        )
-                        if result and result.lastfm_url:
-                            # Log which artist succeeded for debugging
-                            if i > 0:
-                                logger.debug(
-                                    f"Found LastFM match using fallback artist {i + 1}/{len(track.artists)}: {artist.name}",
-                                    track_id=track.id,
-                                    track_title=track.title,
-                                    artist_used=artist.name,
-                                )
-                            return track.id, result
-                    
-                    # No artist worked
-                    logger.debug(
-                        f"No LastFM match found after trying {len(track.artists)} artists for track {track.id}: {track.title}"
-                    )
-                else:
-                    logger.warning(
-                        f"No lookup method available for track {track.id}: {track.title} (no artists)"
-                    )
-                
-                return track.id, LastFMTrackInfo.empty()
-                    
+                return track.id, await self._find_track_info(track, user)
             except Exception as e:
                 logger.error(f"Error processing track {track.id}: {e}")
                 return track.id, LastFMTrackInfo.empty()
@@ -473,6 +474,132 @@ class LastFMConnector:
             if track_id != -1 and info and info.lastfm_url
         }
 
+    def _lookup_candidates(self, track: Track) -> list[dict[str, str]]:
+        """Build ranked lookup parameters for a track, best first.
+
+        MBID outranks artist/title, and artists keep their credit order so the
+        primary artist wins when several variants resolve.
+        """
+        candidates: list[dict[str, str]] = []
+
+        if mbid := track.connector_track_ids.get("musicbrainz"):
+            candidates.append({"mbid": mbid})
+
+        seen_artists: set[str] = set()
+        for artist in track.artists:
+            if artist.name and artist.name not in seen_artists:
+                seen_artists.add(artist.name)
+                candidates.append({
+                    "artist_name": artist.name,
+                    "track_title": track.title,
+                })
+
+        return candidates
+
+    async def _find_track_info(self, track: Track, user: str) -> LastFMTrackInfo:
+        """Find Last.fm info for a track, trying a remembered artist variant first.
+
+        The variant that matched last time (from this process or from the stored
+        connector metadata) is tried on its own. Only when it misses, or none is
+        known, are the remaining candidates raced concurrently.
+        """
+        candidates = self._lookup_candidates(track)
+
+        remembered = track.get_connector_attribute("lastfm", "lastfm_lookup_artist")
+        if track.id in self._preferred_artists:
+            self._preferred_artists.move_to_end(track.id)
+            remembered = self._preferred_artists[track.id]
+        if remembered:
+            preferred = {"artist_name": remembered, "track_title": track.title}
+            result = await self.get_lastfm_track_info(lastfm_username=user, **preferred)
+            if result and result.lastfm_url:
+                return evolve(result, lastfm_lookup_artist=remembered)
+            candidates = [c for c in candidates if c != preferred]
+
+        if not candidates:
+            logger.warning(
+                f"No lookup method available for track {track.id}: {track.title} (no artists)"
+            )
+            return LastFMTrackInfo.empty()
+
+        hit = await self._race_lookups(candidates, user)
+        if hit is None:
+            logger.debug(
+                f"No LastFM match found after trying {len(candidates)} lookups for track {track.id}: {track.title}"
+            )
+            return LastFMTrackInfo.empty()
+
+        rank, result = hit
+        artist_name = candidates[rank].get("artist_name")
+        if artist_name and track.id is not None:
+            self._preferred_artists[track.id] = artist_name
+            self._preferred_artists.move_to_end(track.id)
+            if len(self._preferred_artists) > self.PREFERRED_ARTISTS_MAX:
+                self._preferred_artists.popitem(last=False)
+            if rank > 0:
+                logger.debug(
+                    f"Found LastFM match using fallback lookup {rank + 1}/{len(candidates)}: {artist_name}",
+                    track_id=track.id,
+                    track_title=track.title,
+                    artist_used=artist_name,
+                )
+
+        return evolve(result, lastfm_lookup_artist=artist_name)
+
+    async def _race_lookups(
+        self,
+        candidates: list[dict[str, str]],
+        user: str,
+    ) -> tuple[int, LastFMTrackInfo] | None:
+        """Run lookups concurrently and return the best-ranked hit with its rank.
+
+        Every lookup goes through the shared rate limiter, so racing removes the
+        sequential round trips without raising the request rate. A hit is
+        accepted once all better-ranked lookups have missed; the rest are then
+        cancelled, usually while still queued on the limiter.
+        """
+        tasks = [
+            asyncio.create_task(
+                self.get_lastfm_track_info(lastfm_username=user, **candidate)
+            )
+            for candidate in candidates
+        ]
+        rank_by_task = {task: rank for rank, task in enumerate(tasks)}
+        outcomes: list[LastFMTrackInfo | None] = [None] * len(tasks)
+        finished = [False] * len(tasks)
+
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    rank = rank_by_task[task]
+                    finished[rank] = True
+                    if task.exception() is None:
+                        outcomes[rank] = task.result()
+                    else:
+                        logger.debug(
+                            f"LastFM lookup failed: {task.exception()}",
+                            lookup=candidates[rank],
+                        )
+
+                # The first unfinished rank blocks; the first finished hit wins
+                for rank, is_finished in enumerate(finished):
+                    if not is_finished:
+                        break
+                    result = outcomes[rank]
+                    if result and result.lastfm_url:
+                        return rank, result
+
+            return None
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     @resilient_operation("love_track_on_lastfm")
     @backoff.on_exception(
         backoff.expo,
@@ -528,8 +655,9 @@ class LastFMConnector:
                 track_title,
             )
 
-            # Love the track
-            await asyncio.to_thread(lastfm_track.love)
+            # Love the track; only this call hits the network, so it alone
+            # goes through the shared rate limiter
+            await self._rate_limited_api_call(asyncio.to_thread, lastfm_track.love)
             logger.info(f"Loved track on Last.fm: {artist_name} - {track_title}")
             return True
 
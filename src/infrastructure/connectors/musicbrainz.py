@@ -17,7 +17,6 @@ The module specializes in:
 
 import asyncio
 from importlib.metadata import metadata
-import time
 from typing import Any
 
 from attrs import define, field
@@ -26,6 +25,7 @@ import musicbrainzngs
 
 from src.config import get_config, get_logger, resilient_operation
 from src.infrastructure.connectors.base_connector import BatchProcessor
+from src.infrastructure.connectors.rate_limiter import AdaptiveRateLimiter
 
 # Get contextual logger with service binding
 logger = get_logger(__name__).bind(service="musicbrainz")
@@ -37,6 +37,9 @@ app_version = pkg_meta.get("Version", "0.1.0")
 app_url = pkg_meta.get("Home-page", "https://github.com/user/narada")
 musicbrainzngs.set_useragent(app_name, app_version, app_url)
 
+# MusicBrainz blocks clients above 1 req/sec; stay below it to absorb jitter
+MUSICBRAINZ_MAX_RATE = 0.9
+
 
 @define(slots=True)
 class MusicBrainzConnector:
@@ -46,16 +49,29 @@ class MusicBrainzConnector:
     while strictly adhering to MusicBrainz rate limits (1 req/sec).
 
     Attributes:
-        _last_request_time: Timestamp of last API request for rate limiting
+        _rate_limiter: Adaptive limiter capped below the 1 req/sec API policy
+            that backs off further when MusicBrainz answers 503
         _request_lock: Asyncio lock to ensure sequential request handling
     """
 
-    _last_request_time: float = field(default=0.0)
+    _rate_limiter: AdaptiveRateLimiter = field(init=False, repr=False)
     _request_lock: asyncio.Lock = field(factory=asyncio.Lock, repr=False)
 
     def __attrs_post_init__(self) -> None:
         """Initialize MusicBrainz connector."""
         logger.debug("Initializing MusicBrainz connector")
+        # Configuration may lower the rate, never raise it past the policy
+        max_rate = min(
+            get_config("MUSICBRAINZ_API_RATE_LIMIT_MAX", MUSICBRAINZ_MAX_RATE)
+            or MUSICBRAINZ_MAX_RATE,
+            MUSICBRAINZ_MAX_RATE,
+        )
+        rate_limit = min(
+            get_config("MUSICBRAINZ_API_RATE_LIMIT", max_rate) or max_rate, max_rate
+        )
+        self._rate_limiter = AdaptiveRateLimiter(
+            "musicbrainz", rate_limit, max_rate=max_rate
+        )
 
     async def get_recording_by_isrc(self, isrc: str) -> str | None:
         """
@@ -94,16 +110,10 @@ class MusicBrainzConnector:
 
     async def _rate_limited_request(self, func, *args, **kwargs) -> Any:
         """Execute a rate-limited MusicBrainz request ensuring 1 req/sec compliance."""
-        async with self._request_lock:
-            # Ensure at least 1.1s between requests (safety margin)
-            now = time.time()
-            time_since_last = now - self._last_request_time
-            if time_since_last < 1.1:
-                await asyncio.sleep(1.1 - time_since_last)
-
+        # One request at a time, each starting at least 1/max_rate after the last
+        async with self._request_lock, self._rate_limiter:
             # Execute request in thread pool
             try:
-                self._last_request_time = time.time()
                 return await asyncio.to_thread(func, *args, **kwargs)
             except musicbrainzngs.WebServiceError as e:
                 # Handle 404 errors (not found) differently than other errors
@@ -0,0 +1,447 @@
+"""Offline MusicBrainz recording index backed by a local SQLite file.
+
+The MusicBrainz web service is limited to one request per second, which makes
+bulk ISRC resolution take hours. This module builds a compact on-disk lookup
+from a MusicBrainz data dump (or a pre-extracted TSV) so ISRC and artist/title
+resolution can happen locally, leaving the web service for misses only.
+
+Key components:
+- MusicBrainzLocalIndex: Read-side lookups over the index file
+- get_shared_local_index: Process-wide index held by the connector pool
+- build_musicbrainz_index: Ingests a TSV file or ``mbdump`` directory
+
+Supported sources:
+- TSV with ``isrc``, ``recording_mbid``, ``artist`` and ``title`` columns
+  (header optional; without a header columns are read in that order)
+- A MusicBrainz ``mbdump`` directory containing the ``isrc``, ``recording``
+  and ``artist_credit`` table files
+
+The index lives in its own SQLite file, separate from the application database,
+so it can be rebuilt or deleted independently.
+"""
+
+from collections.abc import Iterable, Iterator
+import csv
+from datetime import UTC, datetime
+from pathlib import Path
+import re
+import sqlite3
+import sys
+from typing import Any
+import unicodedata
+
+from attrs import define, field
+
+from src.config import get_config, get_logger, settings
+from src.infrastructure.connectors.connector_pool import get_connector_pool
+
+logger = get_logger(__name__).bind(service="musicbrainz")
+
+# Keep IN clauses well under SQLite's host parameter limit
+_LOOKUP_CHUNK_SIZE = 500
+_INSERT_CHUNK_SIZE = 10_000
+
+_APOSTROPHES = re.compile(r"['\u2019`]")
+_NON_WORD = re.compile(r"[^\w]+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS recordings (
+    mbid TEXT PRIMARY KEY,
+    artist TEXT NOT NULL,
+    title TEXT NOT NULL,
+    artist_key TEXT NOT NULL,
+    title_key TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS isrc_recordings (
+    isrc TEXT NOT NULL,
+    mbid TEXT NOT NULL,
+    PRIMARY KEY (isrc, mbid)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS index_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Secondary index created after bulk load, which is much faster than
+# maintaining it row by row
+_ARTIST_TITLE_INDEX = """
+CREATE INDEX IF NOT EXISTS ix_recordings_artist_title
+    ON recordings (artist_key, title_key)
+"""
+
+_TSV_COLUMNS = ("isrc", "recording_mbid", "artist", "title")
+
+
+def local_index_path() -> Path:
+    """Configured index location, defaulting to the data directory."""
+    path = get_config("MUSICBRAINZ_LOCAL_INDEX_PATH")
+    return Path(path) if path else settings.data_dir / "musicbrainz_index.db"
+
+
+def normalize_lookup_key(value: str) -> str:
+    """Normalize an artist or title for index lookups.
+
+    Case-folds, strips accents and collapses punctuation/whitespace so that
+    "Beyoncé" and "beyonce", or "Don't Stop" and "Dont  Stop", share a key.
+    """
+    decomposed = unicodedata.normalize("NFKD", value.casefold())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    stripped = _APOSTROPHES.sub("", stripped)
+    return " ".join(_NON_WORD.sub(" ", stripped).split())
+
+
+def normalize_isrc(isrc: str) -> str:
+    """Normalize an ISRC to the bare upper-case form used in the index."""
+    return isrc.replace("-", "").strip().upper()
+
+
+@define(slots=True)
+class MusicBrainzLocalIndex:
+    """Read-only lookups over an offline MusicBrainz index file.
+
+    Results mirror the shapes returned by ``MusicBrainzConnector`` so callers
+    can use the index as a drop-in first tier ahead of the web service.
+
+    Attributes:
+        path: Location of the SQLite index file
+    """
+
+    path: Path = field(converter=Path)
+    _connection: sqlite3.Connection | None = field(default=None, init=False, repr=False)
+
+    @classmethod
+    def from_config(cls) -> "MusicBrainzLocalIndex | None":
+        """Open the configured index, or return None when it hasn't been built."""
+        path = local_index_path()
+        if not path.is_file():
+            return None
+        return cls(path)
+
+    def _conn(self) -> sqlite3.Connection:
+        if self._connection is None:
+            # Read-only URI so a half-written rebuild can never be modified here
+            self._connection = sqlite3.connect(
+                f"{self.path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+            )
+        return self._connection
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def lookup_isrcs(self, isrcs: Iterable[str]) -> dict[str, str]:
+        """Resolve ISRCs to recording MBIDs.
+
+        Args:
+            isrcs: ISRC codes, in any case or hyphenation
+
+        Returns:
+            Mapping of each input ISRC (as given) to a recording MBID. ISRCs
+            missing from the index are omitted.
+        """
+        by_key: dict[str, list[str]] = {}
+        for isrc in isrcs:
+            if isrc:
+                by_key.setdefault(normalize_isrc(isrc), []).append(isrc)
+
+        if not by_key:
+            return {}
+
+        keys = list(by_key)
+        results: dict[str, str] = {}
+        conn = self._conn()
+        for i in range(0, len(keys), _LOOKUP_CHUNK_SIZE):
+            chunk = keys[i : i + _LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            # MIN() keeps the answer stable for ISRCs shared by several recordings
+            query = f"SELECT isrc, MIN(mbid) FROM isrc_recordings WHERE isrc IN ({placeholders}) GROUP BY isrc"  # noqa: S608
+            rows = conn.execute(query, chunk)
+            for key, mbid in rows:
+                for original in by_key[key]:
+                    results[original] = mbid
+
+        return results
+
+    def search_recording(self, artist: str, title: str) -> dict[str, Any] | None:
+        """Find a recording by normalized artist and title.
+
+        Returns:
+            Recording dict shaped like a MusicBrainz search result
+            (``id``, ``title``, ``artist-credit``), or None if not indexed.
+        """
+        if not artist or not title:
+            return None
+
+        row = (
+            self._conn()
+            .execute(
+                "SELECT mbid, artist, title FROM recordings "
+                "WHERE artist_key = ? AND title_key = ? ORDER BY mbid LIMIT 1",
+                (normalize_lookup_key(artist), normalize_lookup_key(title)),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+
+        mbid, artist_name, recording_title = row
+        return {
+            "id": mbid,
+            "title": recording_title,
+            "artist-credit": [{"name": artist_name}],
+        }
+
+    def stats(self) -> dict[str, str]:
+        """Return build metadata recorded at ingest time."""
+        return dict(self._conn().execute("SELECT key, value FROM index_meta"))
+
+
+def get_shared_local_index() -> MusicBrainzLocalIndex | None:
+    """Get the process-wide index, or None when it hasn't been built.
+
+    The index is held by the connector pool alongside the MusicBrainz
+    connector, so its SQLite connection is opened once and closed on shutdown.
+    """
+    if not local_index_path().is_file():
+        return None
+    return get_connector_pool().get(
+        "musicbrainz_index", lambda _params: MusicBrainzLocalIndex.from_config()
+    )
+
+
+def build_musicbrainz_index(source: Path, output: Path) -> dict[str, int]:
+    """Build an offline index from a TSV export or MusicBrainz dump directory.
+
+    The index is written to a temporary file next to ``output`` and moved into
+    place on success, so readers never see a partially built index.
+
+    Args:
+        source: TSV file or directory containing ``mbdump`` table files
+        output: Destination SQLite file
+
+    Returns:
+        Counts of indexed recordings and ISRC links
+
+    Raises:
+        FileNotFoundError: Source does not exist or lacks required dump tables
+    """
+    source = Path(source)
+    output = Path(output)
+    if not source.exists():
+        raise FileNotFoundError(f"MusicBrainz source not found: {source}")
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_name(f"{output.name}.tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(
+            "PRAGMA journal_mode = OFF; PRAGMA synchronous = OFF;" + _SCHEMA
+        )
+
+        if source.is_dir():
+            _ingest_dump(conn, _dump_directory(source))
+            source_format = "mbdump"
+        else:
+            _ingest_tsv(conn, source)
+            source_format = "tsv"
+
+        conn.execute(_ARTIST_TITLE_INDEX)
+
+        counts = {
+            "recordings": conn.execute("SELECT COUNT(*) FROM recordings").fetchone()[0],
+            "isrcs": conn.execute("SELECT COUNT(*) FROM isrc_recordings").fetchone()[0],
+        }
+        conn.executemany(
+            "INSERT OR REPLACE INTO index_meta (key, value) VALUES (?, ?)",
+            [
+                ("source", str(source)),
+                ("source_format", source_format),
+                ("built_at", datetime.now(UTC).isoformat()),
+                ("recordings", str(counts["recordings"])),
+                ("isrcs", str(counts["isrcs"])),
+            ],
+        )
+        conn.commit()
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+    tmp_path.replace(output)
+    logger.info(
+        "Built MusicBrainz local index",
+        output=str(output),
+        source_format=source_format,
+        **counts,
+    )
+    return counts
+
+
+def _insert_recordings(
+    conn: sqlite3.Connection, rows: Iterable[tuple[str, str, str]]
+) -> None:
+    """Insert (mbid, artist, title) rows with their normalized keys."""
+    _executemany_chunked(
+        conn,
+        "INSERT OR IGNORE INTO recordings "
+        "(mbid, artist, title, artist_key, title_key) VALUES (?, ?, ?, ?, ?)",
+        (
+            (
+                mbid,
+                artist,
+                title,
+                normalize_lookup_key(artist),
+                normalize_lookup_key(title),
+            )
+            for mbid, artist, title in rows
+        ),
+    )
+
+
+def _executemany_chunked(
+    conn: sqlite3.Connection, sql: str, rows: Iterable[tuple[Any, ...]]
+) -> None:
+    chunk: list[tuple[Any, ...]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= _INSERT_CHUNK_SIZE:
+            conn.executemany(sql, chunk)
+            chunk.clear()
+    if chunk:
+        conn.executemany(sql, chunk)
+
+
+def _ingest_tsv(conn: sqlite3.Connection, path: Path) -> None:
+    """Load a pre-extracted ``isrc, recording_mbid, artist, title`` TSV."""
+    csv.field_size_limit(sys.maxsize)
+    with path.open(newline="", encoding="utf-8") as handle:
+        reader = csv.reader(handle, delimiter="\t", quoting=csv.QUOTE_NONE)
+        first = next(reader, None)
+        if first is None:
+            return
+
+        header = [c.strip().lower() for c in first]
+        if {"recording_mbid", "artist", "title"} <= set(header):
+            positions = [header.index(c) if c in header else None for c in _TSV_COLUMNS]
+            data: Iterator[list[str]] = reader
+        else:
+            positions = list(range(len(_TSV_COLUMNS)))
+            data = _chain_first(first, reader)
+
+        recordings: list[tuple[str, str, str]] = []
+        links: list[tuple[str, str]] = []
+        for row in data:
+            values = [
+                row[p].strip() if p is not None and p < len(row) else ""
+                for p in positions
+            ]
+            isrc, mbid, artist, title = values
+            if not mbid:
+                continue
+            if artist and title:
+                recordings.append((mbid, artist, title))
+            if isrc:
+                links.append((normalize_isrc(isrc), mbid))
+
+            if len(recordings) >= _INSERT_CHUNK_SIZE:
+                _insert_recordings(conn, recordings)
+                recordings.clear()
+            if len(links) >= _INSERT_CHUNK_SIZE:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO isrc_recordings (isrc, mbid) VALUES (?, ?)",
+                    links,
+                )
+                links.clear()
+
+        _insert_recordings(conn, recordings)
+        conn.executemany(
+            "INSERT OR IGNORE INTO isrc_recordings (isrc, mbid) VALUES (?, ?)", links
+        )
+
+
+def _chain_first(first: list[str], rest: Iterator[list[str]]) -> Iterator[list[str]]:
+    yield first
+    yield from rest
+
+
+def _dump_directory(source: Path) -> Path:
+    """Locate the directory holding the dump's table files."""
+    for candidate in (source / "mbdump", source):
+        if all(
+            (candidate / table).is_file()
+            for table in ("isrc", "recording", "artist_credit")
+        ):
+            return candidate
+    raise FileNotFoundError(
+        f"No MusicBrainz dump tables (isrc, recording, artist_credit) in {source}"
+    )
+
+
+def _read_dump_table(path: Path) -> Iterator[list[str]]:
+    """Stream rows from a PostgreSQL COPY-format dump table."""
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            yield [
+                "" if value == r"\N" else _unescape_copy(value)
+                for value in line.rstrip("\n").split("\t")
+            ]
+
+
+def _unescape_copy(value: str) -> str:
+    if "\\" not in value:
+        return value
+    return (
+        value.replace("\\t", "\t")
+        .replace("\\n", "\n")
+        .replace("\\r", "\r")
+        .replace("\\\\", "\\")
+    )
+
+
+def _ingest_dump(conn: sqlite3.Connection, dump_dir: Path) -> None:
+    """Join the dump's recording, artist_credit and isrc tables into the index.
+
+    Column positions follow the MusicBrainz schema:
+    artist_credit(id, name, ...), recording(id, gid, name, artist_credit, ...),
+    isrc(id, recording, isrc, ...).
+    """
+    credit_names = {
+        row[0]: row[1] for row in _read_dump_table(dump_dir / "artist_credit")
+    }
+
+    # Internal recording IDs are needed only to join ISRCs; keep them in a
+    # scratch table instead of memory since the recording table is large
+    conn.execute(
+        "CREATE TEMP TABLE recording_ids (id INTEGER PRIMARY KEY, mbid TEXT NOT NULL)"
+    )
+
+    def recording_rows() -> Iterator[tuple[str, str, str]]:
+        id_rows: list[tuple[int, str]] = []
+        for row in _read_dump_table(dump_dir / "recording"):
+            recording_id, mbid, title, credit_id = row[0], row[1], row[2], row[3]
+            id_rows.append((int(recording_id), mbid))
+            if len(id_rows) >= _INSERT_CHUNK_SIZE:
+                conn.executemany("INSERT INTO recording_ids VALUES (?, ?)", id_rows)
+                id_rows.clear()
+            yield mbid, credit_names.get(credit_id, ""), title
+        conn.executemany("INSERT INTO recording_ids VALUES (?, ?)", id_rows)
+
+    _insert_recordings(conn, ((m, a, t) for m, a, t in recording_rows() if a and t))
+
+    _executemany_chunked(
+        conn,
+        "INSERT OR IGNORE INTO isrc_recordings (isrc, mbid) "
+        "SELECT ?, mbid FROM recording_ids WHERE id = ?",
+        (
+            (normalize_isrc(row[2]), int(row[1]))
+            for row in _read_dump_table(dump_dir / "isrc")
+            if row[2]
+        ),
+    )
+    conn.execute("DROP TABLE recording_ids")
@@ -0,0 +1,250 @@
+"""Adaptive, feedback-driven rate limiting shared by all service connectors.
+
+Fixed limiters either leave throughput on the table or keep hammering a service
+that is already pushing back. ``AdaptiveRateLimiter`` uses additive-increase /
+multiplicative-decrease (AIMD): every successful call nudges the allowed rate
+up, while throttling (HTTP 429) or server errors (5xx) cut it sharply and honor
+any ``Retry-After`` delay. Over a long run the rate converges on what the
+service actually tolerates.
+
+Key components:
+- AdaptiveRateLimiter: Async context manager that spaces request starts
+- http_feedback: Default classifier mapping exceptions to throttle/error signals
+
+Usage:
+    async with limiter:
+        await do_request()
+
+Leaving the block normally records a success. Leaving it with an exception
+consults the classifier, so connectors only need to let API errors propagate
+through the ``async with`` for the limiter to learn from them.
+
+The limiter registers itself as a progress status source, so long-running
+operations can show the live rate and queue depth.
+"""
+
+import asyncio
+from collections.abc import Callable
+from email.utils import parsedate_to_datetime
+from enum import StrEnum
+import time
+from typing import Any
+
+from attrs import define, field
+
+from src.application.utilities.profiling import record_api_call
+from src.application.utilities.progress import register_status_source
+from src.config import get_logger
+
+logger = get_logger(__name__).bind(service="connectors")
+
+
+class RateSignal(StrEnum):
+    """Feedback signals understood by the limiter."""
+
+    THROTTLED = "throttled"
+    SERVER_ERROR = "server_error"
+
+
+type RateFeedback = tuple[RateSignal, float | None]
+type FeedbackClassifier = Callable[[BaseException], RateFeedback | None]
+
+
+def parse_retry_after(value: Any) -> float | None:
+    """Parse a Retry-After header given as seconds or an HTTP date."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def http_feedback(exc: BaseException) -> RateFeedback | None:
+    """Classify an exception by the HTTP status it carries, if any.
+
+    Understands spotipy (``http_status``/``headers``), musicbrainzngs (``cause``
+    wrapping a urllib ``HTTPError``) and requests/httpx-style ``response``
+    attributes.
+
+    Returns:
+        Signal and optional Retry-After seconds, or None for non-HTTP errors
+    """
+    candidates = [exc, getattr(exc, "cause", None), getattr(exc, "response", None)]
+    status: int | None = None
+    headers: Any = None
+    for candidate in candidates:
+        if candidate is None:
+            continue
+        for attr in ("http_status", "status_code", "code", "status"):
+            value = getattr(candidate, attr, None)
+            if isinstance(value, int):
+                status = value
+                break
+        headers = headers or getattr(candidate, "headers", None)
+        if status is not None:
+            break
+
+    if status is None:
+        return None
+
+    retry_after = None
+    if headers is not None and hasattr(headers, "get"):
+        retry_after = parse_retry_after(
+            headers.get("Retry-After") or headers.get("retry-after")
+        )
+
+    if status == 429:
+        return RateSignal.THROTTLED, retry_after
+    if status >= 500:
+        return RateSignal.SERVER_ERROR, retry_after
+    return None
+
+
+@define(slots=True)
+class AdaptiveRateLimiter:
+    """AIMD rate limiter that spaces request starts and adapts to feedback.
+
+    Attributes:
+        name: Service name used in logs and progress status
+        rate: Starting rate in requests per second
+        max_rate: Ceiling the additive increase may reach
+        min_rate: Floor the multiplicative decrease may reach
+        additive_increase: Requests/second gained per second of clean traffic
+        decrease_factor: Multiplier applied to the rate on throttling or errors
+        classifier: Maps exceptions to feedback signals
+        clock: Monotonic clock, injectable for tests
+    """
+
+    name: str
+    rate: float
+    max_rate: float | None = None
+    min_rate: float = 0.1
+    additive_increase: float = 0.1
+    decrease_factor: float = 0.5
+    classifier: FeedbackClassifier = field(default=http_feedback, repr=False)
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False)
+
+    _next_slot: float = field(default=0.0, init=False, repr=False)
+    _blocked_until: float = field(default=0.0, init=False, repr=False)
+    _last_decrease: float = field(default=float("-inf"), init=False, repr=False)
+    _waiting: int = field(default=0, init=False)
+    _in_flight: int = field(default=0, init=False)
+    _throttled: int = field(default=0, init=False)
+    _errors: int = field(default=0, init=False)
+    _latency_ewma: float | None = field(default=None, init=False, repr=False)
+    _started: dict[Any, list[float]] = field(factory=dict, init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        """Clamp the configured bounds and publish status for progress display."""
+        if self.max_rate is None:
+            self.max_rate = self.rate
+        self.min_rate = min(self.min_rate, self.rate)
+        register_status_source(self.name, self.describe)
+
+    async def acquire(self) -> None:
+        """Wait for the next request slot at the current rate."""
+        now = self.clock()
+        # Reserve a slot synchronously; no await between read and write, so
+        # concurrent callers on the event loop never receive the same slot
+        slot = max(now, self._next_slot, self._blocked_until)
+        self._next_slot = slot + 1.0 / self.rate
+
+        delay = slot - now
+        if delay > 0:
+            self._waiting += 1
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self._waiting -= 1
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+        # Every connector call passes through here, so count it for profiling
+        record_api_call(self.name)
+        self._in_flight += 1
+        self._started.setdefault(asyncio.current_task(), []).append(self.clock())
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._in_flight -= 1
+        task = asyncio.current_task()
+        starts = self._started.get(task)
+        started = starts.pop() if starts else None
+        if not starts:
+            self._started.pop(task, None)
+
+        if exc is None:
+            latency = None if started is None else self.clock() - started
+            self.record_success(latency)
+            return
+
+        feedback = self.classifier(exc)
+        if feedback is not None:
+            self.record_feedback(*feedback)
+
+    def record_success(self, latency: float | None = None) -> None:
+        """Additively raise the rate after a successful call."""
+        if latency is not None:
+            self._latency_ewma = (
+                latency
+                if self._latency_ewma is None
+                else 0.8 * self._latency_ewma + 0.2 * latency
+            )
+        max_rate = self.max_rate or self.rate
+        if self.rate < max_rate:
+            # Dividing by the rate makes growth per second of traffic constant
+            self.rate = min(max_rate, self.rate + self.additive_increase / self.rate)
+
+    def record_feedback(
+        self, signal: RateSignal, retry_after: float | None = None
+    ) -> None:
+        """Multiplicatively lower the rate after throttling or a server error."""
+        now = self.clock()
+        if signal is RateSignal.THROTTLED:
+            self._throttled += 1
+        else:
+            self._errors += 1
+
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+
+        # One decrease per window: a burst of concurrent 429s is one signal
+        window = max(1.0, 1.0 / self.rate)
+        if now - self._last_decrease < window:
+            return
+
+        self._last_decrease = now
+        previous = self.rate
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        # Respace already-reserved slots at the new rate
+        self._next_slot = max(self._next_slot, now) + 1.0 / self.rate
+        logger.warning(
+            f"{self.name} rate reduced after {signal.value}",
+            previous_rate=f"{previous:.2f}/s",
+            rate=f"{self.rate:.2f}/s",
+            retry_after=retry_after,
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current limiter state for logging and progress display."""
+        return {
+            "service": self.name,
+            "rate": round(self.rate, 2),
+            "max_rate": self.max_rate,
+            "queue_depth": self._waiting,
+            "in_flight": self._in_flight,
+            "throttled": self._throttled,
+            "errors": self._errors,
+            "latency_ms": None
+            if self._latency_ewma is None
+            else round(self._latency_ewma * 1000),
+        }
+
+    def describe(self) -> str:
+        """One-line summary such as ``lastfm 4.8/s, 12 queued``."""
+        return f"{self.name} {self.rate:.1f}/s, {self._waiting} queued"
@@ -17,6 +17,7 @@ The module supports:
 """
 
 import asyncio
+from collections.abc import Callable
 from datetime import UTC, datetime
 import os
 from typing import Any, ClassVar
@@ -28,7 +29,7 @@ from dotenv import load_dotenv
 import spotipy
 from spotipy.oauth2 import SpotifyOAuth
 
-from src.config import get_logger, resilient_operation
+from src.config import get_config, get_logger, resilient_operation
 from src.domain.entities import (
     Artist,
     ConnectorPlaylist,
@@ -42,6 +43,7 @@ from src.infrastructure.connectors.base_connector import (
     register_metrics,
 )
 from src.infrastructure.connectors.protocols import ConnectorConfig
+from src.infrastructure.connectors.rate_limiter import AdaptiveRateLimiter
 
 # Get contextual logger with service binding
 logger = get_logger(__name__).bind(service="spotify")
@@ -66,10 +68,21 @@ class SpotifyConnector:
     """
 
     client: spotipy.Spotify = field(init=False, repr=False)
+    _api_rate_limiter: AdaptiveRateLimiter = field(init=False, repr=False)
 
     def __attrs_post_init__(self) -> None:
         """Initialize Spotify client with OAuth configuration."""
         logger.debug("Initializing Spotify connector")
+
+        # Shared adaptive rate limiter for search and playlist mutation calls;
+        # backs off on 429s and honors Retry-After
+        rate_limit = get_config("SPOTIFY_API_RATE_LIMIT", 10.0) or 10.0
+        self._api_rate_limiter = AdaptiveRateLimiter(
+            "spotify",
+            rate_limit,
+            max_rate=get_config("SPOTIFY_API_RATE_LIMIT_MAX", rate_limit) or rate_limit,
+        )
+
         self.client = spotipy.Spotify(
             auth_manager=SpotifyOAuth(
                 scope=[
@@ -84,13 +97,27 @@ class SpotifyConnector:
             ),
         )
 
+    async def _api_call(
+        self, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run a blocking spotipy call under the shared adaptive rate limiter."""
+        async with self._api_rate_limiter:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    def close(self) -> None:
+        """Release pooled HTTP connections held by the spotipy session."""
+        session = getattr(self.client, "_session", None)
+        if session is not None and hasattr(session, "close"):
+            session.close()
+
     @resilient_operation("get_spotify_tracks_by_ids")
-    @backoff.on_exception(backoff.expo, spotipy.SpotifyException, max_tries=3)
     async def get_tracks_by_ids(
         self, track_ids: list[str]
     ) -> dict[str, dict[str, Any]]:
         """Fetch multiple tracks from Spotify in bulk (up to 50 per request).
 
+        Batches are requested concurrently; the shared rate limiter paces them.
+
         Args:
             track_ids: List of Spotify track IDs
 
@@ -100,27 +127,38 @@ class SpotifyConnector:
         if not track_ids:
             return {}
 
-        results = {}
         # Process in batches of 50 (Spotify API limit)
-        for i in range(0, len(track_ids), 50):
-            batch = track_ids[i : i + 50]
-            logger.debug(f"Fetching batch of {len(batch)} tracks from Spotify")
-
-            tracks_response = await asyncio.to_thread(
-                self.client.tracks, batch, market="US"
-            )
+        batches = [track_ids[i : i + 50] for i in range(0, len(track_ids), 50)]
+        batch_results = await asyncio.gather(
+            *(self._get_tracks_batch(batch) for batch in batches)
+        )
 
-            if tracks_response and "tracks" in tracks_response:
-                for j, track in enumerate(tracks_response["tracks"]):
-                    if track and "id" in track:
-                        # Use the original requested ID as the key, not the canonical ID
-                        # This handles cases where Spotify relinks tracks to new IDs
-                        requested_id = batch[j]
-                        results[requested_id] = track
+        results = {}
+        for batch_result in batch_results:
+            results.update(batch_result)
 
         logger.info(f"Retrieved {len(results)}/{len(track_ids)} tracks in bulk")
         return results
 
+    @backoff.on_exception(backoff.expo, spotipy.SpotifyException, max_tries=3)
+    async def _get_tracks_batch(self, batch: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch one batch of at most 50 tracks, keyed by requested ID."""
+        logger.debug(f"Fetching batch of {len(batch)} tracks from Spotify")
+        tracks_response = await self._api_call(self.client.tracks, batch, market="US")
+
+        if not tracks_response or "tracks" not in tracks_response:
+            return {}
+
+        # Use the original requested ID as the key, not the canonical ID
+        # This handles cases where Spotify relinks tracks to new IDs
+        return {
+            requested_id: track
+            for requested_id, track in zip(
+                batch, tracks_response["tracks"], strict=False
+            )
+            if track and "id" in track
+        }
+
     @resilient_operation("search_spotify_by_isrc")
     @backoff.on_exception(backoff.expo, spotipy.SpotifyException, max_tries=3)
     async def search_by_isrc(self, isrc: str) -> dict[str, Any] | None:
@@ -133,17 +171,55 @@ class SpotifyConnector:
             Track data if found, None otherwise
         """
         logger.debug(f"Searching Spotify for ISRC: {isrc}")
-        results = await asyncio.to_thread(
-            self.client.search,
-            f"isrc:{isrc}",
-            type="track",
-            limit=1,
-            market="US",
-        )
+        async with self._api_rate_limiter:
+            results = await asyncio.to_thread(
+                self.client.search,
+                f"isrc:{isrc}",
+                type="track",
+                limit=1,
+                market="US",
+            )
 
         tracks = results.get("tracks", {}).get("items", []) if results else []
         return tracks[0] if tracks else None
 
+    async def search_by_isrcs(self, isrcs: list[str]) -> dict[str, dict[str, Any]]:
+        """Search for many ISRCs concurrently.
+
+        Spotify has no bulk ISRC endpoint, so lookups are fanned out as
+        individual searches. Start rate is bounded by the shared rate limiter
+        and in-flight requests by SPOTIFY_API_CONCURRENCY.
+
+        Args:
+            isrcs: ISRC codes to search for (duplicates are looked up once)
+
+        Returns:
+            Dictionary mapping ISRCs to track data for ISRCs that were found
+        """
+        unique_isrcs = list(dict.fromkeys(isrc for isrc in isrcs if isrc))
+        if not unique_isrcs:
+            return {}
+
+        semaphore = asyncio.Semaphore(get_config("SPOTIFY_API_CONCURRENCY") or 5)
+
+        async def lookup(isrc: str) -> dict[str, Any] | None:
+            async with semaphore:
+                return await self.search_by_isrc(isrc)
+
+        responses = await asyncio.gather(
+            *(lookup(isrc) for isrc in unique_isrcs), return_exceptions=True
+        )
+
+        results = {}
+        for isrc, response in zip(unique_isrcs, responses, strict=True):
+            if isinstance(response, BaseException):
+                logger.warning(f"ISRC search failed for {isrc}: {response}")
+            elif response and response.get("id"):
+                results[isrc] = response
+
+        logger.info(f"Resolved {len(results)}/{len(unique_isrcs)} ISRCs via search")
+        return results
+
     @resilient_operation("search_spotify_track")
     @backoff.on_exception(backoff.expo, spotipy.SpotifyException, max_tries=3)
     async def search_track(self, artist: str, title: str) -> dict[str, Any] | None:
@@ -158,13 +234,14 @@ class SpotifyConnector:
         """
         query = f"artist:{artist} track:{title}"
         logger.debug(f"Searching Spotify with query: {query}")
-        results = await asyncio.to_thread(
-            self.client.search,
-            query,
-            type="track",
-            limit=1,
-            market="US",
-        )
+        async with self._api_rate_limiter:
+            results = await asyncio.to_thread(
+                self.client.search,
+                query,
+                type="track",
+                limit=1,
+                market="US",
+            )
 
         tracks = results.get("tracks", {}).get("items", []) if results else []
         return tracks[0] if tracks else None
@@ -180,8 +257,67 @@ class SpotifyConnector:
         Returns:
             ConnectorPlaylist containing playlist metadata and track items
         """
+        connector_playlist, _ = await self._fetch_playlist(playlist_id)
+        return connector_playlist
+
+    @resilient_operation("get_spotify_playlist_with_tracks")
+    @backoff.on_exception(backoff.expo, spotipy.SpotifyException, max_tries=3)
+    async def get_spotify_playlist_with_tracks(
+        self, playlist_id: str
+    ) -> tuple[ConnectorPlaylist, list[ConnectorTrack]]:
+        """Fetch a Spotify playlist together with its tracks in playlist order.
+
+        Playlist items already embed full track objects, so tracks are built
+        from those payloads. Only relinked or incomplete items are re-fetched
+        through the tracks endpoint. Local files and episodes are skipped and
+        duplicate entries are kept.
+
+        Args:
+            playlist_id: Spotify playlist ID to fetch
+
+        Returns:
+            Tuple of (playlist with its items, tracks in playlist order)
+        """
+        connector_playlist, raw_items = await self._fetch_playlist(playlist_id)
+
+        # Each slot is an embedded track payload or the ID to re-fetch it by
+        slots: list[dict[str, Any] | str] = []
+        for item in raw_items:
+            track = item.get("track")
+            if not track or item.get("is_local") or not track.get("id"):
+                continue
+            if track.get("type", "track") != "track":
+                continue
+            if _is_complete_track(track):
+                slots.append(track)
+            else:
+                slots.append(track.get("linked_from", {}).get("id") or track["id"])
+
+        refetch_ids = list(dict.fromkeys(s for s in slots if isinstance(s, str)))
+        refetched = await self.get_tracks_by_ids(refetch_ids) if refetch_ids else {}
+
+        connector_tracks = []
+        for slot in slots:
+            track = refetched.get(slot) if isinstance(slot, str) else slot
+            if track is not None:
+                connector_tracks.append(convert_spotify_track_to_connector(track))
+
+        logger.info(
+            f"Built {len(connector_tracks)} tracks from {len(raw_items)} playlist "
+            f"items ({len(refetch_ids)} re-fetched)"
+        )
+        return connector_playlist, connector_tracks
+
+    async def _fetch_playlist(
+        self, playlist_id: str
+    ) -> tuple[ConnectorPlaylist, list[dict[str, Any]]]:
+        """Fetch playlist metadata and every raw playlist item page.
+
+        Returns:
+            Tuple of (playlist with its items, raw item payloads in order)
+        """
         # Get initial playlist data
-        raw_playlist = await asyncio.to_thread(
+        raw_playlist = await self._api_call(
             self.client.playlist,
             playlist_id,
             market="US",
@@ -196,7 +332,7 @@ class SpotifyConnector:
 
         # Paginate until we get all tracks
         while tracks["next"]:
-            tracks = await asyncio.to_thread(self.client.next, tracks)
+            tracks = await self._api_call(self.client.next, tracks)
             if tracks is not None and "items" in tracks:
                 all_items.extend(tracks["items"])
             else:
@@ -235,7 +371,7 @@ class SpotifyConnector:
         # Use evolve to add items to the playlist
         connector_playlist = attrs.evolve(connector_playlist, items=playlist_items)
 
-        return connector_playlist
+        return connector_playlist, all_items
 
     @resilient_operation("create_spotify_playlist")
     @backoff.on_exception(backoff.expo, spotipy.SpotifyException, max_tries=3)
@@ -267,7 +403,7 @@ class SpotifyConnector:
             logger.info(
                 f"Creating Spotify playlist: {name} with {len(spotify_track_uris)} tracks",
             )
-            playlist = await asyncio.to_thread(
+            playlist = await self._api_call(
                 self.client.user_playlist_create,
                 user=(self.client.me() or {}).get("id", ""),
                 name=name,
@@ -279,12 +415,11 @@ class SpotifyConnector:
             if spotify_track_uris:
                 for i in range(0, len(spotify_track_uris), 50):
                     batch = spotify_track_uris[i : i + 50]
-                    await asyncio.to_thread(
+                    await self._api_call(
                         self.client.playlist_add_items,
                         playlist_id=playlist["id"] if playlist else "",
                         items=batch,
                     )
-                    await asyncio.sleep(0.5)  # Small delay to prevent rate limiting
 
             if playlist is not None:
                 return playlist["id"]
@@ -324,7 +459,7 @@ class SpotifyConnector:
         try:
             if replace:
                 # Replace entire playlist contents
-                await asyncio.to_thread(
+                await self._api_call(
                     self.client.playlist_replace_items,
                     playlist_id=playlist_id,
                     items=spotify_track_uris[:100] if spotify_track_uris else [],
@@ -341,12 +476,11 @@ class SpotifyConnector:
             # Add remaining tracks in batches of 50
             for i in range(0, len(remaining_tracks), 50):
                 batch = remaining_tracks[i : i + 50]
-                await asyncio.to_thread(
+                await self._api_call(
                     self.client.playlist_add_items,
                     playlist_id=playlist_id,
                     items=batch,
                 )
-                await asyncio.sleep(0.5)  # Small delay to prevent rate limiting
 
         except spotipy.SpotifyException as e:
             logger.error(f"Spotify API error: {e}")
@@ -452,14 +586,13 @@ class SpotifyConnector:
             # Process in batches of 100
             for i in range(0, len(items_to_remove), 100):
                 batch = items_to_remove[i : i + 100]
-                result = await asyncio.to_thread(
+                result = await self._api_call(
                     self.client.playlist_remove_specific_occurrences_of_items,
                     playlist_id=playlist_id,
                     items=batch,
                     snapshot_id=snapshot_id,
                 )
                 snapshot_id = result.get("snapshot_id") if result else snapshot_id
-                await asyncio.sleep(0.1)  # Rate limiting
 
         return snapshot_id
 
@@ -476,18 +609,17 @@ class SpotifyConnector:
         # Group consecutive positions to batch when possible
         for op in sorted_adds:
             if op.spotify_uri:
-                await asyncio.to_thread(
+                await self._api_call(
                     self.client.playlist_add_items,
                     playlist_id=playlist_id,
                     items=[op.spotify_uri],
                     position=op.position,
                 )
                 # Spotify doesn't return snapshot_id from add_items, so we refresh
-                await asyncio.sleep(0.1)  # Rate limiting
 
         # Get updated snapshot ID after all adds
         if sorted_adds:
-            playlist_info = await asyncio.to_thread(
+            playlist_info = await self._api_call(
                 self.client.playlist, playlist_id, fields="snapshot_id"
             )
             snapshot_id = playlist_info.get("snapshot_id") if playlist_info else None
@@ -503,7 +635,7 @@ class SpotifyConnector:
         """Execute move operations individually."""
         for op in move_ops:
             if op.old_position is not None:
-                result = await asyncio.to_thread(
+                result = await self._api_call(
                     self.client.playlist_reorder_items,
                     playlist_id=playlist_id,
                     range_start=op.old_position,
@@ -512,7 +644,6 @@ class SpotifyConnector:
                     snapshot_id=snapshot_id,
                 )
                 snapshot_id = result.get("snapshot_id") if result else snapshot_id
-                await asyncio.sleep(0.1)  # Rate limiting
 
         return snapshot_id
 
@@ -546,7 +677,7 @@ class SpotifyConnector:
                     logger.warning(f"Invalid cursor format: {cursor}, using offset=0")
 
             # Get saved tracks from Spotify API
-            saved_tracks = await asyncio.to_thread(
+            saved_tracks = await self._api_call(
                 self.client.current_user_saved_tracks,
                 limit=min(limit, 50),  # Spotify's max limit is 50
                 offset=offset,
@@ -606,6 +737,24 @@ class SpotifyConnector:
             raise
 
 
+def _is_complete_track(spotify_track: dict[str, Any]) -> bool:
+    """Whether an embedded track payload can be converted as it is.
+
+    Relinked tracks carry the ID of a market-specific substitute, and
+    simplified payloads lack the fields a ConnectorTrack needs.
+    """
+    if spotify_track.get("linked_from"):
+        return False
+    album = spotify_track.get("album")
+    return bool(
+        spotify_track.get("name")
+        and spotify_track.get("artists")
+        and isinstance(album, dict)
+        and album.get("name")
+        and spotify_track.get("duration_ms") is not None
+    )
+
+
 def convert_spotify_track_to_connector(spotify_track: dict[str, Any]) -> ConnectorTrack:
     """Convert Spotify track data to ConnectorTrack domain model."""
     artists = [Artist(name=artist["name"]) for artist in spotify_track["artists"]]
@@ -22,6 +22,7 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import DeclarativeBase
 
+from src.application.utilities.profiling import record_sql_statement
 from src.config import get_logger
 
 # Create module logger
@@ -122,6 +123,11 @@ def create_db_engine(connection_string: str | None = None) -> AsyncEngine:
             cursor.execute("PRAGMA temp_store = MEMORY")  # Store temp tables in memory
             cursor.close()
 
+    # Count statements against the workflow node issuing them, for profiling
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")  # type: ignore
+    def _count_statement(*_args):  # type: ignore
+        record_sql_statement()
+
     # Only log once engine is fully configured
     logger.info("Created database engine with SQLite optimizations")
     return engine
@@ -192,6 +192,14 @@ class DBTrackMetric(NaradaDBBase):
         UniqueConstraint("track_id", "connector_name", "metric_type"),
         # Keep the lookup index
         Index(None, "track_id", "connector_name", "metric_type"),
+        # Covers library queries reading one metric for every track
+        Index(
+            "ix_track_metrics_type_track_value",
+            "metric_type",
+            "track_id",
+            "value",
+            "is_deleted",
+        ),
     )
 
     track_id: Mapped[int] = mapped_column(ForeignKey("tracks.id", ondelete="CASCADE"))
@@ -242,6 +250,8 @@ class DBTrackPlay(NaradaDBBase):
         Index("ix_track_plays_played_at", "played_at"),
         Index("ix_track_plays_import_source", "import_source"),
         Index("ix_track_plays_import_batch", "import_batch_id"),
+        # Covers per-track play aggregates (counts, last played) in library queries
+        Index("ix_track_plays_track_played_at", "track_id", "played_at", "is_deleted"),
     )
 
     # Core fields
@@ -0,0 +1,37 @@
+"""Add indexes backing library queries over play history and track metrics.
+
+Library queries aggregate plays per track and read one metric for every
+track. Both indexes cover the columns those queries read, so neither needs
+to visit the table rows.
+
+Usage:
+    alembic upgrade head
+"""
+
+from alembic import op
+
+# Revision identifiers
+revision = "5c3e1b7a9f02"
+down_revision = "d45a90f8a123"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the library query indexes."""
+    op.create_index(
+        "ix_track_plays_track_played_at",
+        "track_plays",
+        ["track_id", "played_at", "is_deleted"],
+    )
+    op.create_index(
+        "ix_track_metrics_type_track_value",
+        "track_metrics",
+        ["metric_type", "track_id", "value", "is_deleted"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the library query indexes."""
+    op.drop_index("ix_track_metrics_type_track_value", table_name="track_metrics")
+    op.drop_index("ix_track_plays_track_played_at", table_name="track_plays")
@@ -10,6 +10,9 @@ from src.infrastructure.persistence.repositories.track.connector import (
     TrackConnectorRepository,
 )
 from src.infrastructure.persistence.repositories.track.core import TrackRepository
+from src.infrastructure.persistence.repositories.track.library import (
+    TrackLibraryRepository,
+)
 from src.infrastructure.persistence.repositories.track.likes import TrackLikeRepository
 from src.infrastructure.persistence.repositories.track.metrics import (
     TrackMetricsRepository,
@@ -28,6 +31,7 @@ from src.infrastructure.persistence.repositories.track.plays import TrackPlayRep
 __all__ = [
     "SyncCheckpointRepository",
     "TrackConnectorRepository",
+    "TrackLibraryRepository",
     "TrackLikeRepository",
     "TrackMetricsRepository",
     "TrackPlayRepository",
@@ -209,6 +209,44 @@ class TrackConnectorRepository:
 
         return results
 
+    @db_operation("find_connector_tracks_by_isrcs")
+    async def find_connector_tracks_by_isrcs(
+        self, connector: str, isrcs: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Find a connector's tracks by ISRC in bulk.
+
+        Uses the (connector_name, isrc) index. When several connector tracks
+        share an ISRC, the most recently updated one wins.
+
+        Args:
+            connector: Connector name (e.g., "spotify")
+            isrcs: ISRC codes to look up
+
+        Returns:
+            Dictionary mapping ISRCs to connector track dictionaries
+        """
+        if not isrcs:
+            return {}
+
+        model = self.connector_repo.model_class
+        stmt = (
+            select(model)
+            .where(
+                model.connector_name == connector,
+                model.isrc.in_(set(isrcs)),
+                model.is_deleted == False,  # noqa: E712
+            )
+            .order_by(model.last_updated)
+        )
+        result = await self.session.execute(stmt)
+
+        found = {}
+        for db_connector_track in result.scalars():
+            found[db_connector_track.isrc] = await self.connector_repo.mapper.to_domain(
+                db_connector_track
+            )
+        return found
+
     @db_operation("find_track_by_connector")
     async def find_track_by_connector(
         self, connector: str, connector_id: str
@@ -937,3 +975,46 @@ class TrackConnectorRepository:
         except Exception as e:
             logger.error(f"Failed to get metadata timestamps: {e}")
             return {}
+
+    @db_operation("get_current_metrics")
+    async def get_current_metrics(
+        self, track_ids: list[int], connector: str
+    ) -> dict[int, dict[str, tuple[float, datetime]]]:
+        """Get the stored value of every metric a connector has for tracks.
+
+        One query over the track/connector/metric index; there is a single
+        current row per metric, so no aggregation is needed.
+
+        Args:
+            track_ids: Track IDs to read metrics for.
+            connector: Connector name to filter by.
+
+        Returns:
+            Dictionary mapping track_id to metric name -> (value, collected_at),
+            with timestamps in UTC.
+        """
+        if not track_ids:
+            return {}
+
+        from src.infrastructure.persistence.database.db_models import DBTrackMetric
+
+        stmt = select(
+            DBTrackMetric.track_id,
+            DBTrackMetric.metric_type,
+            DBTrackMetric.value,
+            DBTrackMetric.collected_at,
+        ).where(
+            DBTrackMetric.track_id.in_(track_ids),
+            DBTrackMetric.connector_name == connector,
+            DBTrackMetric.is_deleted == False,  # noqa: E712
+        )
+
+        metrics: dict[int, dict[str, tuple[float, datetime]]] = {}
+        for track_id, metric_type, value, collected_at in (
+            await self.session.execute(stmt)
+        ).all():
+            # SQLite drops timezones; stored timestamps are UTC
+            if collected_at.tzinfo is None:
+                collected_at = collected_at.replace(tzinfo=UTC)
+            metrics.setdefault(track_id, {})[metric_type] = (value, collected_at)
+        return metrics
@@ -0,0 +1,254 @@
+"""Track library repository compiling library queries to a single SQL query."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, and_, case, func, null, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import get_logger
+from src.domain.entities import LibraryQuery, Track, TrackList, ValueBound, ensure_utc
+from src.domain.entities.library_query import PLAY_METRICS, TRACK_ATTRIBUTES
+from src.infrastructure.persistence.database.db_models import (
+    DBTrack,
+    DBTrackMetric,
+    DBTrackPlay,
+)
+from src.infrastructure.persistence.repositories.base_repo import BaseRepository
+from src.infrastructure.persistence.repositories.repo_decorator import db_operation
+from src.infrastructure.persistence.repositories.track.mapper import TrackMapper
+
+logger = get_logger(__name__)
+
+# Tracks loaded per IN (...) query, well below SQLite's bound parameter limit
+HYDRATE_BATCH_SIZE = 500
+
+
+def _bind(value: Any) -> Any:
+    """Normalize aware datetimes to UTC, the zone stored in the database."""
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(UTC)
+    return value
+
+
+def _bound_condition(value: ColumnElement, bound: ValueBound) -> ColumnElement:
+    """WHERE clause keeping rows whose value satisfies a bound."""
+    checks = [value.is_not(None)]
+    if bound.min_value is not None:
+        low = _bind(bound.min_value)
+        checks.append(value >= low if bound.min_inclusive else value > low)
+    if bound.max_value is not None:
+        high = _bind(bound.max_value)
+        checks.append(value <= high if bound.max_inclusive else value < high)
+
+    in_range = and_(*checks)
+    return or_(value.is_(None), in_range) if bound.include_missing else in_range
+
+
+def _not_deleted(model: type[DBTrackPlay | DBTrackMetric]) -> ColumnElement:
+    """Soft-delete filter that does not steer SQLite to the is_deleted index.
+
+    Inequality tests cannot use an index, so the planner picks the indexes
+    on the columns that actually narrow the aggregate instead.
+    """
+    return model.is_deleted != True  # noqa: E712
+
+
+class TrackLibraryRepository(BaseRepository[DBTrack, Track]):
+    """Repository answering library queries over all stored tracks.
+
+    Filters, ordering and the limit of a query run in one SQL statement over
+    ``tracks``, per-track aggregates of ``track_plays`` and ``track_metrics``
+    values. Only the IDs of the matching tracks come back from that query;
+    full tracks are loaded for those IDs alone.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with session and mapper."""
+        super().__init__(
+            session=session,
+            model_class=DBTrack,
+            mapper=TrackMapper(),
+        )
+
+    def _play_aggregates(
+        self, stmt: Select, query: LibraryQuery, names: list[str]
+    ) -> tuple[Select, dict[str, ColumnElement]]:
+        """Join per-track play aggregates for the play metrics in ``names``."""
+        played_at = DBTrackPlay.played_at
+        columns: list[ColumnElement] = [DBTrackPlay.track_id.label("track_id")]
+        # Almost no play is deleted, so keep SQLite off the is_deleted index
+        conditions: list[ColumnElement] = [_not_deleted(DBTrackPlay)]
+
+        if "total_plays" in names:
+            columns.append(func.count().label("total_plays"))
+        if "last_played_dates" in names:
+            columns.append(func.max(played_at).label("last_played_dates"))
+        if "period_plays" in names and query.has_period:
+            in_period = played_at.between(
+                _bind(query.period_start), _bind(query.period_end)
+            )
+            if names == ["period_plays"]:
+                # Only the window counts, so the played_at index narrows the scan
+                conditions.append(in_period)
+                columns.append(func.count().label("period_plays"))
+            else:
+                columns.append(
+                    func.sum(case((in_period, 1), else_=0)).label("period_plays")
+                )
+
+        plays = (
+            select(*columns)
+            .where(*conditions)
+            .group_by(DBTrackPlay.track_id)
+            .subquery("plays")
+        )
+        stmt = stmt.outerjoin(plays, plays.c.track_id == DBTrack.id)
+
+        values: dict[str, ColumnElement] = {}
+        for name in names:
+            if name == "period_plays" and not query.has_period:
+                values[name] = null()
+            elif name == "last_played_dates":
+                values[name] = plays.c.last_played_dates
+            else:
+                # Like the play history enricher, tracks without plays count 0
+                values[name] = func.coalesce(plays.c[name], 0)
+        return stmt, values
+
+    def _metric_value(self, stmt: Select, name: str) -> tuple[Select, ColumnElement]:
+        """Join the stored values of one track metric."""
+        metric = (
+            select(
+                DBTrackMetric.track_id.label("track_id"),
+                func.max(DBTrackMetric.value).label("value"),
+            )
+            .where(
+                DBTrackMetric.metric_type == name,
+                _not_deleted(DBTrackMetric),
+            )
+            .group_by(DBTrackMetric.track_id)
+            .subquery()
+        )
+        stmt = stmt.outerjoin(metric, metric.c.track_id == DBTrack.id)
+        return stmt, metric.c.value
+
+    def compile_query(self, query: LibraryQuery) -> tuple[Select, list[str]]:
+        """Compile a library query to SQL selecting track IDs and query values.
+
+        Returns:
+            Select statement whose rows are the track ID followed by one column
+            per returned name, and the names in column order
+        """
+        stmt = select(DBTrack.id).where(DBTrack.is_deleted == False)  # noqa: E712
+        names = query.value_names
+        values: dict[str, ColumnElement] = {}
+
+        play_names = [name for name in names if name in PLAY_METRICS]
+        if play_names:
+            stmt, play_values = self._play_aggregates(stmt, query, play_names)
+            values.update(play_values)
+
+        for name in names:
+            if name in values:
+                continue
+            if name in TRACK_ATTRIBUTES:
+                values[name] = getattr(DBTrack, name)
+            else:
+                stmt, values[name] = self._metric_value(stmt, name)
+
+        for bound in query.bounds:
+            stmt = stmt.where(_bound_condition(values[bound.name], bound))
+
+        order_by: list[ColumnElement] = []
+        for name, reverse in query.sort_keys:
+            value = values[name]
+            # Missing values sort last whatever the direction
+            order_by.append(value.is_(None))
+            order_by.append(value.desc() if reverse else value.asc())
+        # Library order breaks the remaining ties, keeping sorts stable
+        order_by.append(DBTrack.id)
+        stmt = stmt.order_by(*order_by)
+
+        if query.limit is not None:
+            stmt = stmt.limit(query.limit)
+
+        stmt = stmt.add_columns(
+            *(values[name].label(f"value_{i}") for i, name in enumerate(names))
+        )
+        return stmt, names
+
+    async def _query_rows(
+        self, query: LibraryQuery
+    ) -> tuple[list[int], dict[str, dict[int, Any]]]:
+        """Run the compiled query, returning track IDs and the values it used."""
+        stmt, names = self.compile_query(query)
+        rows = (await self.session.execute(stmt)).all()
+
+        metrics: dict[str, dict[int, Any]] = {name: {} for name in names}
+        for row in rows:
+            for name, value in zip(names, row[1:], strict=True):
+                if value is not None:
+                    metrics[name][row[0]] = (
+                        ensure_utc(value) if isinstance(value, datetime) else value
+                    )
+
+        logger.debug(
+            "Library query returned tracks",
+            track_count=len(rows),
+            values=names,
+            limit=query.limit,
+        )
+        return [row[0] for row in rows], metrics
+
+    async def _hydrate(self, track_ids: list[int]) -> list[Track]:
+        """Load full tracks for IDs, in the order given."""
+        tracks_by_id: dict[int, Track] = {}
+        for start in range(0, len(track_ids), HYDRATE_BATCH_SIZE):
+            batch = await self.get_by_ids(track_ids[start : start + HYDRATE_BATCH_SIZE])
+            tracks_by_id.update({track.id: track for track in batch if track.id})
+        return [tracks_by_id[i] for i in track_ids if i in tracks_by_id]
+
+    @db_operation("query_tracks")
+    async def query_tracks(self, query: LibraryQuery) -> TrackList:
+        """Run a library query, loading only the tracks it returns.
+
+        Args:
+            query: Filters, ordering and limit to apply in the database
+
+        Returns:
+            TrackList in query order, with the values the query used stored
+            as metrics in its metadata
+        """
+        track_ids, metrics = await self._query_rows(query)
+        tracks = await self._hydrate(track_ids)
+        return TrackList(tracks=tracks, metadata={"metrics": metrics})
+
+    async def iter_query_tracks(
+        self, query: LibraryQuery, batch_size: int = HYDRATE_BATCH_SIZE
+    ) -> AsyncIterator[TrackList]:
+        """Run a library query, loading its tracks one batch at a time.
+
+        Only the matching IDs and query values are held for the whole
+        iteration; each batch of full tracks is loaded as it is requested.
+
+        Args:
+            query: Filters, ordering and limit to apply in the database
+            batch_size: Tracks per yielded TrackList
+
+        Yields:
+            TrackLists in query order, each with the query values of its
+            own tracks as metrics
+        """
+        track_ids, metrics = await self._query_rows(query)
+        for start in range(0, len(track_ids), batch_size):
+            batch_ids = track_ids[start : start + batch_size]
+            batch_metrics = {
+                name: {i: values[i] for i in batch_ids if i in values}
+                for name, values in metrics.items()
+            }
+            yield TrackList(
+                tracks=await self._hydrate(batch_ids),
+                metadata={"metrics": batch_metrics},
+            )
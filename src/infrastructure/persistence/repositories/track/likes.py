@@ -3,7 +3,9 @@
 from datetime import UTC, datetime
 
 from attrs import define
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from src.config import get_logger
 from src.domain.entities import TrackLike
@@ -85,6 +87,23 @@ class TrackLikeRepository(BaseRepository[DBTrackLike, TrackLike]):
 
         return await self.find_by(conditions)
 
+    @db_operation("get_track_likes_batch")
+    async def get_track_likes_batch(
+        self,
+        track_ids: list[int],
+        services: list[str] | None = None,
+    ) -> list[TrackLike]:
+        """Get likes for many tracks across services in one query."""
+        if not track_ids:
+            return []
+
+        conditions = [self.model_class.track_id.in_(track_ids)]
+
+        if services:
+            conditions.append(self.model_class.service.in_(services))
+
+        return await self.find_by(conditions)
+
     @db_operation("get_all_liked_tracks")
     async def get_all_liked_tracks(
         self,
@@ -104,41 +123,69 @@ class TrackLikeRepository(BaseRepository[DBTrackLike, TrackLike]):
         target_service: str,
         is_liked: bool = True,
         since_timestamp: datetime | None = None,
+        after_id: int | None = None,
+        limit: int | None = None,
     ) -> list[TrackLike]:
-        """Get tracks liked in source_service but not in target_service."""
-        # First get all source tracks with the requested like status
-        source_conditions = [
+        """Get tracks liked in source_service but not in target_service.
+
+        Results are ordered by like ID, so ``after_id`` and ``limit`` page
+        through them with keyset pagination: pass the last ID of one page as
+        ``after_id`` to get the next.
+        """
+        target = aliased(self.model_class)
+        already_synced = (
+            select(target.id)
+            .where(
+                target.track_id == self.model_class.track_id,
+                target.service == target_service,
+                target.is_liked == is_liked,
+                target.is_deleted == False,  # noqa: E712
+            )
+            .exists()
+        )
+
+        stmt = self.select().where(
             self.model_class.service == source_service,
             self.model_class.is_liked == is_liked,
-        ]
-
+            ~already_synced,
+        )
         if since_timestamp:
-            source_conditions.append(self.model_class.updated_at >= since_timestamp)
+            stmt = stmt.where(self.model_class.updated_at >= since_timestamp)
+        if after_id is not None:
+            stmt = stmt.where(self.model_class.id > after_id)
 
-        source_likes = await self.find_by(source_conditions)
-
-        if not source_likes:
-            return []
+        stmt = stmt.order_by(self.model_class.id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
 
-        # Get track IDs that need syncing
-        track_ids = [like.track_id for like in source_likes]
+        db_likes = await self.execute_select_many(stmt)
+        return await self.mapper.map_collection(db_likes)
 
-        # Find target likes for these tracks
-        target_likes = await self.find_by([
-            self.model_class.service == target_service,
-            self.model_class.track_id.in_(track_ids),
-        ])
+    @db_operation("save_track_likes_batch")
+    async def save_track_likes_batch(
+        self,
+        track_ids: list[int],
+        service: str,
+        is_liked: bool = True,
+        last_synced: datetime | None = None,
+    ) -> int:
+        """Save the same like status for many tracks in one upsert.
 
-        # Create lookup dict of target likes by track_id
-        target_likes_dict = {like.track_id: like for like in target_likes}
+        Returns:
+            Number of like rows written
+        """
+        now = datetime.now(UTC)
+        values = {"service": service, "is_liked": is_liked, "updated_at": now}
+        if is_liked:
+            values["liked_at"] = now
+        if last_synced:
+            values["last_synced"] = last_synced
 
-        # Filter source likes that need syncing to target
-        return [
-            like
-            for like in source_likes
-            if like.track_id not in target_likes_dict
-            or target_likes_dict[like.track_id].is_liked != is_liked
-        ]
+        return await self.bulk_upsert(
+            [{"track_id": track_id, **values} for track_id in dict.fromkeys(track_ids)],
+            lookup_keys=["track_id", "service"],
+            return_models=False,
+        )
 
     @db_operation("save_track_like")
     async def save_track_like(
@@ -11,7 +11,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.application.services.external_metadata_service import ExternalMetadataService
 from src.domain.repositories.interfaces import (
     CheckpointRepositoryProtocol,
+    ConnectorPlaylistRepositoryProtocol,
     ConnectorRepositoryProtocol,
+    LibraryRepositoryProtocol,
     LikeRepositoryProtocol,
     MetricsRepositoryProtocol,
     PlaylistRepositoryProtocol,
@@ -19,12 +21,18 @@ from src.domain.repositories.interfaces import (
     TrackIdentityServiceProtocol,
     TrackRepositoryProtocol,
 )
+from src.infrastructure.persistence.repositories.playlist.connector import (
+    ConnectorPlaylistRepository,
+)
 from src.infrastructure.persistence.repositories.playlist.core import PlaylistRepository
 from src.infrastructure.persistence.repositories.sync import SyncCheckpointRepository
 from src.infrastructure.persistence.repositories.track.connector import (
     TrackConnectorRepository,
 )
 from src.infrastructure.persistence.repositories.track.core import TrackRepository
+from src.infrastructure.persistence.repositories.track.library import (
+    TrackLibraryRepository,
+)
 from src.infrastructure.persistence.repositories.track.likes import TrackLikeRepository
 from src.infrastructure.persistence.repositories.track.metrics import (
     TrackMetricsRepository,
@@ -93,6 +101,16 @@ class DatabaseUnitOfWork:
         """Get playlist repository using this unit of work's transaction."""
         return PlaylistRepository(self._session)
 
+    def get_connector_playlist_repository(
+        self,
+    ) -> ConnectorPlaylistRepositoryProtocol:
+        """Get connector playlist repository using this unit of work's transaction."""
+        return ConnectorPlaylistRepository(self._session)
+
+    def get_library_repository(self) -> LibraryRepositoryProtocol:
+        """Get library query repository using this unit of work's transaction."""
+        return TrackLibraryRepository(self._session)
+
     def get_like_repository(self) -> LikeRepositoryProtocol:
         """Get like repository using this unit of work's transaction."""
         return TrackLikeRepository(self._session)
@@ -130,14 +148,12 @@ class DatabaseUnitOfWork:
 
     def get_service_connector_provider(self) -> Any:
         """Get service connector provider for accessing individual music service connectors."""
-        from src.infrastructure.connectors import CONNECTORS
-        
+        from src.infrastructure.connectors.connector_pool import get_connector_pool
+
         class SimpleServiceConnectorProvider:
-            """Simple service connector provider that accesses the CONNECTORS registry."""
-            
+            """Service connector provider handing out process-wide shared connectors."""
+
             def get_connector(self, service_name: str):
-                if service_name not in CONNECTORS:
-                    raise ValueError(f"Unknown connector: {service_name}")
-                return CONNECTORS[service_name]["factory"]({})
-        
+                return get_connector_pool().get(service_name)
+
         return SimpleServiceConnectorProvider()
\ No newline at end of file
@@ -21,6 +21,7 @@ from src.domain.repositories.interfaces import (
     PlaysRepositoryProtocol,
     TrackRepositoryProtocol,
 )
+from src.infrastructure.connectors.connector_pool import get_shared_connector
 from src.infrastructure.connectors.lastfm import LastFMConnector
 from src.infrastructure.services.base_import import BaseImportService
 from src.infrastructure.services.track_identity_resolver import TrackIdentityResolver
@@ -42,7 +43,7 @@ class LastfmImportService(BaseImportService):
         """Initialize with repository access following Clean Architecture."""
         super().__init__(plays_repository)
         self.operation_name = "Last.fm Recent Plays Import"
-        self.lastfm_connector = lastfm_connector or LastFMConnector()
+        self.lastfm_connector = lastfm_connector or get_shared_connector("lastfm")
         self.checkpoint_repository = checkpoint_repository
         self.connector_repository = connector_repository
         self.track_repository = track_repository
@@ -6,6 +6,9 @@ and utilities for provider management.
 
 from typing import Any
 
+from src.domain.repositories.interfaces import ConnectorRepositoryProtocol
+from src.infrastructure.connectors.musicbrainz_index import get_shared_local_index
+
 from .base import MatchProvider
 from .lastfm import LastFMProvider
 from .musicbrainz import MusicBrainzProvider
@@ -21,12 +24,18 @@ __all__ = [
 ]
 
 
-def create_provider(connector: str, connector_instance: Any) -> MatchProvider:
+def create_provider(
+    connector: str,
+    connector_instance: Any,
+    connector_repo: ConnectorRepositoryProtocol | None = None,
+) -> MatchProvider:
     """Create provider instance for given connector.
 
     Args:
         connector: Service name ("lastfm", "spotify", "musicbrainz").
         connector_instance: Service connector implementation.
+        connector_repo: Optional connector repository for providers that can
+            reuse locally known connector tracks before calling the API.
 
     Returns:
         Provider implementing MatchProvider protocol.
@@ -44,6 +53,14 @@ def create_provider(connector: str, connector_instance: Any) -> MatchProvider:
         available = ", ".join(provider_map.keys())
         raise ValueError(f"Unsupported connector: {connector}. Available: {available}")
 
+    if connector == "spotify":
+        return SpotifyProvider(connector_instance, connector_repo=connector_repo)
+
+    if connector == "musicbrainz":
+        return MusicBrainzProvider(
+            connector_instance, local_index=get_shared_local_index()
+        )
+
     provider_class = provider_map[connector]
     return provider_class(connector_instance)
 
@@ -95,10 +95,11 @@ class LastFMProvider:
             MatchResult with confidence scoring, or None if creation fails.
         """
         try:
-            # Determine match method
+            # Determine match method - an artist variant hit means MBID missed
             match_method = (
                 "mbid"
                 if track.connector_track_ids.get("musicbrainz")
+                and not getattr(track_info, "lastfm_lookup_artist", None)
                 else "artist_title"
             )
 
@@ -1,15 +1,21 @@
 """MusicBrainz provider for track matching.
 
 This provider handles communication with the MusicBrainz API and transforms
-MusicBrainz track data into our domain MatchResult objects.
+MusicBrainz track data into our domain MatchResult objects. When an offline
+MusicBrainz index has been built, it is consulted first and the rate-limited
+web service is only used for misses.
 """
 
 from typing import Any
 
-from src.application.utilities.simple_batching import process_in_batches
+from src.application.utilities.simple_batching import (
+    gather_in_batch,
+    process_in_batches,
+)
 from src.config import get_logger
 from src.domain.entities import Track
 from src.domain.matching.types import MatchResult, MatchResultsById
+from src.infrastructure.connectors.musicbrainz_index import MusicBrainzLocalIndex
 
 logger = get_logger(__name__)
 
@@ -17,13 +23,20 @@ logger = get_logger(__name__)
 class MusicBrainzProvider:
     """MusicBrainz track matching provider."""
 
-    def __init__(self, connector_instance: Any) -> None:
+    def __init__(
+        self,
+        connector_instance: Any,
+        local_index: MusicBrainzLocalIndex | None = None,
+    ) -> None:
         """Initialize with MusicBrainz connector.
 
         Args:
             connector_instance: MusicBrainz service connector for API calls.
+            local_index: Optional offline index queried before the web service.
         """
         self.connector_instance = connector_instance
+        self.local_index = local_index
+        self.lookup_stats = {"local_hits": 0, "api_lookups": 0}
 
     @property
     def service_name(self) -> str:
@@ -69,8 +82,7 @@ class MusicBrainzProvider:
                 # Extract ISRCs for batch lookup
                 isrcs = [t.isrc for t in isrc_tracks if t.isrc is not None]
 
-                # Use native batch lookup which is already optimized
-                isrc_results = await self.connector_instance.batch_isrc_lookup(isrcs)
+                isrc_results = await self._resolve_isrcs(isrcs)
 
                 # Map results back to tracks
                 for track in isrc_tracks:
@@ -99,9 +111,45 @@ class MusicBrainzProvider:
                 )
                 results.update(artist_title_results)
 
-            logger.info(f"Found {len(results)} matches from {len(tracks)} tracks")
+            logger.info(
+                f"Found {len(results)} matches from {len(tracks)} tracks",
+                **self.lookup_stats,
+            )
             return results
 
+    async def _resolve_isrcs(self, isrcs: list[str]) -> dict[str, str]:
+        """Resolve ISRCs via the local index, sending only misses to the API.
+
+        Args:
+            isrcs: ISRC codes to resolve.
+
+        Returns:
+            ISRCs mapped to recording MBIDs.
+        """
+        resolved: dict[str, str] = {}
+        if self.local_index is not None:
+            resolved = self.local_index.lookup_isrcs(isrcs)
+            self.lookup_stats["local_hits"] += len(resolved)
+
+        missing = [isrc for isrc in isrcs if isrc not in resolved]
+        if missing:
+            self.lookup_stats["api_lookups"] += len(set(missing))
+            # Use native batch lookup which is already optimized
+            resolved.update(await self.connector_instance.batch_isrc_lookup(missing))
+
+        return resolved
+
+    async def _search_recording(self, artist: str, title: str) -> dict | None:
+        """Search the local index first, then the MusicBrainz web service."""
+        if self.local_index is not None:
+            recording = self.local_index.search_recording(artist, title)
+            if recording:
+                self.lookup_stats["local_hits"] += 1
+                return recording
+
+        self.lookup_stats["api_lookups"] += 1
+        return await self.connector_instance.search_recording(artist, title)
+
     def _create_isrc_match_result(self, track: Track, mbid: str) -> MatchResult | None:
         """Create a MatchResult for an ISRC-based match.
 
@@ -161,36 +209,51 @@ class MusicBrainzProvider:
     async def _process_artist_title_batch(self, batch: list[Track]) -> MatchResultsById:
         """Process a batch of tracks using artist/title matching.
 
+        Lookups run concurrently up to MUSICBRAINZ_API_CONCURRENCY; local index
+        hits return immediately while web searches queue on the connector's
+        rate limiter.
+
         Args:
             batch: List of Track objects with artist and title
 
         Returns:
             Dictionary mapping track IDs to MatchResult objects
         """
+        searchable = [t for t in batch if t.id and t.artists and t.title]
+        outcomes = await gather_in_batch(
+            searchable, self._match_artist_title, connector="musicbrainz"
+        )
+
         batch_results = {}
-        for track in batch:
-            try:
-                if not track.id or not track.artists or not track.title:
-                    continue
-
-                artist = track.artists[0].name if track.artists else ""
-                recording = await self.connector_instance.search_recording(
-                    artist, track.title
+        for track, outcome in zip(searchable, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.warning(
+                    f"Artist/title match failed: {outcome}", track_id=track.id
                 )
+            elif outcome and track.id is not None:
+                batch_results[track.id] = outcome
 
-                if recording and "id" in recording:
-                    match_result = self._create_artist_title_match_result(
-                        track=track,
-                        recording=recording,
-                        original_artist=artist,
-                    )
-                    if match_result:
-                        batch_results[track.id] = match_result
+        return batch_results
 
-            except Exception as e:
-                logger.warning(f"Artist/title match failed: {e}", track_id=track.id)
+    async def _match_artist_title(self, track: Track) -> MatchResult | None:
+        """Look up a single track's recording by its first artist and title.
 
-        return batch_results
+        Args:
+            track: Track with artist and title data
+
+        Returns:
+            MatchResult for the recording found, or None if nothing matched
+        """
+        artist = track.artists[0].name if track.artists else ""
+        recording = await self._search_recording(artist, track.title)
+        if not recording or "id" not in recording:
+            return None
+
+        return self._create_artist_title_match_result(
+            track=track,
+            recording=recording,
+            original_artist=artist,
+        )
 
     def _create_artist_title_match_result(
         self, track: Track, recording: dict[str, Any], original_artist: str
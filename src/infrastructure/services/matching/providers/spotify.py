@@ -6,10 +6,14 @@ Spotify track data into our domain MatchResult objects.
 
 from typing import Any
 
-from src.application.utilities.simple_batching import process_in_batches
+from src.application.utilities.simple_batching import (
+    gather_in_batch,
+    process_in_batches,
+)
 from src.config import get_logger
 from src.domain.entities import Track
 from src.domain.matching.types import MatchResult, MatchResultsById
+from src.domain.repositories.interfaces import ConnectorRepositoryProtocol
 
 logger = get_logger(__name__)
 
@@ -17,13 +21,22 @@ logger = get_logger(__name__)
 class SpotifyProvider:
     """Spotify track matching provider."""
 
-    def __init__(self, connector_instance: Any) -> None:
+    def __init__(
+        self,
+        connector_instance: Any,
+        connector_repo: ConnectorRepositoryProtocol | None = None,
+    ) -> None:
         """Initialize with Spotify connector.
 
         Args:
             connector_instance: Spotify service connector for API calls.
+            connector_repo: Optional connector repository used to resolve ISRCs
+                already known locally without calling the API.
         """
         self.connector_instance = connector_instance
+        self.connector_repo = connector_repo
+        self._isrc_cache: dict[str, dict[str, Any] | None] = {}
+        self.isrc_stats = {"cache_hits": 0, "api_lookups": 0, "api_hits": 0}
 
     @property
     def service_name(self) -> str:
@@ -70,6 +83,7 @@ class SpotifyProvider:
                     connector="spotify",
                 )
                 results.update(isrc_results)
+                self._log_isrc_stats()
 
             # Process remaining tracks using artist/title search
             remaining_tracks = [t for t in other_tracks if t.id not in results]
@@ -97,60 +111,140 @@ class SpotifyProvider:
         Returns:
             Track IDs mapped to MatchResult objects.
         """
+        isrc_tracks = [t for t in batch if t.id and t.isrc]
+        spotify_tracks = await self._resolve_isrcs([
+            t.isrc for t in isrc_tracks if t.isrc
+        ])
+
         batch_results = {}
-        for track in batch:
-            try:
-                if not track.id or not track.isrc:
-                    continue
-
-                spotify_track = await self.connector_instance.search_by_isrc(track.isrc)
-                if spotify_track and spotify_track.get("id"):
-                    match_result = self._create_match_result(
-                        track=track,
-                        spotify_track=spotify_track,
-                        match_method="isrc",
-                    )
-                    if match_result:
-                        batch_results[track.id] = match_result
+        for track in isrc_tracks:
+            spotify_track = spotify_tracks.get(track.isrc or "")
+            if not spotify_track or track.id is None:
+                continue
+
+            match_result = self._create_match_result(
+                track=track,
+                spotify_track=spotify_track,
+                match_method="isrc",
+            )
+            if match_result:
+                batch_results[track.id] = match_result
+
+        return batch_results
+
+    async def _resolve_isrcs(self, isrcs: list[str]) -> dict[str, dict[str, Any]]:
+        """Resolve ISRCs to Spotify track data, calling the API only for unknowns.
+
+        Each unique ISRC is resolved once per provider: first from earlier
+        batches, then from Spotify connector tracks already in the database,
+        and finally via concurrent searches for whatever is left.
+
+        Args:
+            isrcs: ISRC codes to resolve, possibly with duplicates.
 
+        Returns:
+            ISRCs mapped to Spotify track data for the ones that resolved.
+        """
+        unknown = [
+            isrc for isrc in dict.fromkeys(isrcs) if isrc not in self._isrc_cache
+        ]
+
+        if unknown and self.connector_repo is not None:
+            try:
+                known = await self.connector_repo.find_connector_tracks_by_isrcs(
+                    "spotify", unknown
+                )
             except Exception as e:
-                logger.warning(f"ISRC match failed: {e}", track_id=track.id)
+                logger.warning(f"Local ISRC lookup failed: {e}")
+                known = {}
 
-        return batch_results
+            for isrc, connector_track in known.items():
+                self._isrc_cache[isrc] = _connector_track_to_spotify_track(
+                    connector_track
+                )
+            self.isrc_stats["cache_hits"] += len(known)
+            unknown = [isrc for isrc in unknown if isrc not in known]
+
+        if unknown:
+            try:
+                found = await self.connector_instance.search_by_isrcs(unknown)
+            except Exception as e:
+                logger.warning(f"ISRC search failed: {e}")
+                found = {}
+
+            for isrc in unknown:
+                self._isrc_cache[isrc] = found.get(isrc)
+            self.isrc_stats["api_lookups"] += len(unknown)
+            self.isrc_stats["api_hits"] += len(found)
+
+        return {
+            isrc: spotify_track
+            for isrc in isrcs
+            if (spotify_track := self._isrc_cache.get(isrc))
+        }
+
+    def _log_isrc_stats(self) -> None:
+        """Log how ISRC resolution split between local hits and API lookups."""
+        cache_hits = self.isrc_stats["cache_hits"]
+        api_lookups = self.isrc_stats["api_lookups"]
+        total = cache_hits + api_lookups
+        if not total:
+            return
+
+        logger.info(
+            f"ISRC resolution: {cache_hits}/{total} from local connector tracks "
+            f"({cache_hits / total:.0%}), {api_lookups} API lookups "
+            f"({self.isrc_stats['api_hits']} found)",
+            **self.isrc_stats,
+        )
 
     async def _process_artist_title_batch(self, batch: list[Track]) -> MatchResultsById:
         """Process tracks using artist/title search.
 
+        Searches run concurrently up to SPOTIFY_API_CONCURRENCY, paced by the
+        connector's rate limiter.
+
         Args:
             batch: Tracks with artist and title data.
 
         Returns:
             Track IDs mapped to MatchResult objects.
         """
-        batch_results = {}
-        for track in batch:
-            try:
-                if not track.id or not track.artists or not track.title:
-                    continue
+        searchable = [t for t in batch if t.id and t.artists and t.title]
+        outcomes = await gather_in_batch(
+            searchable, self._match_artist_title, connector="spotify"
+        )
 
-                artist = track.artists[0].name if track.artists else ""
-                spotify_track = await self.connector_instance.search_track(
-                    artist, track.title
+        batch_results = {}
+        for track, outcome in zip(searchable, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.warning(
+                    f"Artist/title match failed: {outcome}", track_id=track.id
                 )
+            elif outcome and track.id is not None:
+                batch_results[track.id] = outcome
 
-                if spotify_track and spotify_track.get("id"):
-                    match_result = self._create_match_result(
-                        track=track,
-                        spotify_track=spotify_track,
-                        match_method="artist_title",
-                    )
-                    if match_result:
-                        batch_results[track.id] = match_result
+        return batch_results
 
-            except Exception as e:
-                logger.warning(f"Artist/title match failed: {e}", track_id=track.id)
+    async def _match_artist_title(self, track: Track) -> MatchResult | None:
+        """Search Spotify for a single track by its first artist and title.
 
-        return batch_results
+        Args:
+            track: Track with artist and title data.
+
+        Returns:
+            MatchResult for the best search hit, or None if nothing matched.
+        """
+        artist = track.artists[0].name if track.artists else ""
+        spotify_track = await self.connector_instance.search_track(artist, track.title)
+        if not spotify_track or not spotify_track.get("id"):
+            return None
+
+        return self._create_match_result(
+            track=track,
+            spotify_track=spotify_track,
+            match_method="artist_title",
+        )
 
     def _create_match_result(
         self, track: Track, spotify_track: dict[str, Any], match_method: str
@@ -228,3 +322,32 @@ class SpotifyProvider:
                 track_id=track.id,
             )
             return None
+
+
+def _connector_track_to_spotify_track(
+    connector_track: dict[str, Any],
+) -> dict[str, Any]:
+    """Shape a stored Spotify connector track like a Spotify API track object.
+
+    Args:
+        connector_track: Connector track dictionary from the repository.
+
+    Returns:
+        Dictionary with the API fields used to build match results.
+    """
+    raw_metadata = connector_track.get("raw_metadata") or {}
+    artists = (connector_track.get("artists") or {}).get("names", [])
+    release_date = connector_track.get("release_date")
+
+    return {
+        "id": connector_track["connector_track_id"],
+        "name": connector_track.get("title"),
+        "artists": [{"name": name} for name in artists],
+        "album": {
+            "name": connector_track.get("album"),
+            "release_date": release_date.date().isoformat() if release_date else None,
+        },
+        "duration_ms": connector_track.get("duration_ms"),
+        "popularity": raw_metadata.get("popularity"),
+        "external_ids": {"isrc": connector_track.get("isrc")},
+    }
@@ -5,6 +5,9 @@ freshness policies. It focuses solely on freshness decisions without any data fe
 """
 
 from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from attrs import define, field
 
 from src.config import get_config, get_logger
 from src.domain.repositories.interfaces import ConnectorRepositoryProtocol
@@ -12,6 +15,21 @@ from src.domain.repositories.interfaces import ConnectorRepositoryProtocol
 logger = get_logger(__name__)
 
 
+@define(frozen=True, slots=True)
+class EnrichmentPlan:
+    """Which tracks an enrichment has to fetch, and the values it can reuse.
+
+    Attributes:
+        stale_track_ids: Tracks with at least one missing or stale metric,
+            in request order.
+        fresh_values: Stored values of the other tracks, as metric name ->
+            track_id -> value.
+    """
+
+    stale_track_ids: list[int] = field(factory=list)
+    fresh_values: dict[str, dict[int, Any]] = field(factory=dict)
+
+
 class MetadataFreshnessController:
     """Controls when connector metadata needs refreshing based on configured policies.
 
@@ -30,87 +48,87 @@ class MetadataFreshnessController:
         """Initialize with connector repository interface.
 
         Args:
-            connector_repo: Connector repository for metadata timestamp operations.
+            connector_repo: Connector repository for stored metric reads.
         """
         self.connector_repo = connector_repo
 
-    async def get_stale_tracks(
+    async def plan_enrichment(
         self,
         track_ids: list[int],
         connector: str,
+        metric_names: list[str],
         max_age_hours: float | None = None,
-    ) -> list[int]:
-        """Get list of track IDs that have stale metadata needing refresh.
+    ) -> EnrichmentPlan:
+        """Split tracks into those needing a fetch and those served from storage.
+
+        Reads every stored metric of the tracks in one query. A (track, metric)
+        pair is stale when it was collected before the freshness cutoff, or is
+        missing. A missing pair counts as known-absent, not missing, when the
+        track has other metrics from this connector collected after the cutoff:
+        that collection found no value for it.
 
         Args:
-            track_ids: Track IDs to check for staleness.
+            track_ids: Track IDs to enrich.
             connector: Connector name for freshness policy lookup.
-            max_age_hours: Override freshness policy. If None, uses config default.
+            metric_names: Metrics the enrichment extracts.
+            max_age_hours: Override freshness policy. If None, uses config
+                default; without a policy only missing metrics are stale.
 
         Returns:
-            List of track IDs that need metadata refresh.
+            The tracks to fetch and the stored values of the rest.
         """
         if not track_ids:
-            return []
+            return EnrichmentPlan()
 
-        # Get freshness policy for this connector
         if max_age_hours is None:
             max_age_hours = self._get_freshness_policy(connector)
-
-        # If no freshness policy defined, consider all data fresh
-        if max_age_hours is None:
-            logger.debug(
-                f"No freshness policy for {connector}, considering all data fresh"
+        cutoff_time = (
+            datetime.now(UTC) - timedelta(hours=max_age_hours)
+            if max_age_hours is not None
+            else None
+        )
+
+        stored = await self.connector_repo.get_current_metrics(track_ids, connector)
+
+        stale_track_ids: list[int] = []
+        fresh_values: dict[str, dict[int, Any]] = {}
+        for track_id in track_ids:
+            track_metrics = stored.get(track_id, {})
+            last_collected = max(
+                (collected_at for _, collected_at in track_metrics.values()),
+                default=None,
             )
-            return []
-
-        with logger.contextualize(
-            operation="get_stale_tracks",
-            connector=connector,
+            if not all(
+                self._is_fresh(
+                    track_metrics[name][1] if name in track_metrics else last_collected,
+                    cutoff_time,
+                )
+                for name in metric_names
+            ):
+                stale_track_ids.append(track_id)
+                continue
+            for name in metric_names:
+                if name in track_metrics:
+                    fresh_values.setdefault(name, {})[track_id] = track_metrics[name][0]
+
+        logger.info(
+            f"Planned {connector} enrichment: {len(stale_track_ids)} of "
+            f"{len(track_ids)} tracks to fetch",
             max_age_hours=max_age_hours,
-            track_count=len(track_ids),
-        ):
-            logger.info(
-                f"Checking freshness for {len(track_ids)} tracks (max age: {max_age_hours}h)"
-            )
-
-            # Calculate cutoff time for freshness
-            cutoff_time = datetime.now(UTC) - timedelta(hours=max_age_hours)
-            logger.debug(f"Data older than {cutoff_time} considered stale")
-
-            # Only check track metrics timestamps for this connector
-            # Identity mappings are permanent - once established, they don't expire
-            metrics_timestamps = await self.connector_repo.get_metadata_timestamps(track_ids, connector)
-
-            stale_track_ids = []
-
-            for track_id in track_ids:
-                # Only use metrics timestamps to determine freshness
-                # Identity mappings (track-to-connector relationships) are permanent
-                metrics_timestamp = metrics_timestamps.get(track_id)
-                
-                last_updated = metrics_timestamp
-                timestamp_source = "metrics" if metrics_timestamp else "none"
-                
-                # Ensure timezone consistency for metrics timestamps
-                if last_updated and last_updated.tzinfo is None:
-                    last_updated = last_updated.replace(tzinfo=UTC)
-
-                if not last_updated or last_updated < cutoff_time:
-                    # Metrics data is stale or missing - need to fetch fresh metrics
-                    stale_track_ids.append(track_id)
-                    logger.debug(
-                        f"Track {track_id}: stale metrics (last_updated: {last_updated}, source: {timestamp_source})"
-                    )
-                else:
-                    logger.debug(
-                        f"Track {track_id}: fresh metrics (last_updated: {last_updated}, source: {timestamp_source})"
-                    )
-
-            logger.info(f"Found {len(stale_track_ids)} tracks with stale data out of {len(track_ids)} checked")
-            return stale_track_ids
-
-# _get_metrics_timestamps method removed - functionality moved to ConnectorRepository.get_metadata_timestamps()
+        )
+        return EnrichmentPlan(
+            stale_track_ids=stale_track_ids, fresh_values=fresh_values
+        )
+
+    @staticmethod
+    def _is_fresh(collected_at: datetime | None, cutoff_time: datetime | None) -> bool:
+        """Whether data collected at a time is still fresh at a cutoff."""
+        if collected_at is None:
+            return False
+        # Ensure timezone consistency for metrics timestamps
+        if collected_at.tzinfo is None:
+            collected_at = collected_at.replace(tzinfo=UTC)
+        return cutoff_time is None or collected_at >= cutoff_time
 
     def _get_freshness_policy(self, connector: str) -> float | None:
         """Get freshness policy for a connector from configuration.
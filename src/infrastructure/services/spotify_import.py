@@ -12,7 +12,7 @@ from src.domain.repositories.interfaces import (
     ConnectorRepositoryProtocol,
     PlaysRepositoryProtocol,
 )
-from src.infrastructure.connectors.spotify import SpotifyConnector
+from src.infrastructure.connectors.connector_pool import get_shared_connector
 from src.infrastructure.connectors.spotify_personal_data import (
     SpotifyPlayRecord,
     parse_spotify_personal_data,
@@ -30,7 +30,7 @@ class SpotifyImportService(BaseImportService):
         """Initialize with repository access following Clean Architecture."""
         super().__init__(plays_repository)
         self.operation_name = "Spotify Import"
-        self.spotify_connector = SpotifyConnector()
+        self.spotify_connector = get_shared_connector("spotify")
         self.resolver = SpotifyPlayResolver(
             spotify_connector=self.spotify_connector, connector_repository=connector_repository
         )
@@ -106,13 +106,19 @@ class SpotifyImportService(BaseImportService):
             progress_callback(60, 100, f"Resolving {len(raw_data)} track URIs...")
 
         # Use enhanced resolver for comprehensive track resolution
+        lookups_before = dict(self.resolver.lookup_stats)
         resolution_results = await self.resolver.resolve_with_fallback(raw_data)
+        lookup_stats = {
+            key: count - lookups_before[key]
+            for key, count in self.resolver.lookup_stats.items()
+        }
 
         if progress_callback:
             progress_callback(75, 100, "Creating play records with resolution...")
 
         track_plays = []
         resolution_stats = {
+            "local_id": 0,
             "direct_id": 0,
             "relinked_id": 0,
             "search_match": 0,
@@ -186,6 +192,7 @@ class SpotifyImportService(BaseImportService):
         # Store resolution stats for result creation
         self._resolution_stats = resolution_stats
         self._resolution_results = resolution_results
+        self._lookup_stats = lookup_stats
 
         return track_plays
 
@@ -256,4 +263,18 @@ class SpotifyImportService(BaseImportService):
                 else 0,
             })
 
+        # Local-first resolution: unique tracks served from existing mappings
+        # versus those that needed Spotify API metadata
+        if hasattr(self, "_lookup_stats"):
+            local_hits = self._lookup_stats["local_hits"]
+            api_lookups = self._lookup_stats["api_lookups"]
+            total_lookups = local_hits + api_lookups
+            result.play_metrics.update({
+                "tracks_resolved_locally": local_hits,
+                "tracks_fetched_from_api": api_lookups,
+                "local_hit_rate_percent": round(local_hits / total_lookups * 100, 1)
+                if total_lookups > 0
+                else 0,
+            })
+
         return result
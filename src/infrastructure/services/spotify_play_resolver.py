@@ -1,9 +1,15 @@
-"""Spotify play resolution service using existing matcher infrastructure."""
+"""Spotify play resolution service using existing matcher infrastructure.
 
-from attrs import define
+Resolution is local-first: unique track URIs are checked against stored Spotify
+connector mappings in one query, and only the unknown remainder is fetched from
+the Spotify API. Re-importing an overlapping export therefore costs no API calls
+for tracks already in the database.
+"""
+
+from attrs import define, field
 
 from src.config import get_logger
-from src.domain.entities import Artist, ConnectorTrack, Track
+from src.domain.entities import Artist, ConnectorTrack
 from src.domain.matching.algorithms import calculate_confidence
 from src.domain.matching.types import ConfidenceEvidence
 from src.domain.repositories.interfaces import ConnectorRepositoryProtocol
@@ -19,15 +25,32 @@ def extract_spotify_track_id(spotify_uri: str) -> str:
     return spotify_uri.split(":")[-1]
 
 
+def spotify_data_to_connector_track(
+    spotify_id: str, spotify_data: dict
+) -> ConnectorTrack:
+    """Build a ConnectorTrack from Spotify API track data."""
+    return ConnectorTrack(
+        connector_name="spotify",
+        connector_track_id=spotify_id,
+        title=spotify_data["name"],
+        artists=[
+            Artist(name=artist["name"]) for artist in spotify_data.get("artists", [])
+        ],
+        album=spotify_data.get("album", {}).get("name"),
+        duration_ms=spotify_data.get("duration_ms"),
+        isrc=spotify_data.get("external_ids", {}).get("isrc"),
+        raw_metadata=spotify_data,
+    )
+
+
 @define(frozen=True, slots=True)
 class PlayResolution:
     """Result of resolving a Spotify play record to internal track ID."""
 
     spotify_uri: str
     track_id: int | None
-    resolution_method: (
-        str  # "direct_id", "relinked_id", "search_match", "preserved_metadata"
-    )
+    # "local_id", "direct_id", "relinked_id", "search_match", "preserved_metadata"
+    resolution_method: str
     confidence: int | None
     evidence: ConfidenceEvidence | None = None
     metadata: dict | None = None  # Original JSON metadata for unresolved tracks
@@ -35,10 +58,19 @@ class PlayResolution:
 
 @define(frozen=True, slots=True)
 class SpotifyPlayResolver:
-    """Resolves Spotify play records to internal track IDs using existing matcher."""
+    """Resolves Spotify play records to internal track IDs using existing matcher.
+
+    Attributes:
+        spotify_connector: Spotify API connector for tracks not yet in the database
+        connector_repository: Repository holding Spotify connector track mappings
+        lookup_stats: Unique tracks resolved locally vs. requested from the API
+    """
 
     spotify_connector: SpotifyConnector
     connector_repository: ConnectorRepositoryProtocol
+    lookup_stats: dict[str, int] = field(
+        factory=lambda: {"local_hits": 0, "api_lookups": 0}, init=False
+    )
 
     async def resolve_play_records(
         self, play_records: list[SpotifyPlayRecord]
@@ -55,77 +87,21 @@ class SpotifyPlayResolver:
         if not play_records:
             return {}
 
-        # Extract unique Spotify track IDs
-        unique_uris = list({record.track_uri for record in play_records})
-        unique_track_ids = [extract_spotify_track_id(uri) for uri in unique_uris]
-
-        logger.info(f"Resolving {len(unique_track_ids)} unique Spotify tracks")
-
-        # Fetch track metadata from Spotify API
-        spotify_tracks = await self.spotify_connector.get_tracks_by_ids(
-            unique_track_ids
-        )
-
-        # Create Track objects from Spotify data for matching
-        tracks_for_matching = []
-        uri_to_track_map = {}
-
-        for record in play_records:
-            track_id = extract_spotify_track_id(record.track_uri)
-
-            # Skip if we couldn't get track data from Spotify
-            if track_id not in spotify_tracks:
-                logger.warning(f"No Spotify data for track {track_id}")
-                continue
-
-            spotify_data = spotify_tracks[track_id]
-
-            # Create Track object with Spotify metadata
-            artists = [
-                Artist(name=artist["name"])
-                for artist in spotify_data.get("artists", [])
-            ]
-
-            track = Track(
-                title=spotify_data["name"],
-                artists=artists,
-                album=spotify_data.get("album", {}).get("name"),
-                duration_ms=spotify_data.get("duration_ms"),
-                isrc=spotify_data.get("external_ids", {}).get("isrc"),
-            ).with_connector_track_id("spotify", track_id)
-
-            tracks_for_matching.append(track)
-            uri_to_track_map[record.track_uri] = track
-
-        if not tracks_for_matching:
-            logger.warning("No valid tracks to match")
-            return {}
-
-        # Simple approach: check if we have existing connector tracks for these Spotify IDs
-        # Spotify URI -> ConnectorTrack -> TrackMapping -> Track ID
-
-        track_ids = [
-            extract_spotify_track_id(record.track_uri) for record in play_records
-        ]
-        connections = [("spotify", track_id) for track_id in track_ids]
-
-        # Find tracks that have existing mappings to these Spotify connector tracks
-        existing_tracks = await self.connector_repository.find_tracks_by_connectors(
-            connections
-        )
-
-        # Build mapping: Spotify URI -> internal track ID (if mapping exists)
-        uri_to_id_map = {}
-        for record in play_records:
-            spotify_id = extract_spotify_track_id(record.track_uri)
-            connection_key = ("spotify", spotify_id)
-
-            if connection_key in existing_tracks:
-                internal_track = existing_tracks[connection_key]
-                uri_to_id_map[record.track_uri] = internal_track.id
+        unique_uris = list(dict.fromkeys(record.track_uri for record in play_records))
+        logger.info(f"Resolving {len(unique_uris)} unique Spotify tracks")
+
+        # Spotify URI -> ConnectorTrack -> TrackMapping -> Track ID, in one query
+        known = await self._find_existing_tracks([
+            extract_spotify_track_id(uri) for uri in unique_uris
+        ])
+        uri_to_id_map = {
+            uri: known[extract_spotify_track_id(uri)]
+            for uri in unique_uris
+            if extract_spotify_track_id(uri) in known
+        }
 
         logger.info(
-            f"Resolved {len(uri_to_id_map)} out of {len(play_records)} tracks from existing connector mappings"
+            f"Resolved {len(uri_to_id_map)} out of {len(unique_uris)} unique tracks from existing connector mappings"
         )
         return uri_to_id_map
 
@@ -147,87 +123,48 @@ class SpotifyPlayResolver:
         if not play_records:
             return {}
 
-        # Step 1: Check existing mappings (use existing method)
+        # Step 1: Check existing mappings locally, without API calls
         uri_to_id_map = await self.resolve_play_records(play_records)
 
         # Step 2: Identify unresolved tracks
-        unresolved_records = [
-            record for record in play_records if record.track_uri not in uri_to_id_map
-        ]
+        unresolved_ids = list(
+            dict.fromkeys(
+                extract_spotify_track_id(record.track_uri)
+                for record in play_records
+                if record.track_uri not in uri_to_id_map
+            )
+        )
 
-        if not unresolved_records:
+        if not unresolved_ids:
             logger.info("All tracks already resolved from existing mappings")
             return uri_to_id_map
 
-        logger.info(
-            f"Creating {len(unresolved_records)} missing tracks from Spotify API"
-        )
-
-        # Step 3: Get track data from Spotify API (already fetched in resolve_play_records)
-        unique_track_ids = [
-            extract_spotify_track_id(record.track_uri) for record in unresolved_records
-        ]
-        spotify_tracks = await self.spotify_connector.get_tracks_by_ids(
-            unique_track_ids
-        )
-
-        # Step 4: Create ConnectorTrack objects from Spotify API data
-        connector_tracks = []
-        uri_to_connector_track = {}
-
-        for record in unresolved_records:
-            spotify_id = extract_spotify_track_id(record.track_uri)
+        logger.info(f"Creating {len(unresolved_ids)} missing tracks from Spotify API")
 
+        # Step 3: Get track data from Spotify API for the unknown remainder only
+        spotify_tracks = await self._fetch_spotify_tracks(unresolved_ids)
+        for spotify_id in unresolved_ids:
             if spotify_id not in spotify_tracks:
                 logger.warning(f"No Spotify data for track {spotify_id}")
-                continue
-
-            spotify_data = spotify_tracks[spotify_id]
-
-            # Create ConnectorTrack from Spotify API data
-            artists = [
-                Artist(name=artist["name"])
-                for artist in spotify_data.get("artists", [])
-            ]
-
-            connector_track = ConnectorTrack(
-                connector_name="spotify",
-                connector_track_id=spotify_id,
-                title=spotify_data["name"],
-                artists=artists,
-                album=spotify_data.get("album", {}).get("name"),
-                duration_ms=spotify_data.get("duration_ms"),
-                isrc=spotify_data.get("external_ids", {}).get("isrc"),
-                raw_metadata=spotify_data,
-            )
-
-            connector_tracks.append(connector_track)
-            uri_to_connector_track[record.track_uri] = connector_track
 
-        if not connector_tracks:
+        if not spotify_tracks:
             logger.warning("No valid connector tracks to create")
             return uri_to_id_map
 
-        # Step 5: Use existing infrastructure to create tracks
+        # Step 4: Use existing infrastructure to create tracks
         logger.info(
-            f"Creating {len(connector_tracks)} tracks using existing infrastructure"
-        )
-        created_tracks = await self.connector_repository.ingest_external_tracks_bulk(
-            "spotify", connector_tracks
+            f"Creating {len(spotify_tracks)} tracks using existing infrastructure"
         )
+        created_ids = await self._ingest_spotify_tracks(spotify_tracks)
 
-        # Step 6: Map URIs to newly created track IDs
-        for record, created_track in zip(
-            unresolved_records, created_tracks, strict=True
-        ):
-            if created_track and created_track.id is not None:
-                uri_to_id_map[record.track_uri] = created_track.id
-                logger.debug(
-                    f"Created track {created_track.id} for URI {record.track_uri}"
-                )
+        # Step 5: Map URIs to newly created track IDs
+        for record in play_records:
+            spotify_id = extract_spotify_track_id(record.track_uri)
+            if record.track_uri not in uri_to_id_map and spotify_id in created_ids:
+                uri_to_id_map[record.track_uri] = created_ids[spotify_id]
 
         logger.info(
-            f"Enhanced resolution: {len(uri_to_id_map)} total tracks resolved ({len(created_tracks)} newly created)"
+            f"Enhanced resolution: {len(uri_to_id_map)} total tracks resolved ({len(created_ids)} newly created)"
         )
         return uri_to_id_map
 
@@ -325,55 +262,45 @@ class SpotifyPlayResolver:
         resolution_results = {}
 
         try:
-            # Batch API lookup
-            spotify_tracks = await self.spotify_connector.get_tracks_by_ids(
-                unique_track_ids
-            )
-
-            # Check for existing mappings to internal tracks
-            connections = [("spotify", track_id) for track_id in unique_track_ids]
-            existing_tracks = (
-                await self.connector_repository.find_tracks_by_connectors(connections)
-            )
-
-            # Process results
-            for uri in unique_uris:
-                if uri not in uri_to_id_map:
-                    continue  # Skip invalid URIs
-
-                track_id = uri_to_id_map[uri]
-
-                if track_id in spotify_tracks:
-                    spotify_data = spotify_tracks[track_id]
-
-                    # Check for relinking
-                    linked_from = spotify_data.get("linked_from")
-                    resolution_method = "relinked_id" if linked_from else "direct_id"
-
-                    # Check for existing internal track mapping
-                    connection_key = ("spotify", track_id)
-                    internal_track_id = None
-
-                    if connection_key in existing_tracks:
-                        internal_track = existing_tracks[connection_key]
-                        internal_track_id = internal_track.id
-                    else:
-                        # Create track from Spotify data if not exists
-                        internal_track_id = await self._create_track_from_spotify_data(
-                            track_id, spotify_data
-                        )
-
+            # Tracks with existing mappings resolve locally, without API calls
+            known = await self._find_existing_tracks(unique_track_ids)
+            for uri, track_id in uri_to_id_map.items():
+                if track_id in known:
                     resolution_results[uri] = PlayResolution(
                         spotify_uri=uri,
-                        track_id=internal_track_id,
-                        resolution_method=resolution_method,
-                        confidence=100,  # Full confidence for Spotify API data
-                        metadata={
-                            "spotify_data": spotify_data,
-                            "linked_from": linked_from,
-                        },
+                        track_id=known[track_id],
+                        resolution_method="local_id",
+                        confidence=100,
                     )
 
+            # Batch API lookup for the unknown remainder
+            spotify_tracks = await self._fetch_spotify_tracks([
+                track_id for track_id in unique_track_ids if track_id not in known
+            ])
+            created_ids = await self._ingest_spotify_tracks(spotify_tracks)
+
+            # Process results
+            for uri, track_id in uri_to_id_map.items():
+                if track_id not in spotify_tracks:
+                    continue
+
+                spotify_data = spotify_tracks[track_id]
+
+                # Check for relinking
+                linked_from = spotify_data.get("linked_from")
+                resolution_method = "relinked_id" if linked_from else "direct_id"
+
+                resolution_results[uri] = PlayResolution(
+                    spotify_uri=uri,
+                    track_id=created_ids.get(track_id),
+                    resolution_method=resolution_method,
+                    confidence=100,  # Full confidence for Spotify API data
+                    metadata={
+                        "spotify_data": spotify_data,
+                        "linked_from": linked_from,
+                    },
+                )
+
         except Exception as e:
             logger.error(f"Direct API lookup failed: {e}")
             # Continue to search fallback for all tracks
@@ -519,6 +446,7 @@ class SpotifyPlayResolver:
 
         stats = {
             "total": len(resolution_results),
+            "local_id": 0,
             "direct_id": 0,
             "relinked_id": 0,
             "search_match": 0,
@@ -538,22 +466,7 @@ class SpotifyPlayResolver:
     ) -> int | None:
         """Create internal track from Spotify API data."""
         try:
-            # Create ConnectorTrack from Spotify data (reuse existing pattern)
-            artists = [
-                Artist(name=artist["name"])
-                for artist in spotify_data.get("artists", [])
-            ]
-
-            connector_track = ConnectorTrack(
-                connector_name="spotify",
-                connector_track_id=spotify_id,
-                title=spotify_data["name"],
-                artists=artists,
-                album=spotify_data.get("album", {}).get("name"),
-                duration_ms=spotify_data.get("duration_ms"),
-                isrc=spotify_data.get("external_ids", {}).get("isrc"),
-                raw_metadata=spotify_data,
-            )
+            connector_track = spotify_data_to_connector_track(spotify_id, spotify_data)
 
             # Use existing infrastructure to create track
             created_tracks = (
@@ -580,3 +493,60 @@ class SpotifyPlayResolver:
         except Exception as e:
             logger.error(f"Error creating track from Spotify data {spotify_id}: {e}")
             return None
+
+    async def _find_existing_tracks(self, spotify_ids: list[str]) -> dict[str, int]:
+        """Map Spotify IDs to internal track IDs from stored connector mappings."""
+        if not spotify_ids:
+            return {}
+
+        existing_tracks = await self.connector_repository.find_tracks_by_connectors([
+            ("spotify", spotify_id) for spotify_id in spotify_ids
+        ])
+        found = {
+            spotify_id: track.id
+            for (_, spotify_id), track in existing_tracks.items()
+            if track.id is not None
+        }
+        self.lookup_stats["local_hits"] += len(found)
+        return found
+
+    async def _fetch_spotify_tracks(self, spotify_ids: list[str]) -> dict[str, dict]:
+        """Fetch track data from the Spotify API for IDs not known locally."""
+        if not spotify_ids:
+            return {}
+
+        self.lookup_stats["api_lookups"] += len(spotify_ids)
+        return await self.spotify_connector.get_tracks_by_ids(spotify_ids) or {}
+
+    async def _ingest_spotify_tracks(
+        self, spotify_tracks: dict[str, dict]
+    ) -> dict[str, int]:
+        """Create internal tracks for fetched Spotify data in one bulk ingest.
+
+        Returns:
+            Spotify IDs mapped to internal track IDs; empty if ingestion failed
+        """
+        if not spotify_tracks:
+            return {}
+
+        connector_tracks = [
+            spotify_data_to_connector_track(spotify_id, spotify_data)
+            for spotify_id, spotify_data in spotify_tracks.items()
+        ]
+        try:
+            created_tracks = (
+                await self.connector_repository.ingest_external_tracks_bulk(
+                    "spotify", connector_tracks
+                )
+            )
+        except Exception as e:
+            logger.error(f"Error creating tracks from Spotify data: {e}")
+            return {}
+
+        return {
+            connector_track.connector_track_id: created_track.id
+            for connector_track, created_track in zip(
+                connector_tracks, created_tracks, strict=True
+            )
+            if created_track and created_track.id is not None
+        }
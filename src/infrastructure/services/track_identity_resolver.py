@@ -108,7 +108,9 @@ class TrackIdentityResolver(TrackIdentityServiceProtocol):
             )
 
             # Create provider for this connector
-            provider = create_provider(connector, connector_instance)
+            provider = create_provider(
+                connector, connector_instance, connector_repo=self.connector_repo
+            )
 
             # Use provider to find matches
             match_results = await provider.find_potential_matches(
@@ -93,69 +93,107 @@ class TrackMetadataEnricher:
                 f"Starting track metadata enrichment for {len(track_ids)} tracks"
             )
 
-            # Step 1: Resolve track identities
-            identity_mappings = await self.identity_resolver.resolve_track_identities(
-                track_list, connector, connector_instance, **additional_options
+            # Step 1: Plan from stored metrics which tracks need fetching
+            plan = await self.freshness_controller.plan_enrichment(
+                track_ids, connector, list(extractors), max_age_hours
             )
 
-            logger.info(f"Resolved {len(identity_mappings)} track identities")
-
-            # If no identities could be resolved, return unchanged
-            if not identity_mappings:
-                logger.warning(
-                    "No track identities resolved, returning unchanged tracklist"
-                )
-                return track_list, {}
-
-            # Get track IDs that have identity mappings
-            mapped_track_ids = list(identity_mappings.keys())
-
-            # Step 2: Check metadata freshness
-            stale_track_ids = await self.freshness_controller.get_stale_tracks(
-                mapped_track_ids, connector, max_age_hours
-            )
-
-            if stale_track_ids:
-                logger.info(f"Found {len(stale_track_ids)} tracks with stale metadata")
-
-            # Step 3: Fetch fresh metadata for stale tracks
-            fresh_metadata = {}
-            failed_fresh_track_ids = set()
-            if stale_track_ids:
-                fresh_metadata, failed_fresh_track_ids = await self.metadata_manager.fetch_fresh_metadata(
-                    identity_mappings,
+            # Step 2: Fetch, extract and persist metrics of stale tracks only
+            metrics: dict[str, dict[int, Any]] = {}
+            if plan.stale_track_ids:
+                metrics = await self._fetch_stale_metrics(
+                    track_list,
+                    plan.stale_track_ids,
                     connector,
                     connector_instance,
-                    stale_track_ids,
+                    extractors,
                     **additional_options,
                 )
-                if fresh_metadata:
-                    logger.info(
-                        f"Fetched fresh metadata for {len(fresh_metadata)} tracks"
-                    )
 
-            # Step 4: Get all metadata (fresh + cached) with intelligent fallback
-            all_metadata = await self.metadata_manager.get_all_metadata(
-                mapped_track_ids, connector, fresh_metadata, failed_fresh_track_ids
-            )
+            # Step 3: Serve fresh tracks from stored values; fetched ones override
+            for metric_name, values in plan.fresh_values.items():
+                metrics[metric_name] = {**values, **metrics.get(metric_name, {})}
 
-            # Step 5: Extract metrics using configured extractors
-            metrics = await self._extract_metrics(
-                identity_mappings, all_metadata, extractors
-            )
-
-            # Step 6: Persist metrics to database for future use
-            await self._persist_metrics_to_database(metrics, connector)
+            if not metrics:
+                logger.warning("No metrics available, returning unchanged tracklist")
+                return track_list, {}
 
-            # Step 7: Attach metrics to tracklist
+            # Step 4: Attach metrics to tracklist
             enriched_tracklist = self._attach_metrics_to_tracklist(track_list, metrics)
 
             logger.info(
-                f"Successfully enriched tracklist with {sum(len(values) for values in metrics.values())} total metric values"
+                f"Successfully enriched tracklist with {sum(len(values) for values in metrics.values())} total metric values",
+                fetched_tracks=len(plan.stale_track_ids),
+                stored_tracks=len(track_ids) - len(plan.stale_track_ids),
             )
 
             return enriched_tracklist, metrics
 
+    async def _fetch_stale_metrics(
+        self,
+        track_list: TrackList,
+        stale_track_ids: list[int],
+        connector: str,
+        connector_instance: Any,
+        extractors: dict[str, Any],
+        **additional_options: Any,
+    ) -> dict[str, dict[int, Any]]:
+        """Resolve, fetch, extract and persist metrics of stale tracks.
+
+        Args:
+            track_list: Tracks being enriched.
+            stale_track_ids: Tracks with missing or stale metrics.
+            connector: Connector name.
+            connector_instance: Connector implementation.
+            extractors: Metric extractors for this connector.
+            **additional_options: Options forwarded to services.
+
+        Returns:
+            Dictionary mapping metric names to track_id -> value mappings.
+        """
+        logger.info(f"Found {len(stale_track_ids)} tracks with stale metadata")
+        stale_ids = set(stale_track_ids)
+        stale_tracks = track_list.with_tracks([
+            t for t in track_list.tracks if t.id in stale_ids
+        ])
+
+        # Resolve track identities
+        identity_mappings = await self.identity_resolver.resolve_track_identities(
+            stale_tracks, connector, connector_instance, **additional_options
+        )
+
+        logger.info(f"Resolved {len(identity_mappings)} track identities")
+
+        if not identity_mappings:
+            logger.warning("No track identities resolved for stale tracks")
+            return {}
+
+        # Get track IDs that have identity mappings
+        mapped_track_ids = list(identity_mappings.keys())
+
+        # Fetch fresh metadata for stale tracks
+        fresh_metadata, failed_fresh_track_ids = await self.metadata_manager.fetch_fresh_metadata(
+            identity_mappings,
+            connector,
+            connector_instance,
+            mapped_track_ids,
+            **additional_options,
+        )
+        if fresh_metadata:
+            logger.info(f"Fetched fresh metadata for {len(fresh_metadata)} tracks")
+
+        # Get metadata (fresh + cached) with intelligent fallback
+        all_metadata = await self.metadata_manager.get_all_metadata(
+            mapped_track_ids, connector, fresh_metadata, failed_fresh_track_ids
+        )
+
+        # Extract metrics and persist them for future runs
+        metrics = await self._extract_metrics(
+            identity_mappings, all_metadata, extractors
+        )
+        await self._persist_metrics_to_database(metrics, connector)
+        return metrics
+
     async def _extract_metrics(
         self,
         identity_mappings: dict[int, Any],
@@ -19,8 +19,8 @@ class TestWorkflowRegistration:
 
     def test_all_workflows_appear_in_help(self, runner):
         """Test that narada --help shows all available workflows."""
-        # Since workflows are registered at import time, just test that 
-        # the current real workflows appear in help output
+        # Workflows are listed from the definition index when help renders,
+        # so the current real workflows should appear in help output
         result = runner.invoke(app, ["--help"])
         assert result.exit_code == 0
         
@@ -33,22 +33,25 @@ class TestWorkflowRegistration:
 
     def test_workflow_registration_with_db_unavailable(self, runner):
         """Test workflow registration gracefully handles database unavailable."""
-        with patch("src.infrastructure.cli.app.list_workflows", side_effect=Exception("Database unavailable")):
+        with patch("src.infrastructure.cli.app.load_workflow_index", side_effect=Exception("Database unavailable")):
             result = runner.invoke(app, ["--help"])
             assert result.exit_code == 0
             # Should still show other commands even if workflows fail to load
             assert "status" in result.stdout
             assert "setup" in result.stdout
+            assert "discovery_mix" not in result.stdout
 
     def test_workflow_registration_with_empty_list(self, runner):
         """Test workflow registration with empty workflow list."""
-        with patch("src.infrastructure.cli.app.list_workflows") as mock_list:
+        with patch("src.infrastructure.cli.app.load_workflow_index") as mock_list:
             mock_list.return_value = []
             
             result = runner.invoke(app, ["--help"])
             assert result.exit_code == 0
-            # Should still show basic structure
-            assert "🎵 Playlist Workflows" in result.stdout or "Playlist Workflows" in result.stdout
+            # Should still show basic structure, without workflow commands
+            assert "🔧 Playlist Workflow Management" in result.stdout
+            assert "🎵 Playlist Workflows" not in result.stdout
+            assert "discovery_mix" not in result.stdout
 
     def test_registered_workflows_are_callable(self, runner):
         """Test that registered workflows can actually be called."""
@@ -0,0 +1,96 @@
+"""Startup-cost regression tests for the CLI entry point.
+
+``narada --help`` and ``narada status`` should not pay for Prefect, SQLAlchemy
+or the connector client libraries. These tests import the CLI app in a fresh
+interpreter under ``-X importtime`` and check both which modules load and how
+long Narada's own imports take.
+"""
+
+import subprocess  # noqa: S404
+import sys
+
+from typer.testing import CliRunner
+
+from src.infrastructure.cli.app import app
+
+# Third-party modules only the commands themselves may import
+HEAVY_MODULES = ("prefect", "sqlalchemy", "spotipy", "pylast", "musicbrainzngs")
+
+# Budget for Narada's own import cost on top of the CLI toolkit (Typer, Click,
+# Rich), which is preloaded so the measurement is not dominated by it
+STARTUP_BUDGET_US = 100_000
+
+PRELOAD = "import typer, typer.core, click, rich.console, attrs"
+
+
+def _import_profile() -> list[tuple[int, str]]:
+    """Run a fresh interpreter importing the CLI app and parse -X importtime."""
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"{PRELOAD}; import src.infrastructure.cli.app",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        profile.append((int(cumulative), name))
+    return profile
+
+
+def test_cli_import_skips_heavy_dependencies():
+    """Importing the CLI app must not import command-only dependencies."""
+    imported = {name.strip().split(".")[0] for _, name in _import_profile()}
+
+    assert imported.isdisjoint(HEAVY_MODULES), imported & set(HEAVY_MODULES)
+
+
+def test_cli_import_within_startup_budget():
+    """Narada's own imports at CLI startup stay within the time budget."""
+    # Best of three smooths over scheduler noise on busy machines
+    timings = []
+    for _ in range(3):
+        own_cost = sum(
+            cumulative
+            for cumulative, name in _import_profile()
+            # Top-level entries only; nested ones are already included
+            if not name.startswith("  ") and name.strip().startswith("src")
+        )
+        timings.append(own_cost)
+        if own_cost <= STARTUP_BUDGET_US:
+            break
+
+    assert min(timings) <= STARTUP_BUDGET_US, f"CLI import took {min(timings)}us"
+
+
+def test_help_does_not_load_command_modules():
+    """Rendering help lists lazy commands without importing their modules."""
+    script = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from src.infrastructure.cli.app import app\n"
+        "result = CliRunner().invoke(app, ['--help'])\n"
+        "assert result.exit_code == 0, result.stdout\n"
+        "assert 'data' in result.stdout and 'discovery_mix' in result.stdout\n"
+        "loaded = [m for m in sys.modules if m.endswith(('data_commands',"
+        " 'workflows_commands', 'setup_commands')) or m == 'prefect']\n"
+        "assert not loaded, loaded\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)  # noqa: S603
+
+
+def test_lazy_command_loads_on_invocation():
+    """Invoking a lazy command resolves its real implementation."""
+    result = CliRunner().invoke(app, ["playlist", "--help"])
+
+    assert result.exit_code == 0
+    assert "run" in result.stdout
+    assert "list" in result.stdout
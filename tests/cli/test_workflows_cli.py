@@ -142,4 +142,48 @@ def test_workflow_system_initialization():
     success, message = initialize_workflow_system()
     assert isinstance(success, bool)
     assert isinstance(message, str)
-    assert len(message) > 0
\ No newline at end of file
+    assert len(message) > 0
+
+
+def test_workflow_run_passes_engine_choice(runner):
+    """Test --engine selects the execution engine for the run."""
+    with patch(
+        "src.infrastructure.cli.workflows_commands._run_workflow_interactive"
+    ) as mock_run:
+        result = runner.invoke(
+            app, ["playlist", "run", "test_workflow", "--engine", "local"]
+        )
+
+    assert result.exit_code == 0
+    mock_run.assert_called_once_with(
+        "test_workflow", True, "table", "local", False, None, False
+    )
+
+
+def test_workflow_run_passes_stream_flag(runner):
+    """Test --stream requests a streaming run."""
+    with patch(
+        "src.infrastructure.cli.workflows_commands._run_workflow_interactive"
+    ) as mock_run:
+        result = runner.invoke(app, ["playlist", "run", "test_workflow", "--stream"])
+
+    assert result.exit_code == 0
+    mock_run.assert_called_once_with(
+        "test_workflow", True, "table", "prefect", False, None, True
+    )
+
+
+def test_workflow_run_batch_passes_every_workflow(runner):
+    """Test run-batch hands all requested workflows to one batch run."""
+    with patch(
+        "src.infrastructure.cli.workflows_commands._run_workflow_batch"
+    ) as mock_run:
+        result = runner.invoke(
+            app,
+            ["playlist", "run-batch", "first", "second", "--engine", "local"],
+        )
+
+    assert result.exit_code == 0
+    mock_run.assert_called_once_with(
+        ["first", "second"], True, "table", "local", False
+    )
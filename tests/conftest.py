@@ -19,6 +19,17 @@ def setup_test_database():
     os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///:memory:"
 
 
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    """Keep caches written under the data directory out of the working tree."""
+    from src.config import settings
+
+    data_dir = tmp_path / "data"
+    monkeypatch.setenv("DATA_DIR", str(data_dir))
+    monkeypatch.setattr(settings, "data_dir", data_dir)
+    return data_dir
+
+
 @pytest.fixture
 async def initialize_db():
     """Initialize database schema for tests."""
@@ -0,0 +1,88 @@
+"""Tests for the single- and multi-key track sort transforms."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from src.domain.entities.track import Artist, Track, TrackList
+from src.domain.entities.track_columns import lexsort
+from src.domain.transforms.core import sort_by_attribute, sort_by_keys
+
+
+def _track(track_id: int | None, year: int | None = None) -> Track:
+    """Track with an optional ID and release year."""
+    return Track(
+        id=track_id,
+        title=f"Track {track_id}",
+        artists=[Artist(name="A")],
+        release_date=datetime(year, 1, 1, tzinfo=UTC) if year else None,
+    )
+
+
+def test_lexsort_orders_by_each_key_in_its_own_direction():
+    """Test ties fall through to the next key and None sorts last per key."""
+    plays = [5, 5, None, 9, 5]
+    years = [2001, 1999, 2020, None, 1999]
+
+    assert lexsort([(plays, True), (years, False)]) == [3, 1, 4, 0, 2]
+
+
+def test_sort_computes_each_key_once_with_missing_keys_last():
+    """Test the key function runs once per track and stored metrics skip gaps."""
+    tracklist = TrackList(
+        tracks=[_track(1, 2005), _track(2), _track(3, 1990), _track(None, 2000)],
+        metadata={"metrics": {"release_date": {}}},
+    )
+    calls = []
+
+    def release_date(track: Track) -> datetime | None:
+        calls.append(track.id)
+        return track.release_date
+
+    result = sort_by_attribute(
+        release_date, "release_date", reverse=True, tracklist=tracklist
+    )
+
+    assert [track.id for track in result.tracks] == [1, None, 3, 2]
+    assert sorted(calls, key=str) == sorted([1, 2, 3, None], key=str)
+    assert set(result.metadata["metrics"]["release_date"]) == {1, 3}
+
+
+def test_sort_prefers_resolved_metrics_and_is_stable():
+    """Test metric values win over the fallback and ties keep input order."""
+    tracklist = TrackList(
+        tracks=[_track(i) for i in range(1, 6)],
+        metadata={"metrics": {"plays": {1: 3, 2: 7, 3: 3, 4: None, 5: 7}}},
+    )
+
+    result = sort_by_attribute("plays", "plays", reverse=True, tracklist=tracklist)
+
+    assert [track.id for track in result.tracks] == [2, 5, 1, 3, 4]
+    assert result.metadata["metrics"]["plays"] == {1: 3, 2: 7, 3: 3, 5: 7}
+
+
+def test_sort_rejects_string_track_ids_in_metrics():
+    """Test string metric keys raise instead of silently mis-sorting."""
+    tracklist = TrackList(tracks=[_track(1)], metadata={"metrics": {"plays": {"1": 3}}})
+
+    with pytest.raises(TypeError, match="string keys"):
+        sort_by_attribute("plays", "plays", tracklist=tracklist)
+
+
+def test_sort_by_keys_breaks_ties_with_later_metrics():
+    """Test multi-key sorting with a per-key direction."""
+    tracklist = TrackList(
+        tracks=[_track(i) for i in range(1, 5)],
+        metadata={
+            "metrics": {
+                "plays": {1: 10, 2: 20, 3: 10, 4: 20},
+                "popularity": {1: 50, 2: 40, 3: 60, 4: 90},
+            }
+        },
+    )
+
+    result = sort_by_keys([("plays", True), ("popularity", False)], tracklist=tracklist)
+
+    assert [track.id for track in result.tracks] == [2, 4, 1, 3]
+    with pytest.raises(ValueError, match="at least one"):
+        sort_by_keys([])
@@ -0,0 +1,97 @@
+"""Tests for the columnar TrackList view used by bulk transforms."""
+
+from datetime import UTC, datetime, timedelta
+
+from src.domain.entities.track import Artist, Track, TrackList
+from src.domain.entities.track_columns import TrackColumns, argsort
+from src.domain.transforms.core import (
+    filter_by_date_range,
+    filter_by_metric_range,
+    filter_by_play_history,
+)
+
+
+def _tracklist(count: int) -> TrackList:
+    """Tracks 1..count with one popularity value each; track 0 has no ID."""
+    now = datetime.now(UTC)
+    tracks = [Track(title="No ID", artists=[Artist(name="A")])] + [
+        Track(
+            id=i,
+            title=f"Track {i}",
+            artists=[Artist(name="A")],
+            release_date=now - timedelta(days=i),
+        )
+        for i in range(1, count + 1)
+    ]
+    metrics = {"popularity": {i: i % 100 for i in range(1, count + 1)}}
+    return TrackList(tracks=tracks, metadata={"metrics": metrics})
+
+
+def test_columns_align_with_tracks_and_follow_selection():
+    """Test selected rows keep their columns and resolved metrics aligned."""
+    tracklist = _tracklist(10)
+    popularity = tracklist.metadata["metrics"]["popularity"]
+    tracklist.columns.metric("popularity", popularity)
+
+    picked = tracklist.take([5, 2])
+
+    assert [track.id for track in picked.tracks] == [5, 2]
+    assert picked.columns.ids == [5, 2]
+    assert picked.columns.metric("popularity", popularity) == [5, 2]
+    # Unchanged tracks keep their columns across metadata updates
+    assert picked.with_metadata("note", 1).columns is picked.columns
+
+
+def test_argsort_is_stable_with_missing_values_last():
+    """Test ties keep input order and None sorts last in both directions."""
+    values = [3, None, 1, 3, None, 2]
+
+    assert argsort(values) == [2, 5, 0, 3, 1, 4]
+    assert argsort(values, reverse=True) == [0, 3, 5, 2, 1, 4]
+
+
+def test_chained_filters_reuse_columns():
+    """Test a filter chain matches per-track semantics and reuses one build."""
+    tracklist = _tracklist(300)
+
+    result = filter_by_metric_range("popularity", min_value=50, tracklist=tracklist)
+    result = filter_by_date_range(max_age_days=200, tracklist=result)
+
+    assert [track.id for track in result.tracks] == [
+        i for i in range(1, 201) if i % 100 >= 50
+    ]
+    assert result.columns.ids == [track.id for track in result.tracks]
+    assert result.metadata["filter_metrics"]["removed_count"] == 151
+
+
+def test_chained_filters_work_on_columns_without_rebuilding_tracks(monkeypatch):
+    """Test filters select rows from the columns instead of rebuilding tracks."""
+    tracklist = _tracklist(1_000)
+    plays = {i: i % 7 for i in range(1, 1_001)}
+    tracklist = tracklist.with_metadata("total_plays", plays)
+    tracklist.columns  # noqa: B018 - build columns before counting
+
+    calls = {"track": 0, "columns": 0}
+    track_init = Track.__init__
+    from_tracks = TrackColumns.from_tracks.__func__
+
+    def counting_track_init(self, *args, **kwargs):
+        calls["track"] += 1
+        track_init(self, *args, **kwargs)
+
+    def counting_from_tracks(cls, tracks):
+        calls["columns"] += 1
+        return from_tracks(cls, tracks)
+
+    monkeypatch.setattr(Track, "__init__", counting_track_init)
+    monkeypatch.setattr(TrackColumns, "from_tracks", classmethod(counting_from_tracks))
+
+    result = filter_by_metric_range("popularity", max_value=10, tracklist=tracklist)
+    result = filter_by_play_history(min_plays=3, tracklist=result)
+
+    assert [track.id for track in result.tracks] == [
+        i for i in range(1, 1_001) if i % 100 <= 10 and i % 7 >= 3
+    ]
+    assert result.columns.ids == [track.id for track in result.tracks]
+    # Rows are selected from the columns built up front; no track is copied
+    assert calls == {"track": 0, "columns": 0}
@@ -0,0 +1,112 @@
+"""Tests for lazy planning and fused execution of transform pipelines."""
+
+from src.domain.entities.track import Artist, Track, TrackList
+from src.domain.entities.track_columns import lexsort
+from src.domain.transforms.core import (
+    create_pipeline,
+    filter_by_metric_range,
+    filter_by_predicate,
+    filter_duplicates,
+    limit,
+    sort_by_attribute,
+    sort_by_keys,
+    take_last,
+)
+from src.domain.transforms.pipeline import _top_k
+
+
+def _tracklist(count: int) -> TrackList:
+    """Tracks 1..count, with duplicates of every tenth track and some gaps."""
+    tracks = [
+        Track(id=i, title=f"Track {i}", artists=[Artist(name=f"Artist {i % 7}")])
+        for i in range(1, count + 1)
+    ]
+    tracks += [track for track in tracks if track.id % 10 == 0]
+    metrics = {
+        "popularity": {i: i % 13 for i in range(1, count + 1) if i % 9},
+        "plays": {i: i % 5 for i in range(1, count + 1)},
+    }
+    return TrackList(tracks=tracks, metadata={"metrics": metrics})
+
+
+def _not_artist_zero(track: Track) -> bool:
+    return track.artists[0].name != "Artist 0"
+
+
+def test_pipeline_matches_eager_composition():
+    """Test the fused plan returns the same tracks and metadata as eager steps."""
+    steps = [
+        filter_duplicates(),
+        filter_by_predicate(_not_artist_zero),
+        filter_by_metric_range("popularity", min_value=3, include_missing=True),
+        sort_by_attribute("popularity", "popularity", reverse=True),
+        limit(15),
+    ]
+    tracklist = _tracklist(200)
+
+    fused = create_pipeline(*steps)(tracklist)
+    eager = tracklist
+    for step in steps:
+        # Each step on its own materializes its result, like the old transforms
+        eager = step(eager)
+
+    assert [track.id for track in fused.tracks] == [track.id for track in eager.tracks]
+    assert fused.metadata == eager.metadata
+    assert fused.metadata["duplicates_removed"] == 20
+    assert fused.metadata["filter_metrics"]["original_count"] == 172
+
+
+def test_explain_shows_fused_filters_and_top_k():
+    """Test the plan fuses filters, turns sort+limit into a heap and keeps barriers."""
+    pipeline = create_pipeline(
+        filter_by_predicate(_not_artist_zero),
+        filter_by_metric_range("popularity", min_value=3),
+        sort_by_attribute("popularity", "popularity", reverse=True),
+        limit(20),
+        limit(10),
+        take_last(5),
+    )
+
+    assert pipeline.explain().splitlines() == [
+        "1. filter [filter_by_predicate(_not_artist_zero) -> "
+        "filter_by_metric_range(popularity)], fused 2 filters in one pass",
+        "2. top-10 heap sort_by_attribute(popularity desc)",
+        "3. transform take_last.<locals>.transform (materializes input)",
+    ]
+    assert len(pipeline(_tracklist(100)).tracks) == 5
+
+
+def test_limit_after_plain_filters_stops_the_scan():
+    """Test a pushed-down limit stops testing rows once enough passed."""
+    tested = []
+
+    def even(track: Track) -> bool:
+        tested.append(track.id)
+        return track.id % 2 == 0
+
+    pipeline = create_pipeline(filter_by_predicate(even), limit(3))
+    result = pipeline(_tracklist(100))
+
+    assert [track.id for track in result.tracks] == [2, 4, 6]
+    assert tested == [1, 2, 3, 4, 5, 6]
+    assert "(stops scanning early)" in pipeline.explain()
+
+
+def test_top_k_matches_full_sort_prefix():
+    """Test heap selection keeps the stable, nulls-last order of a full sort."""
+    plays = [3, None, 5, 3, 1, None, 5, 3]
+    years = [2001, 1999, None, 1990, 2001, 2005, 2010, 1990]
+
+    for keys in ([(plays, True)], [(plays, False)], [(plays, True), (years, False)]):
+        for k in range(len(plays) + 1):
+            assert _top_k(keys, k) == lexsort(keys)[:k]
+
+
+def test_multi_key_sort_then_limit():
+    """Test a multi-key sort followed by a limit uses the same order as eager."""
+    tracklist = _tracklist(60)
+    sort = sort_by_keys([("plays", True), ("popularity", False)])
+
+    fused = create_pipeline(sort, limit(7))(tracklist)
+
+    assert fused.tracks == sort(tracklist).tracks[:7]
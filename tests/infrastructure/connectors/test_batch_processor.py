@@ -0,0 +1,107 @@
+"""Tests for the sliding-window connector BatchProcessor."""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.connectors.base_connector import BatchProcessor
+from src.infrastructure.connectors.rate_limiter import AdaptiveRateLimiter
+
+
+def _processor(
+    concurrency: int = 2, batch_size: int = 2, **kwargs
+) -> BatchProcessor[int, int]:
+    """Processor without retries so failures surface immediately."""
+    return BatchProcessor[int, int](
+        batch_size=batch_size,
+        concurrency_limit=concurrency,
+        retry_count=0,
+        retry_base_delay=0.0,
+        retry_max_delay=0.0,
+        request_delay=0.0,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_slow_item_does_not_stall_the_window():
+    """Test later items start while an earlier one is still running."""
+    third_started = asyncio.Event()
+
+    async def work(item: int) -> int:
+        if item == 0:
+            # Would deadlock with fixed chunks: item 2 sits in the next chunk
+            await asyncio.wait_for(third_started.wait(), timeout=1.0)
+        if item == 2:
+            third_started.set()
+        await asyncio.sleep(0)
+        return item
+
+    results = await _processor().process([0, 1, 2, 3], work)
+
+    assert results == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_in_flight_bounded_with_rate_limiter():
+    """Test the worker pool caps concurrency even when a limiter is set."""
+    in_flight = 0
+    peak = 0
+
+    async def work(item: int) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return item
+
+    limiter = AdaptiveRateLimiter("test_batch", 10_000.0)
+    results = await _processor(concurrency=3, rate_limiter=limiter).process(
+        list(range(20)), work
+    )
+
+    assert results == list(range(20))
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_results_ordered_or_as_completed():
+    """Test ordered output follows input order and failures are dropped."""
+
+    async def work(item: int) -> int:
+        if item == 1:
+            raise ValueError("boom")
+        # Earlier items finish last
+        await asyncio.sleep(0.001 * (4 - item))
+        return item
+
+    processor = _processor(concurrency=4)
+
+    assert await processor.process([0, 1, 2, 3], work) == [0, 2, 3]
+    assert await processor.process([0, 1, 2, 3], work, ordered=False) == [3, 2, 0]
+
+
+@pytest.mark.asyncio
+async def test_progress_driven_by_completions():
+    """Test progress events fire per completion window, not per chunk start."""
+    events: list[tuple[str, dict]] = []
+
+    async def work(item: int) -> int:
+        await asyncio.sleep(0)
+        return item
+
+    await _processor(batch_size=2).process(
+        list(range(5)),
+        work,
+        progress_callback=lambda event, data: events.append((event, data)),
+    )
+
+    names = [event for event, _ in events]
+    assert names[0] == "batch_started"
+    assert names[-1] == "batch_completed"
+    windows = [
+        data["items_processed"] for event, data in events if event == "batch_progress"
+    ]
+    assert windows == [2, 4, 5]
+    assert events[-1][1]["batch_failures"] == 0
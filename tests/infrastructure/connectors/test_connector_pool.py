@@ -0,0 +1,59 @@
+"""Tests for the process-scoped connector pool."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.connectors.connector_pool import ConnectorPool
+
+
+class TestConnectorPool:
+    """Test instance sharing and lifecycle handling."""
+
+    async def test_same_instance_shared_per_service(self):
+        """Test the factory runs once and callers share the instance."""
+        pool = ConnectorPool()
+        factory = MagicMock(side_effect=lambda _params: object())
+
+        first = pool.get("spotify", factory)
+        second = pool.get("spotify", factory)
+
+        assert first is second
+        factory.assert_called_once_with({})
+        assert pool.active() == ["spotify"]
+
+    def test_unknown_connector_raises(self):
+        """Test names missing from the registry are rejected."""
+        with pytest.raises(ValueError, match="Unknown connector: nope"):
+            ConnectorPool().get("nope")
+
+    def test_close_runs_hooks_in_reverse_creation_order(self):
+        """Test close hooks run newest first and empty the pool."""
+        pool = ConnectorPool()
+        closed = []
+        for name in ("first", "second"):
+            instance = MagicMock(spec=["close"])
+            instance.close.side_effect = lambda name=name: closed.append(name)
+            pool.get(name, lambda _params, instance=instance: instance)
+
+        pool.close()
+
+        assert closed == ["second", "first"]
+        assert pool.active() == []
+
+    def test_instances_recycled_after_event_loop_closes(self):
+        """Test connectors bound to a finished loop are closed and rebuilt."""
+        pool = ConnectorPool()
+        factory = MagicMock(side_effect=lambda _params: MagicMock(spec=["close"]))
+
+        async def acquire():
+            await asyncio.sleep(0)
+            return pool.get("lastfm", factory)
+
+        first = asyncio.run(acquire())
+        second = asyncio.run(acquire())
+
+        assert first is not second
+        first.close.assert_called_once_with()
+        assert factory.call_count == 2
@@ -1,6 +1,7 @@
 """Tests for LastFM multi-artist fallback functionality."""
 
-from unittest.mock import AsyncMock, Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -187,4 +188,141 @@ class TestLastFMMultiArtistFallback:
         mock_lastfm_connector.get_lastfm_track_info.assert_called_once_with(
             mbid="test-mbid-123",
             lastfm_username=None,
-        )
\ No newline at end of file
+        )
+
+
+class TestConcurrentLookupStrategy:
+    """Test the connector's concurrent, ranked lookup strategy."""
+
+    async def test_best_ranked_hit_beats_faster_lower_ranked_hit(
+        self, multi_artist_track, successful_track_info
+    ):
+        """Test that an earlier-credited hit beats a faster lower-ranked hit."""
+        cancelled = []
+
+        async def fake_lookup(**kwargs):
+            artist = kwargs["artist_name"]
+            if artist == "Versus GT":
+                await asyncio.sleep(0.02)
+                return LastFMTrackInfo.empty()
+            if artist == "Nosaj Thing":
+                await asyncio.sleep(0.04)
+                return successful_track_info
+            try:
+                await asyncio.sleep(0.01)
+                return LastFMTrackInfo(lastfm_url="https://www.last.fm/other")
+            except asyncio.CancelledError:
+                cancelled.append(artist)
+                raise
+
+        connector = LastFMConnector()
+        with patch.object(
+            LastFMConnector, "get_lastfm_track_info", side_effect=fake_lookup
+        ):
+            result = await connector._find_track_info(multi_artist_track, "user")
+
+        # Third artist answered first, but the second artist outranks it
+        assert result.lastfm_url == successful_track_info.lastfm_url
+        assert result.lastfm_lookup_artist == "Nosaj Thing"
+        assert cancelled == []
+
+    async def test_pending_lookups_cancelled_after_top_ranked_hit(
+        self, multi_artist_track, successful_track_info
+    ):
+        """Test that lower-ranked lookups are cancelled once the top rank hits."""
+        cancelled = []
+
+        async def fake_lookup(**kwargs):
+            if kwargs["artist_name"] == "Versus GT":
+                return successful_track_info
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(kwargs["artist_name"])
+                raise
+            return LastFMTrackInfo.empty()
+
+        connector = LastFMConnector()
+        with patch.object(
+            LastFMConnector, "get_lastfm_track_info", side_effect=fake_lookup
+        ):
+            result = await connector._find_track_info(multi_artist_track, "user")
+
+        assert result.lastfm_lookup_artist == "Versus GT"
+        assert sorted(cancelled) == ["Jacques Green", "Nosaj Thing"]
+
+    async def test_remembered_variant_goes_straight_to_lookup(
+        self, multi_artist_track, successful_track_info
+    ):
+        """Test that a stored lookup artist is tried alone on refresh."""
+        track = multi_artist_track.with_connector_metadata(
+            "lastfm", {"lastfm_lookup_artist": "Jacques Green"}
+        )
+
+        connector = LastFMConnector()
+        with patch.object(
+            LastFMConnector,
+            "get_lastfm_track_info",
+            return_value=successful_track_info,
+        ) as mock_lookup:
+            result = await connector._find_track_info(track, "user")
+
+        assert result.lastfm_lookup_artist == "Jacques Green"
+        mock_lookup.assert_called_once_with(
+            lastfm_username="user",
+            artist_name="Jacques Green",
+            track_title="Unknown",
+        )
+
+    async def test_successful_variant_remembered_for_next_lookup(
+        self, multi_artist_track, successful_track_info
+    ):
+        """Test that the winning variant is reused within the same process."""
+        def fake_lookup(**kwargs):
+            if kwargs["artist_name"] == "Jacques Green":
+                return successful_track_info
+            return LastFMTrackInfo.empty()
+
+        connector = LastFMConnector()
+        with patch.object(
+            LastFMConnector, "get_lastfm_track_info", side_effect=fake_lookup
+        ) as mock_lookup:
+            await connector._find_track_info(multi_artist_track, "user")
+            assert mock_lookup.call_count == 3
+
+            mock_lookup.reset_mock()
+            result = await connector._find_track_info(multi_artist_track, "user")
+
+        assert result.lastfm_url == successful_track_info.lastfm_url
+        assert mock_lookup.call_count == 1
+
+    async def test_remembered_variants_are_bounded(
+        self, multi_artist_track, successful_track_info, monkeypatch
+    ):
+        """Test that the least recently used variants are forgotten first."""
+        monkeypatch.setattr(LastFMConnector, "PREFERRED_ARTISTS_MAX", 2)
+        connector = LastFMConnector()
+
+        with patch.object(
+            LastFMConnector,
+            "get_lastfm_track_info",
+            return_value=successful_track_info,
+        ):
+            for track_id in (1, 2, 1, 3):
+                track = multi_artist_track.with_id(track_id)
+                await connector._find_track_info(track, "user")
+
+        assert list(connector._preferred_artists) == [1, 3]
+
+    async def test_all_lookups_miss_returns_empty(self, multi_artist_track):
+        """Test that an empty result is returned when no candidate hits."""
+        connector = LastFMConnector()
+        with patch.object(
+            LastFMConnector,
+            "get_lastfm_track_info",
+            return_value=LastFMTrackInfo.empty(),
+        ) as mock_lookup:
+            result = await connector._find_track_info(multi_artist_track, "user")
+
+        assert result.lastfm_url is None
+        assert mock_lookup.call_count == 3
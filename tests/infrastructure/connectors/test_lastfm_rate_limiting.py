@@ -1,14 +1,14 @@
-"""Tests for LastFM rate limiting with aiolimiter integration."""
+"""Tests for LastFM rate limiting with adaptive rate limiter integration."""
 
 from unittest.mock import AsyncMock, Mock, patch
 
-from src.infrastructure.connectors.lastfm import LastFMConnector
+from src.infrastructure.connectors.lastfm import LastFMConnector, lastfm_feedback
 
 
 class TestLastFMRateLimiting:
     """Test rate limiting integration in LastFM connector."""
 
-    @patch("src.infrastructure.connectors.lastfm.AsyncLimiter")
+    @patch("src.infrastructure.connectors.lastfm.AdaptiveRateLimiter")
     @patch("src.infrastructure.connectors.lastfm.get_config")
     def test_rate_limiter_created_with_correct_config(self, mock_get_config, mock_async_limiter):
         """Test that rate limiter is created with configured rate limit."""
@@ -23,26 +23,32 @@ class TestLastFMRateLimiting:
             "LASTFM_API_REQUEST_DELAY": 0.0,
         }.get(key, default)
         
-        # Mock AsyncLimiter instance
+        # Mock limiter instance
         mock_limiter = Mock()
         mock_async_limiter.return_value = mock_limiter
         
         # Create connector (triggers __attrs_post_init__)
         connector = LastFMConnector()
         
-        # Verify AsyncLimiter was created with correct parameters
-        mock_async_limiter.assert_called_once_with(5.0, 1)  # 5 calls per 1 second
+        # Verify limiter starts at the configured rate with Last.fm feedback
+        mock_async_limiter.assert_called_once_with(
+            "lastfm", 5.0, max_rate=5.0, classifier=lastfm_feedback
+        )
         
         # Verify rate limiter is stored in connector
         assert connector._api_rate_limiter == mock_limiter
 
-    @patch("src.infrastructure.connectors.lastfm.AsyncLimiter")
+    @patch("src.infrastructure.connectors.lastfm.AdaptiveRateLimiter")
     @patch("src.infrastructure.connectors.lastfm.BatchProcessor")
     @patch("src.infrastructure.connectors.lastfm.get_config")
-    def test_batch_processor_uses_shared_rate_limiter(
+    def test_batch_processor_leaves_rate_limiting_to_api_calls(
         self, mock_get_config, mock_batch_processor, mock_async_limiter
     ):
-        """Test that BatchProcessor receives the same rate limiter instance."""
+        """Test that BatchProcessor doesn't spend limiter slots per track.
+
+        Every API call made while processing a track acquires the shared
+        limiter itself, so the processor only bounds concurrency.
+        """
         # Mock config values
         mock_get_config.side_effect = lambda key, default=None: {
             "LASTFM_API_RATE_LIMIT": 5.0,
@@ -54,7 +60,7 @@ class TestLastFMRateLimiting:
             "LASTFM_API_REQUEST_DELAY": 0.0,
         }.get(key, default)
         
-        # Mock AsyncLimiter instance  
+        # Mock limiter instance
         mock_limiter = Mock()
         mock_async_limiter.return_value = mock_limiter
         
@@ -65,12 +71,11 @@ class TestLastFMRateLimiting:
         # Create connector
         LastFMConnector()
         
-        # Verify BatchProcessor was initialized with the rate limiter
         # The call is made on the generic type subscript result
         generic_call = mock_batch_processor.__getitem__.return_value
         generic_call.assert_called_once()
         call_kwargs = generic_call.call_args[1]
-        assert call_kwargs["rate_limiter"] == mock_limiter
+        assert call_kwargs.get("rate_limiter") is None
         assert call_kwargs["concurrency_limit"] == 1000  # High concurrency
         assert call_kwargs["request_delay"] == 0.0  # No artificial delay
 
@@ -80,17 +85,17 @@ class TestLastFMRateLimiting:
         # Mock config to return defaults
         mock_get_config.side_effect = lambda key, default=None: default
         
-        with patch("src.infrastructure.connectors.lastfm.AsyncLimiter") as mock_async_limiter:
+        with patch("src.infrastructure.connectors.lastfm.AdaptiveRateLimiter") as mock_async_limiter:
             # Create connector
             LastFMConnector()
             
             # Verify default rate limit of 5.0 was used
-            mock_async_limiter.assert_called_once_with(5.0, 1)
+            assert mock_async_limiter.call_args[0] == ("lastfm", 5.0)
 
     async def test_rate_limited_api_call_wrapper(self):
         """Test that _rate_limited_api_call properly uses the rate limiter."""
         # Create a real connector but mock the rate limiter
-        with patch("src.infrastructure.connectors.lastfm.AsyncLimiter") as mock_async_limiter:
+        with patch("src.infrastructure.connectors.lastfm.AdaptiveRateLimiter") as mock_async_limiter:
             mock_limiter = AsyncMock()
             mock_async_limiter.return_value = mock_limiter
             
@@ -0,0 +1,145 @@
+"""Tests for the offline MusicBrainz index build and lookups."""
+
+import pytest
+
+from src.infrastructure.connectors.connector_pool import ConnectorPool
+from src.infrastructure.connectors.musicbrainz_index import (
+    MusicBrainzLocalIndex,
+    build_musicbrainz_index,
+    get_shared_local_index,
+    local_index_path,
+    normalize_lookup_key,
+)
+
+RECORDING_MBID = "b1a9c0e9-d987-4042-ae91-78d6a3267d69"
+OTHER_MBID = "0b2f5b6a-1d7e-4d2c-9f0a-3c1d2e4f5a6b"
+
+
+@pytest.fixture
+def tsv_index(tmp_path):
+    """Index built from a pre-extracted TSV with a header row."""
+    source = tmp_path / "recordings.tsv"
+    source.write_text(
+        "isrc\trecording_mbid\tartist\ttitle\n"
+        f"USUM71703861\t{RECORDING_MBID}\tBeyoncé\tDon't Stop\n"
+        f"\t{OTHER_MBID}\tMac DeMarco\tHome\n",
+        encoding="utf-8",
+    )
+    output = tmp_path / "index.db"
+    counts = build_musicbrainz_index(source, output)
+    index = MusicBrainzLocalIndex(output)
+    yield index, counts
+    index.close()
+
+
+class TestMusicBrainzLocalIndex:
+    """Test index ingestion and lookups."""
+
+    def test_tsv_ingest_counts(self, tsv_index):
+        """Test recordings and ISRC links are counted after a TSV build."""
+        index, counts = tsv_index
+
+        assert counts == {"recordings": 2, "isrcs": 1}
+        assert index.stats()["source_format"] == "tsv"
+
+    def test_isrc_lookup_normalizes_input(self, tsv_index):
+        """Test ISRC lookups ignore case and hyphens and omit misses."""
+        index, _ = tsv_index
+
+        found = index.lookup_isrcs(["us-um7-17-03861", "USMISSING0001"])
+
+        assert found == {"us-um7-17-03861": RECORDING_MBID}
+
+    def test_artist_title_lookup_uses_normalized_keys(self, tsv_index):
+        """Test accent, case and punctuation differences still match."""
+        index, _ = tsv_index
+
+        recording = index.search_recording("beyonce", "Dont  Stop!")
+
+        assert recording == {
+            "id": RECORDING_MBID,
+            "title": "Don't Stop",
+            "artist-credit": [{"name": "Beyoncé"}],
+        }
+        assert index.search_recording("Mac DeMarco", "Away") is None
+
+    def test_headerless_tsv_reads_columns_in_order(self, tmp_path):
+        """Test a TSV without a header is read as isrc, mbid, artist, title."""
+        source = tmp_path / "recordings.tsv"
+        source.write_text(f"GBAYE0000001\t{OTHER_MBID}\tArtist\tSong\n")
+        output = tmp_path / "index.db"
+
+        build_musicbrainz_index(source, output)
+        index = MusicBrainzLocalIndex(output)
+
+        assert index.lookup_isrcs(["GBAYE0000001"]) == {"GBAYE0000001": OTHER_MBID}
+        index.close()
+
+    def test_dump_directory_ingest(self, tmp_path):
+        """Test the mbdump table files are joined into the index."""
+        dump = tmp_path / "mbdump"
+        dump.mkdir()
+        (dump / "artist_credit").write_text("7\tNosaj Thing\t1\t1\t\\N\t0\n")
+        (dump / "recording").write_text(
+            f"42\t{RECORDING_MBID}\tEclipse/Blue\t7\t240000\t\t0\t\\N\tf\n"
+        )
+        (dump / "isrc").write_text("1\t42\tUSAB11200001\t\\N\t0\t\\N\n")
+        output = tmp_path / "index.db"
+
+        counts = build_musicbrainz_index(tmp_path, output)
+        index = MusicBrainzLocalIndex(output)
+
+        assert counts == {"recordings": 1, "isrcs": 1}
+        assert index.lookup_isrcs(["USAB11200001"]) == {"USAB11200001": RECORDING_MBID}
+        assert index.search_recording("Nosaj Thing", "Eclipse / Blue")["id"] == (
+            RECORDING_MBID
+        )
+        index.close()
+
+    def test_missing_dump_tables_raise(self, tmp_path):
+        """Test a directory without dump tables is rejected."""
+        with pytest.raises(FileNotFoundError):
+            build_musicbrainz_index(tmp_path, tmp_path / "index.db")
+
+        assert not (tmp_path / "index.db").exists()
+
+    def test_normalize_lookup_key(self):
+        """Test normalization folds case, accents and punctuation."""
+        assert normalize_lookup_key("  Sigur Rós — Hoppípolla ") == (
+            "sigur ros hoppipolla"
+        )
+
+
+class TestSharedLocalIndex:
+    """Test the process-wide index held by the connector pool."""
+
+    @pytest.fixture
+    def pool(self, monkeypatch):
+        pool = ConnectorPool()
+        monkeypatch.setattr(
+            "src.infrastructure.connectors.musicbrainz_index.get_connector_pool",
+            lambda: pool,
+        )
+        yield pool
+        pool.close()
+
+    def test_default_path_is_in_the_data_directory(self, data_dir, pool):
+        """Test the index defaults to the data directory and is optional."""
+        assert local_index_path() == data_dir / "musicbrainz_index.db"
+        assert get_shared_local_index() is None
+        assert pool.active() == []
+
+    def test_index_is_shared_and_closed_by_the_pool(self, tmp_path, pool):
+        """Test every caller gets one index whose connection the pool closes."""
+        source = tmp_path / "recordings.tsv"
+        source.write_text(f"GBAYE0000001\t{OTHER_MBID}\tArtist\tSong\n")
+        build_musicbrainz_index(source, local_index_path())
+
+        index = get_shared_local_index()
+        assert index.lookup_isrcs(["GBAYE0000001"]) == {"GBAYE0000001": OTHER_MBID}
+        assert get_shared_local_index() is index
+        assert index._connection is not None
+
+        pool.close()
+
+        assert index._connection is None
@@ -0,0 +1,67 @@
+"""Tests for MusicBrainz request spacing under the 1 req/sec API policy."""
+
+import asyncio
+from itertools import pairwise
+from unittest.mock import AsyncMock, patch
+
+from src.infrastructure.connectors.musicbrainz import (
+    MUSICBRAINZ_MAX_RATE,
+    MusicBrainzConnector,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestMusicBrainzRateLimiting:
+    """Test the connector never approaches the MusicBrainz rate limit."""
+
+    @patch("src.infrastructure.connectors.musicbrainz.get_config")
+    def test_configured_rates_are_capped_below_policy(self, mock_get_config):
+        """Test configuration cannot raise the rate to 1 req/sec or above."""
+        mock_get_config.side_effect = lambda key, default=None: {
+            "MUSICBRAINZ_API_RATE_LIMIT": 1.0,
+            "MUSICBRAINZ_API_RATE_LIMIT_MAX": 2.0,
+        }.get(key, default)
+
+        limiter = MusicBrainzConnector()._rate_limiter
+
+        assert limiter.rate == MUSICBRAINZ_MAX_RATE
+        assert limiter.max_rate == MUSICBRAINZ_MAX_RATE
+
+    async def test_concurrent_requests_are_serialized_and_spaced(self):
+        """Test concurrent callers run one at a time, more than 1s apart."""
+        connector = MusicBrainzConnector()
+        clock = FakeClock()
+        connector._rate_limiter.clock = clock
+        starts: list[float] = []
+        overlapping: list[int] = []
+
+        def request(_isrc: str) -> dict:
+            starts.append(clock.now)
+            overlapping.append(connector._rate_limiter._in_flight)
+            clock.now += 0.3
+            return {}
+
+        def advance(delay: float) -> None:
+            clock.now += delay
+
+        with patch(
+            "src.infrastructure.connectors.rate_limiter.asyncio.sleep",
+            AsyncMock(side_effect=advance),
+        ):
+            await asyncio.gather(
+                *(connector._rate_limited_request(request, str(i)) for i in range(20))
+            )
+
+        assert len(starts) == 20
+        assert overlapping == [1] * 20
+        # 1/0.9s, leaving a tenth of a second of headroom for jitter
+        assert min(b - a for a, b in pairwise(starts)) >= 1.1
@@ -0,0 +1,115 @@
+"""Tests for the adaptive AIMD rate limiter."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import spotipy
+
+from src.application.utilities.progress import get_status_summary
+from src.infrastructure.connectors.rate_limiter import (
+    AdaptiveRateLimiter,
+    RateSignal,
+    http_feedback,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def sleeps():
+    """Record requested sleeps instead of waiting."""
+    delays: list[float] = []
+    fake_sleep = AsyncMock(side_effect=lambda delay: delays.append(round(delay, 3)))
+
+    with patch("src.infrastructure.connectors.rate_limiter.asyncio.sleep", fake_sleep):
+        yield delays
+
+
+class TestAdaptiveRateLimiter:
+    """Test spacing, additive increase and multiplicative decrease."""
+
+    async def test_request_starts_spaced_at_current_rate(self, clock, sleeps):
+        """Test concurrent acquirers get consecutive slots 1/rate apart."""
+        limiter = AdaptiveRateLimiter("test", 4.0, clock=clock)
+
+        await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+
+        assert sleeps == [0.25, 0.5]
+
+    @pytest.mark.usefixtures("sleeps")
+    async def test_success_raises_rate_up_to_ceiling(self, clock):
+        """Test clean traffic increases the rate but never past max_rate."""
+        limiter = AdaptiveRateLimiter(
+            "test", 2.0, max_rate=2.2, additive_increase=0.2, clock=clock
+        )
+
+        for _ in range(5):
+            async with limiter:
+                pass
+
+        assert limiter.rate == pytest.approx(2.2)
+
+    async def test_throttle_halves_rate_once_per_window(self, clock):
+        """Test a burst of 429s counts as a single decrease."""
+        limiter = AdaptiveRateLimiter("test", 8.0, clock=clock)
+
+        limiter.record_feedback(RateSignal.THROTTLED)
+        limiter.record_feedback(RateSignal.THROTTLED)
+        assert limiter.rate == 4.0
+
+        clock.now += 1.0
+        limiter.record_feedback(RateSignal.SERVER_ERROR)
+        assert limiter.rate == 2.0
+        assert limiter.snapshot()["throttled"] == 2
+        assert limiter.snapshot()["errors"] == 1
+
+    async def test_retry_after_blocks_next_request(self, clock, sleeps):
+        """Test a Retry-After delay postpones the next slot."""
+        limiter = AdaptiveRateLimiter("test", 10.0, clock=clock)
+
+        limiter.record_feedback(RateSignal.THROTTLED, retry_after=3.0)
+        await limiter.acquire()
+
+        assert sleeps == [3.0]
+
+    @pytest.mark.usefixtures("sleeps")
+    async def test_exception_feedback_classified_in_context(self, clock):
+        """Test a 429 raised inside the block reduces the rate."""
+        limiter = AdaptiveRateLimiter("test", 10.0, clock=clock)
+        error = spotipy.SpotifyException(
+            429, -1, "rate limited", headers={"Retry-After": "2"}
+        )
+
+        with pytest.raises(spotipy.SpotifyException):
+            async with limiter:
+                raise error
+
+        assert limiter.rate == 5.0
+        assert http_feedback(error) == (RateSignal.THROTTLED, 2.0)
+        assert http_feedback(ValueError("boom")) is None
+
+    async def test_queue_depth_published_to_progress(self):
+        """Test waiting callers show up in the registered status summary."""
+        limiter = AdaptiveRateLimiter("queue-test", 20.0)
+
+        tasks = [asyncio.create_task(limiter.acquire()) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        assert limiter.snapshot()["queue_depth"] == 2
+        assert get_status_summary("queue-test") == "queue-test 20.0/s, 2 queued"
+        await asyncio.gather(*tasks)
+        assert limiter.snapshot()["queue_depth"] == 0
@@ -0,0 +1,117 @@
+"""Tests for TrackConnectorRepository bulk connector-track lookups."""
+
+from datetime import UTC, datetime, timedelta
+import uuid
+
+import pytest
+
+from src.infrastructure.persistence.database.db_models import (
+    DBConnectorTrack,
+    DBTrackMetric,
+)
+from src.infrastructure.persistence.repositories.track.connector import (
+    TrackConnectorRepository,
+)
+
+
+def _connector_track(connector: str, isrc: str, updated: datetime) -> DBConnectorTrack:
+    """Build a connector track row with a unique connector ID."""
+    return DBConnectorTrack(
+        connector_name=connector,
+        connector_track_id=f"{connector}_{uuid.uuid4().hex[:8]}",
+        title="Home",
+        artists={"names": ["Mac DeMarco"]},
+        album="Album",
+        duration_ms=210000,
+        isrc=isrc,
+        raw_metadata={"popularity": 60},
+        last_updated=updated,
+    )
+
+
+class TestFindConnectorTracksByIsrcs:
+    """Test ISRC lookups over the connector_tracks table."""
+
+    @pytest.mark.asyncio
+    async def test_finds_tracks_for_connector_only(self, db_session):
+        """Test matches are keyed by ISRC and filtered by connector."""
+        isrc = f"US{uuid.uuid4().hex[:10].upper()}"
+        now = datetime.now(UTC)
+        spotify_row = _connector_track("spotify", isrc, now)
+        lastfm_row = _connector_track("lastfm", isrc, now + timedelta(hours=1))
+        db_session.add_all([spotify_row, lastfm_row])
+        await db_session.flush()
+
+        repo = TrackConnectorRepository(db_session)
+        found = await repo.find_connector_tracks_by_isrcs(
+            "spotify", [isrc, "USMISSING0001"]
+        )
+
+        assert set(found) == {isrc}
+        assert found[isrc]["connector_track_id"] == spotify_row.connector_track_id
+
+    @pytest.mark.asyncio
+    async def test_most_recently_updated_track_wins(self, db_session):
+        """Test the newest connector track is returned for a shared ISRC."""
+        isrc = f"US{uuid.uuid4().hex[:10].upper()}"
+        now = datetime.now(UTC)
+        older = _connector_track("spotify", isrc, now - timedelta(days=1))
+        newer = _connector_track("spotify", isrc, now)
+        db_session.add_all([newer, older])
+        await db_session.flush()
+
+        repo = TrackConnectorRepository(db_session)
+        found = await repo.find_connector_tracks_by_isrcs("spotify", [isrc])
+
+        assert found[isrc]["connector_track_id"] == newer.connector_track_id
+
+    @pytest.mark.asyncio
+    async def test_empty_input_returns_empty(self, db_session):
+        """Test no query result for an empty ISRC list."""
+        repo = TrackConnectorRepository(db_session)
+
+        assert await repo.find_connector_tracks_by_isrcs("spotify", []) == {}
+
+
+class TestGetCurrentMetrics:
+    """Test current metric reads for enrichment planning."""
+
+    @pytest.mark.asyncio
+    async def test_reads_every_metric_of_the_connector(
+        self, db_session, persisted_db_track
+    ):
+        """Test values and UTC timestamps are keyed by track and metric."""
+        collected = datetime.now(UTC) - timedelta(hours=2)
+        db_session.add_all([
+            DBTrackMetric(
+                track_id=persisted_db_track.id,
+                connector_name="lastfm",
+                metric_type=metric_type,
+                value=value,
+                collected_at=collected,
+            )
+            for metric_type, value in (
+                ("lastfm_user_playcount", 12.0),
+                ("lastfm_listeners", 300.0),
+            )
+        ])
+        db_session.add(
+            DBTrackMetric(
+                track_id=persisted_db_track.id,
+                connector_name="spotify",
+                metric_type="spotify_popularity",
+                value=60.0,
+            )
+        )
+        await db_session.flush()
+
+        repo = TrackConnectorRepository(db_session)
+        metrics = await repo.get_current_metrics([persisted_db_track.id], "lastfm")
+
+        assert metrics == {
+            persisted_db_track.id: {
+                "lastfm_user_playcount": (12.0, collected),
+                "lastfm_listeners": (300.0, collected),
+            }
+        }
+        assert await repo.get_current_metrics([], "lastfm") == {}
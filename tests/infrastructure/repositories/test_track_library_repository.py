@@ -0,0 +1,175 @@
+"""Tests for TrackLibraryRepository compiling library queries to SQL."""
+
+from datetime import UTC, datetime, timedelta
+import uuid
+
+import pytest
+
+from src.application.workflows.library_query import compile_library_query
+from src.domain.entities import LibraryQuery, ValueBound
+from src.domain.transforms.core import (
+    create_pipeline,
+    filter_by_play_history,
+    limit,
+    sort_by_attribute,
+)
+from src.infrastructure.persistence.database.db_models import (
+    DBTrack,
+    DBTrackMetric,
+    DBTrackPlay,
+)
+from src.infrastructure.persistence.repositories.track.library import (
+    TrackLibraryRepository,
+)
+
+NOW = datetime.now(UTC)
+
+# (days ago of each play, release year) per track
+LIBRARY = [
+    ([1, 2, 3], 2020),
+    ([5, 200], 1999),
+    ([], 2021),
+    ([10, 20, 40, 50], None),
+    ([100, 150], 2010),
+    ([3, 4], 2022),
+    ([7, 8, 9, 300, 301], 2005),
+]
+
+
+@pytest.fixture
+async def library(db_session):
+    """Seeded tracks tagged with a metric unique to this test run.
+
+    The database is shared between tests, so queries are restricted to
+    these tracks by requiring the tag metric.
+    """
+    tag = f"test_tag_{uuid.uuid4().hex[:8]}"
+    tracks = [
+        DBTrack(
+            title=f"Track {i} {tag}",
+            artists={"names": ["Artist"]},
+            release_date=datetime(year, 1, 1, tzinfo=UTC) if year else None,
+        )
+        for i, (_, year) in enumerate(LIBRARY)
+    ]
+    db_session.add_all(tracks)
+    await db_session.flush()
+
+    for track, (days_ago, _) in zip(tracks, LIBRARY, strict=True):
+        db_session.add(
+            DBTrackMetric(
+                track_id=track.id, connector_name="test", metric_type=tag, value=1.0
+            )
+        )
+        db_session.add_all(
+            DBTrackPlay(
+                track_id=track.id,
+                service="spotify",
+                played_at=NOW - timedelta(days=days, hours=1),
+            )
+            for days in days_ago
+        )
+    await db_session.flush()
+    return tag, [track.id for track in tracks]
+
+
+def _own(tag: str) -> ValueBound:
+    return ValueBound(tag, min_value=0)
+
+
+@pytest.mark.asyncio
+async def test_query_filters_sorts_and_limits_in_one_statement(db_session, library):
+    """Test only the final tracks come back, with the values used as metrics."""
+    tag, ids = library
+    repo = TrackLibraryRepository(db_session)
+    query = (
+        LibraryQuery()
+        .where(_own(tag))
+        .where(ValueBound("total_plays", min_value=2))
+        .order_by([("total_plays", True)])
+        .take(3)
+    )
+
+    result = await repo.query_tracks(query)
+
+    # Ties on play count keep library order
+    assert [track.id for track in result.tracks] == [ids[6], ids[3], ids[0]]
+    assert result.metadata["metrics"]["total_plays"] == {
+        ids[6]: 5,
+        ids[3]: 4,
+        ids[0]: 3,
+    }
+
+
+@pytest.mark.asyncio
+async def test_query_streams_tracks_in_batches_of_query_order(db_session, library):
+    """Test batches concatenate to the query result, each with its own values."""
+    tag, _ = library
+    repo = TrackLibraryRepository(db_session)
+    query = LibraryQuery().where(_own(tag)).order_by([("total_plays", True)])
+
+    whole = await repo.query_tracks(query)
+    batches = [batch async for batch in repo.iter_query_tracks(query, batch_size=3)]
+
+    assert [len(batch.tracks) for batch in batches] == [3, 3, 1]
+    assert [track.id for batch in batches for track in batch.tracks] == [
+        track.id for track in whole.tracks
+    ]
+    for batch in batches:
+        assert set(batch.metadata["metrics"]["total_plays"]) == {
+            track.id for track in batch.tracks
+        }
+
+
+@pytest.mark.asyncio
+async def test_missing_values_sort_last_in_both_directions(db_session, library):
+    """Test tracks without a release date come after dated ones either way."""
+    tag, ids = library
+    repo = TrackLibraryRepository(db_session)
+
+    for reverse in (False, True):
+        query = LibraryQuery().where(_own(tag)).order_by([("release_date", reverse)])
+        result = await repo.query_tracks(query)
+        assert result.tracks[-1].id == ids[3]
+
+
+@pytest.mark.asyncio
+async def test_pushed_down_nodes_match_the_python_transforms(db_session, library):
+    """Test the compiled query returns what the in-memory transforms return."""
+    tag, ids = library
+    repo = TrackLibraryRepository(db_session)
+    pushdown = [
+        {"type": "filter.by_play_history", "config": {"days_back": 60}},
+        {"type": "sorter.by_metric", "config": {"metric_name": "period_plays"}},
+        {"type": "selector.limit_tracks", "config": {"count": 4}},
+    ]
+    query = compile_library_query({"period_days": 30, "pushdown": pushdown}, NOW)
+
+    pushed = await repo.query_tracks(query.where(_own(tag)))
+
+    everything = await repo.query_tracks(LibraryQuery().where(_own(tag)))
+    # What the play history enricher attaches for the same plays
+    played = {
+        track_id: [NOW - timedelta(days=days, hours=1) for days in days_ago]
+        for track_id, (days_ago, _) in zip(ids, LIBRARY, strict=True)
+    }
+    play_metrics = {
+        "total_plays": {track_id: len(plays) for track_id, plays in played.items()},
+        "last_played_dates": {
+            track_id: max(plays, default=None) for track_id, plays in played.items()
+        },
+        "period_plays": {
+            track_id: sum(query.period_start <= p <= query.period_end for p in plays)
+            for track_id, plays in played.items()
+        },
+    }
+    in_memory = create_pipeline(
+        filter_by_play_history(days_back=60),
+        sort_by_attribute("period_plays", "period_plays", reverse=True),
+        limit(4),
+    )(everything.with_metadata("metrics", play_metrics))
+
+    assert [track.id for track in pushed.tracks] == [
+        track.id for track in in_memory.tracks
+    ]
+    assert [track.id for track in pushed.tracks] == [ids[0], ids[6], ids[3], ids[5]]
@@ -0,0 +1,81 @@
+"""Tests for TrackLikeRepository unsynced-like paging and bulk like writes."""
+
+import uuid
+
+import pytest
+
+from src.infrastructure.persistence.database.db_models import DBTrack
+from src.infrastructure.persistence.repositories.track.likes import (
+    TrackLikeRepository,
+)
+
+
+@pytest.fixture
+async def liked_track_ids(db_session):
+    """Five tracks liked in narada, the second already loved on Last.fm."""
+    unique_id = str(uuid.uuid4())[:8]
+    tracks = [
+        DBTrack(title=f"Track {i} {unique_id}", artists={"names": ["Mac DeMarco"]})
+        for i in range(5)
+    ]
+    db_session.add_all(tracks)
+    await db_session.flush()
+
+    repo = TrackLikeRepository(db_session)
+    track_ids = [track.id for track in tracks]
+    for track_id in track_ids:
+        await repo.save_track_like(track_id, "narada")
+    await repo.save_track_like(track_ids[1], "lastfm")
+    return track_ids
+
+
+async def _own_unsynced(repo: TrackLikeRepository, track_ids: list[int]) -> list:
+    """Unsynced likes restricted to this test's tracks (the database is shared)."""
+    likes = await repo.get_unsynced_likes("narada", "lastfm")
+    return [like for like in likes if like.track_id in track_ids]
+
+
+@pytest.mark.asyncio
+async def test_unsynced_likes_paged_by_keyset(db_session, liked_track_ids):
+    """Test pages follow like ID order and skip already-synced tracks."""
+    repo = TrackLikeRepository(db_session)
+    expected = [liked_track_ids[i] for i in (0, 2, 3, 4)]
+    start_after = (await _own_unsynced(repo, liked_track_ids))[0].id - 1
+
+    first_page = await repo.get_unsynced_likes(
+        "narada", "lastfm", after_id=start_after, limit=3
+    )
+    second_page = await repo.get_unsynced_likes(
+        "narada", "lastfm", after_id=first_page[-1].id, limit=3
+    )
+
+    assert [like.track_id for like in first_page + second_page] == expected
+    assert len(second_page) == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_like_save_marks_tracks_synced(db_session, liked_track_ids):
+    """Test one bulk write creates and updates like rows for every track."""
+    repo = TrackLikeRepository(db_session)
+
+    written = await repo.save_track_likes_batch(
+        [*liked_track_ids, liked_track_ids[0]], "lastfm"
+    )
+
+    assert written == len(liked_track_ids)
+    assert await _own_unsynced(repo, liked_track_ids) == []
+    lastfm_likes = await repo.get_all_liked_tracks("lastfm")
+    assert {like.track_id for like in lastfm_likes} >= set(liked_track_ids)
+
+
+@pytest.mark.asyncio
+async def test_track_likes_batch_reads_many_tracks(db_session, liked_track_ids):
+    """Test like states for several tracks come back from one call."""
+    repo = TrackLikeRepository(db_session)
+
+    likes = await repo.get_track_likes_batch(liked_track_ids[:2], services=["lastfm"])
+
+    assert [(like.track_id, like.service) for like in likes] == [
+        (liked_track_ids[1], "lastfm")
+    ]
+    assert await repo.get_track_likes_batch([]) == []
@@ -1,7 +1,7 @@
 """Tests for MetadataFreshnessController service."""
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -23,191 +23,231 @@ def freshness_controller(mock_connector_repo):
     return MetadataFreshnessController(mock_connector_repo)
 
 
+def _stored(timestamps: dict[int, datetime]) -> dict:
+    """Stored "plays" metrics collected at the given times, by track ID."""
+    return {
+        track_id: {"plays": (float(track_id), collected_at)}
+        for track_id, collected_at in timestamps.items()
+    }
+
+
 class TestMetadataFreshnessController:
     """Test cases for MetadataFreshnessController service."""
 
     @pytest.mark.asyncio
-    async def test_get_stale_tracks_with_stale_metadata(self, freshness_controller, mock_connector_repo):
-        """Test identifying stale tracks based on metrics timestamp."""
-        # Setup: Current time and cutoff time (2 hours ago)
+    async def test_plan_enrichment_with_stale_metadata(self, freshness_controller, mock_connector_repo):
+        """Test identifying stale tracks based on metric timestamps."""
         current_time = datetime.now(UTC)
         max_age_hours = 2.0
-        current_time - timedelta(hours=max_age_hours)
-        
-        # Mock metrics timestamps (now used for freshness checking)
-        metrics_timestamps = {
-            1: current_time - timedelta(hours=3),  # Stale (3 hours old)
-            2: current_time - timedelta(hours=1),  # Fresh (1 hour old)  
-            3: current_time - timedelta(hours=5),  # Stale (5 hours old)
-            # Track 4 has no metrics timestamp (considered stale)
-        }
-        
-        # Mock the connector repository's get_metadata_timestamps method
-        mock_connector_repo.get_metadata_timestamps = AsyncMock(return_value=metrics_timestamps)
-        
+
+        mock_connector_repo.get_current_metrics = AsyncMock(
+            return_value=_stored({
+                1: current_time - timedelta(hours=3),  # Stale (3 hours old)
+                2: current_time - timedelta(hours=1),  # Fresh (1 hour old)
+                3: current_time - timedelta(hours=5),  # Stale (5 hours old)
+                # Track 4 has no metrics (considered stale)
+            })
+        )
+
         with patch('src.infrastructure.services.metadata_freshness_controller.datetime') as mock_datetime:
             mock_datetime.now.return_value = current_time
-            
-            stale_tracks = await freshness_controller.get_stale_tracks(
-                [1, 2, 3, 4], "lastfm", max_age_hours
+
+            plan = await freshness_controller.plan_enrichment(
+                [1, 2, 3, 4], "lastfm", ["plays"], max_age_hours
             )
 
         # Verify: Tracks 1, 3, and 4 should be stale
-        assert set(stale_tracks) == {1, 3, 4}
+        assert plan.stale_track_ids == [1, 3, 4]
+        assert plan.fresh_values == {"plays": {2: 2.0}}
 
     @pytest.mark.asyncio
-    async def test_get_stale_tracks_all_fresh(self, freshness_controller, mock_connector_repo):
+    async def test_plan_enrichment_all_fresh(self, freshness_controller, mock_connector_repo):
         """Test when all tracks have fresh metrics."""
         current_time = datetime.now(UTC)
-        max_age_hours = 2.0
-        
-        # All metrics are fresh (within 2 hours)
-        metrics_timestamps = {
-            1: current_time - timedelta(minutes=30),
-            2: current_time - timedelta(hours=1),
-            3: current_time - timedelta(minutes=90),
-        }
-        
-        # Mock the connector repository's get_metadata_timestamps method
-        mock_connector_repo.get_metadata_timestamps = AsyncMock(return_value=metrics_timestamps)
+
+        mock_connector_repo.get_current_metrics = AsyncMock(
+            return_value=_stored({
+                1: current_time - timedelta(minutes=30),
+                2: current_time - timedelta(hours=1),
+                3: current_time - timedelta(minutes=90),
+            })
+        )
+
         with patch('src.infrastructure.services.metadata_freshness_controller.datetime') as mock_datetime:
-                mock_datetime.now.return_value = current_time
-                
-                stale_tracks = await freshness_controller.get_stale_tracks(
-                    [1, 2, 3], "lastfm", max_age_hours
-                )
+            mock_datetime.now.return_value = current_time
+
+            plan = await freshness_controller.plan_enrichment(
+                [1, 2, 3], "lastfm", ["plays"], 2.0
+            )
 
         # Verify: No tracks should be stale
-        assert stale_tracks == []
+        assert plan.stale_track_ids == []
+        assert plan.fresh_values == {"plays": {1: 1.0, 2: 2.0, 3: 3.0}}
 
     @pytest.mark.asyncio
-    async def test_get_stale_tracks_no_existing_metadata(self, freshness_controller, mock_connector_repo):
+    async def test_plan_enrichment_no_existing_metadata(self, freshness_controller, mock_connector_repo):
         """Test when tracks have no existing metrics."""
-        # Setup: No metrics exist for any tracks
-        metrics_timestamps = {}
-        
-        # Mock the connector repository's get_metadata_timestamps method
-        mock_connector_repo.get_metadata_timestamps = AsyncMock(return_value=metrics_timestamps)
-        
-        stale_tracks = await freshness_controller.get_stale_tracks(
-            [1, 2, 3], "lastfm", 1.0
+        mock_connector_repo.get_current_metrics = AsyncMock(return_value={})
+
+        plan = await freshness_controller.plan_enrichment(
+            [1, 2, 3], "lastfm", ["plays"], 1.0
         )
 
         # Verify: All tracks should be considered stale
-        assert set(stale_tracks) == {1, 2, 3}
+        assert plan.stale_track_ids == [1, 2, 3]
+        assert plan.fresh_values == {}
 
     @pytest.mark.asyncio
-    async def test_get_stale_tracks_timezone_handling(self, freshness_controller, mock_connector_repo):
-        """Test proper handling of timezone-naive metrics timestamps."""
+    async def test_plan_enrichment_timezone_handling(self, freshness_controller, mock_connector_repo):
+        """Test proper handling of timezone-naive metric timestamps."""
         current_time = datetime.now(UTC)
-        max_age_hours = 1.0
-        
-        # Mix of timezone-aware and naive timestamps
-        # Use a naive timestamp that's definitely old (2 hours ago)
-        naive_timestamp = datetime(2025, 7, 18, 4, 0, 0)  # Naive datetime, old
-        aware_timestamp = current_time - timedelta(minutes=30)  # Aware datetime, recent
-        
-        metrics_timestamps = {
-            1: naive_timestamp,  # Naive - should be converted to UTC and be stale
-            2: aware_timestamp,  # Aware - should work as-is and be fresh
-        }
-        
-        # Mock the connector repository's get_metadata_timestamps method
-        mock_connector_repo.get_metadata_timestamps = AsyncMock(return_value=metrics_timestamps)
+
+        mock_connector_repo.get_current_metrics = AsyncMock(
+            return_value=_stored({
+                1: datetime(2025, 7, 18, 4, 0, 0),  # noqa: DTZ001 - naive, old, read as UTC
+                2: current_time - timedelta(minutes=30),  # Aware, recent
+            })
+        )
+
         with patch('src.infrastructure.services.metadata_freshness_controller.datetime') as mock_datetime:
-                mock_datetime.now.return_value = current_time
-                
-                stale_tracks = await freshness_controller.get_stale_tracks(
-                    [1, 2], "lastfm", max_age_hours
-                )
+            mock_datetime.now.return_value = current_time
 
-        # Verify: Naive timestamp should be handled properly
-        # Track 1 (naive, old) should be stale, Track 2 (aware, recent) should be fresh
-        assert 1 in stale_tracks  # Old naive timestamp
-        assert 2 not in stale_tracks  # Recent aware timestamp
+            plan = await freshness_controller.plan_enrichment(
+                [1, 2], "lastfm", ["plays"], 1.0
+            )
+
+        assert plan.stale_track_ids == [1]
 
     @pytest.mark.asyncio
-    async def test_get_stale_tracks_edge_case_exact_cutoff(self, freshness_controller, mock_connector_repo):
-        """Test behavior when metrics timestamp exactly matches cutoff time."""
+    async def test_plan_enrichment_edge_case_exact_cutoff(self, freshness_controller, mock_connector_repo):
+        """Test behavior when a metric timestamp exactly matches cutoff time."""
         current_time = datetime.now(UTC)
         max_age_hours = 2.0
         exact_cutoff_time = current_time - timedelta(hours=max_age_hours)
-        
-        metrics_timestamps = {
-            1: exact_cutoff_time,  # Exactly at cutoff
-            2: exact_cutoff_time + timedelta(seconds=1),  # Just fresh
-            3: exact_cutoff_time - timedelta(seconds=1),  # Just stale
-        }
-        
-        # Mock the connector repository's get_metadata_timestamps method
-        mock_connector_repo.get_metadata_timestamps = AsyncMock(return_value=metrics_timestamps)
+
+        mock_connector_repo.get_current_metrics = AsyncMock(
+            return_value=_stored({
+                1: exact_cutoff_time,  # Exactly at cutoff
+                2: exact_cutoff_time + timedelta(seconds=1),  # Just fresh
+                3: exact_cutoff_time - timedelta(seconds=1),  # Just stale
+            })
+        )
+
         with patch('src.infrastructure.services.metadata_freshness_controller.datetime') as mock_datetime:
-                mock_datetime.now.return_value = current_time
-                
-                stale_tracks = await freshness_controller.get_stale_tracks(
-                    [1, 2, 3], "lastfm", max_age_hours
-                )
+            mock_datetime.now.return_value = current_time
 
-        # Verify: Only tracks strictly before cutoff should be stale (< cutoff, not <= cutoff)
-        assert set(stale_tracks) == {3}  # Only track 3 (1 second before cutoff)
-        assert 1 not in stale_tracks  # Track 1 (exactly at cutoff) is fresh
-        assert 2 not in stale_tracks  # Track 2 (after cutoff) is fresh
+            plan = await freshness_controller.plan_enrichment(
+                [1, 2, 3], "lastfm", ["plays"], max_age_hours
+            )
+
+        # Verify: Only tracks strictly before cutoff are stale (< cutoff, not <= cutoff)
+        assert plan.stale_track_ids == [3]
 
     @pytest.mark.asyncio
-    async def test_get_stale_tracks_empty_track_list(self, freshness_controller, mock_connector_repo):
+    async def test_plan_enrichment_empty_track_list(self, freshness_controller, mock_connector_repo):
         """Test with empty track list."""
-        stale_tracks = await freshness_controller.get_stale_tracks(
-            [], "lastfm", 1.0
-        )
+        plan = await freshness_controller.plan_enrichment([], "lastfm", ["plays"], 1.0)
 
-        assert stale_tracks == []
+        assert plan.stale_track_ids == []
+        assert plan.fresh_values == {}
+        mock_connector_repo.get_current_metrics.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_get_stale_tracks_zero_max_age(self, freshness_controller, mock_connector_repo):
-        """Test with zero max age (all tracks should be stale)."""
+    async def test_plan_enrichment_zero_max_age(self, freshness_controller, mock_connector_repo):
+        """Test with zero max age (only metrics collected right now are fresh)."""
         current_time = datetime.now(UTC)
-        
-        # Even very recent metrics should be stale with max_age=0
-        metrics_timestamps = {
-            1: current_time - timedelta(seconds=1),
-            2: current_time,  # Even current time should be stale
-        }
-        
-        # Mock the connector repository's get_metadata_timestamps method
-        mock_connector_repo.get_metadata_timestamps = AsyncMock(return_value=metrics_timestamps)
+
+        mock_connector_repo.get_current_metrics = AsyncMock(
+            return_value=_stored({
+                1: current_time - timedelta(seconds=1),
+                2: current_time,
+            })
+        )
+
         with patch('src.infrastructure.services.metadata_freshness_controller.datetime') as mock_datetime:
-                mock_datetime.now.return_value = current_time
-                
-                stale_tracks = await freshness_controller.get_stale_tracks(
-                    [1, 2], "lastfm", 0.0
-                )
+            mock_datetime.now.return_value = current_time
+
+            plan = await freshness_controller.plan_enrichment(
+                [1, 2], "lastfm", ["plays"], 0.0
+            )
 
         # Verify: Only track 1 should be stale (track 2 exactly at current time is fresh)
-        assert set(stale_tracks) == {1}
+        assert plan.stale_track_ids == [1]
 
     @pytest.mark.asyncio
-    async def test_get_stale_tracks_with_config_override(self, freshness_controller, mock_connector_repo):
-        """Test using configuration for different connectors."""
-        # This test verifies the freshness controller uses the max_age_hours parameter
-        # rather than looking up connector-specific config (that's the caller's responsibility)
-        
+    async def test_plan_enrichment_with_max_age_override(self, freshness_controller, mock_connector_repo):
+        """Test the max_age_hours argument decides freshness for the same data."""
         current_time = datetime.now(UTC)
-        
-        metrics_timestamps = {
-            1: current_time - timedelta(hours=2),  # 2 hours old
-        }
-        
-        # Mock the connector repository's get_metadata_timestamps method for both calls
-        mock_connector_repo.get_metadata_timestamps = AsyncMock(return_value=metrics_timestamps)
+
+        mock_connector_repo.get_current_metrics = AsyncMock(
+            return_value=_stored({1: current_time - timedelta(hours=2)})
+        )
+
         with patch('src.infrastructure.services.metadata_freshness_controller.datetime') as mock_datetime:
-                mock_datetime.now.return_value = current_time
-                
-                # With 3 hour limit - should be fresh
-                fresh_result = await freshness_controller.get_stale_tracks([1], "lastfm", 3.0)
-                
-                # With 1 hour limit - should be stale
-                stale_result = await freshness_controller.get_stale_tracks([1], "lastfm", 1.0)
+            mock_datetime.now.return_value = current_time
+
+            fresh_plan = await freshness_controller.plan_enrichment(
+                [1], "lastfm", ["plays"], 3.0
+            )
+            stale_plan = await freshness_controller.plan_enrichment(
+                [1], "lastfm", ["plays"], 1.0
+            )
 
         # Verify: Same track, different results based on max_age parameter
-        assert fresh_result == []
-        assert stale_result == [1]
\ No newline at end of file
+        assert fresh_plan.stale_track_ids == []
+        assert stale_plan.stale_track_ids == [1]
+
+
+class TestPlanEnrichment:
+    """Test planning which tracks an enrichment fetches."""
+
+    @pytest.mark.asyncio
+    async def test_only_missing_or_stale_metrics_are_fetched(
+        self, freshness_controller, mock_connector_repo
+    ):
+        """Test fresh tracks are served from stored values in one read."""
+        now = datetime.now(UTC)
+        fresh, stale = now - timedelta(hours=1), now - timedelta(hours=5)
+        mock_connector_repo.get_current_metrics = AsyncMock(
+            return_value={
+                1: {"plays": (10.0, fresh), "listeners": (99.0, fresh)},
+                # No listeners in the latest collection: known absent
+                2: {"plays": (3.0, fresh)},
+                3: {"plays": (7.0, stale), "listeners": (5.0, fresh)},
+                # Track 4 was never collected
+            }
+        )
+
+        plan = await freshness_controller.plan_enrichment(
+            [1, 2, 3, 4], "lastfm", ["plays", "listeners"], 2.0
+        )
+
+        mock_connector_repo.get_current_metrics.assert_awaited_once_with(
+            [1, 2, 3, 4], "lastfm"
+        )
+        assert plan.stale_track_ids == [3, 4]
+        assert plan.fresh_values == {"plays": {1: 10.0, 2: 3.0}, "listeners": {1: 99.0}}
+
+    @pytest.mark.asyncio
+    async def test_without_policy_missing_metrics_are_still_fetched(
+        self, freshness_controller, mock_connector_repo
+    ):
+        """Test stored values never expire without a policy, missing ones are fetched.
+
+        Without a freshness policy, the former staleness check treated every
+        track as fresh; a never-enriched track must still be fetched once.
+        """
+        collected = datetime.now(UTC) - timedelta(days=365)
+        mock_connector_repo.get_current_metrics = AsyncMock(
+            return_value={1: {"plays": (10.0, collected)}}
+        )
+
+        with patch.object(
+            freshness_controller, "_get_freshness_policy", return_value=None
+        ):
+            plan = await freshness_controller.plan_enrichment(
+                [1, 2], "lastfm", ["plays"]
+            )
+
+        assert plan.stale_track_ids == [2]
+        assert plan.fresh_values == {"plays": {1: 10.0}}
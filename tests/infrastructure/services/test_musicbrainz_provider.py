@@ -0,0 +1,86 @@
+"""Tests for MusicBrainzProvider local-index-first resolution."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.domain.entities import Artist, Track
+from src.infrastructure.connectors.musicbrainz_index import MusicBrainzLocalIndex
+from src.infrastructure.services.matching.providers.musicbrainz import (
+    MusicBrainzProvider,
+)
+
+
+@pytest.fixture
+def tracks():
+    """One ISRC track and one artist/title-only track."""
+    return [
+        Track(
+            id=1,
+            title="Home",
+            artists=[Artist(name="Mac DeMarco")],
+            isrc="USLOCAL0001",
+        ),
+        Track(
+            id=2,
+            title="Away",
+            artists=[Artist(name="Mac DeMarco")],
+            isrc="USREMOTE001",
+        ),
+        Track(id=3, title="Salad Days", artists=[Artist(name="Mac DeMarco")]),
+    ]
+
+
+@pytest.fixture
+def local_index():
+    """Local index that knows one ISRC and one artist/title pair."""
+    index = Mock(spec=MusicBrainzLocalIndex)
+    index.lookup_isrcs.return_value = {"USLOCAL0001": "mbid-local"}
+    index.search_recording.return_value = {
+        "id": "mbid-salad",
+        "title": "Salad Days",
+        "artist-credit": [{"name": "Mac DeMarco"}],
+    }
+    return index
+
+
+@pytest.fixture
+def mock_connector():
+    """MusicBrainz web connector used for index misses."""
+    connector = Mock()
+    connector.batch_isrc_lookup = AsyncMock(return_value={"USREMOTE001": "mbid-api"})
+    connector.search_recording = AsyncMock(return_value=None)
+    return connector
+
+
+class TestMusicBrainzLocalIndexFirst:
+    """Test the web service is only used for index misses."""
+
+    async def test_index_hits_skip_web_service(
+        self, tracks, local_index, mock_connector
+    ):
+        """Test only ISRCs missing from the index reach the connector."""
+        provider = MusicBrainzProvider(mock_connector, local_index=local_index)
+
+        results = await provider.find_potential_matches(tracks)
+
+        assert results[1].connector_id == "mbid-local"
+        assert results[2].connector_id == "mbid-api"
+        assert results[3].connector_id == "mbid-salad"
+        mock_connector.batch_isrc_lookup.assert_awaited_once_with(["USREMOTE001"])
+        mock_connector.search_recording.assert_not_called()
+        assert provider.lookup_stats == {"local_hits": 2, "api_lookups": 1}
+
+    async def test_without_index_uses_web_service(self, tracks, mock_connector):
+        """Test behavior is unchanged when no index has been built."""
+        provider = MusicBrainzProvider(mock_connector)
+
+        await provider.find_potential_matches(tracks)
+
+        mock_connector.batch_isrc_lookup.assert_awaited_once_with([
+            "USLOCAL0001",
+            "USREMOTE001",
+        ])
+        mock_connector.search_recording.assert_awaited_once_with(
+            "Mac DeMarco", "Salad Days"
+        )
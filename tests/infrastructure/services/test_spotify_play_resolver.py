@@ -0,0 +1,150 @@
+"""Tests for local-first Spotify play resolution."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from src.domain.entities import Artist, Track
+from src.domain.repositories.interfaces import ConnectorRepositoryProtocol
+from src.infrastructure.connectors.spotify import SpotifyConnector
+from src.infrastructure.connectors.spotify_personal_data import SpotifyPlayRecord
+from src.infrastructure.services.spotify_play_resolver import SpotifyPlayResolver
+
+KNOWN_ID = "0" * 21 + "K"
+NEW_ID = "0" * 21 + "N"
+
+
+def _record(spotify_id: str) -> SpotifyPlayRecord:
+    """Build a play record for a Spotify track ID."""
+    return SpotifyPlayRecord(
+        timestamp=datetime(2024, 1, 1, tzinfo=UTC),
+        track_uri=f"spotify:track:{spotify_id}",
+        track_name="Home",
+        artist_name="Mac DeMarco",
+        album_name="Album",
+        ms_played=200000,
+        platform="ios",
+        country="US",
+        reason_start="trackdone",
+        reason_end="trackdone",
+        shuffle=False,
+        skipped=False,
+        offline=False,
+        incognito_mode=False,
+    )
+
+
+def _spotify_track(spotify_id: str) -> dict:
+    """Build a minimal Spotify API track object."""
+    return {
+        "id": spotify_id,
+        "name": "Home",
+        "artists": [{"name": "Mac DeMarco"}],
+        "album": {"name": "Album"},
+        "duration_ms": 210000,
+        "external_ids": {"isrc": "USABC1234567"},
+    }
+
+
+@pytest.fixture
+def play_records():
+    """Overlapping records: the known track twice, a new track twice."""
+    return [_record(KNOWN_ID), _record(NEW_ID), _record(KNOWN_ID), _record(NEW_ID)]
+
+
+@pytest.fixture
+def connector_repo():
+    """Repository that already maps the known Spotify ID to track 1."""
+    mock = AsyncMock(spec=ConnectorRepositoryProtocol)
+    mock.find_tracks_by_connectors = AsyncMock(
+        return_value={
+            ("spotify", KNOWN_ID): Track(
+                id=1, title="Home", artists=[Artist(name="Mac DeMarco")]
+            )
+        }
+    )
+    mock.ingest_external_tracks_bulk = AsyncMock(
+        return_value=[Track(id=2, title="Home", artists=[Artist(name="Mac DeMarco")])]
+    )
+    return mock
+
+
+@pytest.fixture
+def spotify_connector():
+    """Spotify connector returning data for the new track only."""
+    mock = Mock()
+    mock.get_tracks_by_ids = AsyncMock(return_value={NEW_ID: _spotify_track(NEW_ID)})
+    return mock
+
+
+@pytest.fixture
+def resolver(spotify_connector, connector_repo):
+    """Resolver wired to mocks."""
+    return SpotifyPlayResolver(
+        spotify_connector=spotify_connector, connector_repository=connector_repo
+    )
+
+
+@pytest.mark.asyncio
+async def test_known_tracks_resolve_without_api_calls(
+    resolver, spotify_connector, connector_repo, play_records
+):
+    """Test existing mappings resolve locally in one deduplicated query."""
+    uri_to_id = await resolver.resolve_play_records(play_records)
+
+    assert uri_to_id == {f"spotify:track:{KNOWN_ID}": 1}
+    spotify_connector.get_tracks_by_ids.assert_not_called()
+    connector_repo.find_tracks_by_connectors.assert_awaited_once_with([
+        ("spotify", KNOWN_ID),
+        ("spotify", NEW_ID),
+    ])
+
+
+@pytest.mark.asyncio
+async def test_creation_fetches_only_unknown_tracks(
+    resolver, spotify_connector, connector_repo, play_records
+):
+    """Test only the unknown remainder hits the API and is ingested once."""
+    uri_to_id = await resolver.resolve_play_records_with_creation(play_records)
+
+    assert uri_to_id == {
+        f"spotify:track:{KNOWN_ID}": 1,
+        f"spotify:track:{NEW_ID}": 2,
+    }
+    spotify_connector.get_tracks_by_ids.assert_awaited_once_with([NEW_ID])
+    ingested = connector_repo.ingest_external_tracks_bulk.await_args.args[1]
+    assert [track.connector_track_id for track in ingested] == [NEW_ID]
+    assert resolver.lookup_stats == {"local_hits": 1, "api_lookups": 1}
+
+
+@pytest.mark.asyncio
+async def test_fallback_resolution_marks_local_hits(
+    resolver, spotify_connector, play_records
+):
+    """Test the import pipeline resolves known URIs locally and the rest via API."""
+    results = await resolver.resolve_with_fallback(play_records)
+
+    known = results[f"spotify:track:{KNOWN_ID}"]
+    new = results[f"spotify:track:{NEW_ID}"]
+    assert (known.resolution_method, known.track_id) == ("local_id", 1)
+    assert (new.resolution_method, new.track_id) == ("direct_id", 2)
+    spotify_connector.get_tracks_by_ids.assert_awaited_once_with([NEW_ID])
+
+
+@pytest.mark.asyncio
+async def test_connector_fetches_batches_of_fifty():
+    """Test bulk track lookup splits into 50-ID requests keyed by requested ID."""
+    track_ids = [f"{i:022d}" for i in range(120)]
+    client = MagicMock()
+    client.tracks.side_effect = lambda batch, **_: {
+        "tracks": [_spotify_track(f"canonical_{track_id}") for track_id in batch]
+    }
+
+    with patch("spotipy.Spotify"):
+        connector = SpotifyConnector()
+        connector.client = client
+        tracks = await connector.get_tracks_by_ids(track_ids)
+
+    assert [len(call.args[0]) for call in client.tracks.call_args_list] == [50, 50, 20]
+    assert list(tracks) == track_ids
@@ -0,0 +1,176 @@
+"""Tests for SpotifyProvider ISRC resolution pipeline."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.domain.entities import Artist, Track
+from src.domain.repositories.interfaces import ConnectorRepositoryProtocol
+from src.infrastructure.services.matching.providers.spotify import SpotifyProvider
+
+
+def _spotify_track(spotify_id: str, isrc: str) -> dict:
+    """Build a minimal Spotify API track object."""
+    return {
+        "id": spotify_id,
+        "name": "Home",
+        "artists": [{"name": "Mac DeMarco"}],
+        "album": {"name": "Album", "release_date": "2019-05-10"},
+        "duration_ms": 210000,
+        "popularity": 60,
+        "external_ids": {"isrc": isrc},
+    }
+
+
+@pytest.fixture
+def isrc_tracks():
+    """Tracks with ISRCs, two of which share one."""
+    return [
+        Track(
+            id=1,
+            title="Home",
+            artists=[Artist(name="Mac DeMarco")],
+            duration_ms=210000,
+            isrc="USKNOWN0001",
+        ),
+        Track(
+            id=2,
+            title="Home",
+            artists=[Artist(name="Mac DeMarco")],
+            duration_ms=210000,
+            isrc="USNEW000001",
+        ),
+        Track(
+            id=3,
+            title="Home",
+            artists=[Artist(name="Mac DeMarco")],
+            duration_ms=210000,
+            isrc="USNEW000001",
+        ),
+    ]
+
+
+@pytest.fixture
+def mock_connector_repo():
+    """Connector repository that already knows one ISRC."""
+    mock = AsyncMock(spec=ConnectorRepositoryProtocol)
+    mock.find_connector_tracks_by_isrcs = AsyncMock(
+        return_value={
+            "USKNOWN0001": {
+                "connector_track_id": "spotify_known",
+                "title": "Home",
+                "artists": {"names": ["Mac DeMarco"]},
+                "album": "Album",
+                "duration_ms": 210000,
+                "release_date": None,
+                "isrc": "USKNOWN0001",
+                "raw_metadata": {"popularity": 55},
+            }
+        }
+    )
+    return mock
+
+
+@pytest.fixture
+def mock_spotify_connector():
+    """Spotify connector that resolves the unknown ISRC via search."""
+    connector = Mock()
+    connector.search_by_isrcs = AsyncMock(
+        return_value={"USNEW000001": _spotify_track("spotify_new", "USNEW000001")}
+    )
+    connector.search_by_isrc = AsyncMock()
+    return connector
+
+
+class TestSpotifyIsrcResolution:
+    """Test ISRC dedupe, local reuse and API fan-out."""
+
+    async def test_known_isrcs_skip_api_and_duplicates_searched_once(
+        self, isrc_tracks, mock_connector_repo, mock_spotify_connector
+    ):
+        """Test local hits avoid the API and duplicate ISRCs cost one search."""
+        provider = SpotifyProvider(
+            mock_spotify_connector, connector_repo=mock_connector_repo
+        )
+
+        results = await provider._process_isrc_batch(isrc_tracks)
+
+        assert results[1].connector_id == "spotify_known"
+        assert results[2].connector_id == "spotify_new"
+        assert results[3].connector_id == "spotify_new"
+        assert all(r.match_method == "isrc" for r in results.values())
+
+        mock_connector_repo.find_connector_tracks_by_isrcs.assert_awaited_once_with(
+            "spotify", ["USKNOWN0001", "USNEW000001"]
+        )
+        mock_spotify_connector.search_by_isrcs.assert_awaited_once_with(["USNEW000001"])
+        mock_spotify_connector.search_by_isrc.assert_not_called()
+        assert provider.isrc_stats == {
+            "cache_hits": 1,
+            "api_lookups": 1,
+            "api_hits": 1,
+        }
+
+    async def test_resolved_isrcs_reused_across_batches(
+        self, isrc_tracks, mock_connector_repo, mock_spotify_connector
+    ):
+        """Test a later batch does not look up ISRCs resolved earlier."""
+        provider = SpotifyProvider(
+            mock_spotify_connector, connector_repo=mock_connector_repo
+        )
+
+        await provider._process_isrc_batch(isrc_tracks[:2])
+        results = await provider._process_isrc_batch(isrc_tracks[2:])
+
+        assert results[3].connector_id == "spotify_new"
+        assert mock_connector_repo.find_connector_tracks_by_isrcs.await_count == 1
+        assert mock_spotify_connector.search_by_isrcs.await_count == 1
+
+    async def test_without_repository_all_isrcs_go_to_api(
+        self, isrc_tracks, mock_spotify_connector
+    ):
+        """Test the provider still works when no repository is available."""
+        provider = SpotifyProvider(mock_spotify_connector)
+
+        results = await provider._process_isrc_batch(isrc_tracks)
+
+        assert set(results) == {2, 3}
+        mock_spotify_connector.search_by_isrcs.assert_awaited_once_with([
+            "USKNOWN0001",
+            "USNEW000001",
+        ])
+        assert provider.isrc_stats["cache_hits"] == 0
+        assert provider.isrc_stats["api_lookups"] == 2
+
+
+class TestSpotifyArtistTitleSearch:
+    """Test concurrent artist/title search within a batch."""
+
+    async def test_searches_overlap_and_failures_are_isolated(self):
+        """Test searches run concurrently and one failure keeps the others."""
+        in_flight = 0
+        peak = 0
+
+        async def search_track(_artist: str, title: str) -> dict | None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            if title == "Broken":
+                raise RuntimeError("search failed")
+            return _spotify_track(f"spotify_{title}", "")
+
+        connector = Mock()
+        connector.search_track = search_track
+        tracks = [
+            Track(id=i, title=title, artists=[Artist(name="Mac DeMarco")])
+            for i, title in enumerate(["Home", "Broken", "Salad Days", "Chamber"], 1)
+        ]
+
+        results = await SpotifyProvider(connector)._process_artist_title_batch(tracks)
+
+        assert set(results) == {1, 3, 4}
+        assert results[3].connector_id == "spotify_Salad Days"
+        assert peak > 1
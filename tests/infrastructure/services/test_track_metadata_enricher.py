@@ -0,0 +1,105 @@
+"""Tests for TrackMetadataEnricher delta enrichment."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.entities import Artist, Track, TrackList
+from src.domain.matching.types import MatchResult
+from src.domain.repositories.interfaces import (
+    ConnectorRepositoryProtocol,
+    MetricsRepositoryProtocol,
+    TrackRepositoryProtocol,
+)
+from src.infrastructure.services.track_metadata_enricher import (
+    TrackMetadataEnricher,
+)
+
+EXTRACTORS = {"lastfm_user_playcount": lambda result: result.service_data["plays"]}
+
+
+@pytest.fixture
+def tracklist():
+    """Create a tracklist of two persisted tracks."""
+    return TrackList(
+        tracks=[
+            Track(id=1, title="Home", artists=[Artist(name="Mac DeMarco")]),
+            Track(id=2, title="Falling", artists=[Artist(name="Chris Lake")]),
+        ]
+    )
+
+
+@pytest.fixture
+def connector_repo():
+    """Create a connector repository with fresh metrics for track 1."""
+    repo = AsyncMock(spec=ConnectorRepositoryProtocol)
+    repo.get_current_metrics = AsyncMock(
+        return_value={
+            1: {"lastfm_user_playcount": (12.0, datetime.now(UTC) - timedelta(hours=1))}
+        }
+    )
+    return repo
+
+
+@pytest.fixture
+def enricher(connector_repo):
+    """Create an enricher whose resolver and metadata manager are mocks."""
+    metrics_repo = AsyncMock(spec=MetricsRepositoryProtocol)
+    metrics_repo.save_track_metrics = AsyncMock()
+    enricher = TrackMetadataEnricher(
+        AsyncMock(spec=TrackRepositoryProtocol), connector_repo, metrics_repo
+    )
+    enricher.identity_resolver = AsyncMock()
+    enricher.metadata_manager = AsyncMock()
+    return enricher
+
+
+@pytest.mark.asyncio
+async def test_only_stale_tracks_are_resolved_and_fetched(enricher, tracklist):
+    """Test stored metrics fill in for tracks that are still fresh."""
+    track = tracklist.tracks[1]
+    enricher.identity_resolver.resolve_track_identities.return_value = {
+        2: MatchResult(track=track, success=True, connector_id="falling")
+    }
+    enricher.metadata_manager.fetch_fresh_metadata.return_value = (
+        {2: {"plays": 3}},
+        set(),
+    )
+    enricher.metadata_manager.get_all_metadata.return_value = {2: {"plays": 3}}
+
+    enriched, metrics = await enricher.enrich_tracks(
+        tracklist, "lastfm", AsyncMock(), EXTRACTORS, max_age_hours=2.0
+    )
+
+    resolved = enricher.identity_resolver.resolve_track_identities.call_args.args[0]
+    assert [t.id for t in resolved.tracks] == [2]
+    assert enricher.metadata_manager.fetch_fresh_metadata.call_args.args[3] == [2]
+    enricher.metrics_repo.save_track_metrics.assert_awaited_once_with([
+        (2, "lastfm", "lastfm_user_playcount", 3.0)
+    ])
+    assert metrics == {"lastfm_user_playcount": {1: 12.0, 2: 3}}
+    assert enriched.metadata["metrics"] == metrics
+
+
+@pytest.mark.asyncio
+async def test_fresh_tracklists_make_no_connector_calls(
+    enricher, connector_repo, tracklist
+):
+    """Test re-enriching fresh tracks neither resolves nor fetches anything."""
+    collected = datetime.now(UTC) - timedelta(hours=1)
+    connector_repo.get_current_metrics.return_value = {
+        1: {"lastfm_user_playcount": (12.0, collected)},
+        2: {"lastfm_user_playcount": (3.0, collected)},
+    }
+    connector = AsyncMock()
+
+    _, metrics = await enricher.enrich_tracks(
+        tracklist, "lastfm", connector, EXTRACTORS, max_age_hours=2.0
+    )
+
+    assert metrics == {"lastfm_user_playcount": {1: 12.0, 2: 3.0}}
+    enricher.identity_resolver.resolve_track_identities.assert_not_called()
+    enricher.metadata_manager.fetch_fresh_metadata.assert_not_called()
+    enricher.metrics_repo.save_track_metrics.assert_not_called()
+    assert connector.mock_calls == []
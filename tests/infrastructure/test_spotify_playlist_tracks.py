@@ -0,0 +1,80 @@
+"""Tests for building Spotify playlist tracks from embedded item payloads."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.infrastructure.connectors.spotify import SpotifyConnector
+
+
+def _track(track_id: str, **overrides) -> dict:
+    """Full Spotify track object as embedded in playlist items."""
+    track = {
+        "id": track_id,
+        "type": "track",
+        "name": f"Track {track_id}",
+        "artists": [{"name": "Artist"}],
+        "album": {"name": "Album", "release_date": "2023-01-01"},
+        "duration_ms": 200000,
+        "external_ids": {"isrc": f"ISRC{track_id}"},
+    }
+    track.update(overrides)
+    return track
+
+
+def _playlist_response(items: list[dict], next_page: str | None = None) -> dict:
+    return {
+        "id": "playlist1",
+        "name": "Mix",
+        "tracks": {"items": items, "next": next_page, "total": len(items)},
+    }
+
+
+@pytest.mark.asyncio
+async def test_playlist_tracks_come_from_embedded_items_in_order():
+    """Test no tracks endpoint calls, with order and duplicates preserved."""
+    items = [
+        {"track": _track("a")},
+        {"track": _track("b")},
+        {"track": _track("a")},
+        {"track": {"id": None, "name": "Local"}, "is_local": True},
+        {"track": _track("ep", type="episode")},
+    ]
+    second_page = {"items": [{"track": _track("c")}], "next": None}
+
+    with patch("spotipy.Spotify"):
+        mock_client = MagicMock()
+        mock_client.playlist.return_value = _playlist_response(items, "page2")
+        mock_client.next.return_value = second_page
+
+        connector = SpotifyConnector()
+        connector.client = mock_client
+
+        playlist, tracks = await connector.get_spotify_playlist_with_tracks("playlist1")
+
+    assert [track.connector_track_id for track in tracks] == ["a", "b", "a", "c"]
+    assert len(playlist.items) == 6
+    mock_client.tracks.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_relinked_and_partial_items_are_refetched():
+    """Test only relinked or incomplete items go to the tracks endpoint."""
+    items = [
+        {"track": _track("a")},
+        {"track": _track("b2", linked_from={"id": "b"})},
+        {"track": {"id": "c", "type": "track", "name": "Partial"}},
+    ]
+
+    with patch("spotipy.Spotify"):
+        mock_client = MagicMock()
+        mock_client.playlist.return_value = _playlist_response(items)
+        mock_client.tracks.return_value = {"tracks": [_track("b"), _track("c")]}
+
+        connector = SpotifyConnector()
+        connector.client = mock_client
+
+        _, tracks = await connector.get_spotify_playlist_with_tracks("playlist1")
+
+    mock_client.tracks.assert_called_once_with(["b", "c"], market="US")
+    assert [track.connector_track_id for track in tracks] == ["a", "b", "c"]
@@ -93,6 +93,7 @@ def mock_spotify_connector():
     """Mock Spotify connector for integration tests."""
     mock = AsyncMock()
     mock.get_spotify_playlist.return_value = MagicMock()
+    mock.get_spotify_playlist_with_tracks.return_value = (MagicMock(), [])
     mock.get_tracks_by_ids.return_value = []
     mock.create_playlist.return_value = "new_playlist_id"
     mock.update_playlist.return_value = None
@@ -0,0 +1,129 @@
+"""Benchmark end-to-end latency of the Prefect and local workflow engines.
+
+Runs every bundled workflow definition through both engines and prints the
+median latency of each. Sources, enrichers and destinations call external
+services, so they are replaced by in-memory nodes returning a fixed library;
+filters, sorters, selectors and combiners run for real. Prefect starts an
+ephemeral API server on first use, so the benchmark is opt-in:
+
+    NARADA_BENCHMARK=1 pytest tests/integration/test_workflow_engine_benchmark.py -s
+"""
+
+from datetime import UTC, datetime, timedelta
+import json
+import os
+from pathlib import Path
+import statistics
+import time
+
+import pytest
+
+from src.application.workflows import local, plan
+from src.domain.entities import Artist, Track, TrackList
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("NARADA_BENCHMARK"),
+    reason="benchmark starts a Prefect server; set NARADA_BENCHMARK=1 to run",
+)
+
+DEFINITIONS = (
+    Path(__file__).parents[2] / "src" / "application" / "workflows" / "definitions"
+)
+LIBRARY_SIZE = 200
+RUNS = 3
+
+NOW = datetime.now(UTC)
+LIBRARY = [
+    Track(
+        id=i,
+        title=f"Track {i}",
+        artists=[Artist(name=f"Artist {i % 40}")],
+        release_date=NOW - timedelta(days=i * 11),
+    )
+    for i in range(1, LIBRARY_SIZE + 1)
+]
+METRICS = {
+    "total_plays": {i: i % 9 for i in range(1, LIBRARY_SIZE + 1)},
+    "period_plays": {i: i % 4 for i in range(1, LIBRARY_SIZE + 1)},
+    "last_played_dates": {
+        i: NOW - timedelta(days=i % 30) for i in range(1, LIBRARY_SIZE + 1)
+    },
+    "lastfm_user_playcount": {i: i * 3 % 101 for i in range(1, LIBRARY_SIZE + 1)},
+    "lastfm_global_playcount": {i: i * 7 % 997 for i in range(1, LIBRARY_SIZE + 1)},
+    "lastfm_listeners": {i: i * 5 % 89 for i in range(1, LIBRARY_SIZE + 1)},
+}
+
+
+async def _source(_context, config):  # noqa: RUF029
+    # Each playlist is a different slice of the library
+    offset = sum(map(ord, config.get("playlist_id", ""))) % 50
+    return {"tracklist": TrackList(tracks=LIBRARY[offset : offset + 150])}
+
+
+async def _enricher(context, _config):  # noqa: RUF029
+    tracklist = context[context["upstream_task_id"]]["tracklist"]
+    return {"tracklist": tracklist.with_metadata("metrics", METRICS)}
+
+
+async def _destination(context, _config):  # noqa: RUF029
+    return context[context["upstream_task_id"]]
+
+
+def _stand_in(get_node):
+    """Node lookup with in-memory nodes for the ones calling external services."""
+
+    def lookup(node_type: str):
+        category = node_type.split(".")[0]
+        stand_ins = {
+            "source": _source,
+            "enricher": _enricher,
+            "destination": _destination,
+        }
+        if category in stand_ins:
+            return stand_ins[category], {}
+        return get_node(node_type)
+
+    return lookup
+
+
+async def _median_latency(run_workflow, workflow_def: dict) -> float:
+    timings = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        _, result = await run_workflow(workflow_def)
+        timings.append(time.perf_counter() - started)
+        assert result.tracks is not None
+    return statistics.median(timings) * 1000
+
+
+@pytest.mark.usefixtures("initialize_db")
+async def test_local_engine_is_faster_on_bundled_definitions(monkeypatch):
+    """Test and report per-definition latency of both engines."""
+    from src.application.workflows import prefect
+
+    monkeypatch.setattr(plan, "get_node", _stand_in(plan.get_node))
+
+    definitions = {
+        path.stem: json.loads(path.read_text())
+        for path in sorted(DEFINITIONS.glob("*.json"))
+    }
+    # Only workflows ending in a destination produce a WorkflowResult
+    definitions = {
+        name: workflow_def
+        for name, workflow_def in definitions.items()
+        if any(t["type"].startswith("destination.") for t in workflow_def["tasks"])
+    }
+    # Warm both engines up, including Prefect's ephemeral server
+    warmup = next(iter(definitions.values()))
+    await prefect.run_workflow(warmup)
+    await local.run_workflow(warmup)
+
+    print(f"\n{'workflow':<36}{'prefect ms':>12}{'local ms':>10}{'speedup':>9}")
+    for name, workflow_def in definitions.items():
+        prefect_ms = await _median_latency(prefect.run_workflow, workflow_def)
+        local_ms = await _median_latency(local.run_workflow, workflow_def)
+        print(
+            f"{name:<36}{prefect_ms:>12.1f}{local_ms:>10.1f}"
+            f"{prefect_ms / local_ms:>8.1f}x"
+        )
+        assert local_ms < prefect_ms
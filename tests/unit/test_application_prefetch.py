@@ -0,0 +1,86 @@
+"""Tests for the read-ahead page prefetcher."""
+
+import asyncio
+
+import pytest
+
+from src.application.utilities.prefetch import PagePrefetcher
+
+
+class FakePager:
+    """Offset-paginated source of ``pages`` pages, recording fetch activity."""
+
+    def __init__(self, pages: int, fail_at: int | None = None) -> None:
+        self.pages = pages
+        self.fail_at = fail_at
+        self.fetched: list[int] = []
+
+    async def fetch(self, cursor: str | None) -> tuple[list[int], str | None]:
+        offset = int(cursor or 0)
+        await asyncio.sleep(0.001)
+        if offset == self.fail_at:
+            raise RuntimeError("page failed")
+        self.fetched.append(offset)
+        next_cursor = str(offset + 1) if offset + 1 < self.pages else None
+        return [offset], next_cursor
+
+
+@pytest.mark.asyncio
+async def test_pages_yielded_in_order_until_last():
+    """Test every page is yielded once, following the cursor chain."""
+    pager = FakePager(pages=5)
+
+    async with PagePrefetcher(pager.fetch, prefetch=2) as pages:
+        seen = [items async for items, _ in pages]
+
+    assert seen == [[0], [1], [2], [3], [4]]
+
+
+@pytest.mark.asyncio
+async def test_fetching_overlaps_consumer_within_bound():
+    """Test pages are fetched while the consumer works, never more than N ahead."""
+    pager = FakePager(pages=10)
+    lead = []
+
+    async with PagePrefetcher(pager.fetch, prefetch=3) as pages:
+        consumed = 0
+        async for _ in pages:
+            consumed += 1
+            # Simulated database write for the current page
+            await asyncio.sleep(0.01)
+            lead.append(len(pager.fetched) - consumed)
+
+    assert max(lead) == 3
+    assert all(ahead <= 3 for ahead in lead)
+
+
+@pytest.mark.asyncio
+async def test_leaving_early_stops_prefetching():
+    """Test breaking out of the loop cancels fetching ahead."""
+    pager = FakePager(pages=100)
+
+    async with PagePrefetcher(pager.fetch, prefetch=2) as pages:
+        async for items, _ in pages:
+            if items == [1]:
+                break
+
+    fetched = len(pager.fetched)
+    await asyncio.sleep(0.01)
+    assert len(pager.fetched) == fetched <= 4
+
+
+@pytest.mark.asyncio
+async def test_fetch_error_raised_in_page_order():
+    """Test pages before a failure are delivered, then the error is raised."""
+    pager = FakePager(pages=5, fail_at=2)
+    seen = []
+
+    async def consume() -> None:
+        async with PagePrefetcher(pager.fetch, prefetch=2) as pages:
+            async for items, _ in pages:
+                seen.append(items)
+
+    with pytest.raises(RuntimeError, match="page failed"):
+        await consume()
+
+    assert seen == [[0], [1]]
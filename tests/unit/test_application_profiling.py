@@ -0,0 +1,61 @@
+"""Tests for per-node resource accounting."""
+
+import asyncio
+
+from src.application.utilities.profiling import (
+    measure_node,
+    record_api_call,
+    record_sql_statement,
+    trace_memory,
+)
+
+
+async def test_calls_are_counted_against_the_running_node():
+    """Test calls from tasks a node spawns count, calls outside do not."""
+    record_api_call("spotify")
+
+    async def lookup():
+        await asyncio.sleep(0)
+        record_api_call("lastfm")
+        record_sql_statement()
+
+    with measure_node("enrich", "enricher.lastfm", 1.5, tracks_in=3) as meter:
+        await asyncio.gather(lookup(), lookup())
+        record_api_call("spotify")
+        profile = meter.finish(tracks_out=2)
+
+    record_sql_statement()
+
+    assert profile.api_calls == {"lastfm": 2, "spotify": 1}
+    assert profile.total_api_calls == 3
+    assert profile.sql_statements == 2
+    assert (profile.tracks_in, profile.tracks_out) == (3, 2)
+    assert profile.start_offset == 1.5
+    assert profile.wall_time >= 0
+    assert profile.peak_memory is None
+
+
+async def test_concurrent_nodes_keep_separate_counts():
+    """Test two nodes running at once never see each other's calls."""
+
+    async def node(name: str, calls: int):
+        with measure_node(name, "source.test", 0.0, tracks_in=0) as meter:
+            for _ in range(calls):
+                await asyncio.sleep(0)
+                record_api_call("spotify")
+            return meter.finish(tracks_out=0)
+
+    first, second = await asyncio.gather(node("a", 2), node("b", 5))
+
+    assert first.api_calls == {"spotify": 2}
+    assert second.api_calls == {"spotify": 5}
+
+
+def test_peak_memory_is_traced_only_when_requested():
+    """Test peak memory covers what the node allocated inside trace_memory."""
+    with trace_memory(), measure_node("big", "filter.test", 0.0, 0) as meter:
+        block = bytearray(4_000_000)
+        profile = meter.finish(tracks_out=len(block) // 4_000_000)
+
+    assert profile.peak_memory is not None
+    assert profile.peak_memory >= 4_000_000
@@ -3,6 +3,7 @@
 Validates Clean Architecture compliance - no external dependencies.
 """
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock
 
@@ -14,6 +15,7 @@ from src.application.utilities.progress import (
     ProgressProvider,
     create_operation,
     get_progress_provider,
+    register_status_source,
     set_progress_provider,
 )
 from src.application.utilities.progress_integration import (
@@ -316,6 +318,88 @@ class TestBatchProgressWrapper:
         # Should not start operation for empty list
         mock_provider.start_operation.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_status_source_appended_to_description(self):
+        """Test live status (e.g. connector rate) is shown per batch."""
+        mock_provider = Mock(spec=ProgressProvider)
+        register_status_source("status-test", lambda: "status-test 4.0/s, 3 queued")
+
+        async def mock_process_func(_batch):
+            await asyncio.sleep(0)
+            return {}
+
+        wrapper = batch_progress_wrapper(
+            [1, 2],
+            mock_process_func,
+            operation_description="Matching",
+            batch_size=2,
+            progress_provider=mock_provider,
+            status_source="status-test",
+        )
+        await wrapper()
+
+        description = mock_provider.set_description.call_args[0][1]
+        assert description == "Matching (batch 1/1) · status-test 4.0/s, 3 queued"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_batches_bounded_with_monotonic_progress(self):
+        """Test batches overlap up to the limit and progress counts completions."""
+        mock_provider = Mock(spec=ProgressProvider)
+        mock_provider.start_operation.return_value = "batch-op-id"
+        in_flight = 0
+        peak = 0
+
+        async def mock_process_func(batch):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Earlier batches finish last
+            await asyncio.sleep(0.001 * (10 - batch[0]))
+            in_flight -= 1
+            return {i: f"processed-{i}" for i in batch}
+
+        wrapper = batch_progress_wrapper(
+            list(range(10)),
+            mock_process_func,
+            batch_size=2,
+            max_concurrent_batches=3,
+            progress_provider=mock_provider,
+        )
+        result = await wrapper()
+
+        assert peak == 3
+        assert list(result) == list(range(10))
+        progress = [c.args[1] for c in mock_provider.update_progress.call_args_list]
+        assert progress == [2, 4, 6, 8, 10]
+        mock_provider.complete_operation.assert_called_once_with("batch-op-id")
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_cancels_batches_in_flight(self):
+        """Test the first batch error stops the rest and completes the operation."""
+        mock_provider = Mock(spec=ProgressProvider)
+        started = []
+
+        async def mock_process_func(batch):
+            started.append(batch[0])
+            if batch[0] == 0:
+                raise ValueError("boom")
+            await asyncio.sleep(1)
+            return {}
+
+        wrapper = batch_progress_wrapper(
+            list(range(8)),
+            mock_process_func,
+            batch_size=2,
+            max_concurrent_batches=2,
+            progress_provider=mock_provider,
+        )
+
+        with pytest.raises(ValueError, match="boom"):
+            await asyncio.wait_for(wrapper(), timeout=0.5)
+
+        assert started == [0, 2]
+        mock_provider.complete_operation.assert_called_once()
+
 
 class TestCleanArchitectureCompliance:
     """Test Clean Architecture compliance - no external dependencies."""
@@ -0,0 +1,103 @@
+"""Tests for the cached workflow definition index."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.cli.workflow_index import load_workflow_index
+
+
+@pytest.fixture
+def definitions_dir(tmp_path):
+    """Directory with two workflow definitions."""
+    definitions = tmp_path / "definitions"
+    definitions.mkdir()
+    (definitions / "alpha.json").write_text(
+        json.dumps({"id": "alpha", "name": "Alpha", "tasks": [{}, {}]})
+    )
+    (definitions / "beta.json").write_text(json.dumps({"name": "Beta"}))
+    return definitions
+
+
+def test_index_summarizes_definitions(definitions_dir, tmp_path):
+    """Test summaries carry id, name, description and task count."""
+    workflows = load_workflow_index(definitions_dir, cache_path=tmp_path / "index.json")
+
+    assert [wf["id"] for wf in workflows] == ["alpha", "beta"]
+    assert workflows[0]["task_count"] == 2
+    assert workflows[1]["name"] == "Beta"
+    assert workflows[1]["description"] == ""
+
+
+def test_unchanged_definitions_are_served_from_cache(definitions_dir, tmp_path):
+    """Test a warm cache skips parsing definition files."""
+    cache_path = tmp_path / "index.json"
+    load_workflow_index(definitions_dir, cache_path=cache_path)
+
+    with patch(
+        "src.infrastructure.cli.workflow_index.json.loads", wraps=json.loads
+    ) as loads:
+        workflows = load_workflow_index(definitions_dir, cache_path=cache_path)
+
+    # Only the cache file itself is decoded
+    assert loads.call_count == 1
+    assert [wf["id"] for wf in workflows] == ["alpha", "beta"]
+
+
+def test_edited_and_deleted_definitions_refresh_the_cache(definitions_dir, tmp_path):
+    """Test changed files are re-read and removed files drop out."""
+    cache_path = tmp_path / "index.json"
+    load_workflow_index(definitions_dir, cache_path=cache_path)
+
+    (definitions_dir / "alpha.json").write_text(
+        json.dumps({"id": "alpha", "name": "Alpha v2", "tasks": [{}]})
+    )
+    (definitions_dir / "beta.json").unlink()
+
+    workflows = load_workflow_index(definitions_dir, cache_path=cache_path)
+
+    assert workflows == [
+        {
+            "id": "alpha",
+            "name": "Alpha v2",
+            "description": "",
+            "task_count": 1,
+            "path": str(definitions_dir / "alpha.json"),
+        }
+    ]
+    cached = json.loads(cache_path.read_text())
+    assert list(cached["files"]) == [str(definitions_dir / "alpha.json")]
+
+
+def test_invalid_definition_reported_and_skipped(definitions_dir, tmp_path):
+    """Test unreadable definitions go to the error handler."""
+    (definitions_dir / "broken.json").write_text("not json")
+    errors = []
+
+    workflows = load_workflow_index(
+        definitions_dir,
+        cache_path=tmp_path / "index.json",
+        on_error=lambda path, _error: errors.append(path.name),
+    )
+
+    assert [wf["id"] for wf in workflows] == ["alpha", "beta"]
+    assert errors == ["broken.json"]
+
+
+def test_corrupt_cache_is_rebuilt(definitions_dir, tmp_path):
+    """Test a corrupt cache file falls back to parsing definitions."""
+    cache_path = tmp_path / "index.json"
+    cache_path.write_text("{truncated")
+
+    workflows = load_workflow_index(definitions_dir, cache_path=cache_path)
+
+    assert [wf["id"] for wf in workflows] == ["alpha", "beta"]
+    assert json.loads(cache_path.read_text())["version"] == 1
+
+
+def test_default_cache_lives_in_the_data_directory(definitions_dir, data_dir):
+    """Test the cache is written under DATA_DIR rather than the working directory."""
+    load_workflow_index(definitions_dir)
+
+    assert (data_dir / "cache" / "workflow_index.json").exists()
@@ -87,6 +87,67 @@ class TestLikeUseCases:
         assert result.operation_name == "Spotify Likes Import"
         mock_unit_of_work.__aenter__.assert_called_once()
 
+    async def test_import_handles_each_page_with_bulk_operations(
+        self, import_use_case, mock_unit_of_work, mock_spotify_connector
+    ):
+        """Test a liked page costs one lookup, one like read, one ingest and one upsert per service."""
+        from src.domain.entities import ConnectorTrack, SyncCheckpoint, TrackLike
+
+        def connector_track(spotify_id: str) -> ConnectorTrack:
+            return ConnectorTrack(
+                connector_name="spotify",
+                connector_track_id=spotify_id,
+                title=f"Song {spotify_id}",
+                artists=[Artist(name="Mac DeMarco")],
+            )
+
+        page = [connector_track(i) for i in ("synced", "unliked", "new", "new")]
+        mock_unit_of_work.get_service_connector_provider().get_connector.return_value = mock_spotify_connector
+        mock_spotify_connector.get_liked_tracks.return_value = (page, None)
+
+        checkpoint = SyncCheckpoint(user_id="test", service="spotify", entity_type="likes")
+        checkpoint_repo = mock_unit_of_work.get_checkpoint_repository()
+        checkpoint_repo.get_sync_checkpoint.return_value = checkpoint
+        checkpoint_repo.save_sync_checkpoint.return_value = checkpoint
+
+        connector_repo = mock_unit_of_work.get_connector_repository()
+        connector_repo.find_tracks_by_connectors.return_value = {
+            ("spotify", "synced"): Track(id=1, title="Synced", artists=[Artist(name="A")]),
+            ("spotify", "unliked"): Track(id=2, title="Unliked", artists=[Artist(name="A")]),
+        }
+        connector_repo.ingest_external_tracks_bulk.return_value = [
+            Track(id=3, title="New", artists=[Artist(name="A")])
+        ]
+        like_repo = mock_unit_of_work.get_like_repository()
+        like_repo.get_track_likes_batch.return_value = [
+            TrackLike(track_id=1, service="spotify"),
+            TrackLike(track_id=1, service="narada"),
+            TrackLike(track_id=2, service="spotify"),
+        ]
+
+        command = ImportSpotifyLikesCommand(user_id="test_user")
+        result = await import_use_case.execute(command, mock_unit_of_work)
+
+        assert result.imported_count == 2
+        assert result.already_liked == 1
+        connector_repo.find_tracks_by_connectors.assert_awaited_once_with([
+            ("spotify", "synced"),
+            ("spotify", "unliked"),
+            ("spotify", "new"),
+        ])
+        like_repo.get_track_likes_batch.assert_awaited_once_with(
+            [1, 2], services=["spotify", "narada"]
+        )
+        ingested = connector_repo.ingest_external_tracks_bulk.await_args.args[1]
+        assert [t.connector_track_id for t in ingested] == ["new"]
+        saved = {
+            c.kwargs["service"]: c.args[0]
+            for c in like_repo.save_track_likes_batch.await_args_list
+        }
+        assert saved == {"spotify": [2, 3], "narada": [2, 3]}
+        connector_repo.find_track_by_connector.assert_not_called()
+        like_repo.save_track_like.assert_not_called()
+
     async def test_export_lastfm_use_case_follows_clean_architecture(
         self, export_use_case, mock_unit_of_work, mock_lastfm_connector
     ):
@@ -115,6 +176,60 @@ class TestLikeUseCases:
         assert result.operation_name == "Last.fm Likes Export"
         mock_unit_of_work.__aenter__.assert_called_once()
 
+    async def test_export_commits_per_chunk_and_resumes_from_cursor(
+        self, export_use_case, mock_unit_of_work, mock_lastfm_connector
+    ):
+        """Test each chunk commits its cursor and a rerun continues after it."""
+        from datetime import UTC, datetime
+
+        from src.domain.entities import SyncCheckpoint, TrackLike
+
+        run_started = datetime(2024, 1, 1, tzinfo=UTC)
+        checkpoint = SyncCheckpoint(
+            user_id="test",
+            service="lastfm",
+            entity_type="likes",
+            cursor=f"7@{run_started.isoformat()}",
+        )
+        checkpoint_repo = mock_unit_of_work.get_checkpoint_repository()
+        checkpoint_repo.get_sync_checkpoint.return_value = checkpoint
+        checkpoint_repo.save_sync_checkpoint.side_effect = lambda cp: cp
+
+        like_repo = mock_unit_of_work.get_like_repository()
+        pages = [
+            [TrackLike(track_id=10 + i, service="narada", id=8 + i) for i in range(2)],
+            [TrackLike(track_id=12, service="narada", id=10)],
+        ]
+        like_repo.get_unsynced_likes.side_effect = pages
+        like_repo.get_all_liked_tracks.return_value = []
+        mock_unit_of_work.get_track_repository().find_tracks_by_ids.side_effect = (
+            lambda ids: {
+                i: Track(id=i, title="Home", artists=[Artist(name="Mac DeMarco")])
+                for i in ids
+            }
+        )
+        mock_unit_of_work.get_service_connector_provider().get_connector.return_value = mock_lastfm_connector
+        mock_lastfm_connector.love_track.return_value = True
+
+        command = ExportLastFmLikesCommand(user_id="test", batch_size=2)
+        result = await export_use_case.execute(command, mock_unit_of_work)
+
+        assert result.exported_count == 3
+        after_ids = [c.kwargs["after_id"] for c in like_repo.get_unsynced_likes.call_args_list]
+        assert after_ids == [7, 9]
+        assert [c.args[0] for c in like_repo.save_track_likes_batch.call_args_list] == [
+            [10, 11],
+            [12],
+        ]
+        saved = [c.args[0] for c in checkpoint_repo.save_sync_checkpoint.call_args_list]
+        assert [cp.cursor for cp in saved] == [
+            f"9@{run_started.isoformat()}",
+            f"10@{run_started.isoformat()}",
+            None,
+        ]
+        assert saved[-1].last_timestamp == run_started
+        assert mock_unit_of_work.commit.await_count == 3
+
     def test_use_cases_have_no_constructor_dependencies(self, import_use_case, export_use_case):
         """Test that use cases follow Clean Architecture with no constructor dependencies."""
         # Import use case should have no constructor dependencies
@@ -18,7 +18,7 @@ from src.application.use_cases.save_playlist import (
     SavePlaylistUseCase,
     TrackEnrichmentStrategy,
 )
-from src.domain.entities.playlist import Playlist
+from src.domain.entities.playlist import ConnectorPlaylist, Playlist
 from src.domain.entities.track import Artist, Track, TrackList
 from src.domain.repositories import UnitOfWorkProtocol
 
@@ -373,4 +373,124 @@ class TestSavePlaylistUseCase:
         
         # Verify operation completed despite track persistence error
         assert isinstance(result, SavePlaylistResult)
-        assert result.track_count == 1
\ No newline at end of file
+        assert result.track_count == 1
+
+    @pytest.fixture
+    def source_playlist(self):
+        """Fetched Spotify playlist state for sync_spotify_source."""
+        return ConnectorPlaylist(
+            connector_name="spotify",
+            connector_playlist_id="spotify123",
+            name="Source Playlist",
+            raw_metadata={"snapshot_id": "snap-2"},
+        )
+
+    def _sync_command(self, track, source_playlist):
+        return SavePlaylistCommand(
+            tracklist=TrackList(tracks=[track]),
+            enrichment_config=EnrichmentConfig(enabled=False),
+            persistence_options=PersistenceOptions(
+                operation_type="sync_spotify_source",
+                playlist_name="Source Playlist",
+                spotify_playlist_id="spotify123",
+                source_playlist=source_playlist,
+            ),
+        )
+
+    def _connector_playlist_repo(self, mock_unit_of_work, stored):
+        repo = AsyncMock()
+        repo.get_by_connector_id = AsyncMock(return_value=stored)
+        mock_unit_of_work.get_connector_playlist_repository = Mock(return_value=repo)
+        return repo
+
+    def test_sync_source_requires_source_playlist(self, track):
+        """Test sync_spotify_source commands need the fetched playlist."""
+        command = self._sync_command(track, None)
+
+        assert not command.validate()
+
+    @pytest.mark.asyncio
+    async def test_sync_source_unchanged_snapshot_skips_writes(
+        self, use_case, track, source_playlist, mock_unit_of_work
+    ):
+        """Test an unchanged snapshot returns the stored mirror untouched."""
+        mock_track_repo = mock_unit_of_work.get_track_repository.return_value
+        mock_playlist_repo = mock_unit_of_work.get_playlist_repository.return_value
+        connector_repo = self._connector_playlist_repo(
+            mock_unit_of_work, source_playlist
+        )
+        stored = Playlist(id=7, name="Source Playlist", tracks=[track])
+        mock_playlist_repo.get_playlist_by_connector = AsyncMock(return_value=stored)
+
+        result = await use_case.execute(
+            self._sync_command(track, source_playlist), mock_unit_of_work
+        )
+
+        assert result.playlist is stored
+        assert result.persistence_stats == {"unchanged": 1}
+        mock_track_repo.save_track.assert_not_called()
+        mock_playlist_repo.save_playlist.assert_not_called()
+        mock_playlist_repo.update_playlist.assert_not_called()
+        connector_repo.upsert_model.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_sync_source_changed_snapshot_updates_mirror_in_place(
+        self, use_case, track, source_playlist, mock_unit_of_work
+    ):
+        """Test a changed snapshot updates the mapped playlist and its state."""
+        mock_track_repo = mock_unit_of_work.get_track_repository.return_value
+        mock_playlist_repo = mock_unit_of_work.get_playlist_repository.return_value
+        connector_repo = self._connector_playlist_repo(
+            mock_unit_of_work,
+            ConnectorPlaylist(
+                connector_name="spotify",
+                connector_playlist_id="spotify123",
+                name="Source Playlist",
+                raw_metadata={"snapshot_id": "snap-1"},
+            ),
+        )
+        mock_track_repo.save_track = AsyncMock(return_value=track)
+        existing = Playlist(
+            id=7,
+            name="Old Name",
+            tracks=[],
+            connector_playlist_ids={"spotify": "spotify123"},
+        )
+        mock_playlist_repo.get_playlist_by_connector = AsyncMock(return_value=existing)
+        mock_playlist_repo.update_playlist = AsyncMock(
+            side_effect=lambda _playlist_id, playlist: playlist
+        )
+
+        result = await use_case.execute(
+            self._sync_command(track, source_playlist), mock_unit_of_work
+        )
+
+        mock_playlist_repo.save_playlist.assert_not_called()
+        playlist_id, updated = mock_playlist_repo.update_playlist.call_args.args
+        assert playlist_id == 7
+        assert updated.name == "Source Playlist"
+        assert updated.tracks == [track]
+        connector_repo.upsert_model.assert_called_once_with(source_playlist)
+        assert result.operation_type == "sync_spotify_source"
+
+    @pytest.mark.asyncio
+    async def test_sync_source_without_mirror_creates_mapped_playlist(
+        self, use_case, track, source_playlist, mock_unit_of_work
+    ):
+        """Test the first sync saves a playlist mapped to the Spotify ID."""
+        mock_track_repo = mock_unit_of_work.get_track_repository.return_value
+        mock_playlist_repo = mock_unit_of_work.get_playlist_repository.return_value
+        connector_repo = self._connector_playlist_repo(mock_unit_of_work, None)
+        mock_track_repo.save_track = AsyncMock(return_value=track)
+        mock_playlist_repo.get_playlist_by_connector = AsyncMock(return_value=None)
+        mock_playlist_repo.save_playlist = AsyncMock(
+            side_effect=lambda playlist: playlist
+        )
+
+        result = await use_case.execute(
+            self._sync_command(track, source_playlist), mock_unit_of_work
+        )
+
+        mock_playlist_repo.update_playlist.assert_not_called()
+        assert result.playlist.connector_playlist_ids == {"spotify": "spotify123"}
+        connector_repo.upsert_model.assert_called_once_with(source_playlist)
@@ -0,0 +1,132 @@
+"""Tests for pushing workflow nodes down into library source queries."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.application.workflows.library_query import (
+    compile_library_query,
+    push_down_library_queries,
+)
+
+
+def _workflow(*tasks: dict) -> dict:
+    return {"name": "library_test", "tasks": list(tasks)}
+
+
+def _task(task_id: str, node_type: str, upstream: list[str], **config) -> dict:
+    task = {"id": task_id, "type": node_type, "config": config}
+    if upstream:
+        task["upstream"] = upstream
+    return task
+
+
+def test_top_played_chain_folds_into_the_source():
+    """Test the source takes over the ID of the last node it absorbed."""
+    workflow = _workflow(
+        _task("library", "source.library_query", [], period_days=90),
+        _task("recent", "filter.by_play_history", ["library"], days_back=90),
+        _task("sort", "sorter.by_metric", ["recent"], metric_name="period_plays"),
+        _task("top", "selector.limit_tracks", ["sort"], count=50),
+        _task("save", "destination.create_internal_playlist", ["top"], name="Top"),
+    )
+
+    planned = push_down_library_queries(workflow)
+
+    assert [task["id"] for task in planned["tasks"]] == ["top", "save"]
+    source = planned["tasks"][0]
+    assert source["type"] == "source.library_query"
+    assert source["upstream"] == []
+    assert [step["type"] for step in source["config"]["pushdown"]] == [
+        "filter.by_play_history",
+        "sorter.by_metric",
+        "selector.limit_tracks",
+    ]
+    # The input definition is left untouched
+    assert len(workflow["tasks"]) == 5
+
+    query = compile_library_query(source["config"])
+    assert query.sort_keys == (("period_plays", True),)
+    assert query.limit == 50
+    assert [bound.name for bound in query.bounds] == ["last_played_dates"]
+
+
+def test_chain_stops_at_nodes_without_a_database_equivalent():
+    """Test folding stops at an enricher, a random selection or a shared input."""
+    workflow = _workflow(
+        _task("library", "source.library_query", []),
+        _task("old", "filter.by_release_date", ["library"], min_age_days=365),
+        _task("lastfm", "enricher.lastfm", ["old"]),
+        _task(
+            "sort", "sorter.by_metric", ["lastfm"], metric_name="lastfm_user_playcount"
+        ),
+        _task("save", "destination.create_internal_playlist", ["sort"], name="Old"),
+    )
+
+    planned = push_down_library_queries(workflow)
+
+    assert [task["id"] for task in planned["tasks"]] == [
+        "old",
+        "lastfm",
+        "sort",
+        "save",
+    ]
+    assert planned["tasks"][0]["config"]["pushdown"] == [
+        {"type": "filter.by_release_date", "config": {"min_age_days": 365}}
+    ]
+
+    shared = _workflow(
+        _task("library", "source.library_query", []),
+        _task("sort", "sorter.by_metric", ["library"], metric_name="total_plays"),
+        _task("others", "filter.by_tracks", ["sort"], exclusion_source="library"),
+    )
+    assert push_down_library_queries(shared) is shared
+
+
+def test_only_a_tighter_limit_folds_after_a_limit():
+    """Test sorting the limited tracks stays a separate node."""
+    workflow = _workflow(
+        _task("library", "source.library_query", []),
+        _task("first", "selector.limit_tracks", ["library"], count=100),
+        _task("fewer", "selector.limit_tracks", ["first"], count=20),
+        _task("sort", "sorter.by_release_date", ["fewer"]),
+        _task("random", "selector.limit_tracks", ["sort"], count=5, method="random"),
+    )
+
+    planned = push_down_library_queries(workflow)
+
+    assert [task["id"] for task in planned["tasks"]] == ["fewer", "sort", "random"]
+    assert compile_library_query(planned["tasks"][0]["config"]).limit == 20
+
+
+def test_release_date_bounds_match_whole_day_ages():
+    """Test age bounds keep exactly the dates the Python filter keeps."""
+    now = datetime(2025, 6, 1, 12, tzinfo=UTC)
+    query = compile_library_query(
+        {
+            "pushdown": [
+                {
+                    "type": "filter.by_release_date",
+                    "config": {"min_age_days": 7, "max_age_days": 30},
+                }
+            ]
+        },
+        now,
+    )
+
+    (bound,) = query.bounds
+    # 31 full days old is excluded, 7 full days old is included
+    assert bound.min_value == now - timedelta(days=31)
+    assert not bound.min_inclusive
+    assert bound.max_value == now - timedelta(days=7)
+    assert bound.max_inclusive
+
+
+def test_unpushable_pushdown_config_is_rejected():
+    """Test period plays need a period before they can be queried."""
+    with pytest.raises(ValueError, match="cannot be pushed"):
+        compile_library_query({
+            "pushdown": [
+                {"type": "sorter.by_metric", "config": {"metric_name": "period_plays"}}
+            ]
+        })
@@ -0,0 +1,146 @@
+"""Tests for the in-process asyncio workflow engine."""
+
+import subprocess  # noqa: S404
+import sys
+
+import pytest
+from sqlalchemy import text
+
+from src.application.workflows import execution, local, plan
+from src.application.workflows.execution import get_workflow_runner
+from src.domain.entities import Artist, Track, TrackList
+
+
+def _tracklist(*ids: int) -> TrackList:
+    return TrackList(
+        tracks=[
+            Track(id=i, title=f"Track {i}", artists=[Artist(name="A")]) for i in ids
+        ]
+    )
+
+
+@pytest.fixture
+def nodes(monkeypatch):
+    """Swap the node registry for in-memory nodes, recording each call."""
+    calls: list[str] = []
+
+    async def source(_context, config):  # noqa: RUF029
+        calls.append("source")
+        return {"tracklist": _tracklist(*config["ids"])}
+
+    async def tag(context, _config):  # noqa: RUF029
+        calls.append("tag")
+        tracklist = context[context["upstream_task_id"]]["tracklist"]
+        scores = {track.id: track.id * 10 for track in tracklist.tracks}
+        return {"tracklist": tracklist.with_metadata("metrics", {"score": scores})}
+
+    async def flaky(context, config):  # noqa: RUF029
+        calls.append("flaky")
+        if calls.count("flaky") <= config["failures"]:
+            raise RuntimeError("temporary outage")
+        return context[context["upstream_task_id"]]
+
+    async def destination(context, _config):
+        calls.append("destination")
+        await context["shared_session"].execute(text("SELECT 1"))
+        return context[context["upstream_task_id"]]
+
+    registry = {
+        "source.test": source,
+        "enricher.test": tag,
+        "selector.flaky": flaky,
+        "destination.test": destination,
+    }
+    monkeypatch.setattr(plan, "get_node", lambda node_type: (registry[node_type], {}))
+    monkeypatch.setattr(execution, "NODE_RETRY_DELAY_SECONDS", 0)
+    return calls
+
+
+def _workflow(failures: int = 0) -> dict:
+    return {
+        "name": "local_test",
+        "tasks": [
+            {"id": "dest", "type": "destination.test", "upstream": ["retry"]},
+            {
+                "id": "retry",
+                "type": "selector.flaky",
+                "config": {"failures": failures},
+                "upstream": ["tag"],
+            },
+            {
+                "id": "tag",
+                "type": "enricher.test",
+                "upstream": ["src"],
+                "result_key": "tagged",
+            },
+            {"id": "src", "type": "source.test", "config": {"ids": [1, 2, 3]}},
+        ],
+    }
+
+
+@pytest.mark.usefixtures("initialize_db")
+async def test_local_engine_runs_tasks_in_dependency_order(nodes):
+    """Test results, result keys and metrics match what Prefect would return."""
+    context, result = await local.run_workflow(_workflow(), limit=5)
+
+    assert nodes == ["source", "tag", "flaky", "destination"]
+    assert context["parameters"] == {"limit": 5}
+    assert context["tagged"] is context["tag"]
+    assert context["workflow_name"] == "local_test"
+    assert [track.id for track in result.tracks] == [1, 2, 3]
+    assert result.metrics["score"] == {1: 10, 2: 20, 3: 30}
+    assert result.operation_name == "local_test"
+    assert result.execution_time > 0
+
+
+@pytest.mark.usefixtures("initialize_db", "nodes")
+async def test_each_node_is_profiled_in_run_order():
+    """Test profiles record track counts, SQL use and a loadable trace."""
+    _, result = await local.run_workflow(_workflow(failures=1))
+
+    profiles = {profile.task_id: profile for profile in result.node_profiles}
+    assert list(profiles) == ["src", "tag", "retry", "dest"]
+    assert (profiles["src"].tracks_in, profiles["src"].tracks_out) == (0, 3)
+    assert (profiles["dest"].tracks_in, profiles["dest"].tracks_out) == (3, 3)
+    assert profiles["dest"].sql_statements == 1
+    assert profiles["src"].sql_statements == 0
+    offsets = [profile.start_offset for profile in result.node_profiles]
+    assert offsets == sorted(offsets)
+
+    events = result.to_chrome_trace()["traceEvents"]
+    spans = [event for event in events if event["ph"] == "X"]
+    assert [span["name"] for span in spans] == ["src", "tag", "retry", "dest"]
+    assert spans[-1]["cat"] == "destination.test"
+    assert spans[-1]["args"]["sql_statements"] == 1
+    assert result.to_dict()["node_profiles"][0]["task_id"] == "src"
+
+
+@pytest.mark.usefixtures("initialize_db")
+async def test_failed_nodes_are_retried_then_reraised(nodes):
+    """Test a node gets the same number of retries as a Prefect task."""
+    _, result = await local.run_workflow(_workflow(failures=execution.NODE_RETRIES))
+    assert [track.id for track in result.tracks] == [1, 2, 3]
+
+    nodes.clear()
+    with pytest.raises(RuntimeError, match="temporary outage"):
+        await local.run_workflow(_workflow(failures=execution.NODE_RETRIES + 1))
+    assert nodes.count("flaky") == execution.NODE_RETRIES + 1
+    assert "destination" not in nodes
+
+
+def test_engines_are_resolved_by_name():
+    """Test the local engine is selectable and unknown engines are rejected."""
+    assert get_workflow_runner("local") is local.run_workflow
+    with pytest.raises(ValueError, match="Unknown workflow engine"):
+        get_workflow_runner("celery")
+
+
+def test_local_engine_does_not_import_prefect():
+    """Test choosing the local engine never pays for importing Prefect."""
+    script = (
+        "import sys\n"
+        "from src.application.workflows.execution import get_workflow_runner\n"
+        "get_workflow_runner('local')\n"
+        "assert 'prefect' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)  # noqa: S603
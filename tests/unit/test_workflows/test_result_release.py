@@ -0,0 +1,130 @@
+"""Tests for releasing task results once their last consumer has run."""
+
+import tracemalloc
+
+import pytest
+
+from src.application.utilities.profiling import trace_memory
+from src.application.workflows import execution, local, plan
+from src.domain.entities import Artist, Track, TrackList
+
+BRANCHES = 16
+TRACKS_PER_BRANCH = 2_000
+
+
+@pytest.fixture(autouse=True)
+def nodes(monkeypatch):
+    """Nodes for a wide workflow: each branch expands to a large tracklist."""
+
+    def input_of(context: dict) -> TrackList:
+        return context[context["upstream_task_id"]]["tracklist"]
+
+    async def source(_context, _config):  # noqa: RUF029
+        return {
+            "tracklist": TrackList(
+                tracks=[Track(title="seed", artists=[Artist(name="A")])]
+            )
+        }
+
+    async def expand(_context, config):  # noqa: RUF029
+        # Distinct 1 KB titles, so every branch allocates its own tracks
+        branch = config["branch"]
+        tracks = [
+            Track(
+                id=branch * TRACKS_PER_BRANCH + i,
+                title=f"{branch}-{i}-".ljust(1024, "x"),
+                artists=[Artist(name="A")],
+            )
+            for i in range(TRACKS_PER_BRANCH)
+        ]
+        branches = {track.id: branch for track in tracks}
+        return {
+            "tracklist": TrackList(
+                tracks=tracks, metadata={"metrics": {"branch": branches}}
+            )
+        }
+
+    async def first(context, _config):  # noqa: RUF029
+        tracklist = input_of(context)
+        return {"tracklist": tracklist.with_tracks(tracklist.tracks[:1])}
+
+    async def combine(context, _config):  # noqa: RUF029
+        tracks = [
+            track
+            for upstream_id in context["upstream_task_ids"]
+            for track in context[upstream_id]["tracklist"].tracks
+        ]
+        return {"tracklist": TrackList(tracks=tracks)}
+
+    async def destination(context, _config):  # noqa: RUF029
+        return context[context["upstream_task_id"]]
+
+    registry = {
+        "source.test": source,
+        "enricher.expand": expand,
+        "selector.first": first,
+        "combiner.test": combine,
+        "destination.test": destination,
+    }
+    monkeypatch.setattr(plan, "get_node", lambda node_type: (registry[node_type], {}))
+    monkeypatch.setattr(execution, "NODE_RETRY_DELAY_SECONDS", 0)
+
+
+def _wide_workflow() -> dict:
+    tasks: list[dict] = [{"id": "seed", "type": "source.test"}]
+    for branch in range(BRANCHES):
+        tasks += [
+            {
+                "id": f"big_{branch}",
+                "type": "enricher.expand",
+                "config": {"branch": branch},
+                "upstream": ["seed"],
+            },
+            {
+                "id": f"small_{branch}",
+                "type": "selector.first",
+                "upstream": [f"big_{branch}"],
+            },
+        ]
+    tasks += [
+        {
+            "id": "merge",
+            "type": "combiner.test",
+            "upstream": [f"small_{branch}" for branch in range(BRANCHES)],
+        },
+        {"id": "save", "type": "destination.test", "upstream": ["merge"]},
+    ]
+    return {"name": "wide", "tasks": tasks}
+
+
+@pytest.mark.usefixtures("initialize_db")
+async def test_only_destination_outputs_outlive_their_consumers():
+    """Test intermediate results leave the context, their metrics do not."""
+    context, result = await local.run_workflow(_wide_workflow())
+
+    assert "save" in context
+    assert not any(key.startswith(("big_", "small_", "merge")) for key in context)
+    assert [track.id for track in result.tracks] == [
+        branch * TRACKS_PER_BRANCH for branch in range(BRANCHES)
+    ]
+    assert len(result.metrics["branch"]) == BRANCHES * TRACKS_PER_BRANCH
+
+
+@pytest.mark.usefixtures("initialize_db")
+async def test_peak_memory_stays_near_one_branch_of_a_wide_workflow():
+    """Test a wide workflow never holds every branch's tracklist at once."""
+    with trace_memory():
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        _, result = await local.run_workflow(_wide_workflow())
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+
+    branch_size = next(
+        profile.peak_memory
+        for profile in result.node_profiles
+        if profile.task_id == "big_0"
+    )
+    assert branch_size is not None
+    assert branch_size > 1_000_000
+    # Keeping every result alive would need about BRANCHES times this
+    assert peak < 4 * branch_size
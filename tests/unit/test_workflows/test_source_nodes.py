@@ -46,7 +46,7 @@ class TestSpotifyPlaylistSource:
         mock_playlist = MagicMock()
         mock_playlist.name = "Empty Playlist"
         mock_playlist.items = []  # Empty playlist
-        mock_spotify.get_spotify_playlist.return_value = mock_playlist
+        mock_spotify.get_spotify_playlist_with_tracks.return_value = (mock_playlist, [])
         
         # Execute the function with mocked connector
         result = await spotify_playlist_source({}, sample_config, mock_spotify)
@@ -71,7 +71,7 @@ class TestSpotifyPlaylistSource:
         
         # Setup mocks for not found
         mock_spotify = mock_workflow_context.connectors.get_connector.return_value
-        mock_spotify.get_spotify_playlist.return_value = None
+        mock_spotify.get_spotify_playlist_with_tracks.return_value = (None, [])
         
         # Execute the function with mocked connector
         result = await spotify_playlist_source({}, sample_config, mock_spotify)
@@ -0,0 +1,155 @@
+"""Tests for streaming workflow runs over bounded track batches."""
+
+import pytest
+
+from src.application.workflows import execution, local, plan, streaming
+from src.application.workflows.streaming import merge_batches, plan_pipes
+from src.domain.entities import Artist, Track, TrackList
+
+
+def _tracklist(*ids: int) -> TrackList:
+    return TrackList(
+        tracks=[
+            Track(id=i, title=f"Track {i}", artists=[Artist(name="A")]) for i in ids
+        ]
+    )
+
+
+def _task(task_id: str, node_type: str, *upstream: str, **config) -> dict:
+    return {
+        "id": task_id,
+        "type": node_type,
+        "upstream": list(upstream),
+        "config": config,
+    }
+
+
+def test_batch_chains_are_piped_up_to_the_first_barrier():
+    """Test only single-consumer batch nodes feeding batch nodes are piped."""
+    tasks = [
+        _task("src", "source.library_query"),
+        _task("other", "source.spotify_playlist"),
+        _task("recent", "filter.by_play_history", "src"),
+        _task("plays", "enricher.play_history", "recent"),
+        _task("fresh", "filter.by_tracks", "plays", "other", exclusion_source="other"),
+        _task("dedup", "filter.deduplicate", "fresh"),
+        _task("top", "sorter.by_metric", "dedup"),
+        _task("dest", "destination.create_internal_playlist", "top"),
+    ]
+
+    # The exclusion list is read whole, deduplication and sorting are barriers
+    assert plan_pipes(tasks) == {"src", "recent", "plays"}
+
+    # A kept result is materialized, and split again for the nodes after it
+    tasks[2]["result_key"] = "recent_tracks"
+    assert plan_pipes(tasks) == {"src", "plays"}
+
+
+def test_merged_batches_keep_order_and_every_metric():
+    """Test merging joins tracks in order and unions per-batch metrics."""
+    first = _tracklist(1, 2).with_metadata("metrics", {"plays": {1: 3, 2: 0}})
+    second = _tracklist(3).with_metadata("metrics", {"plays": {3: 7}})
+
+    merged = merge_batches([first, second])
+
+    assert [track.id for track in merged.tracks] == [1, 2, 3]
+    assert merged.metadata["metrics"] == {"plays": {1: 3, 2: 0, 3: 7}}
+
+
+@pytest.fixture
+def nodes(monkeypatch):
+    """Swap the node registry for in-memory nodes recording their inputs."""
+    seen: dict[str, list] = {}
+
+    def input_of(context: dict) -> TrackList:
+        return context[context["upstream_task_id"]]["tracklist"]
+
+    async def source(_context, config):  # noqa: RUF029
+        seen.setdefault("source", []).append(len(config["ids"]))
+        return {"tracklist": _tracklist(*config["ids"])}
+
+    async def keep_even(context, _config):  # noqa: RUF029
+        tracklist = input_of(context)
+        seen.setdefault("filter", []).append(len(tracklist.tracks))
+        return {
+            "tracklist": tracklist.with_tracks([
+                track for track in tracklist.tracks if track.id % 2 == 0
+            ])
+        }
+
+    async def score(context, _config):  # noqa: RUF029
+        tracklist = input_of(context)
+        seen.setdefault("enricher", []).append(len(tracklist.tracks))
+        scores = {track.id: -track.id for track in tracklist.tracks}
+        return {"tracklist": tracklist.with_metadata("metrics", {"score": scores})}
+
+    async def sort(context, _config):  # noqa: RUF029
+        tracklist = input_of(context)
+        seen.setdefault("sorter", []).append(len(tracklist.tracks))
+        seen["sorter_context"] = sorted(key for key in context if key[:1] == "t")
+        ordered = sorted(tracklist.tracks, key=lambda track: -track.id)
+        return {"tracklist": tracklist.with_tracks(ordered)}
+
+    async def destination(context, _config):  # noqa: RUF029
+        return context[context["upstream_task_id"]]
+
+    registry = {
+        "source.test": source,
+        "filter.by_metric": keep_even,
+        "enricher.play_history": score,
+        "sorter.by_metric": sort,
+        "destination.create_internal_playlist": destination,
+    }
+    monkeypatch.setattr(plan, "get_node", lambda node_type: (registry[node_type], {}))
+    monkeypatch.setattr(execution, "NODE_RETRY_DELAY_SECONDS", 0)
+    monkeypatch.setattr(streaming, "STREAM_BATCH_SIZE", 3)
+    return seen
+
+
+def _workflow() -> dict:
+    return {
+        "name": "streaming_test",
+        "streaming": True,
+        "tasks": [
+            _task("t_src", "source.test", ids=list(range(1, 11))),
+            _task("t_even", "filter.by_metric", "t_src"),
+            _task("t_score", "enricher.play_history", "t_even"),
+            _task("t_sort", "sorter.by_metric", "t_score"),
+            _task("t_dest", "destination.create_internal_playlist", "t_sort"),
+        ],
+    }
+
+
+@pytest.mark.usefixtures("initialize_db")
+async def test_batches_flow_through_chains_into_barriers(nodes):
+    """Test batch nodes see bounded batches and barriers the whole stream."""
+    context, result = await local.run_workflow(_workflow())
+
+    assert nodes["source"] == [10]
+    assert nodes["filter"] == [3, 3, 3, 1]
+    assert nodes["enricher"] == [1, 2, 1, 1]
+    assert nodes["sorter"] == [5]
+    assert [track.id for track in result.tracks] == [10, 8, 6, 4, 2]
+    assert result.metrics["score"] == {2: -2, 4: -4, 6: -6, 8: -8, 10: -10}
+
+    # Intermediate results never outlive their consumer
+    assert nodes["sorter_context"] == ["t_score"]
+    assert "t_sort" not in context
+    assert "t_dest" in context
+
+    profiles = {profile.task_id: profile for profile in result.node_profiles}
+    assert list(profiles) == ["t_src", "t_even", "t_score", "t_sort", "t_dest"]
+    assert (profiles["t_even"].tracks_in, profiles["t_even"].tracks_out) == (10, 5)
+    assert (profiles["t_sort"].tracks_in, profiles["t_sort"].tracks_out) == (5, 5)
+
+
+@pytest.mark.usefixtures("initialize_db", "nodes")
+async def test_streaming_matches_the_default_run():
+    """Test a streaming run returns what the same workflow returns unstreamed."""
+    _, streamed = await local.run_workflow(_workflow())
+    _, whole = await local.run_workflow({**_workflow(), "streaming": False})
+
+    assert [track.id for track in streamed.tracks] == [
+        track.id for track in whole.tracks
+    ]
+    assert streamed.metrics == whole.metrics
@@ -0,0 +1,157 @@
+"""Tests for running several workflows as one merged DAG."""
+
+import pytest
+
+from src.application.workflows import execution, plan
+from src.application.workflows.batch import merge_workflows, run_workflow_batch
+from src.domain.entities import Artist, Track, TrackList
+
+
+def _task(task_id: str, node_type: str, *upstream: str, **config) -> dict:
+    return {
+        "id": task_id,
+        "type": node_type,
+        "upstream": list(upstream),
+        "config": config,
+    }
+
+
+def _sorted_playlist(name: str, playlist_id: str, metric: str) -> dict:
+    return {
+        "name": name,
+        "tasks": [
+            _task("source", "source.spotify_playlist", playlist_id=playlist_id),
+            _task("enrich", "enricher.lastfm", "source"),
+            _task("sort", "sorter.by_metric", "enrich", metric_name=metric),
+            _task("destination", "destination.create_internal_playlist", "sort"),
+        ],
+    }
+
+
+def test_identical_sources_and_enrichers_are_merged():
+    """Test only same-typed, same-config nodes on the same inputs are shared."""
+    batch = merge_workflows({
+        "user": _sorted_playlist("User", "a", "lastfm_user_playcount"),
+        "global": _sorted_playlist("Global", "a", "lastfm_global_playcount"),
+        "other": _sorted_playlist("Other", "b", "lastfm_user_playcount"),
+    })
+
+    assert batch.shared_task_ids == {"user/source", "user/enrich"}
+    assert [task["id"] for task in batch.plan.tasks] == [
+        "user/source",
+        "user/enrich",
+        "user/sort",
+        "user/destination",
+        "global/sort",
+        "global/destination",
+        "other/source",
+        "other/enrich",
+        "other/sort",
+        "other/destination",
+    ]
+    global_tasks = {task["id"]: task for task in batch.members["global"]["tasks"]}
+    assert global_tasks["global/sort"]["upstream"] == ["user/enrich"]
+
+
+def test_config_references_follow_merged_tasks():
+    """Test exclusion sources and combiner inputs are renamed with upstream."""
+    workflow = {
+        "name": "Fresh",
+        "tasks": [
+            _task("new", "source.spotify_playlist", playlist_id="new"),
+            _task("seen", "source.spotify_playlist", playlist_id="a"),
+            _task("fresh", "filter.by_tracks", "new", "seen", exclusion_source="seen"),
+            _task("mix", "combiner.concatenate_playlists", "fresh", order=["fresh"]),
+            _task("destination", "destination.create_internal_playlist", "mix"),
+        ],
+    }
+    batch = merge_workflows({
+        "sorted": _sorted_playlist("Sorted", "a", "lastfm_user_playcount"),
+        "fresh": workflow,
+    })
+
+    tasks = {task["id"]: task for task in batch.plan.tasks}
+    assert tasks["fresh/fresh"]["config"]["exclusion_source"] == "sorted/source"
+    assert tasks["fresh/fresh"]["upstream"] == ["fresh/new", "sorted/source"]
+    assert tasks["fresh/mix"]["config"]["order"] == ["fresh/fresh"]
+
+
+def test_workflows_without_destinations_are_rejected():
+    """Test every workflow in a batch has to produce a result."""
+    workflow = _sorted_playlist("Preview", "a", "lastfm_user_playcount")
+    workflow["tasks"].pop()
+
+    with pytest.raises(ValueError, match="Workflow preview has no destination"):
+        merge_workflows({"preview": workflow})
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Swap sources and enrichers for in-memory nodes counting their runs."""
+    counts: dict[str, int] = {}
+
+    async def source(_context, config):  # noqa: RUF029
+        counts["source"] = counts.get("source", 0) + 1
+        tracks = [
+            Track(
+                id=i, title=f"{config['playlist_id']} {i}", artists=[Artist(name="A")]
+            )
+            for i in (1, 2, 3)
+        ]
+        return {"tracklist": TrackList(tracks=tracks)}
+
+    async def enrich(context, _config):  # noqa: RUF029
+        counts["enricher"] = counts.get("enricher", 0) + 1
+        tracklist = context[context["upstream_task_id"]]["tracklist"]
+        return {
+            "tracklist": tracklist.with_metadata(
+                "metrics",
+                {
+                    "lastfm_user_playcount": {1: 5, 2: 9, 3: 1},
+                    "lastfm_global_playcount": {1: 700, 2: 100, 3: 900},
+                },
+            )
+        }
+
+    async def destination(context, _config):  # noqa: RUF029
+        return context[context["upstream_task_id"]]
+
+    stand_ins = {
+        "source.spotify_playlist": source,
+        "enricher.lastfm": enrich,
+        "destination.create_internal_playlist": destination,
+    }
+    get_node = plan.get_node
+    monkeypatch.setattr(
+        plan,
+        "get_node",
+        lambda node_type: (
+            (stand_ins[node_type], {})
+            if node_type in stand_ins
+            else get_node(node_type)
+        ),
+    )
+    monkeypatch.setattr(execution, "NODE_RETRY_DELAY_SECONDS", 0)
+    return counts
+
+
+@pytest.mark.usefixtures("initialize_db")
+async def test_shared_nodes_run_once_for_every_workflow(calls):
+    """Test a shared source and enrichment feed each workflow's own result."""
+    batch = merge_workflows({
+        "user": _sorted_playlist("User", "a", "lastfm_user_playcount"),
+        "global": _sorted_playlist("Global", "a", "lastfm_global_playcount"),
+    })
+
+    _, results = await run_workflow_batch(batch, engine="local")
+
+    assert calls == {"source": 1, "enricher": 1}
+    assert [track.id for track in results["user"].tracks] == [2, 1, 3]
+    assert [track.id for track in results["global"].tracks] == [3, 1, 2]
+    assert results["global"].operation_name == "Global"
+    assert [profile.task_id for profile in results["global"].node_profiles] == [
+        "user/source",
+        "user/enrich",
+        "global/sort",
+        "global/destination",
+    ]
@@ -0,0 +1,198 @@
+"""Tests for compiling, caching and binding workflow plans."""
+
+import json
+
+import pytest
+
+from src.application.workflows import plan
+from src.application.workflows.execution import topological_sort
+from src.application.workflows.plan import (
+    bind_nodes,
+    compile_workflow,
+    load_workflow_plan,
+)
+from src.domain.entities import Artist, Track, TrackList
+
+
+def _task(task_id: str, node_type: str, *upstream: str, **config) -> dict:
+    return {
+        "id": task_id,
+        "type": node_type,
+        "upstream": list(upstream),
+        "config": config,
+    }
+
+
+def _workflow(*tasks: dict) -> dict:
+    return {"name": "plan_test", "description": "", "tasks": list(tasks)}
+
+
+@pytest.fixture(autouse=True)
+def plans(monkeypatch):
+    """Start every test with an empty in-memory plan cache."""
+    monkeypatch.setattr(plan, "_plans", {})
+
+
+@pytest.mark.parametrize(
+    ("tasks", "error"),
+    [
+        (
+            [_task("a", "sorter.by_metric"), _task("a", "selector.limit_tracks")],
+            "Duplicate workflow task ID: a",
+        ),
+        ([_task("a", "sorter.shuffle")], "Unknown node type for task a"),
+        ([_task("a", "sorter.by_metric", "missing")], "reads unknown tasks: missing"),
+        (
+            [
+                _task("a", "filter.by_tracks", exclusion_source="b"),
+                _task("b", "sorter.by_metric", "a"),
+            ],
+            "cycle",
+        ),
+        ([{"id": "a"}], "needs an id and a type"),
+    ],
+)
+def test_invalid_definitions_are_rejected(tasks, error):
+    """Test compilation fails on anything that is not a DAG of known nodes."""
+    with pytest.raises(ValueError, match=error):
+        compile_workflow(_workflow(*tasks))
+
+
+def test_plans_order_tasks_depth_first_and_group_levels():
+    """Test inputs run first, branches finish in turn and levels are recorded."""
+    compiled = compile_workflow(
+        _workflow(
+            _task("dest", "destination.create_internal_playlist", "merge"),
+            _task("merge", "combiner.merge_playlists", "left", "right"),
+            _task("left", "selector.limit_tracks", "src_a", count=5),
+            _task("right", "filter.by_tracks", "src_b", exclusion_source="src_a"),
+            _task("src_a", "source.spotify_playlist", playlist_id="a"),
+            _task("src_b", "source.spotify_playlist", playlist_id="b"),
+        )
+    )
+
+    assert [task["id"] for task in compiled.tasks] == [
+        "src_a",
+        "left",
+        "src_b",
+        "right",
+        "merge",
+        "dest",
+    ]
+    assert compiled.levels == [
+        ["src_a", "src_b"],
+        ["left", "right"],
+        ["merge"],
+        ["dest"],
+    ]
+    # Identical definitions share one plan
+    assert compile_workflow(json.loads(json.dumps(_workflow()))) is compile_workflow(
+        _workflow()
+    )
+
+
+def test_sorting_deep_chains_does_not_recurse():
+    """Test long chains sort in one pass without hitting the recursion limit."""
+    tasks = [_task("t0", "source.test")] + [
+        _task(f"t{i}", "filter.test", f"t{i - 1}") for i in range(1, 5_000)
+    ]
+
+    ordered = topological_sort(tasks[::-1])
+
+    assert [task["id"] for task in ordered] == [task["id"] for task in tasks]
+
+
+def test_unchanged_definitions_load_from_the_plan_cache(tmp_path, monkeypatch):
+    """Test a cached plan is reused until the definition file changes."""
+    definition = tmp_path / "workflow.json"
+    definition.write_text(
+        json.dumps(_workflow(_task("top", "sorter.by_metric", metric_name="plays")))
+    )
+    cache_dir = tmp_path / "plans"
+    compile_plan = plan._compile
+    compiled_hashes: list[str] = []
+
+    def counting_compile(workflow_def: dict, content_hash: str):
+        compiled_hashes.append(content_hash)
+        return compile_plan(workflow_def, content_hash)
+
+    monkeypatch.setattr(plan, "_compile", counting_compile)
+
+    compiled = load_workflow_plan(definition, cache_dir=cache_dir)
+    assert list(cache_dir.glob("*.json")) == [
+        cache_dir / f"{compiled.content_hash}.json"
+    ]
+
+    # A new process finds the plan on disk and compiles nothing
+    monkeypatch.setattr(plan, "_plans", {})
+    assert load_workflow_plan(definition, cache_dir=cache_dir) == compiled
+    assert len(compiled_hashes) == 1
+
+    definition.write_text(json.dumps(_workflow()))
+    assert load_workflow_plan(definition, cache_dir=cache_dir).tasks == []
+    assert len(compiled_hashes) == 2
+
+
+def test_cached_plans_are_rebuilt_when_the_code_changes(
+    tmp_path, monkeypatch, data_dir
+):
+    """Test plans cached by other code or registries are not served."""
+    definition = tmp_path / "workflow.json"
+    definition.write_text(
+        json.dumps(_workflow(_task("top", "sorter.by_metric", metric_name="plays")))
+    )
+    compiled = load_workflow_plan(definition)
+    cache_file = data_dir / "cache" / "workflow_plans" / f"{compiled.content_hash}.json"
+    assert cache_file.exists()
+
+    compile_plan = plan._compile
+    compiled_hashes: list[str] = []
+
+    def counting_compile(workflow_def: dict, content_hash: str):
+        compiled_hashes.append(content_hash)
+        return compile_plan(workflow_def, content_hash)
+
+    monkeypatch.setattr(plan, "_compile", counting_compile)
+    monkeypatch.setattr(plan, "_plans", {})
+    monkeypatch.setattr(plan, "_code_fingerprint", lambda: "edited")
+
+    assert load_workflow_plan(definition) == compiled
+    assert compiled_hashes == [compiled.content_hash]
+
+
+def test_plans_json_cannot_represent_stay_in_memory(tmp_path):
+    """Test values JSON would change are never written to the plan cache."""
+    compiled = plan.WorkflowPlan(
+        name="plan_test",
+        description="",
+        content_hash="hash",
+        tasks=[_task("top", "filter.by_metric", window=(1, 2))],
+    )
+
+    plan._write_cached_plan(tmp_path / "plan.json", compiled, "fingerprint")
+
+    assert not (tmp_path / "plan.json").exists()
+
+
+async def test_bound_nodes_reuse_strategies_built_from_config():
+    """Test config-only strategies are built once, context ones per run."""
+    compiled = compile_workflow(
+        _workflow(
+            _task("src", "source.spotify_playlist", playlist_id="a"),
+            _task("first", "selector.limit_tracks", "src", count=1),
+            _task("fresh", "filter.by_tracks", "first", exclusion_source="src"),
+        )
+    )
+    nodes = bind_nodes(compiled)
+
+    assert nodes["fresh"] is plan.get_node("filter.by_tracks")[0]
+    assert nodes["first"] is not plan.get_node("selector.limit_tracks")[0]
+
+    tracks = [Track(id=i, title=f"T{i}", artists=[Artist(name="A")]) for i in (1, 2)]
+    context = {
+        "upstream_task_id": "src",
+        "src": {"tracklist": TrackList(tracks=tracks)},
+    }
+    # The bound strategy was built from the plan's config, not this one
+    result = await nodes["first"](context, {"count": 2})
+    assert [track.id for track in result["tracklist"].tracks] == [1]